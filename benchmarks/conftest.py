@@ -0,0 +1,81 @@
+import asyncio
+import hashlib
+import hmac
+import json
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from saleor_app_sdk.app.builder import SaleorAppBuilder
+from saleor_app_sdk.permissions import SaleorPermission
+from saleor_app_sdk.testing import FakeSaleorServer
+from saleor_app_sdk.webhooks.events import WebhookEventType
+
+TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates"
+SECRET_KEY = "benchmark-secret-key"
+
+
+@pytest.fixture
+def event_loop_runner():
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
+
+
+@pytest.fixture
+def saleor_app():
+    builder = (
+        SaleorAppBuilder("benchmark-app", "Benchmark App")
+        .version("1.0.0")
+        .about("App used by the benchmark suite")
+        .permissions(SaleorPermission.MANAGE_ORDERS, SaleorPermission.MANAGE_PRODUCTS)
+        .urls(
+            app_url="https://example.com/app",
+            config_url="https://example.com/config",
+        )
+        .secret_key(SECRET_KEY)
+        .base_url("https://example.com")
+    )
+    for event in WebhookEventType:
+        builder.webhook(
+            f"{event.value} webhook",
+            [event],
+            "subscription { event { __typename } }",
+            f"https://example.com/api/webhooks/{event.value}",
+        )
+    app = builder.build()
+    app.templates.env.loader.searchpath = [str(TEMPLATES_DIR)]
+    return app
+
+
+@pytest.fixture
+def test_client(saleor_app):
+    return TestClient(saleor_app.fastapi_app)
+
+
+@pytest.fixture
+def order_payload() -> bytes:
+    lines = [
+        {
+            "id": f"T3JkZXJMaW5lOj{i}",
+            "productName": f"Product {i}",
+            "quantity": i + 1,
+            "unitPrice": {"gross": {"amount": 9.99, "currency": "USD"}},
+        }
+        for i in range(20)
+    ]
+    return json.dumps(
+        {"order": {"id": "T3JkZXI6MQ==", "number": "1", "lines": lines}}
+    ).encode()
+
+
+@pytest.fixture
+def order_signature(order_payload) -> str:
+    return hmac.new(SECRET_KEY.encode(), order_payload, hashlib.sha256).hexdigest()
+
+
+@pytest.fixture(scope="session")
+def fake_saleor():
+    with FakeSaleorServer() as server:
+        yield server
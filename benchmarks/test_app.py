@@ -0,0 +1,34 @@
+def test_serialize_manifest(benchmark, saleor_app):
+    manifest = benchmark(saleor_app._serialize_manifest)
+
+    assert len(manifest["webhooks"]) == len(saleor_app.manifest.webhooks)
+
+
+def test_manifest_response_cached(benchmark, saleor_app):
+    body, _etag = benchmark(saleor_app.get_manifest_response)
+
+    assert body
+
+
+def test_manifest_route(benchmark, test_client):
+    response = benchmark(test_client.get, "/api/manifest")
+
+    assert response.status_code == 200
+
+
+def test_manifest_route_not_modified(benchmark, test_client):
+    etag = test_client.get("/api/manifest").headers["etag"]
+
+    response = benchmark(
+        test_client.get, "/api/manifest", headers={"If-None-Match": etag}
+    )
+
+    assert response.status_code == 304
+
+
+def test_register_route(benchmark, test_client):
+    data = {"auth_token": "benchmark-token", "domain": "bench.saleor.io"}
+
+    response = benchmark(test_client.post, "/api/register", json=data)
+
+    assert response.status_code == 200
@@ -0,0 +1,80 @@
+import asyncio
+
+import pytest
+from gql import gql
+
+from saleor_app_sdk.graphql.client import SaleorGraphQLClient
+
+PRODUCT_SEARCH_QUERY = gql("""
+    query SearchProducts($search: String!, $first: Int!) {
+        products(filter: {search: $search}, first: $first) {
+            edges {
+                node {
+                    id
+                    name
+                    description
+                    isPublished
+                    pricing {
+                        priceRange {
+                            start {
+                                gross {
+                                    amount
+                                    currency
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+""")
+
+VARIABLES = {"search": "product", "first": 20}
+
+
+def test_execute_async_warm_client(benchmark, event_loop_runner, fake_saleor):
+    client = SaleorGraphQLClient(fake_saleor.api_url, "benchmark-token")
+    # Fetch the schema once so only the query itself is measured
+    event_loop_runner(client.execute_async(PRODUCT_SEARCH_QUERY, VARIABLES))
+
+    result = benchmark(
+        lambda: event_loop_runner(client.execute_async(PRODUCT_SEARCH_QUERY, VARIABLES))
+    )
+
+    assert len(result["products"]["edges"]) == 20
+
+
+def test_execute_async_new_client(benchmark, event_loop_runner, fake_saleor):
+    """What a route pays when it calls get_graphql_client per request"""
+
+    def run():
+        client = SaleorGraphQLClient(fake_saleor.api_url, "benchmark-token")
+        return event_loop_runner(client.execute_async(PRODUCT_SEARCH_QUERY, VARIABLES))
+
+    result = benchmark(run)
+
+    assert len(result["products"]["edges"]) == 20
+
+
+@pytest.mark.parametrize("coalesce", [False, True], ids=["separate", "coalesced"])
+def test_execute_async_concurrent_identical(
+    benchmark, event_loop_runner, fake_saleor, coalesce
+):
+    """Ten requests asking for the same product search at the same time"""
+    clients = [
+        SaleorGraphQLClient(fake_saleor.api_url, "benchmark-token", coalesce=coalesce)
+        for _ in range(10)
+    ]
+
+    async def run():
+        return await asyncio.gather(
+            *(
+                client.execute_async(PRODUCT_SEARCH_QUERY, VARIABLES)
+                for client in clients
+            )
+        )
+
+    results = benchmark(lambda: event_loop_runner(run()))
+
+    assert all(len(result["products"]["edges"]) == 20 for result in results)
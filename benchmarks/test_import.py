@@ -0,0 +1,45 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import saleor_app_sdk
+
+# Run against the same source tree the benchmarks import
+SRC_DIR = str(Path(saleor_app_sdk.__file__).resolve().parents[1])
+
+# Cumulative time for ``import saleor_app_sdk`` as reported by -X importtime
+IMPORT_BUDGET_MS = float(os.environ.get("SALEOR_SDK_IMPORT_BUDGET_MS", "25"))
+
+
+def _import_time_ms(statement: str) -> float:
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": SRC_DIR},
+    )
+    for line in reversed(result.stderr.splitlines()):
+        _self, cumulative, name = line.removeprefix("import time:").split("|")
+        if name.strip() == "saleor_app_sdk":
+            return int(cumulative) / 1000
+    error_msg = "saleor_app_sdk not found in -X importtime output"
+    raise AssertionError(error_msg)
+
+
+def test_import_package(benchmark):
+    import_ms = benchmark.pedantic(
+        _import_time_ms, args=("import saleor_app_sdk",), rounds=5
+    )
+
+    assert import_ms <= IMPORT_BUDGET_MS, (
+        f"import saleor_app_sdk took {import_ms:.1f} ms, "
+        f"budget is {IMPORT_BUDGET_MS:.1f} ms"
+    )
+
+
+def test_import_app(benchmark):
+    benchmark.pedantic(
+        _import_time_ms, args=("from saleor_app_sdk import SaleorApp",), rounds=3
+    )
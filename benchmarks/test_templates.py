@@ -0,0 +1,87 @@
+import pytest
+from fastapi import Request
+
+from saleor_app_sdk.app.templates import create_templates, stream_template
+from saleor_app_sdk.graphql.client import SaleorGraphQLClient
+from saleor_app_sdk.graphql.queries import SaleorQueries
+from saleor_app_sdk.testing import make_product
+
+from .conftest import TEMPLATES_DIR
+
+
+def _product(index: int) -> dict:
+    node = make_product(index)
+    gross = node["pricing"]["priceRange"]["start"]["gross"]
+    return {
+        "id": node["id"],
+        "name": node["name"],
+        "description": node["description"],
+        "is_published": node["isPublished"],
+        "price": gross["amount"],
+        "currency": gross["currency"],
+    }
+
+
+PARTIAL_CONTEXTS = {
+    "partials/config_updated.html": {"success": True},
+    "partials/product_created.html": {"success": True, "product": _product(1)},
+    "partials/product_details.html": {"product": _product(1)},
+    "partials/product_search_results.html": {
+        "products": [_product(i) for i in range(20)],
+        "last_query": "product",
+    },
+}
+
+
+@pytest.mark.parametrize("template_name", sorted(PARTIAL_CONTEXTS))
+def test_render_partial(benchmark, saleor_app, template_name):
+    template = saleor_app.templates.get_template(template_name)
+    context = PARTIAL_CONTEXTS[template_name]
+
+    html = benchmark(template.render, context)
+
+    assert html.strip()
+
+
+@pytest.mark.parametrize("production", [False, True], ids=["auto-reload", "production"])
+def test_get_and_render_search_results(benchmark, production):
+    # TemplateResponse looks the template up on every request; with auto_reload
+    # each lookup also stats the file
+    templates = create_templates(TEMPLATES_DIR, production=production)
+    context = PARTIAL_CONTEXTS["partials/product_search_results.html"]
+
+    def render():
+        template = templates.get_template("partials/product_search_results.html")
+        return template.render(context)
+
+    html = benchmark(render)
+
+    assert html.strip()
+
+
+@pytest.mark.parametrize("until", ["first-row", "complete"])
+def test_stream_product_list(benchmark, event_loop_runner, fake_saleor, until):
+    # Time to the first table row vs. the whole page when streaming 250
+    # products fetched 50 per page from the fake Saleor server
+    templates = create_templates(TEMPLATES_DIR, production=True)
+    client = SaleorGraphQLClient(fake_saleor.api_url, "benchmark-token")
+    request = Request({"type": "http", "method": "GET", "path": "/", "headers": []})
+    # Fetch the schema once so only pagination and rendering are measured
+    event_loop_runner(client.execute_async(SaleorQueries.PRODUCT_LIST, {"first": 1}))
+
+    async def consume():
+        products = client.paginate(SaleorQueries.PRODUCT_LIST, "products", page_size=50)
+        response = stream_template(
+            templates, request, "product_list.html", {"products": products}
+        )
+        html = ""
+        async for chunk in response.body_iterator:
+            html += chunk
+            if until == "first-row" and "<td" in html:
+                await response.body_iterator.aclose()
+                break
+        return html
+
+    html = benchmark(lambda: event_loop_runner(consume()))
+
+    assert "<td" in html
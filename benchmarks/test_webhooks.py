@@ -0,0 +1,134 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from saleor_app_sdk.webhooks.events import SyncWebhookEventType, WebhookEventType
+from saleor_app_sdk.webhooks.memo import SyncResponseCache
+from saleor_app_sdk.webhooks.sync import CalculateTaxesResponse, TaxLine
+
+
+@pytest.fixture
+def order_handler(saleor_app):
+    handler = AsyncMock()
+    saleor_app.webhook_handler.register_handler(WebhookEventType.ORDER_CREATED, handler)
+    return handler
+
+
+def test_verify_signature(benchmark, saleor_app, order_payload, order_signature):
+    handler = saleor_app.webhook_handler
+
+    assert benchmark(handler.verify_signature, order_payload, order_signature)
+
+
+def test_process_webhook(
+    benchmark,
+    event_loop_runner,
+    saleor_app,
+    order_handler,
+    order_payload,
+    order_signature,
+):
+    request = MagicMock()
+    request.body = AsyncMock(return_value=order_payload)
+    request.headers = {
+        "saleor-signature": order_signature,
+        "saleor-event": WebhookEventType.ORDER_CREATED.value,
+    }
+
+    result = benchmark(
+        lambda: event_loop_runner(saleor_app.webhook_handler.process_webhook(request))
+    )
+
+    assert result == {"received": True}
+
+
+def test_webhook_route(
+    benchmark, test_client, order_handler, order_payload, order_signature
+):
+    headers = {
+        "content-type": "application/json",
+        "saleor-signature": order_signature,
+        "saleor-event": WebhookEventType.ORDER_CREATED.value,
+    }
+
+    response = benchmark(
+        test_client.post,
+        "/api/webhooks/ORDER_CREATED",
+        content=order_payload,
+        headers=headers,
+    )
+
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize("memoize", [False, True], ids=["computed", "memoized"])
+def test_process_sync_webhook(
+    benchmark, event_loop_runner, saleor_app, order_payload, order_signature, memoize
+):
+    response = CalculateTaxesResponse(
+        shipping_price_gross_amount=10.0,
+        shipping_price_net_amount=10.0,
+        shipping_tax_rate=0.0,
+        lines=[TaxLine(12.3, 10.0, 23.0) for _ in range(20)],
+    )
+
+    @saleor_app.sync_webhook(
+        SyncWebhookEventType.CHECKOUT_CALCULATE_TAXES,
+        memoize=SyncResponseCache() if memoize else None,
+    )
+    async def calculate_taxes(_payload):
+        # Stands in for a call to a third-party tax API
+        await asyncio.sleep(0.001)
+        return response
+
+    request = MagicMock()
+    request.body = AsyncMock(return_value=order_payload)
+    request.headers = {
+        "saleor-signature": order_signature,
+        "saleor-event": SyncWebhookEventType.CHECKOUT_CALCULATE_TAXES.value,
+    }
+
+    result = benchmark(
+        lambda: event_loop_runner(saleor_app.webhook_handler.process_webhook(request))
+    )
+
+    assert result.status_code == 200
+
+
+@pytest.mark.parametrize("batched", [False, True], ids=["per-event", "batched"])
+def test_process_webhook_burst(
+    benchmark, event_loop_runner, saleor_app, order_payload, order_signature, batched
+):
+    handler = saleor_app.webhook_handler
+    connection = None
+
+    async def write(_payloads):
+        # Stands in for one round-trip to a warehouse over a single connection
+        async with connection:
+            await asyncio.sleep(0.001)
+
+    if batched:
+        handler.register_batch_handler(
+            WebhookEventType.ORDER_CREATED, write, max_size=100, max_wait=0.05
+        )
+    else:
+        handler.register_handler(WebhookEventType.ORDER_CREATED, write)
+
+    request = MagicMock()
+    request.body = AsyncMock(return_value=order_payload)
+    request.headers = {
+        "saleor-signature": order_signature,
+        "saleor-event": WebhookEventType.ORDER_CREATED.value,
+    }
+
+    async def burst():
+        nonlocal connection
+        connection = asyncio.Lock()
+        return await asyncio.gather(
+            *(handler.process_webhook(request) for _ in range(100))
+        )
+
+    results = benchmark(lambda: event_loop_runner(burst()))
+
+    assert results == [{"received": True}] * 100
@@ -117,6 +117,21 @@ async def products_page(request: Request):
     return saleor_app.templates.TemplateResponse("products.html", {"request": request})
 
 
+@saleor_app.get("/products/all", response_class=HTMLResponse)
+async def all_products_page(request: Request):
+    # Stream the table: rows are sent as each page arrives from Saleor instead
+    # of waiting for the whole catalogue to be fetched and rendered
+    installations = list(saleor_app.installations.values())
+    if not installations:
+        return HTMLResponse("No Saleor installation found", status_code=404)
+
+    client = saleor_app.get_graphql_client(installations[0].domain)
+    products = client.paginate(SaleorQueries.PRODUCT_LIST, "products")
+    return saleor_app.stream_template(
+        request, "product_list.html", {"products": products}
+    )
+
+
 @saleor_app.get("/config", response_class=HTMLResponse)
 async def config(request: Request):
     return saleor_app.templates.TemplateResponse("config.html", {
@@ -154,14 +169,43 @@ async def update_config(
         )
 
 # API endpoints for product operations
-@saleor_app.get("/api/products/search", response_class=HTMLResponse)
+# Rendered fragments are cached per installation and query for 30s, revalidated
+# with ETags, and dropped as soon as Saleor reports a product change
+PRODUCT_EVENTS = [
+    WebhookEventType.PRODUCT_CREATED,
+    WebhookEventType.PRODUCT_UPDATED,
+    WebhookEventType.PRODUCT_DELETED,
+]
+# Error fragments opt out of the cache
+NO_STORE = {"Cache-Control": "no-store"}
+
+
+def current_installation(_request: Request) -> str:
+    """Installation the product endpoints read from.
+
+    Like the endpoints, this example serves the first installation; a real
+    app would take it from a verified session. It never comes from the
+    request, so one shop's fragments cannot be served to another.
+    """
+    installation = next(iter(saleor_app.installations.values()), None)
+    return installation.domain if installation is not None else ""
+
+
+@saleor_app.get(
+    "/api/products/search",
+    response_class=HTMLResponse,
+    cache_ttl=30,
+    invalidate_on=PRODUCT_EVENTS,
+    installation_key=current_installation,
+)
 async def search_products(request: Request, query: str = ""):
     # Get the first installation (in a real app, you'd get the installation for the specific domain)
     installations = list(saleor_app.installations.values())
     if not installations:
         return saleor_app.templates.TemplateResponse(
             "partials/product_search_results.html", 
-            {"request": request, "products": [], "error": "No Saleor installation found"}
+            {"request": request, "products": [], "error": "No Saleor installation found"},
+            headers=NO_STORE,
         )
 
     installation = installations[0]
@@ -197,11 +241,18 @@ async def search_products(request: Request, query: str = ""):
         logger.exception("Error searching products: %s", e)
         return saleor_app.templates.TemplateResponse(
             "partials/product_search_results.html", 
-            {"request": request, "products": [], "error": str(e)}
+            {"request": request, "products": [], "error": str(e)},
+            headers=NO_STORE,
         )
 
 
-@saleor_app.get("/api/products/{product_id}", response_class=HTMLResponse)
+@saleor_app.get(
+    "/api/products/{product_id}",
+    response_class=HTMLResponse,
+    cache_ttl=30,
+    invalidate_on=PRODUCT_EVENTS,
+    installation_key=current_installation,
+)
 async def get_product(request: Request, product_id: str):
     # Get the first installation (in a real app, you'd get the installation for the specific domain)
     installations = list(saleor_app.installations.values())
@@ -1,41 +1,60 @@
 """Saleor App SDK for Python
 
 A Python SDK for building Saleor apps with FastAPI and HTMX.
+
+Public names are imported on first access, so ``import saleor_app_sdk`` does
+not pull in FastAPI, gql or pydantic until they are needed.
 """
 
 __version__ = "0.1.0"
 
-# Import from app package
-from .app.builder import SaleorAppBuilder
-from .app.config import AppConfigMixin
-from .app.core import SaleorApp
-
-# Import from graphql package
-from .graphql.client import SaleorGraphQLClient
-from .graphql.queries import SaleorQueries
-
-# Import from models package
-from .models.app_manifest import AppManifest
-from .models.installation import AppInstallation
-from .models.webhooks import WebhookDefinition
-
-# Import from root modules
-from .permissions import SaleorPermission
-
-# Import from webhooks package
-from .webhooks.events import WebhookEventType
-from .webhooks.handler import WebhookHandler
+from typing import TYPE_CHECKING
+
+from ._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .app.builder import SaleorAppBuilder
+    from .app.config import AppConfigMixin
+    from .app.core import SaleorApp
+    from .graphql.client import SaleorGraphQLClient
+    from .graphql.queries import SaleorQueries
+    from .models.app_manifest import AppManifest
+    from .models.installation import AppInstallation, InstallationRecord
+    from .models.webhooks import WebhookDefinition
+    from .permissions import SaleorPermission
+    from .webhooks.events import SyncWebhookEventType, WebhookEventType
+    from .webhooks.handler import WebhookHandler
+
+_EXPORTS = {
+    "AppConfigMixin": ".app.config",
+    "AppInstallation": ".models.installation",
+    "AppManifest": ".models.app_manifest",
+    "InstallationRecord": ".models.installation",
+    "SaleorApp": ".app.core",
+    "SaleorAppBuilder": ".app.builder",
+    "SaleorGraphQLClient": ".graphql.client",
+    "SaleorPermission": ".permissions",
+    "SaleorQueries": ".graphql.queries",
+    "SyncWebhookEventType": ".webhooks.events",
+    "WebhookDefinition": ".models.webhooks",
+    "WebhookEventType": ".webhooks.events",
+    "WebhookHandler": ".webhooks.handler",
+}
 
 __all__ = [
     "AppConfigMixin",
     "AppInstallation",
     "AppManifest",
+    "InstallationRecord",
     "SaleorApp",
     "SaleorAppBuilder",
     "SaleorGraphQLClient",
     "SaleorPermission",
     "SaleorQueries",
+    "SyncWebhookEventType",
     "WebhookDefinition",
     "WebhookEventType",
     "WebhookHandler",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,33 @@
+"""
+Lazy attribute loading for package ``__init__`` modules
+"""
+
+import importlib
+from collections.abc import Callable
+
+
+def lazy_exports(
+    package: str, exports: dict[str, str]
+) -> tuple[Callable[[str], object], Callable[[], list[str]]]:
+    """Build module ``__getattr__`` and ``__dir__`` for lazily imported names.
+
+    ``exports`` maps each public name to the submodule defining it, relative
+    to ``package``. The submodule is imported on first access, so importing
+    the package itself stays cheap.
+    """
+
+    def module_getattr(name: str) -> object:
+        module_name = exports.get(name)
+        if module_name is None:
+            error_msg = f"module {package!r} has no attribute {name!r}"
+            raise AttributeError(error_msg)
+        module = importlib.import_module(module_name, package)
+        value = getattr(module, name)
+        # Cache on the package so later lookups skip __getattr__
+        setattr(importlib.import_module(package), name, value)
+        return value
+
+    def module_dir() -> list[str]:
+        return sorted({*exports, *importlib.import_module(package).__dict__})
+
+    return module_getattr, module_dir
@@ -2,8 +2,37 @@
 App-related functionality for Saleor App SDK
 """
 
-from .builder import SaleorAppBuilder
-from .config import AppConfigMixin
-from .core import SaleorApp
+from typing import TYPE_CHECKING
 
-__all__ = ["AppConfigMixin", "SaleorApp", "SaleorAppBuilder"]
+from saleor_app_sdk._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .builder import SaleorAppBuilder
+    from .config import AppConfigMixin
+    from .core import SaleorApp
+    from .installations import InstallationCache, store_loader
+    from .templates import create_templates, precompile_templates, stream_template
+
+_EXPORTS = {
+    "AppConfigMixin": ".config",
+    "InstallationCache": ".installations",
+    "SaleorApp": ".core",
+    "SaleorAppBuilder": ".builder",
+    "create_templates": ".templates",
+    "precompile_templates": ".templates",
+    "store_loader": ".installations",
+    "stream_template": ".templates",
+}
+
+__all__ = [
+    "AppConfigMixin",
+    "InstallationCache",
+    "SaleorApp",
+    "SaleorAppBuilder",
+    "create_templates",
+    "precompile_templates",
+    "store_loader",
+    "stream_template",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -6,7 +6,7 @@ from saleor_app_sdk.app.core import SaleorApp
 from saleor_app_sdk.models.app_manifest import AppManifest
 from saleor_app_sdk.models.webhooks import WebhookDefinition
 from saleor_app_sdk.permissions import SaleorPermission
-from saleor_app_sdk.webhooks.events import WebhookEventType
+from saleor_app_sdk.webhooks.events import SyncWebhookEventType, WebhookEventType
 
 
 class SaleorAppBuilder:
@@ -46,7 +46,11 @@ class SaleorAppBuilder:
         return self
 
     def webhook(
-        self, name: str, events: list[WebhookEventType], query: str, target_url: str
+        self,
+        name: str,
+        events: list[WebhookEventType | SyncWebhookEventType],
+        query: str,
+        target_url: str,
     ):
         if not self._manifest.webhooks:
             self._manifest.webhooks = []
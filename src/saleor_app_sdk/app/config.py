@@ -2,13 +2,35 @@
 Configuration mixin for Saleor apps
 """
 
+from saleor_app_sdk.storage.base import ConfigStore
+from saleor_app_sdk.storage.cache import CachedConfigStore
+
 
 class AppConfigMixin:
-    """Mixin for apps that need configuration storage"""
+    """Mixin for apps that need configuration storage
+
+    Without a ``config_store`` configs live in a per-process dict. With one,
+    the async ``load_config``/``save_config``/``patch_config`` methods persist
+    through the store, and ``get_config`` keeps serving reads from the local
+    cache that those methods populate.
+    """
 
-    def __init__(self, *args, **kwargs):
+    def __init__(
+        self,
+        *args,
+        config_store: ConfigStore | None = None,
+        config_revalidate_after: float = 1.0,
+        **kwargs,
+    ):
         super().__init__(*args, **kwargs)
         self.config_storage: dict[str, dict] = {}
+        self.config_store: CachedConfigStore | None = None
+        if config_store is not None:
+            self.config_store = CachedConfigStore(
+                config_store,
+                revalidate_after=config_revalidate_after,
+                configs=self.config_storage,
+            )
 
     def get_config(self, domain: str, default: dict | None = None) -> dict:
         return self.config_storage.get(domain, default or {})
@@ -17,6 +39,28 @@ class AppConfigMixin:
         self.config_storage[domain] = config
 
     def update_config(self, domain: str, updates: dict):
+        # Build a new dict so readers holding the old one see a consistent view
         current = self.get_config(domain, {})
-        current.update(updates)
-        self.set_config(domain, current)
+        self.set_config(domain, {**current, **updates})
+
+    async def load_config(self, domain: str, default: dict | None = None) -> dict:
+        """Get config for a domain, refreshing it from the config store"""
+        if self.config_store is None:
+            return self.get_config(domain, default)
+        entry = await self.config_store.get(domain)
+        return entry.config if entry else default or {}
+
+    async def save_config(self, domain: str, config: dict):
+        """Replace config for a domain in the config store"""
+        if self.config_store is None:
+            self.set_config(domain, config)
+        else:
+            await self.config_store.set(domain, config)
+
+    async def patch_config(self, domain: str, updates: dict) -> dict:
+        """Atomically merge updates into the config for a domain"""
+        if self.config_store is None:
+            self.update_config(domain, updates)
+            return self.get_config(domain)
+        entry = await self.config_store.update(domain, updates)
+        return entry.config
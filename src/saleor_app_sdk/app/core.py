@@ -2,49 +2,185 @@
 Core Saleor App class
 """
 
+import hashlib
+import hmac
 import json
 import logging
 import os
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from fastapi.templating import Jinja2Templates
-
+from starlette.routing import Match
+
+from saleor_app_sdk.app.fragments import (
+    FragmentCache,
+    cache_fragment,
+    etag_matches,
+)
+from saleor_app_sdk.app.installations import (
+    Installation,
+    InstallationCache,
+    InstallationLoader,
+)
+from saleor_app_sdk.app.templates import create_templates, stream_template
+from saleor_app_sdk.deadlines import DeadlineMiddleware
 from saleor_app_sdk.graphql.client import SaleorGraphQLClient
+from saleor_app_sdk.instrumentation import (
+    Instrumentation,
+    get_instrumentation,
+    set_instrumentation,
+)
 from saleor_app_sdk.models.app_manifest import AppManifest
-from saleor_app_sdk.models.installation import AppInstallation
-from saleor_app_sdk.webhooks.events import WebhookEventType
-from saleor_app_sdk.webhooks.handler import WebhookHandler
+from saleor_app_sdk.models.installation import AppInstallation, InstallationRecord
+from saleor_app_sdk.profiling import Profiler
+from saleor_app_sdk.webhooks.admission import AdmissionController
+from saleor_app_sdk.webhooks.dead_letters import DeadLetterStore
+from saleor_app_sdk.webhooks.events import SyncWebhookEventType, WebhookEventType
+from saleor_app_sdk.webhooks.handler import DEFAULT_WEBHOOK_DEADLINE, WebhookHandler
+from saleor_app_sdk.webhooks.partitions import PartitionedExecutor
+from saleor_app_sdk.webhooks.retry import RetryPolicy
+from saleor_app_sdk.webhooks.tenants import TenantScheduler
 
 logger = logging.getLogger(__name__)
 
+# Seconds webhooks in flight get to finish on shutdown; below the 30 second
+# grace period Kubernetes allows by default
+DEFAULT_SHUTDOWN_GRACE = 20.0
+
+
+def _graphql_client(installation: Installation | None) -> SaleorGraphQLClient | None:
+    if installation is None:
+        return None
+    return SaleorGraphQLClient(installation.saleor_api_url, installation.auth_token)
+
 
 class SaleorApp:
     """Main Saleor App class - the core of the SDK"""
 
-    def __init__(
+    manifest_cache_control = "public, max-age=60"
+
+    def __init__(  # noqa: PLR0913
         self,
         manifest: AppManifest,
         secret_key: str,
         base_url: str | None = None,
         templates_dir: str = "templates",
+        *,
+        installation_max_idle: float | None = None,
+        installation_loader: InstallationLoader | None = None,
+        instrumentation: Instrumentation | None = None,
+        profiler: Profiler | None = None,
+        templates: Jinja2Templates | None = None,
+        webhook_executor: PartitionedExecutor | None = None,
+        webhook_retry: RetryPolicy | None = None,
+        dead_letters: DeadLetterStore | None = None,
+        admin_token: str | None = None,
+        admission: AdmissionController | None = None,
+        tenant_scheduler: TenantScheduler | None = None,
+        webhook_deadline: float | None = DEFAULT_WEBHOOK_DEADLINE,
+        request_deadline: float | None = None,
+        shutdown_grace: float = DEFAULT_SHUTDOWN_GRACE,
     ):
+        self._manifest_response: tuple[bytes, str] | None = None
         self.manifest = manifest
         self.secret_key = secret_key
         self.base_url = base_url
-        self.fastapi_app = FastAPI(title=manifest.name)
-        self.templates = Jinja2Templates(directory=templates_dir)
-        self.webhook_handler = WebhookHandler(secret_key)
-        self.installations: dict[str, AppInstallation] = {}
+        self.shutdown_grace = shutdown_grace
+        self._shutdown_callbacks: list[Callable] = []
+        self.fastapi_app = FastAPI(title=manifest.name, lifespan=self._lifespan)
+        self.templates = templates or create_templates(templates_dir)
+        self.webhook_handler = WebhookHandler(
+            secret_key,
+            executor=webhook_executor,
+            retry=webhook_retry,
+            dead_letters=dead_letters,
+            admission=admission,
+            scheduler=tenant_scheduler,
+            deadline=webhook_deadline,
+        )
+        self.admin_token = admin_token
+        self.installations = InstallationCache(
+            max_idle=installation_max_idle, loader=installation_loader
+        )
+        self.fragment_cache = FragmentCache()
+        self.instrumentation = instrumentation
+        if instrumentation is not None:
+            set_instrumentation(instrumentation)
 
         # Setup core routes
         self._setup_core_routes()
+        if instrumentation is not None:
+            self._setup_metrics_route()
+        self.profiler = profiler
+        if profiler is not None:
+            self.webhook_handler.profiler = profiler
+            self._setup_profiling()
+        if dead_letters is not None and admin_token:
+            self._setup_dead_letter_routes()
+        if tenant_scheduler is not None and admin_token:
+            self._setup_tenant_stats_route()
+        if request_deadline is not None:
+            # Outermost, so the deadline covers everything a request does
+            self.fastapi_app.add_middleware(
+                DeadlineMiddleware, seconds=request_deadline
+            )
+
+    @property
+    def manifest(self) -> AppManifest:
+        return self._manifest
+
+    @manifest.setter
+    def manifest(self, manifest: AppManifest):
+        self._manifest = manifest
+        self.invalidate_manifest_cache()
+
+    @property
+    def base_url(self) -> str | None:
+        return self._base_url
+
+    @base_url.setter
+    def base_url(self, base_url: str | None):
+        self._base_url = base_url
+        self.invalidate_manifest_cache()
+
+    def invalidate_manifest_cache(self):
+        """Drop the pre-encoded manifest.
+
+        Called automatically when ``manifest`` or ``base_url`` is reassigned;
+        call it yourself after mutating the manifest object in place.
+        """
+        self._manifest_response = None
+
+    def get_manifest_response(self) -> tuple[bytes, str]:
+        """Return the manifest as pre-encoded JSON bytes and its ETag"""
+        instrumentation = get_instrumentation()
+        if instrumentation is not None:
+            instrumentation.record_cache(
+                "manifest", self._manifest_response is not None
+            )
+        if self._manifest_response is None:
+            body = json.dumps(
+                self._serialize_manifest(), separators=(",", ":")
+            ).encode()
+            etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+            self._manifest_response = (body, etag)
+        return self._manifest_response
 
     def _setup_core_routes(self):
         """Setup core SDK routes"""
 
         @self.fastapi_app.get("/api/manifest")
-        async def get_manifest():
-            return self._serialize_manifest()
+        async def get_manifest(request: Request):
+            body, etag = self.get_manifest_response()
+            headers = {"ETag": etag, "Cache-Control": self.manifest_cache_control}
+            if etag_matches(request.headers.get("if-none-match"), etag):
+                return Response(status_code=304, headers=headers)
+            return Response(
+                content=body, media_type="application/json", headers=headers
+            )
 
         @self.fastapi_app.post("/api/register")
         async def register_installation(request: Request):
@@ -83,7 +219,10 @@ class SaleorApp:
                 saleor_api_url=saleor_api_url,
             )
 
-            self.installations[installation.domain] = installation
+            # Validated above, so cache the compact immutable form
+            self.installations[installation.domain] = (
+                InstallationRecord.from_installation(installation)
+            )
 
             # Call custom installation handler if defined
             if hasattr(self, "on_install"):
@@ -92,9 +231,151 @@ class SaleorApp:
             return {"success": True}
 
         @self.fastapi_app.post("/api/webhooks/{event_type}")
-        async def handle_webhook(_event_type: str, request: Request):
+        async def handle_webhook(event_type: str, request: Request):  # noqa: ARG001
+            # The saleor-event header is authoritative; the path is informational
             return await self.webhook_handler.process_webhook(request)
 
+    def _setup_metrics_route(self):
+        """Expose the instrumentation's metrics at ``/metrics``"""
+
+        @self.fastapi_app.get("/metrics", include_in_schema=False)
+        async def get_metrics():
+            rendered = self.instrumentation.render_metrics()
+            if rendered is None:
+                return Response(status_code=404)
+            body, content_type = rendered
+            return Response(content=body, media_type=content_type)
+
+    def _profile_key(self, request: Request) -> str | None:
+        """Profile key of the route a request will reach, e.g. ``/items/{id}``.
+
+        Middleware runs before routing, so the routes are matched here;
+        keying by path template keeps one key per route instead of one per
+        URL. Returns None for unknown paths and for paths that are not
+        profiled here.
+        """
+        # Webhooks are profiled by the handler, profiles are not profiled
+        if request.url.path.startswith(("/api/webhooks/", "/api/admin/profiles")):
+            return None
+        partial = None
+        for route in self.fastapi_app.router.routes:
+            match, _child_scope = route.matches(request.scope)
+            if match is Match.FULL:
+                return Profiler.route_key(route.path)
+            if match is Match.PARTIAL and partial is None:
+                partial = route.path
+        return None if partial is None else Profiler.route_key(partial)
+
+    def _setup_profiling(self):
+        """Profile sampled route calls and serve profiles to admins"""
+        profiler = self.profiler
+
+        @self.fastapi_app.middleware("http")
+        async def profile_routes(request: Request, call_next):
+            key = self._profile_key(request)
+            if key is None:
+                return await call_next(request)
+            with profiler.profile(key, request.headers):
+                return await call_next(request)
+
+        if not profiler.admin_token:
+            return
+
+        def require_admin(request: Request):
+            token = request.headers.get("authorization", "").removeprefix("Bearer ")
+            if not profiler.is_admin(token):
+                raise HTTPException(status_code=401, detail="Invalid admin token")
+
+        @self.fastapi_app.get("/api/admin/profiles", include_in_schema=False)
+        async def list_profiles(request: Request):
+            require_admin(request)
+            return [record.to_dict() for record in profiler.store.list()]
+
+        @self.fastapi_app.get(
+            "/api/admin/profiles/{profile_id}", include_in_schema=False
+        )
+        async def download_profile(
+            profile_id: int, request: Request, fmt: str = Query("prof", alias="format")
+        ):
+            require_admin(request)
+            record = profiler.store.get(profile_id)
+            if record is None:
+                raise HTTPException(status_code=404, detail="Profile not found")
+            if fmt == "text":
+                return Response(content=record.format_text(), media_type="text/plain")
+            return Response(
+                content=record.dump(),
+                media_type="application/octet-stream",
+                headers={
+                    "Content-Disposition": (
+                        f'attachment; filename="profile-{record.id}.prof"'
+                    )
+                },
+            )
+
+    def _require_admin(self, request: Request):
+        token = request.headers.get("authorization", "").removeprefix("Bearer ")
+        if not self.admin_token or not hmac.compare_digest(token, self.admin_token):
+            raise HTTPException(status_code=401, detail="Invalid admin token")
+
+    def _setup_dead_letter_routes(self):
+        """Let admins inspect and replay dead-lettered webhooks"""
+        handler = self.webhook_handler
+        store = handler.dead_letters
+
+        @self.fastapi_app.get("/api/admin/dead-letters", include_in_schema=False)
+        async def list_dead_letters(
+            request: Request, limit: int = 100, event_type: str | None = None
+        ):
+            self._require_admin(request)
+            entries = await store.list(limit, event_type)
+            return [entry.to_dict(payload=False) for entry in entries]
+
+        @self.fastapi_app.get(
+            "/api/admin/dead-letters/{entry_id}", include_in_schema=False
+        )
+        async def get_dead_letter(entry_id: str, request: Request):
+            self._require_admin(request)
+            entry = await store.get(entry_id)
+            if entry is None:
+                raise HTTPException(status_code=404, detail="Dead letter not found")
+            return entry.to_dict()
+
+        @self.fastapi_app.post(
+            "/api/admin/dead-letters/{entry_id}/replay", include_in_schema=False
+        )
+        async def replay_dead_letter(entry_id: str, request: Request):
+            self._require_admin(request)
+            try:
+                replayed = await handler.replay(entry_id)
+            except KeyError as e:
+                raise HTTPException(
+                    status_code=404, detail="Dead letter not found"
+                ) from e
+            return {"replayed": replayed}
+
+        @self.fastapi_app.delete(
+            "/api/admin/dead-letters/{entry_id}", include_in_schema=False
+        )
+        async def delete_dead_letter(entry_id: str, request: Request):
+            self._require_admin(request)
+            if not await store.remove(entry_id):
+                raise HTTPException(status_code=404, detail="Dead letter not found")
+            return {"deleted": True}
+
+    def _setup_tenant_stats_route(self):
+        """Let admins see queueing and latency per installation"""
+        scheduler = self.webhook_handler.scheduler
+
+        @self.fastapi_app.get("/api/admin/tenants", include_in_schema=False)
+        async def tenant_stats(request: Request):
+            self._require_admin(request)
+            return {
+                "running": scheduler.running,
+                "queued": scheduler.queued(),
+                "tenants": scheduler.stats(),
+            }
+
     def _serialize_manifest(self) -> dict:
         """Serialize app manifest to dict"""
         manifest_dict = {
@@ -119,39 +400,88 @@ class SaleorApp:
 
         # Add webhooks
         if self.manifest.webhooks:
-            for webhook in self.manifest.webhooks:
-                manifest_dict["webhooks"].append(
-                    {
-                        "name": webhook.name,
-                        "asyncEvents": [e.value for e in webhook.events],
-                        "query": webhook.query,
-                        "targetUrl": webhook.target_url,
-                        "isActive": webhook.is_active,
-                    }
-                )
+            manifest_dict["webhooks"] = [
+                webhook.to_dict() for webhook in self.manifest.webhooks
+            ]
 
         return manifest_dict
 
-    def get_installation(self, domain: str) -> AppInstallation | None:
-        """Get app installation by domain"""
-        return self.installations.get(domain)
+    def get_installation(self, domain: str) -> Installation | None:
+        """Get app installation by domain and mark it as recently used.
+
+        Only installations in memory are found; with an
+        ``installation_loader``, use :meth:`get_installation_async`.
+        """
+        return self.installations.get_active(domain)
+
+    async def get_installation_async(self, domain: str) -> Installation | None:
+        """Get app installation by domain, loading it again if it was evicted"""
+        return await self.installations.get_active_async(domain)
 
     def get_graphql_client(self, domain: str) -> SaleorGraphQLClient | None:
         """Get GraphQL client for specific installation"""
-        installation = self.get_installation(domain)
-        if installation:
-            return SaleorGraphQLClient(
-                installation.saleor_api_url, installation.auth_token
-            )
-        return None
+        return _graphql_client(self.get_installation(domain))
+
+    async def get_graphql_client_async(self, domain: str) -> SaleorGraphQLClient | None:
+        """Get GraphQL client for an installation, loading it if evicted"""
+        return _graphql_client(await self.get_installation_async(domain))
+
+    def stream_template(
+        self, request: Request, name: str, context: dict | None = None, **kwargs
+    ) -> StreamingResponse:
+        """Render one of the app's templates as a streaming response"""
+        return stream_template(self.templates, request, name, context, **kwargs)
 
     # Decorators for common patterns
     def route(self, path: str, **kwargs):
         """Add custom route to the app"""
         return self.fastapi_app.route(path, **kwargs)
 
-    def get(self, path: str, **kwargs):
-        return self.fastapi_app.get(path, **kwargs)
+    def get(
+        self,
+        path: str,
+        *,
+        cache_ttl: float | None = None,
+        invalidate_on: tuple[WebhookEventType, ...] | list[WebhookEventType] = (),
+        cache_control: str = "private, no-cache",
+        installation_key: Callable[[Request], str] | None = None,
+        **kwargs,
+    ):
+        """Add a GET route, optionally caching its rendered response.
+
+        With ``cache_ttl`` the rendered fragment is cached per installation
+        and query parameters for that many seconds, served with ``ETag`` and
+        ``Last-Modified``, and dropped early when any ``invalidate_on``
+        webhook arrives for the installation. ``installation_key`` is then
+        required: it names the installation of a request and must come from
+        an authenticated source (see
+        :func:`~saleor_app_sdk.app.fragments.cache_fragment`).
+        """
+        route = self.fastapi_app.get(path, **kwargs)
+        if cache_ttl is None and not invalidate_on:
+            return route
+        if installation_key is None:
+            error_msg = "installation_key is required with cache_ttl or invalidate_on"
+            raise ValueError(error_msg)
+
+        for event_type in invalidate_on:
+            self.webhook_handler.add_listener(
+                event_type,
+                lambda domain, _payload: self.fragment_cache.invalidate(domain, path),
+            )
+        caching = cache_fragment(
+            self.fragment_cache,
+            path,
+            ttl=cache_ttl if cache_ttl is not None else float("inf"),
+            cache_control=cache_control,
+            installation_key=installation_key,
+        )
+
+        def decorator(func):
+            route(caching(func))
+            return func
+
+        return decorator
 
     def post(self, path: str, **kwargs):
         return self.fastapi_app.post(path, **kwargs)
@@ -160,6 +490,68 @@ class SaleorApp:
         """Decorator for webhook handlers"""
         return self.webhook_handler.on(event_type)
 
+    def batch_webhook(self, event_type: WebhookEventType, **options):
+        """Decorator for handlers receiving lists of webhook payloads, see
+        :meth:`WebhookHandler.register_batch_handler` for the options"""
+        return self.webhook_handler.on_batch(event_type, **options)
+
+    def sync_webhook(self, event_type: SyncWebhookEventType, **options):
+        """Decorator for synchronous webhook handlers, see
+        :meth:`WebhookHandler.register_sync_handler` for the options"""
+        return self.webhook_handler.on_sync(event_type, **options)
+
+    def on_shutdown(self, func: Callable):
+        """Decorator for callbacks run on shutdown, after webhooks drained and
+        before the config store and dead-letter store are closed"""
+        self._shutdown_callbacks.append(func)
+        return func
+
+    @asynccontextmanager
+    async def _lifespan(self, _app: FastAPI) -> AsyncIterator[None]:
+        await self.startup()
+        # A lifespan replaces FastAPI's on_event handlers; keep running them
+        await self.fastapi_app.router.startup()
+        yield
+        await self.shutdown()
+        await self.fastapi_app.router.shutdown()
+
+    async def startup(self):
+        """Start background work; run by the app's lifespan.
+
+        Subscribes the config store to change notifications, so configs
+        written by other workers reach :meth:`AppConfigMixin.get_config`.
+        """
+        # Set by AppConfigMixin
+        config_store = getattr(self, "config_store", None)
+        if config_store is not None:
+            await config_store.start()
+
+    async def shutdown(self):
+        """Drain webhooks and release connections; run by the app's lifespan.
+
+        New webhooks are refused while the ones in flight get
+        ``shutdown_grace`` seconds to finish (see
+        :meth:`WebhookHandler.shutdown`). Then the :meth:`on_shutdown`
+        callbacks run, and the config store and dead-letter store are closed.
+        """
+        await self.webhook_handler.shutdown(self.shutdown_grace)
+        for callback in self._shutdown_callbacks:
+            try:
+                result = callback()
+                if result is not None:
+                    await result
+            except Exception:
+                logger.exception("Shutdown callback %r failed", callback)
+        # Set by AppConfigMixin
+        config_store = getattr(self, "config_store", None)
+        for store in (config_store, self.webhook_handler.dead_letters):
+            if store is None:
+                continue
+            try:
+                await store.close()
+            except Exception:
+                logger.exception("Closing %r failed", store)
+
     async def on_install(self, installation: AppInstallation):
         """Override this method to handle app installation"""
 
@@ -0,0 +1,238 @@
+"""
+Response cache for rendered HTMX fragments
+"""
+
+import asyncio
+import functools
+import hashlib
+import inspect
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from email.utils import formatdate, parsedate_to_datetime
+
+from fastapi import Request, Response
+from fastapi.concurrency import run_in_threadpool
+
+from saleor_app_sdk.instrumentation import get_instrumentation
+
+FragmentKey = tuple[str, str, str, tuple[tuple[str, str], ...]]
+
+# Headers that describe the stored body and are recomputed on every reply
+_VOLATILE_HEADERS = frozenset({"content-length", "etag", "last-modified", "date"})
+
+
+def header_installation_key(request: Request) -> str:
+    """Identify the installation from the ``saleor-domain`` header.
+
+    Falls back to the ``domain`` query parameter. The client controls both,
+    so only pass this as ``installation_key`` when fragments show no
+    installation-specific data or a proxy in front of the app sets the header.
+    """
+    return request.headers.get("saleor-domain") or request.query_params.get(
+        "domain", ""
+    )
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return any(tag in {etag, "*"} for tag in candidates)
+
+
+def _not_modified_since(if_modified_since: str | None, last_modified: float) -> bool:
+    if not if_modified_since:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since).timestamp()
+    except (TypeError, ValueError):
+        return False
+    return int(last_modified) <= since
+
+
+@dataclass(slots=True)
+class CachedFragment:
+    """A rendered response body with its validators"""
+
+    body: bytes
+    media_type: str | None
+    headers: dict[str, str]
+    etag: str
+    last_modified: float
+    expires_at: float
+
+    @classmethod
+    def from_response(cls, response: Response, ttl: float) -> "CachedFragment":
+        body = bytes(response.body)
+        return cls(
+            body=body,
+            media_type=response.media_type,
+            headers={
+                key: value
+                for key, value in response.headers.items()
+                if key not in _VOLATILE_HEADERS
+            },
+            etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+            last_modified=time.time(),
+            expires_at=time.monotonic() + ttl,
+        )
+
+    def validators(self) -> dict[str, str]:
+        return {
+            "ETag": self.etag,
+            "Last-Modified": formatdate(self.last_modified, usegmt=True),
+        }
+
+
+class FragmentCache:
+    """LRU cache of rendered fragments keyed by installation, route and params.
+
+    Entries expire after their TTL and can be dropped per installation and
+    route, e.g. when a webhook reports that the underlying data changed.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[FragmentKey, CachedFragment] = OrderedDict()
+
+    def get(self, key: FragmentKey) -> CachedFragment | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: FragmentKey, entry: CachedFragment) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(
+        self, installation: str | None = None, route: str | None = None
+    ) -> int:
+        """Drop matching entries; return how many were dropped"""
+        stale = [
+            key
+            for key in self._entries
+            if (installation is None or key[0] == installation)
+            and (route is None or key[1] == route)
+        ]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _request_parameter(signature: inspect.Signature) -> str | None:
+    for parameter in signature.parameters.values():
+        if parameter.annotation in {Request, "Request"}:
+            return parameter.name
+    return None
+
+
+async def _render(func: Callable, *args, **kwargs):
+    if asyncio.iscoroutinefunction(func):
+        return await func(*args, **kwargs)
+    return await run_in_threadpool(func, *args, **kwargs)
+
+
+def cache_fragment(
+    cache: FragmentCache,
+    route: str,
+    ttl: float,
+    cache_control: str = "private, no-cache",
+    *,
+    installation_key: Callable[[Request], str],
+):
+    """Wrap a GET endpoint so its rendered response is cached and revalidated.
+
+    The endpoint must return a rendered ``Response`` (e.g. a
+    ``TemplateResponse``); other results, non-200 responses and responses
+    marked ``Cache-Control: no-store`` (e.g. error fragments) pass through
+    uncached. Every cached reply carries ``ETag`` and ``Last-Modified`` and
+    conditional requests get a ``304``.
+
+    Entries are shared by every request with the same ``installation_key``,
+    so it must come from an authenticated source, e.g. a verified session or
+    token, not from anything the client can set. Requests whose key is empty
+    bypass the cache.
+    """
+
+    def decorator(func: Callable):
+        signature = inspect.signature(func)
+        request_param = _request_parameter(signature)
+        injected = request_param is None
+        if injected:
+            request_param = "_fragment_request"
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            request: Request = (
+                kwargs.pop(request_param) if injected else kwargs[request_param]
+            )
+            installation = installation_key(request)
+            if not installation:
+                # Unknown installation: its fragment must not be shared
+                return await _render(func, *args, **kwargs)
+            key = (
+                installation,
+                route,
+                request.url.path,
+                tuple(sorted(request.query_params.multi_items())),
+            )
+            entry = cache.get(key)
+            instrumentation = get_instrumentation()
+            if instrumentation is not None:
+                instrumentation.record_cache("fragment", entry is not None)
+
+            if entry is None:
+                response = await _render(func, *args, **kwargs)
+                if (
+                    not isinstance(response, Response)
+                    or response.status_code != 200  # noqa: PLR2004
+                    or not hasattr(response, "body")
+                    or "no-store" in response.headers.get("cache-control", "")
+                ):
+                    return response
+                entry = CachedFragment.from_response(response, ttl)
+                cache.set(key, entry)
+
+            headers = {**entry.validators(), "Cache-Control": cache_control}
+            if etag_matches(request.headers.get("if-none-match"), entry.etag) or (
+                "if-none-match" not in request.headers
+                and _not_modified_since(
+                    request.headers.get("if-modified-since"), entry.last_modified
+                )
+            ):
+                return Response(status_code=304, headers=headers)
+            return Response(
+                content=entry.body,
+                media_type=entry.media_type,
+                headers={**entry.headers, **headers},
+            )
+
+        if injected:
+            wrapper.__signature__ = signature.replace(
+                parameters=[
+                    *signature.parameters.values(),
+                    inspect.Parameter(
+                        request_param,
+                        inspect.Parameter.KEYWORD_ONLY,
+                        annotation=Request,
+                    ),
+                ]
+            )
+        return wrapper
+
+    return decorator
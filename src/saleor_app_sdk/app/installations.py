@@ -0,0 +1,167 @@
+"""
+In-memory installation cache for Saleor apps
+"""
+
+import logging
+import time
+from collections.abc import Awaitable, Callable, Iterator, MutableMapping
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+from saleor_app_sdk.models.installation import AppInstallation, InstallationRecord
+
+if TYPE_CHECKING:
+    from saleor_app_sdk.storage.base import ConfigStore
+
+logger = logging.getLogger(__name__)
+
+Installation = AppInstallation | InstallationRecord
+InstallationLoader = Callable[[str], Awaitable[Installation | None]]
+
+
+def store_loader(store: "ConfigStore") -> InstallationLoader:
+    """Loader reading installations saved by domain in a config store.
+
+    Save each installation with ``store.set(domain, json.loads(
+    installation.model_dump_json()))``, e.g. from ``on_install``. Wrap the
+    store in an :class:`~saleor_app_sdk.storage.EncryptedConfigStore` to keep
+    auth tokens encrypted at rest.
+    """
+
+    async def load(domain: str) -> Installation | None:
+        entry = await store.get(domain)
+        if entry is None:
+            return None
+        return InstallationRecord.model_validate(entry.config)
+
+    return load
+
+
+class InstallationCache(MutableMapping[str, Installation]):
+    """Installations keyed by domain, with idle tracking and eviction.
+
+    Usage is recorded as a :func:`time.monotonic` stamp per domain, so marking
+    an installation as used on the hot path is a single dict store. With
+    ``max_idle`` set, installations unused for longer than that many seconds
+    are evicted by :meth:`evict_idle`, which :meth:`get_active` also runs at
+    most once per ``sweep_interval``. ``on_evict`` is called with each evicted
+    installation, e.g. to persist it before it leaves memory.
+
+    The cache may hold the only copy of an installation's auth token, so
+    ``max_idle`` requires a ``loader``, an async function such as
+    :func:`store_loader`. :meth:`get_active_async` awaits
+    ``loader(domain)`` on a miss and caches what it returns, so evicted
+    installations come back from durable storage.
+    """
+
+    def __init__(
+        self,
+        max_idle: float | None = None,
+        sweep_interval: float | None = None,
+        on_evict: Callable[[Installation], None] | None = None,
+        loader: InstallationLoader | None = None,
+    ):
+        if max_idle is not None and loader is None:
+            error_msg = (
+                "max_idle needs a loader: evicting drops the only copy of an "
+                "installation's auth token"
+            )
+            raise ValueError(error_msg)
+        self.max_idle = max_idle
+        self.sweep_interval = (
+            sweep_interval if sweep_interval is not None else (max_idle or 0) / 4
+        )
+        self.on_evict = on_evict
+        self.loader = loader
+        self._data: dict[str, Installation] = {}
+        self._last_used: dict[str, float] = {}
+        self._last_sweep = time.monotonic()
+
+    def __getitem__(self, domain: str) -> Installation:
+        return self._data[domain]
+
+    def __setitem__(self, domain: str, installation: Installation) -> None:
+        self._data[domain] = installation
+        self._last_used[domain] = time.monotonic()
+
+    def __delitem__(self, domain: str) -> None:
+        del self._data[domain]
+        self._last_used.pop(domain, None)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, domain: object) -> bool:
+        return domain in self._data
+
+    def get(self, domain: str, default=None):
+        return self._data.get(domain, default)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._data!r})"
+
+    def touch(self, domain: str) -> None:
+        """Mark an installation as used now"""
+        if domain in self._data:
+            self._last_used[domain] = time.monotonic()
+
+    def get_active(self, domain: str) -> Installation | None:
+        """Get an installation from memory and mark it as used.
+
+        Evicted installations are not loaded again; use
+        :meth:`get_active_async` when there is a ``loader``.
+        """
+        now = time.monotonic()
+        if self.max_idle is not None and now - self._last_sweep >= self.sweep_interval:
+            self.evict_idle(now=now)
+        installation = self._data.get(domain)
+        if installation is not None:
+            self._last_used[domain] = now
+        return installation
+
+    async def get_active_async(self, domain: str) -> Installation | None:
+        """Get an installation and mark it as used, loading it on a miss"""
+        installation = self.get_active(domain)
+        if installation is None and self.loader is not None:
+            installation = await self.loader(domain)
+            if installation is not None:
+                self[domain] = installation
+        return installation
+
+    def idle_seconds(self, domain: str) -> float | None:
+        last_used = self._last_used.get(domain)
+        return None if last_used is None else time.monotonic() - last_used
+
+    def last_used_at(self, domain: str) -> datetime | None:
+        """Wall-clock time of the last use, derived from the monotonic stamp"""
+        idle = self.idle_seconds(domain)
+        return None if idle is None else datetime.now(UTC) - timedelta(seconds=idle)
+
+    def evict_idle(
+        self, max_idle: float | None = None, now: float | None = None
+    ) -> list[Installation]:
+        """Remove installations idle for longer than ``max_idle`` seconds"""
+        max_idle = self.max_idle if max_idle is None else max_idle
+        now = time.monotonic() if now is None else now
+        self._last_sweep = now
+        if max_idle is None:
+            return []
+
+        cutoff = now - max_idle
+        idle = [domain for domain, used in self._last_used.items() if used < cutoff]
+        evicted = []
+        for domain in idle:
+            installation = self._data.pop(domain)
+            del self._last_used[domain]
+            evicted.append(installation)
+            if self.on_evict is not None:
+                try:
+                    self.on_evict(installation)
+                except Exception:
+                    logger.exception("Installation eviction hook failed")
+        if evicted:
+            logger.info("Evicted %d idle installations", len(evicted))
+        return evicted
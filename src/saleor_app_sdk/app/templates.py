@@ -0,0 +1,180 @@
+"""
+Jinja2 template environment for Saleor apps
+"""
+
+import logging
+import os
+import time
+import weakref
+from collections.abc import AsyncIterator, Mapping, Sequence
+from os import PathLike
+
+import jinja2
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from fastapi.templating import Jinja2Templates
+
+from saleor_app_sdk.instrumentation import get_instrumentation
+
+logger = logging.getLogger(__name__)
+
+# Async overlays of template environments, used for streaming renders
+_async_environments: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+class TimedTemplate(jinja2.Template):
+    """Template that reports render time to the active instrumentation"""
+
+    def render(self, *args, **kwargs) -> str:
+        instrumentation = get_instrumentation()
+        if instrumentation is None:
+            return super().render(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return super().render(*args, **kwargs)
+        finally:
+            instrumentation.observe_template_render(
+                self.name or "<string>", time.perf_counter() - start
+            )
+
+
+def _bytecode_cache(
+    bytecode_cache: str | PathLike | jinja2.BytecodeCache | None,
+) -> jinja2.BytecodeCache | None:
+    if bytecode_cache is None or isinstance(bytecode_cache, jinja2.BytecodeCache):
+        return bytecode_cache
+    if bytecode_cache == "memory":
+        # MemcachedBytecodeCache only needs an object with get/set
+        return jinja2.MemcachedBytecodeCache(_DictClient(), prefix="")
+    os.makedirs(bytecode_cache, exist_ok=True)
+    return jinja2.FileSystemBytecodeCache(str(bytecode_cache))
+
+
+class _DictClient:
+    """Minimal in-process stand-in for a memcached client"""
+
+    def __init__(self):
+        self._data: dict[str, bytes] = {}
+
+    def get(self, key: str) -> bytes | None:
+        return self._data.get(key)
+
+    def set(self, key: str, value: bytes, timeout: int | None = None) -> None:  # noqa: ARG002
+        self._data[key] = value
+
+
+def precompile_templates(
+    templates: Jinja2Templates, extensions: Sequence[str] = ("html",)
+) -> int:
+    """Load and compile every template so no request pays for it.
+
+    With a filesystem bytecode cache this also writes the cache, so it can
+    run as a build step. Returns the number of templates compiled.
+    """
+    env = templates.env
+    names = env.list_templates(extensions=extensions)
+    for name in names:
+        env.get_template(name)
+    logger.info("Precompiled %s templates", len(names))
+    return len(names)
+
+
+def create_templates(
+    directory: str | PathLike,
+    *,
+    production: bool = False,
+    bytecode_cache: str | PathLike | jinja2.BytecodeCache | None = None,
+    precompile: bool = False,
+) -> Jinja2Templates:
+    """Create the Jinja2 templates used by :class:`SaleorApp`.
+
+    ``production=True`` turns off the per-render mtime check
+    (``auto_reload=False``) and keeps compiled bytecode in memory unless
+    ``bytecode_cache`` names a directory (or is a ``jinja2.BytecodeCache``).
+    A shared cache directory lets workers skip compiling templates another
+    worker or a build step already compiled.
+    """
+    if production and bytecode_cache is None:
+        bytecode_cache = "memory"
+    env = jinja2.Environment(
+        loader=jinja2.FileSystemLoader(directory),
+        autoescape=True,
+        auto_reload=not production,
+        bytecode_cache=_bytecode_cache(bytecode_cache),
+    )
+    env.template_class = TimedTemplate
+    templates = Jinja2Templates(env=env)
+    if precompile:
+        precompile_templates(templates)
+    return templates
+
+
+def _async_environment(env: jinja2.Environment) -> jinja2.Environment:
+    if env.is_async:
+        return env
+    async_env = _async_environments.get(env)
+    if async_env is None:
+        # Async templates compile to different code, so they get their own
+        # template cache and skip the (sync) bytecode cache
+        async_env = env.overlay(
+            enable_async=True,
+            cache_size=getattr(env.cache, "capacity", 400),
+            bytecode_cache=None,
+        )
+        _async_environments[env] = async_env
+    return async_env
+
+
+async def _buffered(
+    template: jinja2.Template, context: dict, buffer_size: int
+) -> AsyncIterator[str]:
+    instrumentation = get_instrumentation()
+    start = time.perf_counter()
+    buffer: list[str] = []
+    buffered = 0
+    try:
+        async for chunk in template.generate_async(context):
+            buffer.append(chunk)
+            buffered += len(chunk)
+            if buffered >= buffer_size:
+                yield "".join(buffer)
+                buffer.clear()
+                buffered = 0
+        if buffer:
+            yield "".join(buffer)
+    finally:
+        if instrumentation is not None:
+            instrumentation.observe_template_render(
+                template.name or "<string>", time.perf_counter() - start
+            )
+
+
+def stream_template(  # noqa: PLR0913
+    templates: Jinja2Templates,
+    request: Request,
+    name: str,
+    context: Mapping | None = None,
+    *,
+    status_code: int = 200,
+    headers: Mapping[str, str] | None = None,
+    media_type: str = "text/html",
+    buffer_size: int = 4096,
+) -> StreamingResponse:
+    """Render a template incrementally into a ``StreamingResponse``.
+
+    Unlike ``TemplateResponse`` the page is sent while it renders, so the
+    context may hold async iterators (e.g. :meth:`SaleorGraphQLClient.paginate`)
+    that the template loops over with a plain ``{% for %}``; rows go out as
+    soon as their page arrives. Output is flushed every ``buffer_size``
+    characters.
+    """
+    context = {**(context or {}), "request": request}
+    for processor in templates.context_processors:
+        context.update(processor(request))
+    template = _async_environment(templates.env).get_template(name)
+    return StreamingResponse(
+        _buffered(template, context, buffer_size),
+        status_code=status_code,
+        headers=headers,
+        media_type=media_type,
+    )
@@ -0,0 +1,306 @@
+"""
+Command line interface for Saleor App SDK
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+
+import httpx
+
+from saleor_app_sdk.webhooks.events import SyncWebhookEventType, WebhookEventType
+
+
+def _event_type(value: str) -> WebhookEventType:
+    try:
+        return WebhookEventType(value.upper())
+    except ValueError as e:
+        error_msg = f"unknown webhook event type {value!r}"
+        raise argparse.ArgumentTypeError(error_msg) from e
+
+
+def _any_event_type(value: str) -> WebhookEventType | SyncWebhookEventType:
+    try:
+        return SyncWebhookEventType(value.upper())
+    except ValueError:
+        return _event_type(value)
+
+
+async def bench_webhooks(args: argparse.Namespace) -> dict:
+    """Run a webhook load test and return the report summary"""
+    from saleor_app_sdk.testing.load import (  # noqa: PLC0415
+        WebhookLoadGenerator,
+        load_recorded_payloads,
+    )
+    from saleor_app_sdk.testing.webhooks import WebhookEmitter  # noqa: PLC0415
+
+    recorded = load_recorded_payloads(args.payloads) if args.payloads else None
+    if recorded and args.events:
+        recorded = [delivery for delivery in recorded if delivery[0] in args.events]
+
+    limits = httpx.Limits(
+        max_connections=args.concurrency, max_keepalive_connections=args.concurrency
+    )
+    async with httpx.AsyncClient(limits=limits, timeout=args.timeout) as client:
+        emitter = WebhookEmitter(
+            args.url,
+            args.secret_key,
+            domain=args.domain,
+            saleor_api_url=args.saleor_api_url,
+            client=client,
+        )
+        generator = WebhookLoadGenerator(
+            emitter,
+            events=args.events,
+            recorded=recorded,
+            rps=args.rps,
+            concurrency=args.concurrency,
+        )
+        report = await generator.run(
+            requests=args.requests,
+            duration=None if args.requests else args.duration,
+        )
+
+    if args.json:
+        print(json.dumps(report.summary(), indent=2))  # noqa: T201
+    else:
+        print(report.format_text())  # noqa: T201
+    return report.summary()
+
+
+def compile_templates(args: argparse.Namespace) -> int:
+    """Fill a bytecode cache directory with every compiled template"""
+    from saleor_app_sdk.app.templates import (  # noqa: PLC0415
+        create_templates,
+        precompile_templates,
+    )
+
+    templates = create_templates(
+        args.directory, production=True, bytecode_cache=args.cache_dir
+    )
+    count = precompile_templates(templates, extensions=args.extensions)
+    print(f"Compiled {count} templates into {args.cache_dir}")  # noqa: T201
+    return count
+
+
+def subscription(args: argparse.Namespace) -> str:
+    """Print a minimal subscription query and, with a sample, its size report"""
+    from saleor_app_sdk.webhooks.subscriptions import (  # noqa: PLC0415
+        build_subscription,
+        load_schema,
+        size_report,
+    )
+
+    schema = load_schema(args.schema) if args.schema else None
+    query = build_subscription(args.event, args.fields, schema)
+    print(query)  # noqa: T201
+
+    sample = None
+    if args.sample:
+        with open(args.sample, encoding="utf-8") as file:
+            sample = json.load(file)
+    elif isinstance(args.event, WebhookEventType):
+        from saleor_app_sdk.testing.webhooks import sample_payload  # noqa: PLC0415
+
+        sample = sample_payload(args.event)
+    if sample is not None:
+        original = None
+        if args.original_query:
+            with open(args.original_query, encoding="utf-8") as file:
+                original = file.read()
+        report = size_report(args.event, query, sample, original)
+        print(report.format_text(), file=sys.stderr)  # noqa: T201
+    return query
+
+
+async def dead_letters(args: argparse.Namespace) -> int:
+    """List dead letters of a running app, or replay them at a fixed rate"""
+    headers = {"Authorization": f"Bearer {args.admin_token}"}
+    base_url = f"{args.url.rstrip('/')}/api/admin/dead-letters"
+    async with httpx.AsyncClient(headers=headers, timeout=args.timeout) as client:
+        if args.ids:
+            entries = [{"id": entry_id} for entry_id in args.ids]
+        else:
+            params = {"limit": args.limit}
+            if args.event:
+                params["event_type"] = args.event.value
+            response = await client.get(base_url, params=params)
+            response.raise_for_status()
+            entries = response.json()
+
+        if args.action == "list":
+            for entry in entries:
+                print(json.dumps(entry))  # noqa: T201
+            return 0
+
+        failed = 0
+        interval = 1 / args.rate if args.rate > 0 else 0.0
+        for index, entry in enumerate(entries):
+            if index and interval:
+                await asyncio.sleep(interval)
+            response = await client.post(f"{base_url}/{entry['id']}/replay")
+            replayed = response.is_success and response.json()["replayed"]
+            failed += not replayed
+            print(f"{entry['id']} {'replayed' if replayed else 'failed'}")  # noqa: T201
+        print(  # noqa: T201
+            f"Replayed {len(entries) - failed} of {len(entries)} dead letters",
+            file=sys.stderr,
+        )
+        return 1 if failed else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="saleor-app", description="Saleor App SDK tools"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    bench = subparsers.add_parser(
+        "bench-webhooks",
+        help="Replay signed webhooks against a running app",
+        description=(
+            "Send signed webhook deliveries to a running app at a target rate "
+            "and report throughput, latency percentiles and errors."
+        ),
+    )
+    bench.add_argument("url", help="Base URL of the app, e.g. http://localhost:8000")
+    bench.add_argument(
+        "--secret-key",
+        default=os.getenv("SECRET_KEY"),
+        required=os.getenv("SECRET_KEY") is None,
+        help="Webhook signing key (defaults to $SECRET_KEY)",
+    )
+    bench.add_argument(
+        "--event",
+        dest="events",
+        action="append",
+        type=_event_type,
+        help="Event type to send; repeat for several (default: all)",
+    )
+    bench.add_argument(
+        "--payloads",
+        help="JSONL file or directory of recorded payloads to replay",
+    )
+    bench.add_argument(
+        "--rps", type=float, default=0.0, help="Target rate, 0 for unthrottled"
+    )
+    bench.add_argument("--concurrency", type=int, default=10)
+    bench.add_argument("--duration", type=float, default=10.0, help="Seconds")
+    bench.add_argument(
+        "--requests", type=int, default=None, help="Send N requests instead"
+    )
+    bench.add_argument("--timeout", type=float, default=10.0)
+    bench.add_argument("--domain", default="fake.saleor.local")
+    bench.add_argument("--saleor-api-url", default=None)
+    bench.add_argument("--json", action="store_true", help="Print a JSON report")
+
+    compile_parser = subparsers.add_parser(
+        "compile-templates",
+        help="Precompile Jinja2 templates into a bytecode cache",
+        description=(
+            "Compile every template into a filesystem bytecode cache, e.g. at "
+            "image build time, for apps using "
+            "create_templates(..., bytecode_cache=CACHE_DIR)."
+        ),
+    )
+    compile_parser.add_argument("directory", nargs="?", default="templates")
+    compile_parser.add_argument("--cache-dir", default=".jinja-cache")
+    compile_parser.add_argument(
+        "--extension",
+        dest="extensions",
+        action="append",
+        default=None,
+        help="Template file extension to include; repeat for several (default: html)",
+    )
+
+    subscription_parser = subparsers.add_parser(
+        "subscription",
+        help="Build a minimal webhook subscription query",
+        description=(
+            "Print the smallest subscription query selecting the given dotted "
+            "fields (e.g. order.id order.total.gross.amount), validated against "
+            "a schema, and report how much smaller the payload gets."
+        ),
+    )
+    subscription_parser.add_argument("event", type=_any_event_type)
+    subscription_parser.add_argument("fields", nargs="+")
+    subscription_parser.add_argument(
+        "--schema", help="Saleor schema as SDL or introspection JSON"
+    )
+    subscription_parser.add_argument(
+        "--sample",
+        help="Payload JSON delivered for the current query (default: a synthetic one)",
+    )
+    subscription_parser.add_argument(
+        "--original-query", help="File with the current subscription query"
+    )
+
+    dead_letters_parser = subparsers.add_parser(
+        "dead-letters",
+        help="Inspect and replay dead-lettered webhooks of a running app",
+        description=(
+            "List the webhooks a running app dead-lettered after its handler "
+            "kept failing, or replay them at a controlled rate. The app needs "
+            "a dead-letter store and an admin token."
+        ),
+    )
+    dead_letters_parser.add_argument("action", choices=["list", "replay"])
+    dead_letters_parser.add_argument("url", help="Base URL of the app")
+    dead_letters_parser.add_argument(
+        "--admin-token",
+        default=os.getenv("SALEOR_APP_ADMIN_TOKEN"),
+        required=os.getenv("SALEOR_APP_ADMIN_TOKEN") is None,
+        help="Admin token of the app (defaults to $SALEOR_APP_ADMIN_TOKEN)",
+    )
+    dead_letters_parser.add_argument("--event", type=_event_type)
+    dead_letters_parser.add_argument("--limit", type=int, default=100)
+    dead_letters_parser.add_argument(
+        "--id", dest="ids", action="append", help="Entry to replay; repeat for several"
+    )
+    dead_letters_parser.add_argument(
+        "--rate", type=float, default=1.0, help="Replays per second, 0 for unthrottled"
+    )
+    dead_letters_parser.add_argument("--timeout", type=float, default=30.0)
+
+    subparsers.add_parser(
+        "fake-saleor",
+        help="Serve a fake Saleor GraphQL API",
+        add_help=False,
+    )
+    return parser
+
+
+def cli(argv: list[str] | None = None) -> int:
+    """Entry point for the ``saleor-app`` command"""
+    argv = sys.argv[1:] if argv is None else argv
+    parser = build_parser()
+    args, extra = parser.parse_known_args(argv)
+
+    if args.command == "fake-saleor":
+        from saleor_app_sdk.testing.fake_saleor import main  # noqa: PLC0415
+
+        main(extra)
+        return 0
+
+    if extra:
+        parser.error(f"unrecognized arguments: {' '.join(extra)}")
+    if args.command == "compile-templates":
+        args.extensions = args.extensions or ["html"]
+        compile_templates(args)
+        return 0
+    if args.command == "subscription":
+        try:
+            subscription(args)
+        except ValueError as e:
+            parser.error(str(e))
+        return 0
+    if args.command == "dead-letters":
+        return asyncio.run(dead_letters(args))
+    summary = asyncio.run(bench_webhooks(args))
+    return 1 if summary["requests"] and not summary["succeeded"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(cli())
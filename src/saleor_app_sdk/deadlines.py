@@ -0,0 +1,100 @@
+"""
+Request-scoped deadlines
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+
+from saleor_app_sdk.instrumentation import get_instrumentation
+
+# Monotonic time by which the current request must be answered
+_deadline: ContextVar[float | None] = ContextVar("saleor_app_deadline", default=None)
+
+
+class DeadlineExceededError(TimeoutError):
+    """Raised when work is given up because the request's deadline passed"""
+
+    def __init__(self, operation: str):
+        super().__init__(f"Deadline exceeded during {operation}")
+        self.operation = operation
+
+
+@contextmanager
+def deadline(seconds: float | None) -> Iterator[float | None]:
+    """Give the work inside the block ``seconds`` to finish.
+
+    Deadlines only ever shrink: inside an outer deadline, the earlier of the
+    two applies. The deadline is held in a context variable, so it follows
+    the request into tasks it starts. Yields the seconds left, or None when
+    there is no deadline.
+    """
+    current = _deadline.get()
+    if seconds is not None:
+        new = time.monotonic() + seconds
+        if current is None or new < current:
+            current = new
+    token = _deadline.set(current)
+    try:
+        yield remaining()
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> float | None:
+    """Seconds left until the current deadline, or None without one"""
+    current = _deadline.get()
+    return None if current is None else current - time.monotonic()
+
+
+def exceeded(operation: str) -> DeadlineExceededError:
+    """Record that ``operation`` ran out of time and return the error to raise"""
+    instrumentation = get_instrumentation()
+    if instrumentation is not None:
+        instrumentation.observe_deadline_exceeded(operation)
+    return DeadlineExceededError(operation)
+
+
+def check(operation: str) -> float | None:
+    """Return the seconds left, raising when the deadline already passed"""
+    left = remaining()
+    if left is not None and left <= 0:
+        raise exceeded(operation)
+    return left
+
+
+@asynccontextmanager
+async def limit(operation: str) -> AsyncIterator[None]:
+    """Cancel the block when the current deadline passes.
+
+    Raises :class:`DeadlineExceededError` instead of starting when no time
+    is left. Without a deadline the block runs unbounded.
+    """
+    left = check(operation)
+    if left is None:
+        yield
+        return
+    try:
+        async with asyncio.timeout(left) as timeout:
+            yield
+    except TimeoutError as e:
+        if not timeout.expired():
+            raise
+        raise exceeded(operation) from e
+
+
+class DeadlineMiddleware:
+    """ASGI middleware giving every HTTP request ``seconds`` to be answered"""
+
+    def __init__(self, app, seconds: float):
+        self.app = app
+        self.seconds = seconds
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with deadline(self.seconds):
+            await self.app(scope, receive, send)
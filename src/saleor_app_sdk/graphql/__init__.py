@@ -2,7 +2,22 @@
 GraphQL-related functionality for Saleor App SDK
 """
 
-from .client import SaleorGraphQLClient
-from .queries import SaleorQueries
+from typing import TYPE_CHECKING
 
-__all__ = ["SaleorGraphQLClient", "SaleorQueries"]
+from saleor_app_sdk._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .client import SaleorGraphQLClient
+    from .queries import SaleorQueries
+
+_EXPORTS = {
+    "SaleorGraphQLClient": ".client",
+    "SaleorQueries": ".queries",
+}
+
+__all__ = [
+    "SaleorGraphQLClient",
+    "SaleorQueries",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
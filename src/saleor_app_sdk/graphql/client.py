@@ -3,20 +3,38 @@ GraphQL client for Saleor API
 """
 
 import logging
+from collections.abc import AsyncIterator
+from urllib.parse import urlparse
 
 from gql import Client
-from gql.transport.httpx import HTTPXTransport
+from gql.transport.httpx import HTTPXAsyncTransport, HTTPXTransport
+
+from saleor_app_sdk import deadlines
+from saleor_app_sdk.graphql.singleflight import SingleFlight, request_key
+from saleor_app_sdk.instrumentation import get_instrumentation, graphql_span
 
 logger = logging.getLogger(__name__)
 
+# Shared by all clients, since a client is usually created per request
+_in_flight = SingleFlight()
+
+
+def _response_size(transport) -> int | None:
+    """Body size of the transport's last response, if Saleor reported it"""
+    headers = getattr(transport, "response_headers", None)
+    length = headers.get("content-length") if headers is not None else None
+    return int(length) if length is not None else None
+
 
 class SaleorGraphQLClient:
     """Enhanced GraphQL client for Saleor API"""
 
-    def __init__(self, api_url: str, auth_token: str):
+    def __init__(self, api_url: str, auth_token: str, *, coalesce: bool = True):
         self.api_url = api_url
         self.auth_token = auth_token
+        self.coalesce = coalesce
         self._client = None
+        self._async_client = None
 
     @property
     def client(self) -> Client:
@@ -27,15 +45,119 @@ class SaleorGraphQLClient:
             self._client = Client(transport=transport, fetch_schema_from_transport=True)
         return self._client
 
+    @property
+    def async_client(self) -> Client:
+        """Client backed by an async transport, used by :meth:`execute_async`"""
+        if self._async_client is None:
+            transport = HTTPXAsyncTransport(
+                url=self.api_url, headers={"Authorization": f"Bearer {self.auth_token}"}
+            )
+            self._async_client = Client(
+                transport=transport, fetch_schema_from_transport=True
+            )
+        return self._async_client
+
+    @property
+    def installation(self) -> str:
+        """Saleor domain this client talks to, used to label metrics"""
+        return urlparse(self.api_url).netloc
+
     async def execute(self, query, variables: dict | None = None):
         """Execute GraphQL query/mutation"""
+        # Blocking calls cannot be cancelled, but need not start too late
+        deadlines.check("graphql")
+        instrumentation = get_instrumentation()
         try:
-            return self.client.execute(query, variable_values=variables or {})
+            if instrumentation is None:
+                return self.client.execute(query, variable_values=variables or {})
+            with graphql_span(
+                instrumentation, query, variables or {}, self.installation
+            ) as outcome:
+                outcome["result"] = self.client.execute(
+                    query,
+                    variable_values=variables or {},
+                    extra_args={"headers": instrumentation.trace_headers()},
+                )
+                outcome["response_size"] = _response_size(self.client.transport)
+                return outcome["result"]
         except Exception:
             logger.exception("GraphQL execution failed")
             raise
 
     async def execute_async(self, query, variables: dict | None = None):
-        """Execute GraphQL query/mutation asynchronously"""
-        async with self.client as session:
-            return await session.execute(query, variable_values=variables or {})
+        """Execute GraphQL query/mutation asynchronously
+
+        Identical queries (same installation, document and variables) that
+        are already in flight share that request and its result instead of
+        sending another one; callers must treat the result as read-only.
+        Mutations are always sent.
+
+        Inside a request deadline (see :mod:`saleor_app_sdk.deadlines`), the
+        call is cancelled when it passes and
+        :class:`~saleor_app_sdk.deadlines.DeadlineExceededError` is raised.
+        """
+        async with deadlines.limit("graphql"):
+            return await self._execute_shared(query, variables or {})
+
+    async def _execute_shared(self, query, variables: dict):
+        key = (
+            request_key(f"{self.api_url} {self.auth_token}", query, variables)
+            if self.coalesce
+            else None
+        )
+        if key is None:
+            return await self._execute_async(query, variables)
+
+        result, shared = await _in_flight.do(
+            key, lambda: self._execute_async(query, variables)
+        )
+        instrumentation = get_instrumentation()
+        if instrumentation is not None:
+            instrumentation.record_cache("graphql_in_flight", shared)
+        return result
+
+    async def _execute_async(self, query, variables: dict):
+        instrumentation = get_instrumentation()
+        async with self.async_client as session:
+            if instrumentation is None:
+                return await session.execute(query, variable_values=variables)
+            with graphql_span(
+                instrumentation, query, variables, self.installation
+            ) as outcome:
+                outcome["result"] = await session.execute(
+                    query,
+                    variable_values=variables,
+                    extra_args={"headers": instrumentation.trace_headers()},
+                )
+                outcome["response_size"] = _response_size(self.async_client.transport)
+                return outcome["result"]
+
+    async def paginate(
+        self,
+        query,
+        connection: str,
+        variables: dict | None = None,
+        *,
+        page_size: int = 100,
+    ) -> AsyncIterator[dict]:
+        """Yield the nodes of a connection, fetching one page at a time.
+
+        ``connection`` is the dotted path to the connection in the result,
+        e.g. ``"products"``; the query must accept ``$first`` and ``$after``
+        and select ``pageInfo { hasNextPage endCursor }``. Nodes of a page are
+        yielded before the next page is requested, so consumers can start
+        working on them straight away.
+        """
+        after = None
+        while True:
+            result = await self.execute_async(
+                query, {**(variables or {}), "first": page_size, "after": after}
+            )
+            for key in connection.split("."):
+                result = result[key]
+            for edge in result["edges"]:
+                yield edge["node"]
+            page_info = result["pageInfo"]
+            if not page_info["hasNextPage"]:
+                return
+            after = page_info["endCursor"]
@@ -2,13 +2,34 @@
 Pre-built GraphQL queries for common operations
 """
 
-from gql import gql
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from graphql import DocumentNode
+
+
+class _LazyDocument:
+    """Class attribute holding a GraphQL document parsed on first access"""
+
+    def __init__(self, source: str):
+        self.source = source
+        self._document: DocumentNode | None = None
+
+    def __get__(self, instance, owner=None) -> "DocumentNode":
+        if self._document is None:
+            from gql import gql  # noqa: PLC0415
+
+            self._document = gql(self.source)
+        return self._document
 
 
 class SaleorQueries:
-    """Pre-built GraphQL queries for common operations"""
+    """Pre-built GraphQL queries for common operations
+
+    Documents are parsed the first time each one is used.
+    """
 
-    APP_INFO = gql("""
+    APP_INFO = _LazyDocument("""
         query GetApp {
             app {
                 id
@@ -22,7 +43,7 @@ class SaleorQueries:
         }
     """)
 
-    ORDERS_LIST = gql("""
+    ORDERS_LIST = _LazyDocument("""
         query GetOrders($first: Int!, $after: String) {
             orders(first: $first, after: $after) {
                 pageInfo {
@@ -53,7 +74,7 @@ class SaleorQueries:
         }
     """)
 
-    PRODUCT_LIST = gql("""
+    PRODUCT_LIST = _LazyDocument("""
         query GetProducts($first: Int!, $after: String) {
             products(first: $first, after: $after) {
                 pageInfo {
@@ -0,0 +1,82 @@
+"""
+Coalescing of identical concurrent GraphQL queries
+"""
+
+import asyncio
+import hashlib
+import json
+import weakref
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+# Per document: hash of the query text, or None when it must not be shared
+_query_hashes: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def query_hash(document) -> str | None:
+    """Hash a document's text, or return None unless it only holds queries.
+
+    Mutations and subscriptions have side effects, so they are never shared.
+    Documents that are not parsed (e.g. plain strings) are not shared either.
+    """
+    definitions = getattr(document, "definitions", None)
+    if not definitions:
+        return None
+    if document in _query_hashes:
+        return _query_hashes[document]
+    if any(
+        getattr(definition, "operation", None) is not None
+        and definition.operation.value != "query"
+        for definition in definitions
+    ):
+        digest = None
+    else:
+        from graphql import print_ast  # noqa: PLC0415
+
+        source = document.loc.source.body if document.loc else print_ast(document)
+        digest = hashlib.sha256(source.encode()).hexdigest()
+    _query_hashes[document] = digest
+    return digest
+
+
+def request_key(installation: str, document, variables: dict) -> Hashable | None:
+    """Key identical requests by installation, query hash and variables"""
+    digest = query_hash(document)
+    if digest is None:
+        return None
+    return installation, digest, json.dumps(variables, sort_keys=True, default=str)
+
+
+class SingleFlight:
+    """Share one in-flight call between concurrent callers with the same key.
+
+    The first caller starts the call; callers arriving before it finishes
+    await the same result (or exception) instead of starting their own.
+    Nothing is cached once the call completes. A caller being cancelled
+    does not cancel the shared call for the others.
+    """
+
+    def __init__(self):
+        self._calls: dict[Hashable, asyncio.Task] = {}
+
+    async def do(
+        self, key: Hashable, call: Callable[[], Awaitable[Any]]
+    ) -> tuple[Any, bool]:
+        """Run ``call`` unless one is in flight for ``key``.
+
+        Returns the result and whether it was shared with an earlier caller.
+        """
+        task = self._calls.get(key)
+        shared = task is not None and task.get_loop() is asyncio.get_running_loop()
+        if not shared:
+            task = asyncio.ensure_future(call())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(task), shared
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+
+    def __len__(self) -> int:
+        return len(self._calls)
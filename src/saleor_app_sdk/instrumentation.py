@@ -0,0 +1,477 @@
+"""
+Optional metrics and tracing for SDK internals
+
+Instrumentation is off by default: hot paths call :func:`get_instrumentation`
+and skip all timing work when it returns None. Enable it by passing an
+:class:`Instrumentation` to :class:`~saleor_app_sdk.app.core.SaleorApp` or by
+calling :func:`set_instrumentation`.
+"""
+
+import json
+import time
+import weakref
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, nullcontext
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from graphql import DocumentNode
+
+PoolSampler = Callable[[], tuple[int, int]]
+
+# Beyond this many, installation labels are merged so series stay bounded
+DEFAULT_MAX_INSTALLATION_LABELS = 1000
+
+# Per document: length of its query text, so it is not printed on every call
+_query_sizes: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+_instrumentation: "Instrumentation | None" = None
+
+
+def get_instrumentation() -> "Instrumentation | None":
+    """Return the active instrumentation, or None when disabled"""
+    return _instrumentation
+
+
+def set_instrumentation(instrumentation: "Instrumentation | None") -> None:
+    """Enable instrumentation process-wide, or disable it with None"""
+    global _instrumentation  # noqa: PLW0603
+    _instrumentation = instrumentation
+
+
+def operation_name(document: "DocumentNode | str") -> str:
+    """Name of the first named operation in a GraphQL document"""
+    for definition in getattr(document, "definitions", ()):
+        if definition.kind == "operation_definition" and definition.name:
+            return definition.name.value
+    return "anonymous"
+
+
+class StageTimer:
+    """Report the time between successive :meth:`lap` calls as webhook stages"""
+
+    __slots__ = ("_instrumentation", "_last", "event_type")
+
+    def __init__(self, instrumentation: "Instrumentation", event_type: str):
+        self._instrumentation = instrumentation
+        self.event_type = event_type
+        self._last = time.perf_counter()
+
+    def lap(self, stage: str) -> None:
+        now = time.perf_counter()
+        self._instrumentation.observe_webhook_stage(
+            self.event_type, stage, now - self._last
+        )
+        self._last = now
+
+
+class Instrumentation:
+    """Instrumentation hooks called by the SDK.
+
+    The base class records nothing; subclasses override the ``observe_*``
+    methods. Passing an OpenTelemetry ``tracer`` enables spans, which nest
+    through the current context so a webhook's span is the parent of the
+    GraphQL calls its handler makes.
+    """
+
+    def __init__(self, tracer: Any | None = None):
+        self.tracer = tracer
+        self._pools: dict[str, PoolSampler] = {}
+
+    def span(self, name: str, **attributes):
+        """Start a span as the current span, or do nothing without a tracer"""
+        if self.tracer is None:
+            return nullcontext()
+        return self.tracer.start_as_current_span(name, attributes=attributes)
+
+    def trace_headers(self) -> dict[str, str]:
+        """Propagation headers for the current span, for outbound requests"""
+        if self.tracer is None:
+            return {}
+        from opentelemetry.propagate import inject  # noqa: PLC0415
+
+        headers: dict[str, str] = {}
+        inject(headers)
+        return headers
+
+    def webhook_timer(self, event_type: str) -> StageTimer:
+        return StageTimer(self, event_type)
+
+    def observe_webhook_stage(self, event_type: str, stage: str, seconds: float):
+        """Time spent in one stage (receive, verify, decode, handler, batch)"""
+
+    def observe_webhook_result(self, event_type: str, outcome: str):
+        """Count a processed webhook by outcome (ok, invalid_signature, error)"""
+
+    def observe_sync_webhook(self, event_type: str, outcome: str, seconds: float):
+        """Time a sync webhook handler took to answer (ok, timeout, error)"""
+
+    def observe_webhook_batch(self, event_type: str, size: int, seconds: float):
+        """Size of a batch handed to a batch handler and time it took"""
+
+    def observe_partition_lag(self, partition: str, seconds: float):
+        """Time a webhook waited in its partition before its handler ran"""
+
+    def observe_webhook_retry(self, event_type: str):
+        """Count a local retry of a failed webhook handler"""
+
+    def observe_dead_letter(self, event_type: str, outcome: str):
+        """Count dead letters by outcome (stored, replayed, replay_failed)"""
+
+    def observe_webhook_shed(self, event_type: str, reason: str):
+        """Count a webhook rejected by admission control"""
+
+    def observe_tenant_webhook(self, installation: str, wait: float, seconds: float):
+        """Time a webhook queued for its installation's slot and then ran"""
+
+    def observe_deadline_exceeded(self, operation: str):
+        """Count work given up because the request's deadline passed"""
+
+    def observe_abandoned(self, kind: str, count: int):
+        """Count work left unfinished when the app shut down"""
+
+    def observe_graphql(  # noqa: PLR0913
+        self,
+        operation: str,
+        installation: str,
+        seconds: float,
+        *,
+        request_size: int,
+        response_size: int,
+        error: bool,
+    ):
+        """Latency and payload sizes of an outbound GraphQL request"""
+
+    def record_cache(self, cache: str, hit: bool):
+        """Count a lookup in one of the SDK's caches"""
+
+    def observe_template_render(self, template: str, seconds: float):
+        """Time spent rendering a Jinja2 template"""
+
+    def register_pool(self, name: str, sampler: PoolSampler) -> None:
+        """Track a connection pool; ``sampler`` returns ``(in_use, size)``"""
+        self._pools[name] = sampler
+
+    def unregister_pool(self, name: str) -> None:
+        self._pools.pop(name, None)
+
+    def sample_pools(self) -> Iterator[tuple[str, int, int]]:
+        for name, sampler in list(self._pools.items()):
+            in_use, size = sampler()
+            yield name, in_use, size
+
+    def render_metrics(self) -> tuple[bytes, str] | None:
+        """Metrics in an exposition format with its content type, if any"""
+        return None
+
+
+class PrometheusInstrumentation(Instrumentation):
+    """Record SDK metrics with ``prometheus_client``.
+
+    Metrics live in their own registry (or the one passed in) and are served
+    by the app's ``/metrics`` endpoint. Installation labels are capped at
+    ``max_installations`` distinct values; later installations are recorded
+    as ``other``.
+    """
+
+    def __init__(
+        self,
+        registry: Any | None = None,
+        namespace: str = "saleor_app",
+        tracer: Any | None = None,
+        max_installations: int = DEFAULT_MAX_INSTALLATION_LABELS,
+    ):
+        super().__init__(tracer=tracer)
+        self.max_installations = max_installations
+        self._installations: set[str] = set()
+        try:
+            import prometheus_client  # noqa: PLC0415
+        except ImportError as e:
+            error_msg = (
+                "prometheus-client is required for PrometheusInstrumentation; "
+                "install saleor-app-sdk[observability]"
+            )
+            raise ImportError(error_msg) from e
+
+        self._prometheus = prometheus_client
+        self.registry = registry or prometheus_client.CollectorRegistry()
+        self.webhook_stage_seconds = prometheus_client.Histogram(
+            "webhook_stage_seconds",
+            "Time spent per webhook processing stage",
+            ["event_type", "stage"],
+            namespace=namespace,
+            registry=self.registry,
+        )
+        self.webhooks = prometheus_client.Counter(
+            "webhooks",
+            "Processed webhooks by outcome",
+            ["event_type", "outcome"],
+            namespace=namespace,
+            registry=self.registry,
+        )
+        self.sync_webhook_seconds = prometheus_client.Histogram(
+            "sync_webhook_seconds",
+            "Time sync webhook handlers took to answer Saleor",
+            ["event_type", "outcome"],
+            buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10),
+            namespace=namespace,
+            registry=self.registry,
+        )
+        self.webhook_batch_size = prometheus_client.Histogram(
+            "webhook_batch_size",
+            "Webhook events handed to batch handlers at once",
+            ["event_type"],
+            buckets=(1, 5, 10, 25, 50, 100, 250, 500, 1000),
+            namespace=namespace,
+            registry=self.registry,
+        )
+        self.webhook_batch_seconds = prometheus_client.Histogram(
+            "webhook_batch_seconds",
+            "Time batch handlers took per batch",
+            ["event_type"],
+            namespace=namespace,
+            registry=self.registry,
+        )
+        self.webhook_partition_lag_seconds = prometheus_client.Histogram(
+            "webhook_partition_lag_seconds",
+            "Time webhooks waited for their partition's worker",
+            ["partition"],
+            namespace=namespace,
+            registry=self.registry,
+        )
+        self.webhook_retries = prometheus_client.Counter(
+            "webhook_retries",
+            "Local retries of failed webhook handlers",
+            ["event_type"],
+            namespace=namespace,
+            registry=self.registry,
+        )
+        self.dead_letters = prometheus_client.Counter(
+            "dead_letters",
+            "Dead-lettered webhooks and their replays by outcome",
+            ["event_type", "outcome"],
+            namespace=namespace,
+            registry=self.registry,
+        )
+        self.webhooks_shed = prometheus_client.Counter(
+            "webhooks_shed",
+            "Webhooks rejected by admission control",
+            ["event_type", "reason"],
+            namespace=namespace,
+            registry=self.registry,
+        )
+        self.tenant_queue_seconds = prometheus_client.Histogram(
+            "tenant_queue_seconds",
+            "Time webhooks waited for a slot of their installation",
+            ["installation"],
+            namespace=namespace,
+            registry=self.registry,
+        )
+        self.tenant_webhook_seconds = prometheus_client.Histogram(
+            "tenant_webhook_seconds",
+            "Webhook processing time per installation",
+            ["installation"],
+            namespace=namespace,
+            registry=self.registry,
+        )
+        self.deadlines_exceeded = prometheus_client.Counter(
+            "deadlines_exceeded",
+            "Operations given up because the request's deadline passed",
+            ["operation"],
+            namespace=namespace,
+            registry=self.registry,
+        )
+        self.abandoned_work = prometheus_client.Counter(
+            "abandoned_work",
+            "Webhooks, batched events and queued calls left unfinished at shutdown",
+            ["kind"],
+            namespace=namespace,
+            registry=self.registry,
+        )
+        self.graphql_seconds = prometheus_client.Histogram(
+            "graphql_request_seconds",
+            "Outbound GraphQL request latency",
+            ["operation", "installation"],
+            namespace=namespace,
+            registry=self.registry,
+        )
+        self.graphql_request_bytes = prometheus_client.Histogram(
+            "graphql_request_bytes",
+            "Outbound GraphQL request payload size",
+            ["operation"],
+            buckets=(256, 1024, 4096, 16384, 65536, 262144, 1048576),
+            namespace=namespace,
+            registry=self.registry,
+        )
+        self.graphql_response_bytes = prometheus_client.Histogram(
+            "graphql_response_bytes",
+            "Outbound GraphQL response payload size",
+            ["operation"],
+            buckets=(256, 1024, 4096, 16384, 65536, 262144, 1048576),
+            namespace=namespace,
+            registry=self.registry,
+        )
+        self.graphql_errors = prometheus_client.Counter(
+            "graphql_errors",
+            "Failed outbound GraphQL requests",
+            ["operation", "installation"],
+            namespace=namespace,
+            registry=self.registry,
+        )
+        self.cache_lookups = prometheus_client.Counter(
+            "cache_lookups",
+            "Cache lookups by cache and result",
+            ["cache", "result"],
+            namespace=namespace,
+            registry=self.registry,
+        )
+        self.template_render_seconds = prometheus_client.Histogram(
+            "template_render_seconds",
+            "Jinja2 template render time",
+            ["template"],
+            buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25),
+            namespace=namespace,
+            registry=self.registry,
+        )
+        pool_in_use = prometheus_client.Gauge(
+            "pool_connections_in_use",
+            "Connections checked out of a pool",
+            ["pool"],
+            namespace=namespace,
+            registry=self.registry,
+        )
+        pool_size = prometheus_client.Gauge(
+            "pool_connections",
+            "Connections currently open in a pool",
+            ["pool"],
+            namespace=namespace,
+            registry=self.registry,
+        )
+        self._pool_gauges = (pool_in_use, pool_size)
+
+    def observe_webhook_stage(self, event_type: str, stage: str, seconds: float):
+        self.webhook_stage_seconds.labels(event_type, stage).observe(seconds)
+
+    def observe_webhook_result(self, event_type: str, outcome: str):
+        self.webhooks.labels(event_type, outcome).inc()
+
+    def observe_sync_webhook(self, event_type: str, outcome: str, seconds: float):
+        self.sync_webhook_seconds.labels(event_type, outcome).observe(seconds)
+
+    def observe_webhook_batch(self, event_type: str, size: int, seconds: float):
+        self.webhook_batch_size.labels(event_type).observe(size)
+        self.webhook_batch_seconds.labels(event_type).observe(seconds)
+
+    def observe_partition_lag(self, partition: str, seconds: float):
+        self.webhook_partition_lag_seconds.labels(partition).observe(seconds)
+
+    def observe_webhook_retry(self, event_type: str):
+        self.webhook_retries.labels(event_type).inc()
+
+    def observe_dead_letter(self, event_type: str, outcome: str):
+        self.dead_letters.labels(event_type, outcome).inc()
+
+    def observe_webhook_shed(self, event_type: str, reason: str):
+        self.webhooks_shed.labels(event_type, reason).inc()
+
+    def _installation_label(self, installation: str) -> str:
+        if installation in self._installations:
+            return installation
+        if len(self._installations) >= self.max_installations:
+            return "other"
+        self._installations.add(installation)
+        return installation
+
+    def observe_tenant_webhook(self, installation: str, wait: float, seconds: float):
+        installation = self._installation_label(installation)
+        self.tenant_queue_seconds.labels(installation).observe(wait)
+        self.tenant_webhook_seconds.labels(installation).observe(seconds)
+
+    def observe_deadline_exceeded(self, operation: str):
+        self.deadlines_exceeded.labels(operation).inc()
+
+    def observe_abandoned(self, kind: str, count: int):
+        self.abandoned_work.labels(kind).inc(count)
+
+    def observe_graphql(  # noqa: PLR0913
+        self,
+        operation: str,
+        installation: str,
+        seconds: float,
+        *,
+        request_size: int,
+        response_size: int,
+        error: bool,
+    ):
+        installation = self._installation_label(installation)
+        self.graphql_seconds.labels(operation, installation).observe(seconds)
+        self.graphql_request_bytes.labels(operation).observe(request_size)
+        if error:
+            self.graphql_errors.labels(operation, installation).inc()
+        else:
+            self.graphql_response_bytes.labels(operation).observe(response_size)
+
+    def record_cache(self, cache: str, hit: bool):
+        self.cache_lookups.labels(cache, "hit" if hit else "miss").inc()
+
+    def observe_template_render(self, template: str, seconds: float):
+        self.template_render_seconds.labels(template).observe(seconds)
+
+    def render_metrics(self) -> tuple[bytes, str]:
+        pool_in_use, pool_size = self._pool_gauges
+        for name, in_use, size in self.sample_pools():
+            pool_in_use.labels(name).set(in_use)
+            pool_size.labels(name).set(size)
+        return (
+            self._prometheus.generate_latest(self.registry),
+            self._prometheus.CONTENT_TYPE_LATEST,
+        )
+
+
+def _query_size(document: "DocumentNode") -> int:
+    """Length of a document's query text, printed once per document"""
+    size = _query_sizes.get(document)
+    if size is None:
+        from graphql import print_ast  # noqa: PLC0415
+
+        source = document.loc.source.body if document.loc else print_ast(document)
+        size = _query_sizes[document] = len(source)
+    return size
+
+
+@contextmanager
+def graphql_span(
+    instrumentation: Instrumentation,
+    document: "DocumentNode",
+    variables: dict,
+    installation: str,
+) -> Iterator[dict]:
+    """Time an outbound GraphQL call; the caller stores the result in the dict.
+
+    The caller should also store ``response_size``, the body size of the HTTP
+    response; without it the result is serialized again to measure it.
+    """
+    operation = operation_name(document)
+    outcome: dict = {"result": None, "response_size": None}
+    request_size = _query_size(document) + len(json.dumps(variables, default=str))
+    start = time.perf_counter()
+    error = True
+    with instrumentation.span(
+        "saleor.graphql",
+        **{"graphql.operation.name": operation, "saleor.domain": installation},
+    ):
+        try:
+            yield outcome
+            error = False
+        finally:
+            response_size = 0 if error else outcome["response_size"]
+            if response_size is None:
+                response_size = len(json.dumps(outcome["result"], default=str))
+            instrumentation.observe_graphql(
+                operation,
+                installation,
+                time.perf_counter() - start,
+                request_size=request_size,
+                response_size=response_size,
+                error=error,
+            )
@@ -2,8 +2,27 @@
 Data models for Saleor App SDK
 """
 
-from .app_manifest import AppManifest
-from .installation import AppInstallation
-from .webhooks import WebhookDefinition
+from typing import TYPE_CHECKING
 
-__all__ = ["AppInstallation", "AppManifest", "WebhookDefinition"]
+from saleor_app_sdk._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .app_manifest import AppManifest
+    from .installation import AppInstallation, InstallationRecord
+    from .webhooks import WebhookDefinition
+
+_EXPORTS = {
+    "AppInstallation": ".installation",
+    "AppManifest": ".app_manifest",
+    "InstallationRecord": ".installation",
+    "WebhookDefinition": ".webhooks",
+}
+
+__all__ = [
+    "AppInstallation",
+    "AppManifest",
+    "InstallationRecord",
+    "WebhookDefinition",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
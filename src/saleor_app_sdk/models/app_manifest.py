@@ -9,8 +9,15 @@ from saleor_app_sdk.permissions import SaleorPermission
 from .webhooks import WebhookDefinition
 
 
-@dataclass
+@dataclass(slots=True)
 class AppManifest:
+    """The app's manifest, served at ``/api/manifest``.
+
+    Left mutable because :class:`~saleor_app_sdk.SaleorAppBuilder` fills it
+    in step by step; after changing it in place on a running app, call
+    :meth:`~saleor_app_sdk.SaleorApp.invalidate_manifest_cache`.
+    """
+
     id: str
     name: str
     version: str
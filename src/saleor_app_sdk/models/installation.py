@@ -2,9 +2,15 @@
 App installation model for Saleor App SDK
 """
 
+import json
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC)
 
 
 class AppInstallation(BaseModel):
@@ -13,4 +19,85 @@ class AppInstallation(BaseModel):
     auth_token: str
     domain: str
     saleor_api_url: str
-    installed_at: datetime = datetime.now(UTC)
+    installed_at: datetime = Field(default_factory=_utcnow)
+    token_refreshed_at: datetime | None = None
+
+    def with_token(self, auth_token: str) -> "AppInstallation":
+        """Return a copy carrying a new token, stamped with the refresh time"""
+        return self.model_copy(
+            update={"auth_token": auth_token, "token_refreshed_at": _utcnow()}
+        )
+
+
+def _isoformat(value: datetime) -> str:
+    # Match pydantic's JSON output for UTC datetimes
+    return value.isoformat().replace("+00:00", "Z")
+
+
+@dataclass(slots=True, frozen=True)
+class InstallationRecord:
+    """Compact, immutable counterpart of :class:`AppInstallation`.
+
+    Construction skips validation, so use it for trusted data such as rows
+    loaded from storage or installations already validated on registration.
+    Exposes the same attributes and ``model_*`` helpers as the pydantic model.
+    """
+
+    auth_token: str
+    domain: str
+    saleor_api_url: str
+    installed_at: datetime = field(default_factory=_utcnow)
+    token_refreshed_at: datetime | None = None
+
+    @classmethod
+    def from_installation(cls, installation: AppInstallation) -> "InstallationRecord":
+        return cls(
+            installation.auth_token,
+            installation.domain,
+            installation.saleor_api_url,
+            installation.installed_at,
+            installation.token_refreshed_at,
+        )
+
+    @classmethod
+    def model_validate(cls, data: dict) -> "InstallationRecord":
+        """Build a record from a dict, validating it through AppInstallation"""
+        return cls.from_installation(AppInstallation.model_validate(data))
+
+    def to_installation(self) -> AppInstallation:
+        return AppInstallation.model_construct(
+            auth_token=self.auth_token,
+            domain=self.domain,
+            saleor_api_url=self.saleor_api_url,
+            installed_at=self.installed_at,
+            token_refreshed_at=self.token_refreshed_at,
+        )
+
+    def with_token(self, auth_token: str) -> "InstallationRecord":
+        """Return a copy carrying a new token, stamped with the refresh time"""
+        return replace(self, auth_token=auth_token, token_refreshed_at=_utcnow())
+
+    def model_copy(self, update: dict | None = None) -> "InstallationRecord":
+        return replace(self, **update) if update else self
+
+    def model_dump(self) -> dict:
+        return {
+            "auth_token": self.auth_token,
+            "domain": self.domain,
+            "saleor_api_url": self.saleor_api_url,
+            "installed_at": self.installed_at,
+            "token_refreshed_at": self.token_refreshed_at,
+        }
+
+    def model_dump_json(self) -> str:
+        return json.dumps(
+            {
+                "auth_token": self.auth_token,
+                "domain": self.domain,
+                "saleor_api_url": self.saleor_api_url,
+                "installed_at": _isoformat(self.installed_at),
+                "token_refreshed_at": self.token_refreshed_at
+                and _isoformat(self.token_refreshed_at),
+            },
+            separators=(",", ":"),
+        )
@@ -4,13 +4,31 @@ Webhook-related models for Saleor App SDK
 
 from dataclasses import dataclass
 
-from saleor_app_sdk.webhooks.events import WebhookEventType
+from saleor_app_sdk.webhooks.events import SyncWebhookEventType, WebhookEventType
 
 
-@dataclass
+@dataclass(slots=True)
 class WebhookDefinition:
     name: str
-    events: list[WebhookEventType]
+    events: list[WebhookEventType | SyncWebhookEventType]
     query: str
     target_url: str
     is_active: bool = True
+
+    def to_dict(self) -> dict:
+        """Serialize to the camelCase shape used in the Saleor manifest"""
+        data = {
+            "name": self.name,
+            "asyncEvents": [
+                e.value for e in self.events if not isinstance(e, SyncWebhookEventType)
+            ],
+            "query": self.query,
+            "targetUrl": self.target_url,
+            "isActive": self.is_active,
+        }
+        sync_events = [
+            e.value for e in self.events if isinstance(e, SyncWebhookEventType)
+        ]
+        if sync_events:
+            data["syncEvents"] = sync_events
+        return data
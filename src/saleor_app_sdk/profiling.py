@@ -0,0 +1,181 @@
+"""
+Sampling cProfile hook for webhook and route handlers
+"""
+
+import cProfile
+import hmac
+import io
+import itertools
+import marshal
+import pstats
+import random
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from saleor_app_sdk.webhooks.events import WebhookEventType
+
+PROFILE_HEADER = "x-saleor-profile"
+
+
+@dataclass(slots=True)
+class ProfileRecord:
+    """A captured profile of one request"""
+
+    id: int
+    key: str
+    started_at: float
+    duration: float
+    stats: dict
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "key": self.key,
+            "startedAt": self.started_at,
+            "duration": self.duration,
+        }
+
+    def dump(self) -> bytes:
+        """Profile in the ``.prof`` format read by ``pstats`` and snakeviz"""
+        return marshal.dumps(self.stats)
+
+    def format_text(self, sort: str = "cumulative", limit: int = 50) -> str:
+        stream = io.StringIO()
+        pstats.Stats(_StatsSource(self.stats), stream=stream).sort_stats(
+            sort
+        ).print_stats(limit)
+        return stream.getvalue()
+
+
+class _StatsSource:
+    """Adapter letting :class:`pstats.Stats` load an in-memory stats dict"""
+
+    def __init__(self, stats: dict):
+        self.stats = dict(stats)
+
+    def create_stats(self):
+        pass
+
+
+class ProfileStore:
+    """Keep the most recent ``max_profiles`` profiles in memory"""
+
+    def __init__(self, max_profiles: int = 50):
+        self.max_profiles = max_profiles
+        self._profiles: OrderedDict[int, ProfileRecord] = OrderedDict()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def add(self, key: str, started_at: float, duration: float, stats: dict):
+        with self._lock:
+            record = ProfileRecord(next(self._ids), key, started_at, duration, stats)
+            self._profiles[record.id] = record
+            while len(self._profiles) > self.max_profiles:
+                self._profiles.popitem(last=False)
+        return record
+
+    def get(self, profile_id: int) -> ProfileRecord | None:
+        return self._profiles.get(profile_id)
+
+    def list(self) -> list[ProfileRecord]:
+        with self._lock:
+            return list(reversed(self._profiles.values()))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._profiles.clear()
+
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+
+class Profiler:
+    """Profile a sample of requests with cProfile.
+
+    Requests are keyed ``webhook:<EVENT_TYPE>`` or ``route:<path>``. Each key
+    is sampled at its rate in ``rates``, falling back to ``sample_rate``;
+    ``rates`` may also be keyed by :class:`WebhookEventType` or a bare path.
+    Sending the ``admin_token`` in the ``x-saleor-profile`` header forces a
+    profile of that request.
+
+    cProfile hooks the whole thread, so only one request is profiled at a
+    time and concurrent requests are skipped; time spent in other coroutines
+    while the profiled one awaits shows up in its profile.
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = 0.0,
+        rates: Mapping[str | WebhookEventType, float] | None = None,
+        admin_token: str | None = None,
+        max_profiles: int = 50,
+    ):
+        self.sample_rate = sample_rate
+        self.rates = {
+            self._normalize_key(key): rate for key, rate in (rates or {}).items()
+        }
+        self.admin_token = admin_token
+        self.store = ProfileStore(max_profiles)
+        self._active = threading.Lock()
+        self._random = random.Random()  # noqa: S311
+
+    @staticmethod
+    def webhook_key(event_type: str) -> str:
+        return f"webhook:{event_type}"
+
+    @staticmethod
+    def route_key(path: str) -> str:
+        return f"route:{path}"
+
+    @classmethod
+    def _normalize_key(cls, key: str | WebhookEventType) -> str:
+        if isinstance(key, WebhookEventType):
+            return cls.webhook_key(key.value)
+        if key.startswith("/"):
+            return cls.route_key(key)
+        return key
+
+    def is_admin(self, token: str | None) -> bool:
+        """Check a token against ``admin_token`` in constant time"""
+        if not self.admin_token or not token:
+            return False
+        return hmac.compare_digest(token, self.admin_token)
+
+    def should_profile(self, key: str, headers: Mapping[str, str] | None = None):
+        if headers is not None and self.is_admin(headers.get(PROFILE_HEADER)):
+            return True
+        rate = self.rates.get(key, self.sample_rate)
+        return rate > 0 and self._random.random() < rate
+
+    @contextmanager
+    def profile(
+        self, key: str, headers: Mapping[str, str] | None = None
+    ) -> Iterator[cProfile.Profile | None]:
+        """Profile the block if this request is sampled and no other is running"""
+        if not self.should_profile(key, headers) or not self._active.acquire(
+            blocking=False
+        ):
+            yield None
+            return
+
+        profile = cProfile.Profile()
+        started_at = time.time()
+        start = time.perf_counter()
+        try:
+            profile.enable()
+        except ValueError:
+            # Another profiler (e.g. a debugger or coverage tool) is active
+            self._active.release()
+            yield None
+            return
+        try:
+            yield profile
+        finally:
+            profile.disable()
+            self._active.release()
+            profile.create_stats()
+            self.store.add(key, started_at, time.perf_counter() - start, profile.stats)
@@ -0,0 +1,54 @@
+"""
+Config storage backends for Saleor App SDK
+"""
+
+from typing import TYPE_CHECKING
+
+from saleor_app_sdk._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .base import ConfigStore, VersionedConfig
+    from .cache import CachedConfigStore
+    from .encryption import (
+        DecryptionError,
+        EncryptedConfigStore,
+        EnvelopeEncryptor,
+        KeyRing,
+    )
+    from .memory import MemoryConfigStore
+    from .postgres import PostgresConfigStore
+    from .redis import RedisConfigStore
+    from .sharded import ShardedConfigStore
+    from .sqlite import SQLiteConfigStore
+
+_EXPORTS = {
+    "CachedConfigStore": ".cache",
+    "ConfigStore": ".base",
+    "DecryptionError": ".encryption",
+    "EncryptedConfigStore": ".encryption",
+    "EnvelopeEncryptor": ".encryption",
+    "KeyRing": ".encryption",
+    "MemoryConfigStore": ".memory",
+    "PostgresConfigStore": ".postgres",
+    "RedisConfigStore": ".redis",
+    "SQLiteConfigStore": ".sqlite",
+    "ShardedConfigStore": ".sharded",
+    "VersionedConfig": ".base",
+}
+
+__all__ = [
+    "CachedConfigStore",
+    "ConfigStore",
+    "DecryptionError",
+    "EncryptedConfigStore",
+    "EnvelopeEncryptor",
+    "KeyRing",
+    "MemoryConfigStore",
+    "PostgresConfigStore",
+    "RedisConfigStore",
+    "SQLiteConfigStore",
+    "ShardedConfigStore",
+    "VersionedConfig",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
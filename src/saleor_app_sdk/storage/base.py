@@ -0,0 +1,57 @@
+"""
+Config store interface for Saleor App SDK
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+from typing import NamedTuple
+
+InvalidationCallback = Callable[[str], Awaitable[None] | None]
+
+
+class VersionedConfig(NamedTuple):
+    """Config dict together with the version stamp it was stored under"""
+
+    config: dict
+    version: int
+
+
+class ConfigStore(ABC):
+    """Async per-domain config storage.
+
+    Every write bumps a per-domain version stamp, which lets read caches
+    detect stale entries without reloading the whole config.
+    """
+
+    @abstractmethod
+    async def get(self, domain: str) -> VersionedConfig | None:
+        """Return the stored config for a domain, or None if there is none"""
+
+    @abstractmethod
+    async def get_version(self, domain: str) -> int:
+        """Return the current version stamp for a domain (0 if missing)"""
+
+    @abstractmethod
+    async def set(self, domain: str, config: dict) -> int:
+        """Replace the config for a domain and return the new version"""
+
+    @abstractmethod
+    async def update(self, domain: str, updates: dict) -> VersionedConfig:
+        """Atomically merge top-level keys into the config for a domain"""
+
+    @abstractmethod
+    async def delete(self, domain: str) -> None:
+        """Remove the config for a domain"""
+
+    async def subscribe(self, callback: InvalidationCallback) -> bool:  # noqa: ARG002
+        """Call ``callback(domain)`` whenever a domain changes.
+
+        Backends may also notify about this process's own writes.
+
+        Returns False when the backend has no change notifications, in which
+        case callers have to poll :meth:`get_version` instead.
+        """
+        return False
+
+    async def close(self) -> None:  # noqa: B027
+        """Release connections held by the store"""
@@ -0,0 +1,144 @@
+"""
+In-process read cache for config stores
+"""
+
+import time
+
+from saleor_app_sdk.instrumentation import get_instrumentation
+
+from .base import ConfigStore, VersionedConfig
+
+
+class CachedConfigStore(ConfigStore):
+    """Read-through cache in front of another :class:`ConfigStore`.
+
+    Hot-path reads go through :meth:`get_cached`, which is a plain dict
+    lookup. Entries are kept fresh either by the backing store's change
+    notifications (see :meth:`start`) or, for stores without them, by
+    re-checking the version stamp at most once per ``revalidate_after``
+    seconds per domain.
+
+    A notification does not drop the cached config, since sync readers would
+    then see nothing until it is reloaded. The entry is marked stale and
+    refreshed in the background instead; notifications of this process's own
+    writes, which Redis and Postgres deliver too, only cost a version check.
+    """
+
+    def __init__(
+        self,
+        store: ConfigStore,
+        revalidate_after: float = 1.0,
+        configs: dict[str, dict] | None = None,
+    ):
+        self.store = store
+        self.revalidate_after = revalidate_after
+        # May be shared with the owner so sync readers see the same dicts
+        self.configs: dict[str, dict] = {} if configs is None else configs
+        self._versions: dict[str, tuple[int, float]] = {}
+        # Domains notified as changed and not revalidated since
+        self._stale: set[str] = set()
+        self._subscribed = False
+
+    async def start(self) -> None:
+        """Subscribe to change notifications from the backing store.
+
+        Called by the app's lifespan at startup; calling it again is a no-op.
+        """
+        if self._subscribed:
+            return
+        self._subscribed = await self.store.subscribe(self.refresh)
+
+    async def refresh(self, domain: str) -> None:
+        """Reload a domain if its version changed, keeping it readable meanwhile"""
+        cached = self._versions.get(domain)
+        if cached is None:
+            return
+        # Revalidated by get() if this reload fails
+        self._stale.add(domain)
+        if await self.store.get_version(domain) == cached[0]:
+            self._stale.discard(domain)
+            return
+        entry = await self.store.get(domain)
+        if entry is None:
+            self.invalidate(domain)
+        else:
+            self._remember(domain, entry.config, entry.version)
+
+    def get_cached(self, domain: str) -> dict | None:
+        """Return the cached config without touching the backing store"""
+        config = self.configs.get(domain)
+        instrumentation = get_instrumentation()
+        if instrumentation is not None:
+            instrumentation.record_cache("config", config is not None)
+        return config
+
+    def invalidate(self, domain: str | None = None) -> None:
+        """Drop one domain, or every domain, from the cache"""
+        if domain is None:
+            self.configs.clear()
+            self._versions.clear()
+            self._stale.clear()
+        else:
+            self.configs.pop(domain, None)
+            self._versions.pop(domain, None)
+            self._stale.discard(domain)
+
+    async def get(self, domain: str) -> VersionedConfig | None:
+        instrumentation = get_instrumentation()
+        cached = self._versions.get(domain)
+        if cached is not None:
+            version, checked_at = cached
+            now = time.monotonic()
+            if domain in self._stale:
+                fresh = False
+            else:
+                fresh = self._subscribed or now - checked_at < self.revalidate_after
+            if not fresh and await self.store.get_version(domain) == version:
+                self._versions[domain] = (version, now)
+                self._stale.discard(domain)
+                fresh = True
+            if fresh:
+                if instrumentation is not None:
+                    instrumentation.record_cache("config", True)
+                return VersionedConfig(self.configs[domain], version)
+
+        if instrumentation is not None:
+            instrumentation.record_cache("config", False)
+        entry = await self.store.get(domain)
+        if entry is None:
+            self.invalidate(domain)
+        else:
+            self._remember(domain, entry.config, entry.version)
+        return entry
+
+    async def get_version(self, domain: str) -> int:
+        return await self.store.get_version(domain)
+
+    async def set(self, domain: str, config: dict) -> int:
+        version = await self.store.set(domain, config)
+        self._remember(domain, dict(config), version)
+        return version
+
+    async def update(self, domain: str, updates: dict) -> VersionedConfig:
+        entry = await self.store.update(domain, updates)
+        self._remember(domain, entry.config, entry.version)
+        return entry
+
+    async def delete(self, domain: str) -> None:
+        await self.store.delete(domain)
+        self.invalidate(domain)
+
+    async def subscribe(self, callback) -> bool:
+        return await self.store.subscribe(callback)
+
+    async def close(self) -> None:
+        await self.store.close()
+
+    def _remember(self, domain: str, config: dict, version: int) -> None:
+        current = self._versions.get(domain)
+        # A notification-triggered reload may race a local write; keep newest
+        if current is not None and current[0] > version:
+            return
+        self.configs[domain] = config
+        self._versions[domain] = (version, time.monotonic())
+        self._stale.discard(domain)
@@ -0,0 +1,276 @@
+"""
+Envelope encryption for stored tokens and config secrets
+"""
+
+import base64
+import json
+import os
+import threading
+from collections import OrderedDict
+
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+from saleor_app_sdk.instrumentation import get_instrumentation
+
+from .base import ConfigStore, InvalidationCallback, VersionedConfig
+
+TOKEN_PREFIX = "enc1"  # noqa: S105
+NONCE_SIZE = 12
+
+
+class DecryptionError(ValueError):
+    """Raised when an encrypted value cannot be decrypted"""
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+class KeyRing:
+    """Named key-encryption keys, one of which is used for new values.
+
+    Older keys stay in the ring so existing values can still be decrypted
+    until they have been rotated onto the primary key.
+    """
+
+    def __init__(self, keys: dict[str, str | bytes], primary: str):
+        if primary not in keys:
+            error_msg = f"Primary key {primary!r} is not in the key ring"
+            raise ValueError(error_msg)
+        self._keys: dict[str, AESGCM] = {}
+        for key_id, key in keys.items():
+            self.add_key(key_id, key, make_primary=False)
+        self.primary = primary
+
+    @staticmethod
+    def generate_key() -> str:
+        """Generate a new base64-encoded 256-bit key"""
+        return _b64encode(AESGCM.generate_key(bit_length=256))
+
+    def add_key(self, key_id: str, key: str | bytes, make_primary: bool = True):
+        """Add a key, by default making it the one used for new values"""
+        # Key ids are embedded in dot-separated tokens
+        if "." in key_id:
+            error_msg = f"Key id {key_id!r} must not contain '.'"
+            raise ValueError(error_msg)
+        raw = _b64decode(key) if isinstance(key, str) else key
+        self._keys[key_id] = AESGCM(raw)
+        if make_primary:
+            self.primary = key_id
+
+    def get(self, key_id: str) -> AESGCM:
+        try:
+            return self._keys[key_id]
+        except KeyError as e:
+            error_msg = f"Unknown encryption key {key_id!r}"
+            raise DecryptionError(error_msg) from e
+
+
+class EnvelopeEncryptor:
+    """Encrypt values with per-value data keys wrapped by a :class:`KeyRing`.
+
+    Tokens look like ``enc1.<key id>.<wrapped data key>.<ciphertext>``.
+    Rotation only re-wraps the data key, so the payload is never re-encrypted.
+    Decrypted values are kept in a bounded LRU cache so repeated reads of the
+    same token skip AES entirely.
+    """
+
+    def __init__(self, keyring: KeyRing, cache_size: int = 1024):
+        self.keyring = keyring
+        self.cache_size = cache_size
+        self._cache: OrderedDict[tuple[str, str], str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def is_encrypted(value) -> bool:
+        return isinstance(value, str) and value.startswith(TOKEN_PREFIX + ".")
+
+    def encrypt(self, plaintext: str, context: str = "") -> str:
+        """Encrypt a value, binding it to ``context`` (e.g. the domain)"""
+        data_key = AESGCM.generate_key(bit_length=256)
+        payload_nonce = os.urandom(NONCE_SIZE)
+        ciphertext = AESGCM(data_key).encrypt(
+            payload_nonce, plaintext.encode(), context.encode()
+        )
+        token = self._seal(
+            self.keyring.primary, data_key, payload_nonce + ciphertext, context
+        )
+        self._remember((token, context), plaintext)
+        return token
+
+    def decrypt(self, token: str, context: str = "") -> str:
+        """Decrypt a token produced by :meth:`encrypt`"""
+        cache_key = (token, context)
+        with self._lock:
+            plaintext = self._cache.get(cache_key)
+            if plaintext is not None:
+                self._cache.move_to_end(cache_key)
+        instrumentation = get_instrumentation()
+        if instrumentation is not None:
+            instrumentation.record_cache("decryption", plaintext is not None)
+        if plaintext is not None:
+            return plaintext
+
+        _key_id, data_key, payload = self._open(token, context)
+        try:
+            plaintext = (
+                AESGCM(data_key)
+                .decrypt(payload[:NONCE_SIZE], payload[NONCE_SIZE:], context.encode())
+                .decode()
+            )
+        except InvalidTag as e:
+            error_msg = "Encrypted value failed authentication"
+            raise DecryptionError(error_msg) from e
+        self._remember(cache_key, plaintext)
+        return plaintext
+
+    def needs_rotation(self, token: str) -> bool:
+        """Return True if the token is wrapped with a non-primary key"""
+        return self._parse(token)[0] != self.keyring.primary
+
+    def rotate(self, token: str, context: str = "") -> str:
+        """Re-wrap a token's data key with the primary key"""
+        if not self.needs_rotation(token):
+            return token
+        _key_id, data_key, payload = self._open(token, context)
+        return self._seal(self.keyring.primary, data_key, payload, context)
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def _seal(self, key_id: str, data_key: bytes, payload: bytes, context: str):
+        wrap_nonce = os.urandom(NONCE_SIZE)
+        wrapped = self.keyring.get(key_id).encrypt(
+            wrap_nonce, data_key, f"{key_id}.{context}".encode()
+        )
+        return ".".join(
+            (
+                TOKEN_PREFIX,
+                key_id,
+                _b64encode(wrap_nonce + wrapped),
+                _b64encode(payload),
+            )
+        )
+
+    def _parse(self, token: str) -> tuple[str, bytes, bytes]:
+        parts = token.split(".")
+        if len(parts) != 4 or parts[0] != TOKEN_PREFIX:  # noqa: PLR2004
+            error_msg = "Malformed encrypted value"
+            raise DecryptionError(error_msg)
+        try:
+            return parts[1], _b64decode(parts[2]), _b64decode(parts[3])
+        except ValueError as e:
+            error_msg = "Malformed encrypted value"
+            raise DecryptionError(error_msg) from e
+
+    def _open(self, token: str, context: str) -> tuple[str, bytes, bytes]:
+        key_id, wrapped, payload = self._parse(token)
+        try:
+            data_key = self.keyring.get(key_id).decrypt(
+                wrapped[:NONCE_SIZE],
+                wrapped[NONCE_SIZE:],
+                f"{key_id}.{context}".encode(),
+            )
+        except InvalidTag as e:
+            error_msg = "Encrypted value failed authentication"
+            raise DecryptionError(error_msg) from e
+        return key_id, data_key, payload
+
+    def _remember(self, cache_key: tuple[str, str], plaintext: str) -> None:
+        if self.cache_size <= 0:
+            return
+        with self._lock:
+            self._cache[cache_key] = plaintext
+            self._cache.move_to_end(cache_key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+
+class EncryptedConfigStore(ConfigStore):
+    """Wrap a config store so selected top-level keys are stored encrypted.
+
+    Values of ``secret_fields`` are JSON-encoded and encrypted with the
+    domain as context before they reach the backing store, and decrypted on
+    the way back. Use ``secret_fields=("auth_token",)`` to persist
+    installation records without plaintext tokens.
+    """
+
+    def __init__(
+        self,
+        store: ConfigStore,
+        encryptor: EnvelopeEncryptor,
+        secret_fields: tuple[str, ...] | list[str] = ("auth_token",),
+    ):
+        self.store = store
+        self.encryptor = encryptor
+        self.secret_fields = frozenset(secret_fields)
+
+    def encrypt_config(self, domain: str, config: dict) -> dict:
+        return {
+            key: self.encryptor.encrypt(json.dumps(value), domain)
+            if key in self.secret_fields
+            else value
+            for key, value in config.items()
+        }
+
+    def decrypt_config(self, domain: str, config: dict) -> dict:
+        return {
+            key: json.loads(self.encryptor.decrypt(value, domain))
+            if key in self.secret_fields and self.encryptor.is_encrypted(value)
+            else value
+            for key, value in config.items()
+        }
+
+    async def get(self, domain: str) -> VersionedConfig | None:
+        entry = await self.store.get(domain)
+        if entry is None:
+            return None
+        return VersionedConfig(self.decrypt_config(domain, entry.config), entry.version)
+
+    async def get_version(self, domain: str) -> int:
+        return await self.store.get_version(domain)
+
+    async def set(self, domain: str, config: dict) -> int:
+        return await self.store.set(domain, self.encrypt_config(domain, config))
+
+    async def update(self, domain: str, updates: dict) -> VersionedConfig:
+        entry = await self.store.update(domain, self.encrypt_config(domain, updates))
+        return VersionedConfig(self.decrypt_config(domain, entry.config), entry.version)
+
+    async def delete(self, domain: str) -> None:
+        await self.store.delete(domain)
+
+    async def rotate(self, domain: str) -> bool:
+        """Re-wrap secrets for a domain onto the primary key.
+
+        Returns True if anything was rewritten. The config is read and then
+        updated without a version check, so a secret written for the same
+        domain in between would be overwritten with its previous value. Do
+        not run this concurrently with writes to the domain, e.g. run it
+        from a maintenance job while the app is not saving configs.
+        """
+        entry = await self.store.get(domain)
+        if entry is None:
+            return False
+        rotated = {
+            key: self.encryptor.rotate(value, domain)
+            for key, value in entry.config.items()
+            if key in self.secret_fields
+            and self.encryptor.is_encrypted(value)
+            and self.encryptor.needs_rotation(value)
+        }
+        if rotated:
+            await self.store.update(domain, rotated)
+        return bool(rotated)
+
+    async def subscribe(self, callback: InvalidationCallback) -> bool:
+        return await self.store.subscribe(callback)
+
+    async def close(self) -> None:
+        await self.store.close()
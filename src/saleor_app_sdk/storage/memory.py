@@ -0,0 +1,44 @@
+"""
+In-memory config store
+"""
+
+import copy
+
+from .base import ConfigStore, VersionedConfig
+
+
+class MemoryConfigStore(ConfigStore):
+    """Process-local config store, mostly useful for tests and single workers"""
+
+    def __init__(self):
+        self._configs: dict[str, dict] = {}
+        # Versions survive deletes so a re-created config never reuses a stamp
+        self._versions: dict[str, int] = {}
+
+    async def get(self, domain: str) -> VersionedConfig | None:
+        config = self._configs.get(domain)
+        if config is None:
+            return None
+        return VersionedConfig(copy.deepcopy(config), self._versions[domain])
+
+    async def get_version(self, domain: str) -> int:
+        return self._versions.get(domain, 0)
+
+    async def set(self, domain: str, config: dict) -> int:
+        self._configs[domain] = copy.deepcopy(config)
+        return self._bump(domain)
+
+    async def update(self, domain: str, updates: dict) -> VersionedConfig:
+        # No awaits between read and write, so this is atomic within the loop
+        merged = {**self._configs.get(domain, {}), **copy.deepcopy(updates)}
+        self._configs[domain] = merged
+        return VersionedConfig(copy.deepcopy(merged), self._bump(domain))
+
+    async def delete(self, domain: str) -> None:
+        if self._configs.pop(domain, None) is not None:
+            self._bump(domain)
+
+    def _bump(self, domain: str) -> int:
+        version = self._versions.get(domain, 0) + 1
+        self._versions[domain] = version
+        return version
@@ -0,0 +1,172 @@
+"""
+PostgreSQL config store
+"""
+
+import asyncio
+import json
+from contextlib import asynccontextmanager
+
+from saleor_app_sdk import deadlines
+from saleor_app_sdk.instrumentation import get_instrumentation
+
+from .base import ConfigStore, InvalidationCallback, VersionedConfig
+
+
+class PostgresConfigStore(ConfigStore):
+    """Config store backed by a PostgreSQL JSONB column.
+
+    Partial updates are applied server-side with the JSONB ``||`` operator, so
+    concurrent writers from different workers never overwrite each other's
+    keys. Every write also fires ``NOTIFY`` on :attr:`channel` so caches in
+    other processes can drop their copy immediately.
+
+    Requires the ``asyncpg`` package (``pip install saleor-app-sdk[storage]``).
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        table: str = "saleor_app_config",
+        channel: str = "saleor_app_config",
+        min_size: int = 1,
+        max_size: int = 10,
+    ):
+        if not table.isidentifier() or not channel.isidentifier():
+            error_msg = f"Invalid table or channel name: {table!r}, {channel!r}"
+            raise ValueError(error_msg)
+        self.dsn = dsn
+        self.table = table
+        self.channel = channel
+        self.min_size = min_size
+        self.max_size = max_size
+        self._pool = None
+        self._listener = None
+
+    async def _get_pool(self):
+        if self._pool is None:
+            try:
+                import asyncpg  # noqa: PLC0415
+            except ImportError as e:
+                error_msg = (
+                    "PostgresConfigStore requires asyncpg; "
+                    "install saleor-app-sdk[storage]"
+                )
+                raise ImportError(error_msg) from e
+
+            self._pool = await asyncpg.create_pool(
+                self.dsn, min_size=self.min_size, max_size=self.max_size
+            )
+            instrumentation = get_instrumentation()
+            if instrumentation is not None:
+                pool = self._pool
+                instrumentation.register_pool(
+                    f"postgres:{self.table}",
+                    lambda: (pool.get_size() - pool.get_idle_size(), pool.get_size()),
+                )
+            async with self._pool.acquire() as conn:
+                await conn.execute(
+                    f"CREATE TABLE IF NOT EXISTS {self.table} ("
+                    "domain TEXT PRIMARY KEY, "
+                    "config JSONB, "
+                    "version BIGINT NOT NULL)"
+                )
+        return self._pool
+
+    @asynccontextmanager
+    async def _connection(self):
+        """Borrow a pooled connection, waiting no longer than the deadline"""
+        pool = await self._get_pool()
+        operation = "postgres_pool"
+        timeout = deadlines.check(operation)
+        try:
+            conn = await pool.acquire(timeout=timeout)
+        except TimeoutError as e:
+            if timeout is None:
+                raise
+            raise deadlines.exceeded(operation) from e
+        try:
+            yield conn
+        finally:
+            await pool.release(conn)
+
+    async def get(self, domain: str) -> VersionedConfig | None:
+        async with self._connection() as conn:
+            row = await conn.fetchrow(
+                f"SELECT config, version FROM {self.table} WHERE domain = $1",  # noqa: S608
+                domain,
+            )
+        if row is None or row["config"] is None:
+            return None
+        return VersionedConfig(json.loads(row["config"]), row["version"])
+
+    async def get_version(self, domain: str) -> int:
+        async with self._connection() as conn:
+            version = await conn.fetchval(
+                f"SELECT version FROM {self.table} WHERE domain = $1",  # noqa: S608
+                domain,
+            )
+        return version or 0
+
+    async def set(self, domain: str, config: dict) -> int:
+        row = await self._upsert("EXCLUDED.config", domain, config)
+        return row["version"]
+
+    async def update(self, domain: str, updates: dict) -> VersionedConfig:
+        row = await self._upsert(
+            f"COALESCE({self.table}.config, '{{}}'::jsonb) || EXCLUDED.config",
+            domain,
+            updates,
+        )
+        return VersionedConfig(json.loads(row["config"]), row["version"])
+
+    async def delete(self, domain: str) -> None:
+        # A NULL config is a tombstone that keeps the version counter alive
+        async with self._connection() as conn:
+            await conn.execute(
+                f"WITH changed AS ("  # noqa: S608
+                f"UPDATE {self.table} SET config = NULL, version = version + 1 "
+                "WHERE domain = $1 AND config IS NOT NULL RETURNING domain) "
+                "SELECT pg_notify($2, domain) FROM changed",
+                domain,
+                self.channel,
+            )
+
+    async def _upsert(self, merge_expression: str, domain: str, config: dict):
+        async with self._connection() as conn:
+            return await conn.fetchrow(
+                f"WITH changed AS ("  # noqa: S608
+                f"INSERT INTO {self.table} (domain, config, version) "
+                "VALUES ($1, $2::jsonb, 1) "
+                f"ON CONFLICT (domain) DO UPDATE SET config = {merge_expression}, "
+                f"version = {self.table}.version + 1 "
+                "RETURNING config::text AS config, version) "
+                "SELECT config, version, pg_notify($3, $1) FROM changed",
+                domain,
+                json.dumps(config),
+                self.channel,
+            )
+
+    async def subscribe(self, callback: InvalidationCallback) -> bool:
+        pool = await self._get_pool()
+        if self._listener is None:
+            self._listener = await pool.acquire()
+
+        def on_notify(_conn, _pid, _channel, payload):
+            result = callback(payload)
+            if result is not None:
+                # asyncpg listeners are sync; schedule async callbacks
+                asyncio.ensure_future(result)  # noqa: RUF006
+
+        await self._listener.add_listener(self.channel, on_notify)
+        return True
+
+    async def close(self) -> None:
+        if self._pool is not None:
+            if self._listener is not None:
+                await self._pool.release(self._listener)
+                self._listener = None
+            await self._pool.close()
+            self._pool = None
+            instrumentation = get_instrumentation()
+            if instrumentation is not None:
+                instrumentation.unregister_pool(f"postgres:{self.table}")
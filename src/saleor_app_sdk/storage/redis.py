@@ -0,0 +1,136 @@
+"""
+Redis config store
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+
+from .base import ConfigStore, InvalidationCallback, VersionedConfig
+
+logger = logging.getLogger(__name__)
+
+VERSION_FIELD = "__version__"
+
+
+class RedisConfigStore(ConfigStore):
+    """Config store keeping each domain's config in a Redis hash.
+
+    Every top-level config key is a hash field holding a JSON value, so
+    partial updates are a single ``HSET`` and never race with other writers.
+    Writes bump a version field and publish the domain on :attr:`channel`
+    inside the same ``MULTI`` transaction.
+
+    Requires the ``redis`` package (``pip install saleor-app-sdk[storage]``).
+    """
+
+    def __init__(
+        self,
+        url: str = "redis://localhost:6379/0",
+        prefix: str = "saleor_app:config",
+        channel: str = "saleor_app:config:changed",
+        client=None,
+    ):
+        self.url = url
+        self.prefix = prefix
+        self.channel = channel
+        self._redis = client
+        self._pubsub = None
+        self._listener: asyncio.Task | None = None
+
+    @property
+    def redis(self):
+        if self._redis is None:
+            try:
+                from redis import asyncio as aioredis  # noqa: PLC0415
+            except ImportError as e:
+                error_msg = (
+                    "RedisConfigStore requires redis; install saleor-app-sdk[storage]"
+                )
+                raise ImportError(error_msg) from e
+            self._redis = aioredis.from_url(self.url, decode_responses=True)
+        return self._redis
+
+    def _key(self, domain: str) -> str:
+        return f"{self.prefix}:{domain}"
+
+    def _version_key(self, domain: str) -> str:
+        # Kept outside the hash so it survives deletes
+        return f"{self.prefix}:{domain}:{VERSION_FIELD}"
+
+    async def get(self, domain: str) -> VersionedConfig | None:
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hgetall(self._key(domain))
+            pipe.get(self._version_key(domain))
+            fields, version = await pipe.execute()
+        if not fields:
+            return None
+        config = {key: json.loads(value) for key, value in fields.items()}
+        return VersionedConfig(config, int(version or 0))
+
+    async def get_version(self, domain: str) -> int:
+        return int(await self.redis.get(self._version_key(domain)) or 0)
+
+    async def set(self, domain: str, config: dict) -> int:
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.delete(self._key(domain))
+            if config:
+                pipe.hset(self._key(domain), mapping=self._encode(config))
+            pipe.incr(self._version_key(domain))
+            pipe.publish(self.channel, domain)
+            results = await pipe.execute()
+        return int(results[-2])
+
+    async def update(self, domain: str, updates: dict) -> VersionedConfig:
+        async with self.redis.pipeline(transaction=True) as pipe:
+            if updates:
+                pipe.hset(self._key(domain), mapping=self._encode(updates))
+            pipe.incr(self._version_key(domain))
+            pipe.hgetall(self._key(domain))
+            pipe.publish(self.channel, domain)
+            results = await pipe.execute()
+        config = {key: json.loads(value) for key, value in results[-2].items()}
+        return VersionedConfig(config, int(results[-3]))
+
+    async def delete(self, domain: str) -> None:
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.delete(self._key(domain))
+            pipe.incr(self._version_key(domain))
+            pipe.publish(self.channel, domain)
+            await pipe.execute()
+
+    async def subscribe(self, callback: InvalidationCallback) -> bool:
+        if self._pubsub is None:
+            self._pubsub = self.redis.pubsub()
+            await self._pubsub.subscribe(self.channel)
+            self._listener = asyncio.create_task(self._listen(callback))
+        return True
+
+    async def _listen(self, callback: InvalidationCallback) -> None:
+        async for message in self._pubsub.listen():
+            if message.get("type") != "message":
+                continue
+            try:
+                result = callback(message["data"])
+                if result is not None:
+                    await result
+            except Exception:
+                logger.exception("Config invalidation callback failed")
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+        if self._pubsub is not None:
+            await self._pubsub.aclose()
+            self._pubsub = None
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+    @staticmethod
+    def _encode(config: dict) -> dict[str, str]:
+        return {key: json.dumps(value) for key, value in config.items()}
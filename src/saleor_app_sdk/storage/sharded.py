@@ -0,0 +1,49 @@
+"""
+Sharded config store
+"""
+
+import asyncio
+import zlib
+
+from .base import ConfigStore, InvalidationCallback, VersionedConfig
+
+
+class ShardedConfigStore(ConfigStore):
+    """Spread domains across several stores by a stable hash of the domain.
+
+    The shard list must stay in the same order across workers and restarts,
+    otherwise domains would be looked up on the wrong shard.
+    """
+
+    def __init__(self, shards: list[ConfigStore]):
+        if not shards:
+            error_msg = "At least one shard is required"
+            raise ValueError(error_msg)
+        self.shards = shards
+
+    def shard_for(self, domain: str) -> ConfigStore:
+        return self.shards[zlib.crc32(domain.encode()) % len(self.shards)]
+
+    async def get(self, domain: str) -> VersionedConfig | None:
+        return await self.shard_for(domain).get(domain)
+
+    async def get_version(self, domain: str) -> int:
+        return await self.shard_for(domain).get_version(domain)
+
+    async def set(self, domain: str, config: dict) -> int:
+        return await self.shard_for(domain).set(domain, config)
+
+    async def update(self, domain: str, updates: dict) -> VersionedConfig:
+        return await self.shard_for(domain).update(domain, updates)
+
+    async def delete(self, domain: str) -> None:
+        await self.shard_for(domain).delete(domain)
+
+    async def subscribe(self, callback: InvalidationCallback) -> bool:
+        results = await asyncio.gather(
+            *(shard.subscribe(callback) for shard in self.shards)
+        )
+        return all(results)
+
+    async def close(self) -> None:
+        await asyncio.gather(*(shard.close() for shard in self.shards))
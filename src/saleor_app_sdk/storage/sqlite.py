@@ -0,0 +1,107 @@
+"""
+SQLite config store
+"""
+
+import asyncio
+import json
+import sqlite3
+import threading
+
+from .base import ConfigStore, VersionedConfig
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS {table} (
+    domain TEXT PRIMARY KEY,
+    config TEXT,
+    version INTEGER NOT NULL
+)
+"""
+
+
+class SQLiteConfigStore(ConfigStore):
+    """Config store backed by a SQLite file.
+
+    Queries run in a worker thread so the event loop is never blocked, and
+    updates use ``BEGIN IMMEDIATE`` so concurrent processes sharing the file
+    serialize their read-modify-write cycles.
+    """
+
+    def __init__(self, path: str, table: str = "saleor_app_config"):
+        if not table.isidentifier():
+            error_msg = f"Invalid table name: {table!r}"
+            raise ValueError(error_msg)
+        self.path = path
+        self.table = table
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(
+                self.path, check_same_thread=False, isolation_level=None
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_SCHEMA.format(table=self.table))
+            self._conn = conn
+        return self._conn
+
+    async def _run(self, func, *args):
+        def locked():
+            with self._lock:
+                return func(self._connection(), *args)
+
+        return await asyncio.to_thread(locked)
+
+    async def get(self, domain: str) -> VersionedConfig | None:
+        row = await self._run(self._select, domain)
+        if row is None or row[0] is None:
+            return None
+        return VersionedConfig(json.loads(row[0]), row[1])
+
+    async def get_version(self, domain: str) -> int:
+        row = await self._run(self._select, domain)
+        return row[1] if row else 0
+
+    async def set(self, domain: str, config: dict) -> int:
+        return await self._run(self._write, domain, json.dumps(config))
+
+    async def update(self, domain: str, updates: dict) -> VersionedConfig:
+        return await self._run(self._merge, domain, updates)
+
+    async def delete(self, domain: str) -> None:
+        await self._run(self._write, domain, None)
+
+    async def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _select(self, conn: sqlite3.Connection, domain: str):
+        return conn.execute(
+            f"SELECT config, version FROM {self.table} WHERE domain = ?",  # noqa: S608
+            (domain,),
+        ).fetchone()
+
+    def _write(self, conn: sqlite3.Connection, domain: str, payload: str | None):
+        # A NULL config is a tombstone that keeps the version counter alive
+        row = conn.execute(
+            f"INSERT INTO {self.table} (domain, config, version) VALUES (?, ?, 1) "  # noqa: S608
+            "ON CONFLICT (domain) DO UPDATE SET "
+            "config = excluded.config, version = version + 1 "
+            "RETURNING version",
+            (domain, payload),
+        ).fetchone()
+        return row[0]
+
+    def _merge(self, conn: sqlite3.Connection, domain: str, updates: dict):
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = self._select(conn, domain)
+            current = json.loads(row[0]) if row and row[0] is not None else {}
+            merged = {**current, **updates}
+            version = self._write(conn, domain, json.dumps(merged))
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        return VersionedConfig(merged, version)
@@ -0,0 +1,51 @@
+"""
+Testing utilities for Saleor App SDK
+"""
+
+from typing import TYPE_CHECKING
+
+from saleor_app_sdk._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .fake_saleor import (
+        FakeSaleor,
+        FakeSaleorConfig,
+        FakeSaleorServer,
+        FakeSaleorStats,
+        make_order,
+        make_product,
+    )
+    from .load import LoadReport, WebhookLoadGenerator, load_recorded_payloads
+    from .webhooks import WebhookEmitter, sample_payload, sign_payload
+
+_EXPORTS = {
+    "FakeSaleor": ".fake_saleor",
+    "FakeSaleorConfig": ".fake_saleor",
+    "FakeSaleorServer": ".fake_saleor",
+    "FakeSaleorStats": ".fake_saleor",
+    "LoadReport": ".load",
+    "WebhookEmitter": ".webhooks",
+    "WebhookLoadGenerator": ".load",
+    "load_recorded_payloads": ".load",
+    "make_order": ".fake_saleor",
+    "make_product": ".fake_saleor",
+    "sample_payload": ".webhooks",
+    "sign_payload": ".webhooks",
+}
+
+__all__ = [
+    "FakeSaleor",
+    "FakeSaleorConfig",
+    "FakeSaleorServer",
+    "FakeSaleorStats",
+    "LoadReport",
+    "WebhookEmitter",
+    "WebhookLoadGenerator",
+    "load_recorded_payloads",
+    "make_order",
+    "make_product",
+    "sample_payload",
+    "sign_payload",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
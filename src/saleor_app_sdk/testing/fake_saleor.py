@@ -0,0 +1,662 @@
+"""
+Fake Saleor GraphQL server for offline load and latency testing
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import random
+import socket
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field, replace
+from datetime import UTC, datetime, timedelta
+
+from graphql import GraphQLError, build_schema, graphql, parse
+from graphql.language import OperationDefinitionNode
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+SCHEMA_SDL = """
+    scalar DateTime
+
+    type Money {
+        amount: Float!
+        currency: String!
+    }
+
+    type TaxedMoney {
+        gross: Money!
+        net: Money!
+    }
+
+    type TaxedMoneyRange {
+        start: TaxedMoney
+        stop: TaxedMoney
+    }
+
+    type PageInfo {
+        hasNextPage: Boolean!
+        hasPreviousPage: Boolean!
+        startCursor: String
+        endCursor: String
+    }
+
+    type Permission {
+        code: String!
+        name: String!
+    }
+
+    type App {
+        id: ID!
+        name: String
+        isActive: Boolean
+        permissions: [Permission!]
+    }
+
+    type Shop {
+        name: String!
+        domain: String!
+    }
+
+    type Category {
+        id: ID!
+        name: String!
+    }
+
+    type ProductPricingInfo {
+        priceRange: TaxedMoneyRange
+    }
+
+    type VariantPricingInfo {
+        price: TaxedMoney
+    }
+
+    type ProductVariant {
+        id: ID!
+        name: String!
+        sku: String
+        pricing: VariantPricingInfo
+    }
+
+    type Product {
+        id: ID!
+        name: String!
+        slug: String!
+        description: String
+        isPublished: Boolean!
+        category: Category
+        defaultVariant: ProductVariant
+        pricing: ProductPricingInfo
+        created: DateTime!
+        updatedAt: DateTime!
+    }
+
+    type ProductCountableEdge {
+        node: Product!
+        cursor: String!
+    }
+
+    type ProductCountableConnection {
+        pageInfo: PageInfo!
+        edges: [ProductCountableEdge!]!
+        totalCount: Int
+    }
+
+    type User {
+        id: ID!
+        email: String!
+        firstName: String!
+        lastName: String!
+    }
+
+    type Order {
+        id: ID!
+        number: String!
+        status: String!
+        total: TaxedMoney!
+        user: User
+        userEmail: String
+        created: DateTime!
+        updatedAt: DateTime!
+    }
+
+    type OrderCountableEdge {
+        node: Order!
+        cursor: String!
+    }
+
+    type OrderCountableConnection {
+        pageInfo: PageInfo!
+        edges: [OrderCountableEdge!]!
+        totalCount: Int
+    }
+
+    type Error {
+        field: String
+        message: String
+    }
+
+    type ProductCreate {
+        product: Product
+        errors: [Error!]!
+    }
+
+    type ProductDelete {
+        product: Product
+        errors: [Error!]!
+    }
+
+    input ProductFilterInput {
+        search: String
+        ids: [ID!]
+    }
+
+    input ProductCreateInput {
+        name: String
+        description: String
+        productType: ID
+        category: ID
+        basePrice: Float
+        isPublished: Boolean
+    }
+
+    type Query {
+        app: App
+        shop: Shop!
+        product(id: ID!): Product
+        products(
+            first: Int
+            last: Int
+            after: String
+            before: String
+            filter: ProductFilterInput
+        ): ProductCountableConnection
+        order(id: ID!): Order
+        orders(
+            first: Int
+            last: Int
+            after: String
+            before: String
+        ): OrderCountableConnection
+    }
+
+    type Mutation {
+        productCreate(input: ProductCreateInput!): ProductCreate
+        productDelete(id: ID!): ProductDelete
+    }
+
+    interface Event {
+        issuedAt: DateTime
+    }
+
+    type OrderCreated implements Event {
+        issuedAt: DateTime
+        order: Order
+    }
+
+    type OrderUpdated implements Event {
+        issuedAt: DateTime
+        order: Order
+    }
+
+    type OrderPaid implements Event {
+        issuedAt: DateTime
+        order: Order
+    }
+
+    type OrderFullyPaid implements Event {
+        issuedAt: DateTime
+        order: Order
+    }
+
+    type OrderRefunded implements Event {
+        issuedAt: DateTime
+        order: Order
+    }
+
+    type OrderCancelled implements Event {
+        issuedAt: DateTime
+        order: Order
+    }
+
+    type OrderFulfilled implements Event {
+        issuedAt: DateTime
+        order: Order
+    }
+
+    type ProductCreated implements Event {
+        issuedAt: DateTime
+        product: Product
+    }
+
+    type ProductUpdated implements Event {
+        issuedAt: DateTime
+        product: Product
+    }
+
+    type ProductDeleted implements Event {
+        issuedAt: DateTime
+        product: Product
+    }
+
+    type CustomerCreated implements Event {
+        issuedAt: DateTime
+        user: User
+    }
+
+    type CustomerUpdated implements Event {
+        issuedAt: DateTime
+        user: User
+    }
+
+    type Subscription {
+        event: Event
+    }
+"""
+
+SCHEMA = build_schema(SCHEMA_SDL)
+
+_EPOCH = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def encode_id(type_name: str, pk: int) -> str:
+    """Build a Saleor-style global ID"""
+    return base64.b64encode(f"{type_name}:{pk}".encode()).decode()
+
+
+def decode_id(global_id: str) -> tuple[str, int]:
+    try:
+        type_name, pk = base64.b64decode(global_id).decode().split(":", 1)
+        return type_name, int(pk)
+    except ValueError as e:
+        error_msg = f"Couldn't resolve id: {global_id}."
+        raise GraphQLError(error_msg) from e
+
+
+def _money(amount: float, currency: str = "USD") -> dict:
+    return {"amount": round(amount, 2), "currency": currency}
+
+
+def _taxed(amount: float) -> dict:
+    return {"gross": _money(amount), "net": _money(amount / 1.23)}
+
+
+def _timestamp(pk: int) -> str:
+    return (_EPOCH + timedelta(minutes=pk)).isoformat()
+
+
+def make_product(pk: int, name: str | None = None, **overrides) -> dict:
+    """Build a deterministic product node"""
+    price = _taxed(9.99 + pk % 100)
+    product = {
+        "id": encode_id("Product", pk),
+        "name": name or f"Product {pk}",
+        "slug": f"product-{pk}",
+        "description": f"Description of product {pk}",
+        "isPublished": pk % 7 != 0,
+        "category": {"id": encode_id("Category", pk % 5), "name": f"Category {pk % 5}"},
+        "defaultVariant": {
+            "id": encode_id("ProductVariant", pk),
+            "name": "Default",
+            "sku": f"SKU-{pk:06d}",
+            "pricing": {"price": price},
+        },
+        "pricing": {"priceRange": {"start": price, "stop": price}},
+        "created": _timestamp(pk),
+        "updatedAt": _timestamp(pk),
+    }
+    product.update(overrides)
+    return product
+
+
+def make_order(pk: int) -> dict:
+    """Build a deterministic order node"""
+    return {
+        "id": encode_id("Order", pk),
+        "number": str(pk),
+        "status": ("UNFULFILLED", "FULFILLED", "CANCELED")[pk % 3],
+        "total": _taxed(25.0 + pk % 250),
+        "user": {
+            "id": encode_id("User", pk % 50),
+            "email": f"customer{pk % 50}@example.com",
+            "firstName": "Customer",
+            "lastName": str(pk % 50),
+        },
+        "userEmail": f"customer{pk % 50}@example.com",
+        "created": _timestamp(pk),
+        "updatedAt": _timestamp(pk),
+    }
+
+
+@dataclass
+class FakeSaleorConfig:
+    """Knobs controlling how the fake server behaves.
+
+    Rates are probabilities in ``[0, 1]`` applied per request. Latency is
+    ``latency`` seconds plus a uniform random ``latency_jitter``.
+    """
+
+    latency: float = 0.0
+    latency_jitter: float = 0.0
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    retry_after: int = 1
+    max_page_size: int = 100
+    product_count: int = 250
+    order_count: int = 250
+    auth_token: str | None = None
+    domain: str = "fake.saleor.local"
+    seed: int | None = None
+
+
+@dataclass
+class FakeSaleorStats:
+    """Counters collected while serving requests"""
+
+    requests: int = 0
+    throttled: int = 0
+    errors: int = 0
+    unauthorized: int = 0
+    operations: Counter = field(default_factory=Counter)
+
+    def reset(self) -> None:
+        self.requests = self.throttled = self.errors = self.unauthorized = 0
+        self.operations.clear()
+
+
+def _paginate(items: list, max_page_size: int, page_args: dict) -> dict:
+    first, last = page_args.get("first"), page_args.get("last")
+    after, before = page_args.get("after"), page_args.get("before")
+    for name, value in (("first", first), ("last", last)):
+        if value is not None and value > max_page_size:
+            error_msg = (
+                f"Requesting {value} records on the connection exceeds the "
+                f"`{name}` limit of {max_page_size} records."
+            )
+            raise GraphQLError(error_msg)
+    if first is None and last is None:
+        error_msg = "You must provide a `first` or `last` value to properly paginate."
+        raise GraphQLError(error_msg)
+
+    start = int(base64.b64decode(after)) + 1 if after else 0
+    stop = int(base64.b64decode(before)) if before else len(items)
+    window = list(enumerate(items))[start:stop]
+    if first is not None:
+        has_next = len(window) > first
+        window = window[:first]
+        has_previous = start > 0
+    else:
+        has_previous = len(window) > last
+        window = window[-last:] if last else []
+        has_next = stop < len(items)
+
+    def cursor(index: int) -> str:
+        return base64.b64encode(str(index).encode()).decode()
+
+    edges = [{"node": node, "cursor": cursor(index)} for index, node in window]
+    return {
+        "pageInfo": {
+            "hasNextPage": has_next,
+            "hasPreviousPage": has_previous,
+            "startCursor": edges[0]["cursor"] if edges else None,
+            "endCursor": edges[-1]["cursor"] if edges else None,
+        },
+        "edges": edges,
+        "totalCount": len(items),
+    }
+
+
+class _RootValue:
+    """Resolvers for the top-level Query and Mutation fields"""
+
+    def __init__(self, fake: "FakeSaleor"):
+        self.fake = fake
+
+    def app(self, _info):
+        return {
+            "id": encode_id("App", 1),
+            "name": "Fake App",
+            "isActive": True,
+            "permissions": [
+                {"code": "MANAGE_ORDERS", "name": "Manage orders."},
+                {"code": "MANAGE_PRODUCTS", "name": "Manage products."},
+            ],
+        }
+
+    def shop(self, _info):
+        return {"name": "Fake Saleor", "domain": self.fake.config.domain}
+
+    def product(self, _info, id):  # noqa: A002
+        _type_name, pk = decode_id(id)
+        return self.fake.products.get(pk)
+
+    def products(self, _info, **kwargs):
+        products = list(self.fake.products.values())
+        product_filter = kwargs.get("filter") or {}
+        if search := (product_filter.get("search") or "").lower():
+            products = [p for p in products if search in p["name"].lower()]
+        if ids := product_filter.get("ids"):
+            products = [p for p in products if p["id"] in ids]
+        return _paginate(products, self.fake.config.max_page_size, kwargs)
+
+    def order(self, _info, id):  # noqa: A002
+        _type_name, pk = decode_id(id)
+        return self.fake.orders.get(pk)
+
+    def orders(self, _info, **kwargs):
+        orders = list(self.fake.orders.values())
+        return _paginate(orders, self.fake.config.max_page_size, kwargs)
+
+    def productCreate(self, _info, input):  # noqa: A002, N802
+        if not input.get("name"):
+            return {
+                "product": None,
+                "errors": [{"field": "name", "message": "This field is required."}],
+            }
+        pk = max(self.fake.products, default=0) + 1
+        product = make_product(
+            pk,
+            name=input["name"],
+            description=input.get("description"),
+            isPublished=input.get("isPublished", False),
+        )
+        self.fake.products[pk] = product
+        return {"product": product, "errors": []}
+
+    def productDelete(self, _info, id):  # noqa: A002, N802
+        _type_name, pk = decode_id(id)
+        product = self.fake.products.pop(pk, None)
+        if product is None:
+            return {
+                "product": None,
+                "errors": [{"field": "id", "message": f"Couldn't resolve id: {id}."}],
+            }
+        return {"product": product, "errors": []}
+
+
+class FakeSaleor:
+    """In-process stand-in for the Saleor GraphQL API.
+
+    :attr:`app` is an ASGI application serving ``POST /graphql/``; mount it in
+    a test client, or run it on a real socket with :class:`FakeSaleorServer`.
+    Introspection works, so clients with ``fetch_schema_from_transport`` can
+    talk to it unchanged.
+    """
+
+    def __init__(self, config: FakeSaleorConfig | None = None, **overrides):
+        self.config = replace(config or FakeSaleorConfig(), **overrides)
+        self.stats = FakeSaleorStats()
+        self._random = random.Random(self.config.seed)  # noqa: S311
+        self.products = {
+            pk: make_product(pk) for pk in range(1, self.config.product_count + 1)
+        }
+        self.orders = {
+            pk: make_order(pk) for pk in range(1, self.config.order_count + 1)
+        }
+        self._root = _RootValue(self)
+        self.app = Starlette(
+            routes=[Route("/graphql/", self.handle_graphql, methods=["POST"])]
+        )
+
+    async def handle_graphql(self, request: Request) -> JSONResponse:
+        self.stats.requests += 1
+        config = self.config
+
+        delay = config.latency
+        if config.latency_jitter:
+            delay += self._random.uniform(0, config.latency_jitter)
+        if delay:
+            await asyncio.sleep(delay)
+
+        if config.auth_token is not None:
+            expected = f"Bearer {config.auth_token}"
+            if request.headers.get("authorization") != expected:
+                self.stats.unauthorized += 1
+                return _error_response("Invalid token.", 401)
+
+        if config.rate_limit_rate and self._random.random() < config.rate_limit_rate:
+            self.stats.throttled += 1
+            return _error_response(
+                "Too many requests.",
+                429,
+                headers={"Retry-After": str(config.retry_after)},
+            )
+
+        if config.error_rate and self._random.random() < config.error_rate:
+            self.stats.errors += 1
+            return _error_response("Internal Server Error", 500)
+
+        try:
+            payload = json.loads(await request.body())
+            query = payload["query"]
+        except (ValueError, KeyError, TypeError):
+            return _error_response("Must provide query string.", 400)
+
+        self.stats.operations[_operation_name(query, payload)] += 1
+        result = await graphql(
+            SCHEMA,
+            query,
+            root_value=self._root,
+            variable_values=payload.get("variables"),
+            operation_name=payload.get("operationName"),
+        )
+        return JSONResponse(result.formatted)
+
+
+def _error_response(message: str, status_code: int, headers=None) -> JSONResponse:
+    return JSONResponse(
+        {"errors": [{"message": message}]}, status_code=status_code, headers=headers
+    )
+
+
+def _operation_name(query: str, payload: dict) -> str:
+    if payload.get("operationName"):
+        return payload["operationName"]
+    try:
+        document = parse(query)
+    except GraphQLError:
+        return "<invalid>"
+    for definition in document.definitions:
+        if isinstance(definition, OperationDefinitionNode):
+            return definition.name.value if definition.name else "<anonymous>"
+    return "<anonymous>"
+
+
+class FakeSaleorServer:
+    """Run a :class:`FakeSaleor` with uvicorn on a background thread.
+
+    Example:
+        >>> with FakeSaleorServer(latency=0.05, rate_limit_rate=0.1) as server:
+        ...     client = SaleorGraphQLClient(server.api_url, "token")
+    """
+
+    def __init__(
+        self,
+        fake: FakeSaleor | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        **overrides,
+    ):
+        import uvicorn  # noqa: PLC0415
+
+        self.fake = fake or FakeSaleor(**overrides)
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._socket.bind((host, port))
+        self._server = uvicorn.Server(
+            uvicorn.Config(self.fake.app, log_level="warning", lifespan="off")
+        )
+        self._thread = threading.Thread(
+            target=self._server.run, kwargs={"sockets": [self._socket]}, daemon=True
+        )
+
+    @property
+    def api_url(self) -> str:
+        host, port = self._socket.getsockname()[:2]
+        return f"http://{host}:{port}/graphql/"
+
+    @property
+    def stats(self) -> FakeSaleorStats:
+        return self.fake.stats
+
+    def start(self, timeout: float = 5.0) -> "FakeSaleorServer":
+        self._thread.start()
+        deadline = time.monotonic() + timeout
+        while not self._server.started:
+            if time.monotonic() > deadline or not self._thread.is_alive():
+                error_msg = "Fake Saleor server failed to start"
+                raise RuntimeError(error_msg)
+            time.sleep(0.01)
+        return self
+
+    def stop(self) -> None:
+        self._server.should_exit = True
+        self._thread.join(timeout=5)
+        self._socket.close()
+
+    def __enter__(self) -> "FakeSaleorServer":
+        return self.start()
+
+    def __exit__(self, *_exc) -> None:
+        self.stop()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Serve a fake Saleor API from the command line"""
+    import uvicorn  # noqa: PLC0415
+
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--latency-jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--max-page-size", type=int, default=100)
+    parser.add_argument("--product-count", type=int, default=250)
+    parser.add_argument("--order-count", type=int, default=250)
+    parser.add_argument("--auth-token", default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    fake = FakeSaleor(
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        max_page_size=args.max_page_size,
+        product_count=args.product_count,
+        order_count=args.order_count,
+        auth_token=args.auth_token,
+        seed=args.seed,
+    )
+    uvicorn.run(fake.app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
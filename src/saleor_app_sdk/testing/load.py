@@ -0,0 +1,234 @@
+"""
+Webhook load generator for capacity planning
+"""
+
+import asyncio
+import json
+import random
+import time
+from collections import Counter
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import httpx
+
+from saleor_app_sdk.webhooks.events import WebhookEventType
+
+from .webhooks import WebhookEmitter, sample_payload
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted sequence"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, round(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def load_recorded_payloads(path: str | Path) -> list[tuple[WebhookEventType, bytes]]:
+    """Load recorded webhook deliveries.
+
+    ``path`` is either a JSON Lines file whose lines look like
+    ``{"event": "ORDER_CREATED", "payload": {...}}``, or a directory of
+    ``<EVENT_TYPE>*.json`` files holding one payload each.
+    """
+    path = Path(path)
+    deliveries = []
+    if path.is_dir():
+        for file in sorted(path.glob("*.json")):
+            event_name = file.stem.split(".")[0].upper()
+            event_name = next(
+                (e.value for e in WebhookEventType if event_name.startswith(e.value)),
+                event_name,
+            )
+            deliveries.append((WebhookEventType(event_name), file.read_bytes()))
+    else:
+        for line in path.read_text().splitlines():
+            if line.strip():
+                record = json.loads(line)
+                payload = json.dumps(record["payload"]).encode()
+                deliveries.append((WebhookEventType(record["event"]), payload))
+    if not deliveries:
+        error_msg = f"No recorded payloads found in {path}"
+        raise ValueError(error_msg)
+    return deliveries
+
+
+@dataclass
+class LoadReport:
+    """Outcome of a load run"""
+
+    duration: float = 0.0
+    latencies: list[float] = field(default_factory=list)
+    corrected_latencies: list[float] = field(default_factory=list)
+    statuses: Counter = field(default_factory=Counter)
+    errors: Counter = field(default_factory=Counter)
+    by_event: Counter = field(default_factory=Counter)
+
+    @property
+    def total(self) -> int:
+        return len(self.latencies)
+
+    @property
+    def succeeded(self) -> int:
+        return sum(
+            count
+            for status, count in self.statuses.items()
+            if 200 <= status < 300  # noqa: PLR2004
+        )
+
+    @property
+    def failed(self) -> int:
+        return self.total - self.succeeded
+
+    @property
+    def throughput(self) -> float:
+        return self.total / self.duration if self.duration else 0.0
+
+    def summary(self) -> dict:
+        latencies = sorted(self.latencies)
+        corrected = sorted(self.corrected_latencies)
+        return {
+            "requests": self.total,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "duration_s": round(self.duration, 3),
+            "throughput_rps": round(self.throughput, 2),
+            "latency_ms": {
+                **{
+                    f"p{p}": round(percentile(latencies, p) * 1000, 2)
+                    for p in PERCENTILES
+                },
+                "max": round((latencies[-1] if latencies else 0) * 1000, 2),
+            },
+            "corrected_latency_ms": {
+                f"p{p}": round(percentile(corrected, p) * 1000, 2) for p in PERCENTILES
+            },
+            "status_codes": {str(k): v for k, v in sorted(self.statuses.items())},
+            "errors": dict(self.errors.most_common()),
+            "events": dict(self.by_event.most_common()),
+        }
+
+    def format_text(self) -> str:
+        summary = self.summary()
+        latency = summary["latency_ms"]
+        corrected = summary["corrected_latency_ms"]
+        lines = [
+            (
+                f"Requests:    {summary['requests']} "
+                f"({summary['succeeded']} ok, {summary['failed']} failed)"
+            ),
+            f"Duration:    {summary['duration_s']} s",
+            f"Throughput:  {summary['throughput_rps']} req/s",
+            "Latency ms:  "
+            + "  ".join(f"{name}={value}" for name, value in latency.items()),
+            "Corrected:   "
+            + "  ".join(f"{name}={value}" for name, value in corrected.items()),
+        ]
+        if summary["status_codes"]:
+            lines.append(
+                "Statuses:    "
+                + "  ".join(f"{k}={v}" for k, v in summary["status_codes"].items())
+            )
+        if summary["errors"]:
+            lines.append("Errors:")
+            lines.extend(
+                f"  {count:>7}  {error}" for error, count in summary["errors"].items()
+            )
+        return "\n".join(lines)
+
+
+class WebhookLoadGenerator:
+    """Replay signed webhooks against an app at a target rate and concurrency.
+
+    Requests are scheduled open-loop at ``rps`` (or as fast as the
+    concurrency allows when ``rps`` is 0). ``corrected_latencies`` are
+    measured from each request's scheduled start, so they include time spent
+    waiting for a free slot when the app falls behind.
+    """
+
+    def __init__(
+        self,
+        emitter: WebhookEmitter,
+        *,
+        events: Sequence[WebhookEventType] | None = None,
+        recorded: Sequence[tuple[WebhookEventType, bytes]] | None = None,
+        rps: float = 0.0,
+        concurrency: int = 10,
+    ):
+        self.emitter = emitter
+        self.events = list(events or WebhookEventType)
+        self.recorded = list(recorded or [])
+        self.rps = rps
+        self.concurrency = concurrency
+        self._random = random.Random()  # noqa: S311
+
+    def deliveries(self) -> Iterator[tuple[WebhookEventType, bytes]]:
+        """Endless stream of (event type, body) pairs to send"""
+        while True:
+            if self.recorded:
+                yield self._random.choice(self.recorded)
+            else:
+                event = self._random.choice(self.events)
+                pk = self._random.randint(1, 100_000)
+                yield event, json.dumps(sample_payload(event, pk)).encode()
+
+    async def run(
+        self, requests: int | None = None, duration: float | None = None
+    ) -> LoadReport:
+        """Send until ``requests`` have been issued or ``duration`` has elapsed"""
+        if requests is None and duration is None:
+            error_msg = "Either requests or duration is required"
+            raise ValueError(error_msg)
+
+        report = LoadReport()
+        slots = asyncio.Semaphore(self.concurrency)
+        tasks: set[asyncio.Task] = set()
+        start = time.perf_counter()
+        deliveries = self.deliveries()
+
+        sent = 0
+        while requests is None or sent < requests:
+            scheduled = start + sent / self.rps if self.rps else time.perf_counter()
+            if duration is not None and scheduled - start >= duration:
+                break
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            await slots.acquire()
+            event, body = next(deliveries)
+            task = asyncio.create_task(self._send(event, body, scheduled, report))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            task.add_done_callback(lambda _task: slots.release())
+            sent += 1
+
+        if tasks:
+            await asyncio.gather(*tasks)
+        report.duration = time.perf_counter() - start
+        return report
+
+    async def _send(
+        self, event: WebhookEventType, body: bytes, scheduled: float, report: LoadReport
+    ) -> None:
+        sent_at = time.perf_counter()
+        try:
+            response = await self.emitter.emit(event, body)
+        except httpx.TimeoutException:
+            report.errors["timeout"] += 1
+            report.statuses[0] += 1
+        except httpx.HTTPError as e:
+            report.errors[type(e).__name__] += 1
+            report.statuses[0] += 1
+        else:
+            report.statuses[response.status_code] += 1
+            if response.status_code >= 400:  # noqa: PLR2004
+                report.errors[f"HTTP {response.status_code}"] += 1
+        finally:
+            done = time.perf_counter()
+            report.latencies.append(done - sent_at)
+            report.corrected_latencies.append(done - min(scheduled, sent_at))
+            report.by_event[event.value] += 1
@@ -2,7 +2,99 @@
 Webhook-related functionality for Saleor App SDK
 """
 
-from .events import WebhookEventType
-from .handler import WebhookHandler
+from typing import TYPE_CHECKING
 
-__all__ = ["WebhookEventType", "WebhookHandler"]
+from saleor_app_sdk._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .admission import AdmissionController
+    from .batching import WebhookBatcher
+    from .dead_letters import (
+        DeadLetter,
+        DeadLetterStore,
+        MemoryDeadLetterStore,
+        SQLiteDeadLetterStore,
+    )
+    from .events import SyncWebhookEventType, WebhookEventType
+    from .handler import WebhookHandler
+    from .memo import SyncResponseCache
+    from .partitions import PartitionedExecutor
+    from .retry import RetryPolicy
+    from .subscriptions import (
+        SubscriptionSizeReport,
+        build_subscription,
+        fetch_schema,
+        load_schema,
+        size_report,
+    )
+    from .sync import (
+        CalculateTaxesResponse,
+        ExcludedShippingMethod,
+        FilterShippingMethodsResponse,
+        ListShippingMethodsResponse,
+        PaymentGatewayInitializeSessionResponse,
+        ShippingMethod,
+        TaxLine,
+        TransactionResponse,
+    )
+    from .tenants import TenantScheduler
+
+_EXPORTS = {
+    "AdmissionController": ".admission",
+    "CalculateTaxesResponse": ".sync",
+    "DeadLetter": ".dead_letters",
+    "DeadLetterStore": ".dead_letters",
+    "ExcludedShippingMethod": ".sync",
+    "FilterShippingMethodsResponse": ".sync",
+    "ListShippingMethodsResponse": ".sync",
+    "MemoryDeadLetterStore": ".dead_letters",
+    "PartitionedExecutor": ".partitions",
+    "PaymentGatewayInitializeSessionResponse": ".sync",
+    "RetryPolicy": ".retry",
+    "SQLiteDeadLetterStore": ".dead_letters",
+    "ShippingMethod": ".sync",
+    "SubscriptionSizeReport": ".subscriptions",
+    "SyncResponseCache": ".memo",
+    "SyncWebhookEventType": ".events",
+    "TaxLine": ".sync",
+    "TenantScheduler": ".tenants",
+    "TransactionResponse": ".sync",
+    "WebhookBatcher": ".batching",
+    "WebhookEventType": ".events",
+    "WebhookHandler": ".handler",
+    "build_subscription": ".subscriptions",
+    "fetch_schema": ".subscriptions",
+    "load_schema": ".subscriptions",
+    "size_report": ".subscriptions",
+}
+
+__all__ = [
+    "AdmissionController",
+    "CalculateTaxesResponse",
+    "DeadLetter",
+    "DeadLetterStore",
+    "ExcludedShippingMethod",
+    "FilterShippingMethodsResponse",
+    "ListShippingMethodsResponse",
+    "MemoryDeadLetterStore",
+    "PartitionedExecutor",
+    "PaymentGatewayInitializeSessionResponse",
+    "RetryPolicy",
+    "SQLiteDeadLetterStore",
+    "ShippingMethod",
+    "SubscriptionSizeReport",
+    "SyncResponseCache",
+    "SyncWebhookEventType",
+    "TaxLine",
+    "TenantScheduler",
+    "TransactionResponse",
+    "WebhookBatcher",
+    "WebhookEventType",
+    "WebhookHandler",
+    "build_subscription",
+    "fetch_schema",
+    "load_schema",
+    "size_report",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
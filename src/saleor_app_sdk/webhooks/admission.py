@@ -0,0 +1,99 @@
+"""
+Admission control for the webhook endpoint
+"""
+
+import asyncio
+import contextlib
+from collections import Counter
+
+# Seconds Saleor is asked to wait before re-sending a rejected webhook
+DEFAULT_RETRY_AFTER = 5
+
+
+class AdmissionController:
+    """Reject webhooks early, while rejecting is still cheap.
+
+    A webhook is shed when the event loop lags more than ``max_loop_lag``
+    seconds, when ``max_in_flight`` webhooks are already being processed, or
+    when ``max_queue_depth`` events wait in partitions and batches. Async
+    events are answered with a 503 and ``Retry-After``, which Saleor retries
+    later. Sync events block a checkout and are not retried, so their limits
+    are ``sync_headroom`` times higher; past those, a sync handler's
+    fallback is sent when it has one.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        max_loop_lag: float = 0.25,
+        max_in_flight: int = 256,
+        max_queue_depth: int = 1000,
+        sync_headroom: float = 2.0,
+        retry_after: int = DEFAULT_RETRY_AFTER,
+        lag_interval: float = 0.05,
+    ):
+        self.max_loop_lag = max_loop_lag
+        self.max_in_flight = max_in_flight
+        self.max_queue_depth = max_queue_depth
+        self.sync_headroom = sync_headroom
+        self.retry_after = retry_after
+        self.lag_interval = lag_interval
+        self.loop_lag = 0.0
+        self.admitted = 0
+        self.shed: Counter[str] = Counter()
+        self._monitor: asyncio.Task | None = None
+
+    def _watch_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._monitor is None or self._monitor.get_loop() is not loop:
+            self.loop_lag = 0.0
+            self._monitor = loop.create_task(self._measure_lag(loop))
+
+    async def _measure_lag(self, loop: asyncio.AbstractEventLoop) -> None:
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.lag_interval)
+            self.loop_lag = max(0.0, loop.time() - start - self.lag_interval)
+
+    def check(
+        self, *, in_flight: int, queue_depth: int, sync: bool = False
+    ) -> str | None:
+        """Return why a webhook must be shed, or None to admit it"""
+        self._watch_loop()
+        headroom = self.sync_headroom if sync else 1.0
+        if self.loop_lag > self.max_loop_lag * headroom:
+            reason = "loop_lag"
+        elif in_flight >= self.max_in_flight * headroom:
+            reason = "in_flight"
+        elif queue_depth >= self.max_queue_depth * headroom:
+            reason = "queue_depth"
+        else:
+            self.admitted += 1
+            return None
+        self.shed[reason] += 1
+        return reason
+
+    @property
+    def shed_ratio(self) -> float:
+        """Fraction of webhooks shed since start"""
+        shed = sum(self.shed.values())
+        total = self.admitted + shed
+        return shed / total if total else 0.0
+
+    def stats(self) -> dict:
+        """Current loop lag, and webhooks admitted and shed by reason"""
+        return {
+            "loopLag": self.loop_lag,
+            "admitted": self.admitted,
+            "shed": dict(self.shed),
+            "shedRatio": self.shed_ratio,
+        }
+
+    async def close(self) -> None:
+        """Stop watching the event loop"""
+        if self._monitor is not None:
+            self._monitor.cancel()
+            if self._monitor.get_loop() is asyncio.get_running_loop():
+                with contextlib.suppress(asyncio.CancelledError):
+                    await self._monitor
+            self._monitor = None
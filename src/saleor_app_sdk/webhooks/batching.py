@@ -0,0 +1,120 @@
+"""
+Micro-batching of asynchronous webhook events
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+
+from saleor_app_sdk.instrumentation import get_instrumentation
+
+from .events import WebhookEventType
+
+logger = logging.getLogger(__name__)
+
+# Defaults for a batch handler: flush at this many events, or this many
+# seconds after the first event of the batch arrived
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_BATCH_WAIT = 0.5
+
+
+class WebhookBatcher:
+    """Collect payloads of one event type into batches for a list handler.
+
+    A batch is handed to ``handler`` once it holds ``max_size`` payloads or
+    ``max_wait`` seconds after its first payload arrived, whichever comes
+    first. :meth:`submit` returns only when the batch holding its payload was
+    handled, and raises the handler's exception otherwise, so each webhook is
+    still acknowledged (or left for Saleor to retry) on its own.
+    """
+
+    __slots__ = (
+        "_batches",
+        "_pending",
+        "_timer",
+        "event_type",
+        "handler",
+        "max_size",
+        "max_wait",
+    )
+
+    def __init__(
+        self,
+        event_type: WebhookEventType,
+        handler: Callable,
+        *,
+        max_size: int = DEFAULT_BATCH_SIZE,
+        max_wait: float = DEFAULT_BATCH_WAIT,
+    ):
+        if max_size < 1:
+            error_msg = "max_size must be at least 1"
+            raise ValueError(error_msg)
+        if max_wait < 0:
+            error_msg = "max_wait must not be negative"
+            raise ValueError(error_msg)
+        self.event_type = WebhookEventType(event_type)
+        self.handler = handler
+        self.max_size = max_size
+        self.max_wait = max_wait
+        self._pending: list[tuple[dict, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._batches: set[asyncio.Task] = set()
+
+    async def submit(self, payload: dict) -> None:
+        """Add a payload to the current batch and wait until it is handled"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((payload, future))
+        if len(self._pending) >= self.max_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+        await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        # Payloads whose request went away are left for Saleor to re-send
+        batch = [(p, f) for p, f in self._pending if not f.done()]
+        self._pending = []
+        if not batch:
+            return
+        task = asyncio.ensure_future(self._handle(batch))
+        self._batches.add(task)
+        task.add_done_callback(self._batches.discard)
+
+    async def _handle(self, batch: list[tuple[dict, asyncio.Future]]) -> None:
+        start = time.perf_counter()
+        try:
+            payloads = [payload for payload, _future in batch]
+            if asyncio.iscoroutinefunction(self.handler):
+                await self.handler(payloads)
+            else:
+                self.handler(payloads)
+        except Exception as e:
+            logger.exception(
+                "%s batch handler failed (%d events)", self.event_type.value, len(batch)
+            )
+            for _payload, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for _payload, future in batch:
+                if not future.done():
+                    future.set_result(None)
+        instrumentation = get_instrumentation()
+        if instrumentation is not None:
+            instrumentation.observe_webhook_batch(
+                self.event_type.value, len(batch), time.perf_counter() - start
+            )
+
+    async def flush(self) -> None:
+        """Hand the current batch over now and wait for all running batches"""
+        self._flush()
+        if self._batches:
+            await asyncio.gather(*self._batches, return_exceptions=True)
+
+    def __len__(self) -> int:
+        return len(self._pending)
@@ -0,0 +1,216 @@
+"""
+Dead-letter stores for webhooks whose handlers kept failing
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class DeadLetter:
+    """A verified webhook payload whose handler failed, with the error"""
+
+    event_type: str
+    domain: str
+    payload: dict | list
+    error: str
+    attempts: int
+    failed_at: float = field(default_factory=time.time)
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+
+    def to_dict(self, *, payload: bool = True) -> dict:
+        data = {
+            "id": self.id,
+            "eventType": self.event_type,
+            "domain": self.domain,
+            "error": self.error,
+            "attempts": self.attempts,
+            "failedAt": self.failed_at,
+        }
+        if payload:
+            data["payload"] = self.payload
+        return data
+
+
+class DeadLetterStore(ABC):
+    """Async storage of dead letters, oldest first"""
+
+    @abstractmethod
+    async def add(self, entry: DeadLetter) -> None:
+        """Store an entry, replacing one with the same id"""
+
+    @abstractmethod
+    async def get(self, entry_id: str) -> DeadLetter | None:
+        """Return an entry by id, or None"""
+
+    @abstractmethod
+    async def list(
+        self, limit: int = 100, event_type: str | None = None
+    ) -> list[DeadLetter]:
+        """Return up to ``limit`` entries, oldest first"""
+
+    @abstractmethod
+    async def remove(self, entry_id: str) -> bool:
+        """Delete an entry; returns False if there was none"""
+
+    async def close(self) -> None:  # noqa: B027
+        """Release connections held by the store"""
+
+
+class MemoryDeadLetterStore(DeadLetterStore):
+    """Dead letters in process memory, dropping the oldest past ``max_entries``.
+
+    Entries are lost on restart; use :class:`SQLiteDeadLetterStore` or your
+    own store to keep them.
+    """
+
+    def __init__(self, max_entries: int = 10_000):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, DeadLetter] = OrderedDict()
+
+    async def add(self, entry: DeadLetter) -> None:
+        self._entries[entry.id] = entry
+        while len(self._entries) > self.max_entries:
+            dropped_id, dropped = self._entries.popitem(last=False)
+            logger.warning(
+                "Dead-letter store full, dropped %s (%s)",
+                dropped_id,
+                dropped.event_type,
+            )
+
+    async def get(self, entry_id: str) -> DeadLetter | None:
+        return self._entries.get(entry_id)
+
+    async def list(
+        self, limit: int = 100, event_type: str | None = None
+    ) -> list[DeadLetter]:
+        entries = (
+            entry
+            for entry in self._entries.values()
+            if event_type is None or entry.event_type == event_type
+        )
+        return [entry for _, entry in zip(range(limit), entries, strict=False)]
+
+    async def remove(self, entry_id: str) -> bool:
+        return self._entries.pop(entry_id, None) is not None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS {table} (
+    id TEXT PRIMARY KEY,
+    event_type TEXT NOT NULL,
+    domain TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    error TEXT NOT NULL,
+    attempts INTEGER NOT NULL,
+    failed_at REAL NOT NULL
+)
+"""
+
+
+class SQLiteDeadLetterStore(DeadLetterStore):
+    """Dead letters kept in a SQLite file, surviving restarts.
+
+    Queries run in a worker thread so the event loop is never blocked.
+    """
+
+    def __init__(self, path: str, table: str = "saleor_app_dead_letters"):
+        if not table.isidentifier():
+            error_msg = f"Invalid table name: {table!r}"
+            raise ValueError(error_msg)
+        self.path = path
+        self.table = table
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(
+                self.path, check_same_thread=False, isolation_level=None
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_SCHEMA.format(table=self.table))
+            self._conn = conn
+        return self._conn
+
+    async def _run(self, query: str, params: tuple = ()) -> list[tuple]:
+        def locked():
+            with self._lock:
+                return self._connection().execute(query, params).fetchall()
+
+        return await asyncio.to_thread(locked)
+
+    @staticmethod
+    def _entry(row: tuple) -> DeadLetter:
+        entry_id, event_type, domain, payload, error, attempts, failed_at = row
+        return DeadLetter(
+            event_type,
+            domain,
+            json.loads(payload),
+            error,
+            attempts,
+            failed_at,
+            entry_id,
+        )
+
+    async def add(self, entry: DeadLetter) -> None:
+        await self._run(
+            f"INSERT OR REPLACE INTO {self.table} VALUES (?, ?, ?, ?, ?, ?, ?)",  # noqa: S608
+            (
+                entry.id,
+                entry.event_type,
+                entry.domain,
+                json.dumps(entry.payload),
+                entry.error,
+                entry.attempts,
+                entry.failed_at,
+            ),
+        )
+
+    async def get(self, entry_id: str) -> DeadLetter | None:
+        rows = await self._run(
+            f"SELECT * FROM {self.table} WHERE id = ?",  # noqa: S608
+            (entry_id,),
+        )
+        return self._entry(rows[0]) if rows else None
+
+    async def list(
+        self, limit: int = 100, event_type: str | None = None
+    ) -> list[DeadLetter]:
+        if event_type is None:
+            rows = await self._run(
+                f"SELECT * FROM {self.table} ORDER BY failed_at LIMIT ?",  # noqa: S608
+                (limit,),
+            )
+        else:
+            rows = await self._run(
+                f"SELECT * FROM {self.table} WHERE event_type = ? "  # noqa: S608
+                "ORDER BY failed_at LIMIT ?",
+                (event_type, limit),
+            )
+        return [self._entry(row) for row in rows]
+
+    async def remove(self, entry_id: str) -> bool:
+        rows = await self._run(
+            f"DELETE FROM {self.table} WHERE id = ? RETURNING id",  # noqa: S608
+            (entry_id,),
+        )
+        return bool(rows)
+
+    async def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -21,3 +21,19 @@ class WebhookEventType(str, Enum):
     CHECKOUT_CREATED = "CHECKOUT_CREATED"
     CHECKOUT_UPDATED = "CHECKOUT_UPDATED"
     # Add more as needed
+
+
+class SyncWebhookEventType(str, Enum):
+    """Synchronous events: Saleor waits for the app's response"""
+
+    CHECKOUT_CALCULATE_TAXES = "CHECKOUT_CALCULATE_TAXES"
+    ORDER_CALCULATE_TAXES = "ORDER_CALCULATE_TAXES"
+    SHIPPING_LIST_METHODS_FOR_CHECKOUT = "SHIPPING_LIST_METHODS_FOR_CHECKOUT"
+    CHECKOUT_FILTER_SHIPPING_METHODS = "CHECKOUT_FILTER_SHIPPING_METHODS"
+    ORDER_FILTER_SHIPPING_METHODS = "ORDER_FILTER_SHIPPING_METHODS"
+    PAYMENT_GATEWAY_INITIALIZE_SESSION = "PAYMENT_GATEWAY_INITIALIZE_SESSION"
+    TRANSACTION_INITIALIZE_SESSION = "TRANSACTION_INITIALIZE_SESSION"
+    TRANSACTION_PROCESS_SESSION = "TRANSACTION_PROCESS_SESSION"
+    TRANSACTION_CHARGE_REQUESTED = "TRANSACTION_CHARGE_REQUESTED"
+    TRANSACTION_REFUND_REQUESTED = "TRANSACTION_REFUND_REQUESTED"
+    TRANSACTION_CANCELATION_REQUESTED = "TRANSACTION_CANCELATION_REQUESTED"
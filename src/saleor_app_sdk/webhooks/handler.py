@@ -7,26 +7,91 @@ import hashlib
 import hmac
 import json
 import logging
+import time
 from collections.abc import Callable
+from contextlib import nullcontext
 
-from fastapi import HTTPException, Request
+from fastapi import HTTPException, Request, Response
 
-from .events import WebhookEventType
+from saleor_app_sdk import deadlines
+from saleor_app_sdk.instrumentation import StageTimer, get_instrumentation
+from saleor_app_sdk.profiling import Profiler
+
+from .admission import DEFAULT_RETRY_AFTER, AdmissionController
+from .batching import DEFAULT_BATCH_SIZE, DEFAULT_BATCH_WAIT, WebhookBatcher
+from .dead_letters import DeadLetter, DeadLetterStore
+from .events import SyncWebhookEventType, WebhookEventType
+from .memo import MemoKey, SyncResponseCache
+from .partitions import PartitionedExecutor
+from .retry import RetryPolicy
+from .sync import SyncWebhookResponse, SyncWebhookRoute
+from .tenants import TenantScheduler
 
 logger = logging.getLogger(__name__)
 
+# Saleor gives up on an async webhook delivery after this many seconds
+DEFAULT_WEBHOOK_DEADLINE = 10.0
+
+# How often shutdown checks whether the webhooks in flight have finished
+_DRAIN_INTERVAL = 0.01
+
+
+def _record_abandoned(kind: str, count: int) -> None:
+    logger.warning("Abandoned %d unfinished %s(s)", count, kind)
+    instrumentation = get_instrumentation()
+    if instrumentation is not None:
+        instrumentation.observe_abandoned(kind, count)
+
 
 class WebhookHandler:
-    """Handle incoming webhooks from Saleor"""
+    """Handle incoming webhooks from Saleor.
+
+    Async webhooks are processed within ``deadline`` seconds of arriving
+    (None for no limit): GraphQL calls, pool and slot waits and retries made
+    for them give up once it passed, since Saleor re-sends the webhook
+    anyway. Sync webhooks use the deadline of their handler.
+    """
 
-    def __init__(self, secret_key: str):
+    def __init__(  # noqa: PLR0913
+        self,
+        secret_key: str,
+        *,
+        executor: PartitionedExecutor | None = None,
+        retry: RetryPolicy | None = None,
+        dead_letters: DeadLetterStore | None = None,
+        admission: AdmissionController | None = None,
+        scheduler: TenantScheduler | None = None,
+        deadline: float | None = DEFAULT_WEBHOOK_DEADLINE,
+    ):
         self.secret_key = secret_key
+        self.executor = executor
+        self.retry = retry
+        self.dead_letters = dead_letters
+        self.admission = admission
+        self.scheduler = scheduler
+        self.deadline = deadline
+        self.accepting = True
+        self.in_flight = 0
         self._handlers: dict[WebhookEventType, Callable] = {}
+        self._listeners: dict[WebhookEventType, list[Callable[[str, dict], None]]] = {}
+        self._sync_routes: dict[SyncWebhookEventType, SyncWebhookRoute] = {}
+        self._batchers: dict[WebhookEventType, WebhookBatcher] = {}
+        self.profiler: Profiler | None = None
 
     def register_handler(self, event_type: WebhookEventType, handler: Callable):
         """Register a handler for specific webhook event"""
         self._handlers[event_type] = handler
 
+    def add_listener(
+        self, event_type: WebhookEventType, listener: Callable[[str, dict], None]
+    ):
+        """Call ``listener(domain, payload)`` after each handled event.
+
+        Unlike handlers, any number of listeners can watch an event type. They
+        run synchronously and should be cheap, e.g. cache invalidation.
+        """
+        self._listeners.setdefault(event_type, []).append(listener)
+
     def on(self, event_type: WebhookEventType):
         """Decorator to register webhook handlers"""
 
@@ -36,6 +101,86 @@ class WebhookHandler:
 
         return decorator
 
+    def register_batch_handler(
+        self,
+        event_type: WebhookEventType,
+        handler: Callable[[list[dict]], None],
+        *,
+        max_size: int = DEFAULT_BATCH_SIZE,
+        max_wait: float = DEFAULT_BATCH_WAIT,
+    ):
+        """Register a handler called with lists of payloads of an event.
+
+        Payloads are collected until ``max_size`` arrived or ``max_wait``
+        seconds passed since the first one. Each webhook is acknowledged only
+        after its batch was handled; when the handler raises, every webhook
+        of the batch fails and Saleor re-sends it.
+        """
+        self._batchers[event_type] = WebhookBatcher(
+            event_type, handler, max_size=max_size, max_wait=max_wait
+        )
+
+    def on_batch(self, event_type: WebhookEventType, **options):
+        """Decorator to register batch handlers, taking the options of
+        :meth:`register_batch_handler`"""
+
+        def decorator(func: Callable):
+            self.register_batch_handler(event_type, func, **options)
+            return func
+
+        return decorator
+
+    async def flush_batches(self) -> None:
+        """Hand pending batches to their handlers and wait for them"""
+        await asyncio.gather(*(batcher.flush() for batcher in self._batchers.values()))
+
+    def register_sync_handler(  # noqa: PLR0913
+        self,
+        event_type: SyncWebhookEventType,
+        handler: Callable,
+        *,
+        deadline: float | None = None,
+        fallback: SyncWebhookResponse | None = None,
+        memoize: SyncResponseCache | None = None,
+        memo_key: MemoKey | None = None,
+    ):
+        """Register the handler answering a synchronous webhook.
+
+        The handler must return the response type for the event (e.g.
+        ``CalculateTaxesResponse``) within ``deadline`` seconds; otherwise it
+        is cancelled and ``fallback`` is sent instead, or a 503 when there is
+        no fallback.
+
+        With ``memoize``, successful responses are cached per installation
+        and hash of the payload fields named by ``memo_key`` (see
+        :func:`~saleor_app_sdk.webhooks.memo.memo_key_function`), so Saleor's
+        repeated deliveries for an unchanged checkout skip the handler.
+        Only tax and shipping events can be memoized; the filter-shipping
+        events also need an explicit ``memo_key``.
+        """
+        self._sync_routes[event_type] = SyncWebhookRoute(
+            event_type,
+            handler,
+            deadline=deadline,
+            fallback=fallback,
+            memo=memoize,
+            memo_key=memo_key,
+        )
+
+    def on_sync(
+        self,
+        event_type: SyncWebhookEventType,
+        **options,
+    ):
+        """Decorator to register synchronous webhook handlers, taking the
+        options of :meth:`register_sync_handler`"""
+
+        def decorator(func: Callable):
+            self.register_sync_handler(event_type, func, **options)
+            return func
+
+        return decorator
+
     def verify_signature(self, payload: bytes, signature: str) -> bool:
         """Verify webhook signature"""
         expected_signature = hmac.new(
@@ -43,27 +188,311 @@ class WebhookHandler:
         ).hexdigest()
         return hmac.compare_digest(signature, expected_signature)
 
-    async def process_webhook(self, request: Request) -> dict:
+    def queue_depth(self) -> int:
+        """Events waiting for a tenant slot, in partitions and in batches"""
+        depth = sum(len(batcher) for batcher in self._batchers.values())
+        if self.executor is not None:
+            depth += len(self.executor)
+        if self.scheduler is not None:
+            depth += self.scheduler.queued()
+        return depth
+
+    def _shed(self, request: Request) -> Response | None:
+        event_name = request.headers.get("saleor-event", "")
+        route = self._sync_routes.get(event_name)
+        if not self.accepting:
+            reason = "shutdown"
+        elif self.admission is None:
+            return None
+        else:
+            reason = self.admission.check(
+                in_flight=self.in_flight,
+                queue_depth=self.queue_depth(),
+                sync=route is not None,
+            )
+            if reason is None:
+                return None
+        instrumentation = get_instrumentation()
+        if instrumentation is not None:
+            instrumentation.observe_webhook_shed(event_name, reason)
+        if route is not None and route.fallback is not None:
+            return route.fallback_response()
+        retry_after = (
+            DEFAULT_RETRY_AFTER
+            if self.admission is None
+            else self.admission.retry_after
+        )
+        raise HTTPException(
+            status_code=503,
+            detail="Shutting down"
+            if reason == "shutdown"
+            else f"Overloaded ({reason})",
+            headers={"Retry-After": str(retry_after)},
+        )
+
+    async def process_webhook(self, request: Request) -> dict | Response:
         """Process incoming webhook request"""
+        # Checked before reading the body, while rejecting is cheap
+        if self.admission is not None or not self.accepting:
+            shed = self._shed(request)
+            if shed is not None:
+                return shed
+        self.in_flight += 1
+        try:
+            # Sync webhooks are bounded by their own deadline and never queued
+            if request.headers.get("saleor-event", "") in self._sync_routes:
+                return await self._profile_webhook(request)
+            with deadlines.deadline(self.deadline):
+                return await self._profile_webhook(request)
+        except deadlines.DeadlineExceededError as e:
+            raise HTTPException(status_code=503, detail=str(e)) from e
+        except asyncio.CancelledError:
+            # The server dropped the request, e.g. when its graceful shutdown
+            # timeout ran out before the lifespan shutdown could drain it
+            _record_abandoned("webhook", 1)
+            raise
+        finally:
+            self.in_flight -= 1
+
+    async def shutdown(self, grace: float) -> dict[str, int]:
+        """Stop accepting webhooks and finish the work already accepted.
+
+        New webhooks are answered with a 503 and ``Retry-After`` (or their
+        sync fallback), so Saleor re-sends them to another worker. Pending
+        batches are handed to their handlers, and webhooks in flight and
+        queued partition calls get up to ``grace`` seconds to finish. Then the
+        partition workers and the loop-lag monitor are stopped.
+
+        Returns how many webhooks, batched events and partition calls were
+        left unfinished, by kind. Dropped batched events and partition calls
+        are counted in the metrics here; webhooks still in flight are counted
+        when the server cancels them.
+        """
+        self.accepting = False
+        drain = asyncio.ensure_future(self._drain())
+        await asyncio.wait({drain}, timeout=grace)
+        abandoned = {
+            "webhook": self.in_flight,
+            "batch": sum(len(batcher) for batcher in self._batchers.values()),
+            "partition": len(self.executor) if self.executor is not None else 0,
+        }
+        drain.cancel()
+        if self.executor is not None:
+            await self.executor.close()
+        if self.admission is not None:
+            await self.admission.close()
+        if abandoned["webhook"]:
+            logger.warning(
+                "Shutdown grace ran out with %d webhook(s) in flight",
+                abandoned["webhook"],
+            )
+        for kind in ("batch", "partition"):
+            if abandoned[kind]:
+                _record_abandoned(kind, abandoned[kind])
+        return abandoned
+
+    async def _drain(self) -> None:
+        await self.flush_batches()
+        while self.in_flight:
+            await asyncio.sleep(_DRAIN_INTERVAL)
+            # Webhooks still in flight may have joined a new batch
+            await self.flush_batches()
+        if self.executor is not None:
+            await self.executor.drain()
+
+    async def _profile_webhook(self, request: Request) -> dict | Response:
+        if self.profiler is None:
+            return await self._observe_webhook(request)
+        key = Profiler.webhook_key(request.headers.get("saleor-event", ""))
+        with self.profiler.profile(key, request.headers):
+            return await self._observe_webhook(request)
+
+    async def _observe_webhook(self, request: Request) -> dict | Response:
+        instrumentation = get_instrumentation()
+        if instrumentation is None:
+            return await self._process_webhook(request, None)
+
+        event_name = request.headers.get("saleor-event", "")
+        timer = instrumentation.webhook_timer(event_name)
+        with instrumentation.span("saleor.webhook", **{"saleor.event": event_name}):
+            try:
+                response = await self._process_webhook(request, timer)
+            except HTTPException as e:
+                outcome = (
+                    "invalid_signature" if e.status_code == 401 else "error"  # noqa: PLR2004
+                )
+                instrumentation.observe_webhook_result(event_name, outcome)
+                raise
+            instrumentation.observe_webhook_result(event_name, "ok")
+            return response
+
+    @staticmethod
+    async def _call(handler: Callable, data: dict) -> None:
+        if asyncio.iscoroutinefunction(handler):
+            await handler(data)
+        else:
+            handler(data)
+
+    async def _retrying(self, event_type: WebhookEventType, call: Callable):
+        if self.retry is None:
+            return await call()
+
+        def on_retry(_attempt: int, _error: Exception) -> None:
+            instrumentation = get_instrumentation()
+            if instrumentation is not None:
+                instrumentation.observe_webhook_retry(event_type.value)
+
+        return await self.retry.run(call, on_retry)
+
+    async def _dispatch(
+        self,
+        event_type: WebhookEventType,
+        data: dict,
+        timer: StageTimer | None,
+        domain: str = "",
+    ) -> None:
+        handler = self._handlers.get(event_type)
+        if handler is not None:
+
+            async def call():
+                # Retried in place, so later events of a partition stay behind
+                return await self._retrying(
+                    event_type, lambda: self._call(handler, data)
+                )
+
+            if self.executor is None:
+                await call()
+            else:
+                # Entity ids are only unique within one Saleor instance
+                entity = self.executor.key(data)
+                await self.executor.submit(
+                    None if entity is None else f"{domain} {entity}", call
+                )
+            if timer is not None:
+                timer.lap("handler")
+        batcher = self._batchers.get(event_type)
+        if batcher is not None:
+            await self._retrying(event_type, lambda: batcher.submit(data))
+            if timer is not None:
+                timer.lap("batch")
+        for listener in self._listeners.get(event_type, ()):
+            listener(domain, data)
+
+    async def _dead_letter(
+        self, event_type: WebhookEventType, data: dict, domain: str, error: Exception
+    ) -> DeadLetter:
+        entry = DeadLetter(
+            event_type.value,
+            domain,
+            data,
+            repr(error),
+            self.retry.attempts if self.retry is not None else 1,
+        )
+        await self.dead_letters.add(entry)
+        instrumentation = get_instrumentation()
+        if instrumentation is not None:
+            instrumentation.observe_dead_letter(event_type.value, "stored")
+        return entry
+
+    async def replay(self, entry_id: str) -> bool:
+        """Run the handlers for a dead letter again.
+
+        The entry is removed when they succeed. Otherwise it is kept with the
+        new error and attempt count, and False is returned.
+        """
+        if self.dead_letters is None:
+            error_msg = "no dead-letter store configured"
+            raise ValueError(error_msg)
+        entry = await self.dead_letters.get(entry_id)
+        if entry is None:
+            error_msg = f"no dead letter {entry_id!r}"
+            raise KeyError(error_msg)
+        event_type = WebhookEventType(entry.event_type)
+        instrumentation = get_instrumentation()
+        try:
+            await self._dispatch(event_type, entry.payload, None, entry.domain)
+        except Exception as e:
+            logger.exception("Replaying dead letter %s failed", entry_id)
+            entry.error = repr(e)
+            entry.attempts += self.retry.attempts if self.retry is not None else 1
+            await self.dead_letters.add(entry)
+            if instrumentation is not None:
+                instrumentation.observe_dead_letter(entry.event_type, "replay_failed")
+            return False
+        await self.dead_letters.remove(entry_id)
+        if instrumentation is not None:
+            instrumentation.observe_dead_letter(entry.event_type, "replayed")
+        return True
+
+    async def _respond(
+        self,
+        route: SyncWebhookRoute,
+        request: Request,
+        body: bytes,
+        timer: StageTimer | None,
+    ) -> Response:
+        try:
+            data = json.loads(body)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+        if timer is not None:
+            timer.lap("decode")
+
+        instrumentation = get_instrumentation()
+        start = time.perf_counter() if instrumentation is not None else 0.0
+        response, outcome = await route.respond(
+            data, request.headers.get("saleor-domain", "")
+        )
+        if instrumentation is not None:
+            instrumentation.observe_sync_webhook(
+                route.event_type.value, outcome, time.perf_counter() - start
+            )
+        if timer is not None:
+            timer.lap("handler")
+        if response is None:
+            raise HTTPException(
+                status_code=503,
+                detail=f"{route.event_type.value} handler failed ({outcome})",
+            )
+        return response
+
+    async def _process_webhook(
+        self, request: Request, timer: StageTimer | None
+    ) -> dict | Response:
         body = await request.body()
+        if timer is not None:
+            timer.lap("receive")
         signature = request.headers.get("saleor-signature", "")
 
         if not self.verify_signature(body, signature):
             raise HTTPException(status_code=401, detail="Invalid signature")
+        if timer is not None:
+            timer.lap("verify")
+
+        route = self._sync_routes.get(request.headers.get("saleor-event", ""))
+        if route is not None:
+            return await self._respond(route, request, body, timer)
 
         try:
             data = json.loads(body)
             event_type = WebhookEventType(request.headers.get("saleor-event", ""))
-
-            if event_type in self._handlers:
-                handler = self._handlers[event_type]
-                if asyncio.iscoroutinefunction(handler):
-                    await handler(data)
-                else:
-                    handler(data)
-        except Exception as e:
-            logger.exception("Webhook processing failed")
+        except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e)) from e
-        else:
-            # Return success response in the else block
-            return {"received": True}
+        if timer is not None:
+            timer.lap("decode")
+
+        domain = request.headers.get("saleor-domain", "")
+        # Taken only for verified webhooks, so unsigned requests cannot add
+        # installations to the scheduler
+        slot = nullcontext() if self.scheduler is None else self.scheduler.slot(domain)
+        async with slot:
+            try:
+                await self._dispatch(event_type, data, timer, domain)
+            except Exception as e:
+                logger.exception("Webhook processing failed")
+                if self.dead_letters is None:
+                    raise HTTPException(status_code=400, detail=str(e)) from e
+                # Kept for replay, so Saleor does not need to re-send it
+                entry = await self._dead_letter(event_type, data, domain, e)
+                return {"received": True, "deadLetter": entry.id}
+        return {"received": True}
@@ -0,0 +1,206 @@
+"""
+Memoization of sync webhook responses
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+
+from .events import SyncWebhookEventType
+
+logger = logging.getLogger(__name__)
+
+MemoKey = Sequence[str] | Callable[[dict], object]
+
+_TAX_FIELDS = (
+    "taxBase.lines",
+    "taxBase.address",
+    "taxBase.channel",
+    "taxBase.currency",
+    "taxBase.pricesEnteredWithTax",
+    "taxBase.shippingPrice",
+    "taxBase.discounts",
+)
+_CHECKOUT_SHIPPING_FIELDS = (
+    "checkout.lines",
+    "checkout.shippingAddress",
+    "checkout.channel",
+)
+
+# Payload fields that determine the answer; the rest (ids, timestamps) changes
+# on every re-send of the same checkout
+DEFAULT_MEMO_FIELDS: dict[SyncWebhookEventType, tuple[str, ...]] = {
+    SyncWebhookEventType.CHECKOUT_CALCULATE_TAXES: _TAX_FIELDS,
+    SyncWebhookEventType.ORDER_CALCULATE_TAXES: _TAX_FIELDS,
+    SyncWebhookEventType.SHIPPING_LIST_METHODS_FOR_CHECKOUT: _CHECKOUT_SHIPPING_FIELDS,
+}
+
+# Tax and shipping answers depend only on the payload; payment and transaction
+# events move money and must reach the handler on every delivery
+MEMOIZABLE_EVENTS = frozenset(
+    {
+        *DEFAULT_MEMO_FIELDS,
+        SyncWebhookEventType.CHECKOUT_FILTER_SHIPPING_METHODS,
+        SyncWebhookEventType.ORDER_FILTER_SHIPPING_METHODS,
+    }
+)
+
+
+def check_memoizable(
+    event_type: SyncWebhookEventType, memo_key: MemoKey | None = None
+) -> None:
+    """Raise ValueError unless responses to ``event_type`` may be memoized.
+
+    Only tax and shipping events qualify, and those without
+    :data:`DEFAULT_MEMO_FIELDS` need an explicit ``memo_key``.
+    """
+    if event_type not in MEMOIZABLE_EVENTS:
+        error_msg = f"{event_type.value} responses must not be memoized"
+        raise ValueError(error_msg)
+    if memo_key is None and event_type not in DEFAULT_MEMO_FIELDS:
+        error_msg = f"Memoizing {event_type.value} requires a memo_key"
+        raise ValueError(error_msg)
+
+
+def _lookup(payload: dict, path: str) -> object:
+    value: object = payload
+    for key in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def payload_digest(payload: dict | list, fields: Sequence[str] | None = None) -> str:
+    """Canonical hash of a payload, or of the dotted ``fields`` of it.
+
+    Key order does not matter; missing fields hash as null. When the payload
+    is not a dict (e.g. a legacy list payload) or has none of ``fields``, the
+    whole payload is hashed, so payloads the fields do not describe never
+    share a key.
+    """
+    subset = payload
+    if fields is not None and isinstance(payload, dict):
+        values = {f: _lookup(payload, f) for f in fields}
+        if any(value is not None for value in values.values()):
+            subset = values
+    canonical = json.dumps(subset, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def memo_key_function(
+    event_type: SyncWebhookEventType, memo_key: MemoKey | None = None
+) -> Callable[[dict | list], str]:
+    """Build the function deriving a cache key from a payload.
+
+    ``memo_key`` is a list of dotted payload fields or a callable returning
+    any JSON-serializable value; by default the event's
+    :data:`DEFAULT_MEMO_FIELDS` are used, or the whole payload. Payloads
+    without any of the fields are keyed by their whole content.
+    """
+    if callable(memo_key):
+        return lambda payload: payload_digest({"key": memo_key(payload)})
+    fields = memo_key if memo_key is not None else DEFAULT_MEMO_FIELDS.get(event_type)
+    return lambda payload: payload_digest(payload, fields)
+
+
+class SyncResponseCache:
+    """TTL and LRU cache of encoded sync webhook responses.
+
+    Entries live in process memory, bounded to ``max_entries``. Passing a
+    ``redis`` client (or ``redis_url``) adds a shared tier, so workers reuse
+    each other's results; Redis errors are logged and treated as misses.
+    The Redis tier requires the ``redis`` package
+    (``pip install saleor-app-sdk[storage]``).
+    """
+
+    def __init__(
+        self,
+        ttl: float = 300.0,
+        max_entries: int = 4096,
+        *,
+        redis=None,
+        redis_url: str | None = None,
+        prefix: str = "saleor_app:sync",
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.redis_url = redis_url
+        self.prefix = prefix
+        self._redis = redis
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._writes: set[asyncio.Task] = set()
+
+    @property
+    def redis(self):
+        if self._redis is None and self.redis_url is not None:
+            try:
+                from redis import asyncio as aioredis  # noqa: PLC0415
+            except ImportError as e:
+                error_msg = (
+                    "SyncResponseCache with redis_url requires redis; "
+                    "install saleor-app-sdk[storage]"
+                )
+                raise ImportError(error_msg) from e
+            self._redis = aioredis.from_url(self.redis_url)
+        return self._redis
+
+    def _get_local(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _set_local(self, key: str, value: bytes, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get(self, key: str) -> bytes | None:
+        value = self._get_local(key)
+        if value is not None or self.redis is None:
+            return value
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.get(f"{self.prefix}:{key}")
+                pipe.pttl(f"{self.prefix}:{key}")
+                value, ttl_ms = await pipe.execute()
+        except Exception:
+            logger.exception("Sync response cache lookup failed")
+            return None
+        if value is not None:
+            # Keep the shared entry's remaining lifetime locally
+            self._set_local(key, value, ttl_ms / 1000 if ttl_ms > 0 else self.ttl)
+        return value
+
+    def set(self, key: str, value: bytes) -> None:
+        """Store a response; the Redis write happens in the background"""
+        self._set_local(key, value, self.ttl)
+        if self.redis is None:
+            return
+        task = asyncio.ensure_future(self._set_shared(key, value))
+        self._writes.add(task)
+        task.add_done_callback(self._writes.discard)
+
+    async def _set_shared(self, key: str, value: bytes) -> None:
+        try:
+            await self.redis.set(f"{self.prefix}:{key}", value, px=int(self.ttl * 1000))
+        except Exception:
+            logger.exception("Sync response cache write failed")
+
+    def clear(self) -> None:
+        """Drop the in-process entries"""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
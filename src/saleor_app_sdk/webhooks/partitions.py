@@ -0,0 +1,148 @@
+"""
+Per-entity ordered, cross-entity parallel execution of webhook handlers
+"""
+
+import asyncio
+import contextvars
+import itertools
+import time
+import zlib
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from saleor_app_sdk.instrumentation import get_instrumentation
+
+DEFAULT_PARTITIONS = 8
+
+
+def entity_key(payload: dict | list) -> str | None:
+    """Key of the entity a payload is about, e.g. ``"order:T3JkZXI6MQ=="``.
+
+    Saleor puts the subject of an event first (``order``, ``product``,
+    ``user``...), so the first top-level object with an ``id`` is used. For
+    legacy list payloads the first item's ``type`` and ``id`` are used.
+    """
+    if isinstance(payload, list):
+        first = payload[0] if payload else None
+        if isinstance(first, dict) and first.get("id") is not None:
+            return f"{first.get('type', '')}:{first['id']}"
+        return None
+    for name, value in payload.items():
+        if isinstance(value, dict) and value.get("id") is not None:
+            return f"{name}:{value['id']}"
+    return None
+
+
+class PartitionedExecutor:
+    """Run calls on ``partitions`` workers, one partition per entity key.
+
+    Calls with the same key always land on the same worker and run one at a
+    time, in the order they were submitted; calls for other keys run in
+    parallel on the other workers. Calls without a key are spread round
+    robin. Keys sharing a partition also wait for each other, so use more
+    partitions than the concurrency you need.
+    """
+
+    def __init__(
+        self,
+        partitions: int = DEFAULT_PARTITIONS,
+        *,
+        key: Callable[[dict | list], str | None] = entity_key,
+    ):
+        if partitions < 1:
+            error_msg = "partitions must be at least 1"
+            raise ValueError(error_msg)
+        self.partitions = partitions
+        self.key = key
+        self._queues: list[asyncio.Queue] = []
+        self._workers: list[asyncio.Task] = []
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._lag = [0.0] * partitions
+        self._round_robin = itertools.cycle(range(partitions))
+
+    def partition(self, key: str | None) -> int:
+        """Index of the worker running calls for ``key``"""
+        if key is None:
+            return next(self._round_robin)
+        return zlib.crc32(key.encode()) % self.partitions
+
+    def _start(self) -> list[asyncio.Queue]:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._queues = [asyncio.Queue() for _ in range(self.partitions)]
+            # Workers outlive the request that started them, so they must
+            # not inherit its context (deadline, trace span)
+            self._workers = [
+                loop.create_task(
+                    self._work(index, queue), context=contextvars.Context()
+                )
+                for index, queue in enumerate(self._queues)
+            ]
+        return self._queues
+
+    async def submit(self, key: str | None, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Queue ``call`` on the partition for ``key`` and return its result.
+
+        The call runs in a copy of the caller's context, so it sees the
+        caller's deadline and trace span. When the caller stops waiting (e.g.
+        the webhook request was dropped) before its turn, the call is skipped.
+        """
+        queue = self._start()[self.partition(key)]
+        future = self._loop.create_future()
+        context = contextvars.copy_context()
+        queue.put_nowait((call, context, future, time.perf_counter()))
+        return await future
+
+    async def _work(self, index: int, queue: asyncio.Queue) -> None:
+        while True:
+            call, context, future, queued_at = await queue.get()
+            try:
+                if future.done():
+                    continue
+                lag = time.perf_counter() - queued_at
+                self._lag[index] = lag
+                instrumentation = get_instrumentation()
+                if instrumentation is not None:
+                    instrumentation.observe_partition_lag(str(index), lag)
+                try:
+                    result = await asyncio.create_task(
+                        context.run(call), context=context
+                    )
+                except Exception as e:  # noqa: BLE001 - raised again by the caller
+                    if not future.done():
+                        future.set_exception(e)
+                else:
+                    if not future.done():
+                        future.set_result(result)
+            finally:
+                queue.task_done()
+
+    async def drain(self) -> None:
+        """Wait until every queued call has run"""
+        if self._loop is asyncio.get_running_loop():
+            await asyncio.gather(*(queue.join() for queue in self._queues))
+
+    async def close(self) -> None:
+        """Stop the workers; calls still queued are not run"""
+        for worker in self._workers:
+            worker.cancel()
+        if self._loop is asyncio.get_running_loop():
+            await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queues = []
+        self._loop = None
+
+    def stats(self) -> list[dict]:
+        """Queued calls and the last observed queueing lag of each partition"""
+        return [
+            {
+                "partition": index,
+                "depth": self._queues[index].qsize() if self._queues else 0,
+                "lag": self._lag[index],
+            }
+            for index in range(self.partitions)
+        ]
+
+    def __len__(self) -> int:
+        return sum(queue.qsize() for queue in self._queues)
@@ -0,0 +1,74 @@
+"""
+Local retries of failed webhook handlers
+"""
+
+import asyncio
+import logging
+import random
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from saleor_app_sdk import deadlines
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True, frozen=True)
+class RetryPolicy:
+    """Retry a failing handler with exponential backoff.
+
+    The handler runs up to ``attempts`` times. Before attempt ``n + 1`` it
+    waits ``base_delay * multiplier ** (n - 1)`` seconds, capped at
+    ``max_delay`` and reduced by up to ``jitter`` of itself at random so
+    retries of a burst do not line up. Only ``retry_on`` exceptions are
+    retried.
+    """
+
+    attempts: int = 3
+    base_delay: float = 0.1
+    max_delay: float = 2.0
+    multiplier: float = 2.0
+    jitter: float = 0.5
+    retry_on: tuple[type[Exception], ...] = (Exception,)
+
+    def __post_init__(self):
+        if self.attempts < 1:
+            error_msg = "attempts must be at least 1"
+            raise ValueError(error_msg)
+
+    def delay(self, attempt: int) -> float:
+        """Seconds to wait after the ``attempt``-th failure"""
+        delay = min(self.base_delay * self.multiplier ** (attempt - 1), self.max_delay)
+        return delay * (1 - self.jitter * random.random())  # noqa: S311
+
+    async def run(
+        self,
+        call: Callable[[], Awaitable[Any]],
+        on_retry: Callable[[int, Exception], None] | None = None,
+    ) -> Any:
+        """Await ``call()`` until it succeeds or the attempts are used up.
+
+        ``on_retry(attempt, error)`` is called before each retry. The last
+        error is raised when every attempt failed, or as soon as the request's
+        deadline (see :mod:`saleor_app_sdk.deadlines`) would pass before the
+        next attempt.
+        """
+        attempt = 1
+        while True:
+            try:
+                return await call()
+            except self.retry_on as e:
+                if attempt >= self.attempts:
+                    raise
+                delay = self.delay(attempt)
+                left = deadlines.remaining()
+                if left is not None and left <= delay:
+                    logger.warning("Attempt %d failed, no time left to retry", attempt)
+                    deadlines.exceeded("retry")
+                    raise
+                logger.warning("Attempt %d failed, retrying: %r", attempt, e)
+                if on_retry is not None:
+                    on_retry(attempt, e)
+                await asyncio.sleep(delay)
+                attempt += 1
@@ -0,0 +1,270 @@
+"""
+Minimal subscription queries for webhook payloads
+
+Saleor builds each webhook payload from the subscription query in the
+manifest, so every selected field is generated, serialized and sent on every
+delivery. :func:`build_subscription` selects only the fields a handler reads,
+checked against the Saleor schema.
+"""
+
+import json
+import os
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from .events import SyncWebhookEventType, WebhookEventType
+
+if TYPE_CHECKING:
+    from graphql import GraphQLSchema
+
+    from saleor_app_sdk.graphql.client import SaleorGraphQLClient
+
+EventType = WebhookEventType | SyncWebhookEventType
+
+# Subscription types whose name is not the event name in PascalCase
+_EVENT_TYPE_NAMES = {
+    SyncWebhookEventType.CHECKOUT_CALCULATE_TAXES: "CalculateTaxes",
+    SyncWebhookEventType.ORDER_CALCULATE_TAXES: "CalculateTaxes",
+}
+
+# Nested dict of selected field names; leaves are empty dicts. Type
+# conditions are stored as inline fragment keys ("... on Checkout")
+Selection = dict[str, "Selection"]
+
+_TYPE_CONDITION = "... on "
+# A field name, optionally narrowed to one type: "sourceObject[Checkout]"
+_SEGMENT = re.compile(r"(\w+)(?:\[(\w+)\])?")
+
+
+def event_type_name(event_type: EventType) -> str:
+    """Name of the GraphQL type Saleor uses for an event's payload"""
+    name = _EVENT_TYPE_NAMES.get(event_type)
+    if name is not None:
+        return name
+    return "".join(part.title() for part in event_type.value.split("_"))
+
+
+def _selection(fields: Iterable[str]) -> Selection:
+    tree: Selection = {}
+    for path in fields:
+        node = tree
+        for segment in path.split("."):
+            match = _SEGMENT.fullmatch(segment)
+            if match is None:
+                error_msg = f"invalid field path {path!r}"
+                raise ValueError(error_msg)
+            name, type_condition = match.groups()
+            node = node.setdefault(name, {})
+            if type_condition is not None:
+                node = node.setdefault(f"{_TYPE_CONDITION}{type_condition}", {})
+    if not tree:
+        error_msg = "at least one field is required"
+        raise ValueError(error_msg)
+    return tree
+
+
+def _type_condition(schema: "GraphQLSchema", parent, name: str, field_path: str):
+    from graphql import is_abstract_type, is_object_type  # noqa: PLC0415
+
+    condition = schema.get_type(name)
+    if not is_object_type(condition) or not (
+        condition is parent
+        or (is_abstract_type(parent) and schema.is_sub_type(parent, condition))
+    ):
+        error_msg = f"{name} is not a possible type of {parent.name} ({field_path})"
+        raise ValueError(error_msg)
+    return condition
+
+
+def _check(schema: "GraphQLSchema", parent, node: Selection, path: str) -> None:
+    from graphql import get_named_type, is_abstract_type, is_leaf_type  # noqa: PLC0415
+
+    for name, children in node.items():
+        if name.startswith(_TYPE_CONDITION):
+            type_name = name.removeprefix(_TYPE_CONDITION)
+            field_path = f"{path}[{type_name}]"
+            field_type = _type_condition(schema, parent, type_name, field_path)
+        else:
+            field_path = f"{path}.{name}" if path else name
+            field = getattr(parent, "fields", {}).get(name)
+            if field is None:
+                error_msg = f"{parent.name} has no field {name!r} ({field_path})"
+                if is_abstract_type(parent):
+                    error_msg += f"; select a type with {path}[Type]"
+                raise ValueError(error_msg)
+            field_type = get_named_type(field.type)
+        if is_leaf_type(field_type):
+            if children:
+                error_msg = f"{field_path} is a {field_type.name} and has no fields"
+                raise ValueError(error_msg)
+        elif not children:
+            error_msg = f"{field_path} is a {field_type.name}; select its fields"
+            raise ValueError(error_msg)
+        else:
+            _check(schema, field_type, children, field_path)
+
+
+def _validate(schema: "GraphQLSchema", type_name: str, tree: Selection) -> None:
+    parent = schema.get_type(type_name)
+    if parent is None:
+        error_msg = f"schema has no subscription type {type_name!r}"
+        raise ValueError(error_msg)
+    _check(schema, parent, tree, "")
+
+
+def _print(tree: Selection) -> str:
+    return " ".join(
+        f"{name} {{ {_print(children)} }}" if children else name
+        for name, children in tree.items()
+    )
+
+
+def build_subscription(
+    event_type: EventType,
+    fields: Iterable[str],
+    schema: "GraphQLSchema | None" = None,
+) -> str:
+    """Build the smallest subscription query selecting ``fields``.
+
+    Fields are dotted paths from the event type, e.g. ``"order.id"`` or
+    ``"order.total.gross.amount"``. Fields of union and interface types
+    are selected per type with a type condition after the field name, e.g.
+    ``"taxBase.sourceObject[Checkout].id"``. With a ``schema`` (see
+    :func:`load_schema` and :func:`fetch_schema`) every path is checked:
+    unknown fields, objects without a sub-selection, sub-selections of
+    scalars and impossible type conditions raise ``ValueError``.
+    """
+    type_name = event_type_name(event_type)
+    tree = _selection(fields)
+    if schema is not None:
+        _validate(schema, type_name, tree)
+    query = f"subscription {{ event {{ ... on {type_name} {{ {_print(tree)} }} }} }}"
+    if schema is not None and schema.subscription_type is not None:
+        from graphql import parse, validate  # noqa: PLC0415
+
+        errors = validate(schema, parse(query))
+        if errors:
+            raise ValueError(errors[0].message)
+    return query
+
+
+def load_schema(path: str | os.PathLike) -> "GraphQLSchema":
+    """Load a schema from SDL or from an introspection result saved as JSON"""
+    from graphql import build_client_schema, build_schema  # noqa: PLC0415
+
+    with open(path, encoding="utf-8") as file:
+        source = file.read()
+    if os.fspath(path).endswith(".json"):
+        introspection = json.loads(source)
+        return build_client_schema(introspection.get("data", introspection))
+    return build_schema(source)
+
+
+async def fetch_schema(
+    client: "SaleorGraphQLClient", cache_path: str | os.PathLike | None = None
+) -> "GraphQLSchema":
+    """Return the Saleor schema, reading and filling an SDL cache file.
+
+    Without a cached file the schema is introspected through ``client``; the
+    gql client keeps it too, so later queries are validated against it.
+    """
+    if cache_path is not None and os.path.exists(cache_path):
+        return load_schema(cache_path)
+
+    async with client.async_client as session:
+        schema = session.client.schema
+    if cache_path is not None:
+        from graphql import print_schema  # noqa: PLC0415
+
+        with open(cache_path, "w", encoding="utf-8") as file:
+            file.write(print_schema(schema))
+    return schema
+
+
+def project_payload(payload: dict, query: str) -> dict:
+    """Keep only the parts of ``payload`` that ``query`` selects"""
+    from graphql import parse  # noqa: PLC0415
+
+    document = parse(query)
+    selections = document.definitions[0].selection_set.selections
+    event_selection = selections[0].selection_set
+
+    def project(value, selection_set):
+        if selection_set is None or value is None:
+            return value
+        if isinstance(value, list):
+            return [project(item, selection_set) for item in value]
+        result = {}
+        for selection in selection_set.selections:
+            if selection.kind == "inline_fragment":
+                # Without __typename, every branch keeps the fields it names
+                typename = value.get("__typename")
+                condition = selection.type_condition
+                if typename is None or typename == condition.name.value:
+                    result.update(project(value, selection.selection_set))
+                continue
+            key = (selection.alias or selection.name).value
+            if key in value:
+                result[key] = project(value[key], selection.selection_set)
+        return result
+
+    return project(payload, event_selection)
+
+
+@dataclass(slots=True)
+class SubscriptionSizeReport:
+    """Query and payload sizes of a minimal subscription vs. the original"""
+
+    event_type: str
+    query_bytes: int
+    payload_bytes: int
+    original_query_bytes: int | None
+    original_payload_bytes: int
+
+    @property
+    def payload_reduction(self) -> float:
+        """Fraction of the payload no longer sent, between 0 and 1"""
+        if not self.original_payload_bytes:
+            return 0.0
+        return 1 - self.payload_bytes / self.original_payload_bytes
+
+    def format_text(self) -> str:
+        lines = [f"{self.event_type}:"]
+        if self.original_query_bytes is not None:
+            lines.append(
+                f"  query    {self.original_query_bytes:>8} B -> {self.query_bytes} B"
+            )
+        lines.append(
+            f"  payload  {self.original_payload_bytes:>8} B -> {self.payload_bytes} B"
+            f" ({self.payload_reduction:.0%} smaller)"
+        )
+        return "\n".join(lines)
+
+
+def _size(value) -> int:
+    return len(json.dumps(value, separators=(",", ":")).encode())
+
+
+def size_report(
+    event_type: EventType,
+    query: str,
+    sample_payload: dict,
+    original_query: str | None = None,
+) -> SubscriptionSizeReport:
+    """Compare the payload ``query`` produces with a full sample payload.
+
+    ``sample_payload`` is a payload as delivered for the original query,
+    e.g. one recorded from Saleor; it is projected onto ``query`` to get the
+    size of the minimal payload.
+    """
+    return SubscriptionSizeReport(
+        event_type=event_type.value,
+        query_bytes=len(query.encode()),
+        payload_bytes=_size(project_payload(sample_payload, query)),
+        original_query_bytes=(
+            len(original_query.encode()) if original_query is not None else None
+        ),
+        original_payload_bytes=_size(sample_payload),
+    )
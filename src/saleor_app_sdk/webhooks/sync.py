@@ -0,0 +1,270 @@
+"""
+Synchronous webhooks: typed responses, deadlines and fallbacks
+"""
+
+import asyncio
+import json
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any, Protocol
+
+from fastapi import Response
+from fastapi.concurrency import run_in_threadpool
+
+from saleor_app_sdk import deadlines
+
+from .events import SyncWebhookEventType
+from .memo import MemoKey, SyncResponseCache, check_memoizable, memo_key_function
+
+logger = logging.getLogger(__name__)
+
+# Deadline for a sync handler when none is given, in seconds
+DEFAULT_SYNC_DEADLINE = 2.0
+
+
+class SyncWebhookResponse(Protocol):
+    def to_payload(self) -> dict | list:
+        """JSON-ready body in the shape Saleor expects"""
+
+
+@dataclass(slots=True)
+class TaxLine:
+    total_gross_amount: float
+    total_net_amount: float
+    tax_rate: float
+
+    def to_payload(self) -> dict:
+        return {
+            "total_gross_amount": self.total_gross_amount,
+            "total_net_amount": self.total_net_amount,
+            "tax_rate": self.tax_rate,
+        }
+
+
+@dataclass(slots=True)
+class CalculateTaxesResponse:
+    """Response to ``CHECKOUT_CALCULATE_TAXES`` and ``ORDER_CALCULATE_TAXES``"""
+
+    shipping_price_gross_amount: float
+    shipping_price_net_amount: float
+    shipping_tax_rate: float
+    lines: list[TaxLine] = field(default_factory=list)
+
+    def to_payload(self) -> dict:
+        return {
+            "shipping_price_gross_amount": self.shipping_price_gross_amount,
+            "shipping_price_net_amount": self.shipping_price_net_amount,
+            "shipping_tax_rate": self.shipping_tax_rate,
+            "lines": [line.to_payload() for line in self.lines],
+        }
+
+
+@dataclass(slots=True)
+class ShippingMethod:
+    id: str
+    name: str
+    amount: float
+    currency: str
+    maximum_delivery_days: int | None = None
+    minimum_delivery_days: int | None = None
+    description: str | None = None
+
+    def to_payload(self) -> dict:
+        payload = {
+            "id": self.id,
+            "name": self.name,
+            "amount": self.amount,
+            "currency": self.currency,
+        }
+        for key in ("maximum_delivery_days", "minimum_delivery_days", "description"):
+            value = getattr(self, key)
+            if value is not None:
+                payload[key] = value
+        return payload
+
+
+@dataclass(slots=True)
+class ListShippingMethodsResponse:
+    """Response to ``SHIPPING_LIST_METHODS_FOR_CHECKOUT``"""
+
+    methods: list[ShippingMethod] = field(default_factory=list)
+
+    def to_payload(self) -> list:
+        return [method.to_payload() for method in self.methods]
+
+
+@dataclass(slots=True)
+class ExcludedShippingMethod:
+    id: str
+    reason: str = ""
+
+    def to_payload(self) -> dict:
+        return {"id": self.id, "reason": self.reason}
+
+
+@dataclass(slots=True)
+class FilterShippingMethodsResponse:
+    """Response to ``CHECKOUT_FILTER_SHIPPING_METHODS`` and
+    ``ORDER_FILTER_SHIPPING_METHODS``"""
+
+    excluded_methods: list[ExcludedShippingMethod] = field(default_factory=list)
+
+    def to_payload(self) -> dict:
+        return {
+            "excluded_methods": [
+                method.to_payload() for method in self.excluded_methods
+            ]
+        }
+
+
+@dataclass(slots=True)
+class PaymentGatewayInitializeSessionResponse:
+    """Response to ``PAYMENT_GATEWAY_INITIALIZE_SESSION``"""
+
+    data: Any = None
+
+    def to_payload(self) -> dict:
+        return {"data": self.data}
+
+
+@dataclass(slots=True)
+class TransactionResponse:
+    """Response to the ``TRANSACTION_*`` session and action events"""
+
+    result: str
+    amount: float | None = None
+    psp_reference: str | None = None
+    data: Any = None
+    message: str | None = None
+    external_url: str | None = None
+    time: str | None = None
+    actions: list[str] | None = None
+
+    def to_payload(self) -> dict:
+        payload = {"result": self.result}
+        for key, value in (
+            ("amount", self.amount),
+            ("pspReference", self.psp_reference),
+            ("data", self.data),
+            ("message", self.message),
+            ("externalUrl", self.external_url),
+            ("time", self.time),
+            ("actions", self.actions),
+        ):
+            if value is not None:
+                payload[key] = value
+        return payload
+
+
+RESPONSE_TYPES: dict[SyncWebhookEventType, type] = {
+    SyncWebhookEventType.CHECKOUT_CALCULATE_TAXES: CalculateTaxesResponse,
+    SyncWebhookEventType.ORDER_CALCULATE_TAXES: CalculateTaxesResponse,
+    SyncWebhookEventType.SHIPPING_LIST_METHODS_FOR_CHECKOUT: (
+        ListShippingMethodsResponse
+    ),
+    SyncWebhookEventType.CHECKOUT_FILTER_SHIPPING_METHODS: (
+        FilterShippingMethodsResponse
+    ),
+    SyncWebhookEventType.ORDER_FILTER_SHIPPING_METHODS: FilterShippingMethodsResponse,
+    SyncWebhookEventType.PAYMENT_GATEWAY_INITIALIZE_SESSION: (
+        PaymentGatewayInitializeSessionResponse
+    ),
+    SyncWebhookEventType.TRANSACTION_INITIALIZE_SESSION: TransactionResponse,
+    SyncWebhookEventType.TRANSACTION_PROCESS_SESSION: TransactionResponse,
+    SyncWebhookEventType.TRANSACTION_CHARGE_REQUESTED: TransactionResponse,
+    SyncWebhookEventType.TRANSACTION_REFUND_REQUESTED: TransactionResponse,
+    SyncWebhookEventType.TRANSACTION_CANCELATION_REQUESTED: TransactionResponse,
+}
+
+
+def _encode(event_type: SyncWebhookEventType, response: Any) -> bytes:
+    response_type = RESPONSE_TYPES[event_type]
+    if not isinstance(response, response_type):
+        error_msg = (
+            f"{event_type.value} handlers must return {response_type.__name__}, "
+            f"got {type(response).__name__}"
+        )
+        raise TypeError(error_msg)
+    return json.dumps(response.to_payload(), separators=(",", ":")).encode()
+
+
+class SyncWebhookRoute:
+    """A sync handler with its deadline and pre-encoded fallback response"""
+
+    __slots__ = ("_memo_key", "deadline", "event_type", "fallback", "handler", "memo")
+
+    def __init__(  # noqa: PLR0913
+        self,
+        event_type: SyncWebhookEventType,
+        handler: Callable,
+        *,
+        deadline: float | None = None,
+        fallback: SyncWebhookResponse | None = None,
+        memo: SyncResponseCache | None = None,
+        memo_key: MemoKey | None = None,
+    ):
+        self.event_type = SyncWebhookEventType(event_type)
+        self.handler = handler
+        self.deadline = DEFAULT_SYNC_DEADLINE if deadline is None else deadline
+        if self.deadline <= 0:
+            error_msg = "deadline must be positive"
+            raise ValueError(error_msg)
+        # Encoded once so answering with the fallback costs nothing
+        self.fallback = None if fallback is None else _encode(self.event_type, fallback)
+        if memo is not None:
+            check_memoizable(self.event_type, memo_key)
+        self.memo = memo
+        self._memo_key = memo_key_function(self.event_type, memo_key)
+
+    async def respond(
+        self, data: dict, installation: str = ""
+    ) -> tuple[Response | None, str]:
+        """Run the handler within the deadline.
+
+        Returns the response and the outcome: ``ok``, ``cached`` when a
+        memoized response for the same installation and payload was reused,
+        or ``timeout`` / ``error`` with the fallback response (None when
+        there is none). The handler is cancelled when the deadline passes;
+        plain functions run in a thread that cannot be interrupted, so only
+        their result is discarded. The deadline is also set as the request's
+        deadline, so GraphQL calls made by the handler give up in time.
+        """
+        key = None
+        try:
+            with deadlines.deadline(self.deadline):
+                async with asyncio.timeout(self.deadline):
+                    if self.memo is not None:
+                        key = (
+                            f"{self.event_type.value}:{installation}:"
+                            f"{self._memo_key(data)}"
+                        )
+                        content = await self.memo.get(key)
+                        if content is not None:
+                            return self._json(content), "cached"
+                    if asyncio.iscoroutinefunction(self.handler):
+                        result = await self.handler(data)
+                    else:
+                        result = await run_in_threadpool(self.handler, data)
+            content = _encode(self.event_type, result)
+        except TimeoutError:
+            logger.warning(
+                "%s handler missed its %ss deadline",
+                self.event_type.value,
+                self.deadline,
+            )
+            return self.fallback_response(), "timeout"
+        except Exception:
+            logger.exception("%s handler failed", self.event_type.value)
+            return self.fallback_response(), "error"
+        if key is not None:
+            self.memo.set(key, content)
+        return self._json(content), "ok"
+
+    @staticmethod
+    def _json(content: bytes) -> Response:
+        return Response(content=content, media_type="application/json")
+
+    def fallback_response(self) -> Response | None:
+        """The pre-encoded fallback as a response, or None without one"""
+        return None if self.fallback is None else self._json(self.fallback)
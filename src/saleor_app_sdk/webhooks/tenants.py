@@ -0,0 +1,197 @@
+"""
+Fair-share scheduling of webhook processing across installations
+"""
+
+import asyncio
+import contextlib
+import itertools
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+
+from saleor_app_sdk import deadlines
+from saleor_app_sdk.instrumentation import get_instrumentation
+
+DEFAULT_MAX_TENANTS = 1024
+
+
+@dataclass(slots=True)
+class _Tenant:
+    weight: float
+    finish: float = 0.0
+    running: int = 0
+    waiting: deque = field(default_factory=deque)
+    handled: int = 0
+    wait_seconds: float = 0.0
+    busy_seconds: float = 0.0
+
+    def stats(self) -> dict:
+        return {
+            "weight": self.weight,
+            "running": self.running,
+            "queued": len(self.waiting),
+            "handled": self.handled,
+            "avgWaitSeconds": self.wait_seconds / self.handled if self.handled else 0,
+            "avgSeconds": self.busy_seconds / self.handled if self.handled else 0,
+        }
+
+
+class TenantScheduler:
+    """Share webhook processing slots fairly between installations.
+
+    At most ``concurrency`` webhooks are processed at once, and at most
+    ``per_tenant`` of them for one installation (its bulkhead). When slots
+    are taken, waiting webhooks are queued per installation and a freed slot
+    goes to the installation whose next webhook has the lowest virtual
+    finish time (weighted fair queuing): each webhook advances its
+    installation's clock by ``1 / weight``, so a store running a bulk import
+    gets its share but cannot starve the others.
+
+    At most ``max_tenants`` installations are tracked; beyond that, the least
+    recently seen idle ones are forgotten along with their stats.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = 64,
+        per_tenant: int = 8,
+        *,
+        weights: dict[str, float] | None = None,
+        default_weight: float = 1.0,
+        max_tenants: int = DEFAULT_MAX_TENANTS,
+    ):
+        if concurrency < 1 or per_tenant < 1:
+            error_msg = "concurrency and per_tenant must be at least 1"
+            raise ValueError(error_msg)
+        self.concurrency = concurrency
+        self.per_tenant = per_tenant
+        self.weights = dict(weights or {})
+        self.default_weight = default_weight
+        self.max_tenants = max_tenants
+        self.running = 0
+        self._virtual_time = 0.0
+        self._tenants: dict[str, _Tenant] = {}
+        self._order = itertools.count()
+
+    def _tenant(self, domain: str) -> _Tenant:
+        # Popped and re-inserted, so the dict stays in least recently seen order
+        tenant = self._tenants.pop(domain, None)
+        if tenant is None:
+            if len(self._tenants) >= self.max_tenants:
+                self._forget_idle()
+            weight = self.weights.get(domain, self.default_weight)
+            tenant = _Tenant(weight)
+        self._tenants[domain] = tenant
+        return tenant
+
+    def _forget_idle(self) -> None:
+        for domain in list(self._tenants):
+            if len(self._tenants) < self.max_tenants:
+                return
+            tenant = self._tenants[domain]
+            if not tenant.running and not tenant.waiting:
+                del self._tenants[domain]
+
+    def set_weight(self, domain: str, weight: float) -> None:
+        """Give an installation a larger (or smaller) share of the slots"""
+        if weight <= 0:
+            error_msg = "weight must be positive"
+            raise ValueError(error_msg)
+        self.weights[domain] = weight
+        self._tenant(domain).weight = weight
+
+    def _tag(self, tenant: _Tenant) -> float:
+        tenant.finish = max(self._virtual_time, tenant.finish) + 1 / tenant.weight
+        return tenant.finish
+
+    async def acquire(self, domain: str) -> None:
+        """Wait for a slot for ``domain``; pair with :meth:`release`.
+
+        Raises :class:`~saleor_app_sdk.deadlines.DeadlineExceededError` when
+        the request's deadline passes before a slot is free.
+        """
+        tenant = self._tenant(domain)
+        tag = self._tag(tenant)
+        if (
+            self.running < self.concurrency
+            and tenant.running < self.per_tenant
+            and not tenant.waiting
+        ):
+            self._start(tenant, tag)
+            return
+        future = asyncio.get_running_loop().create_future()
+        entry = (tag, next(self._order), future)
+        tenant.waiting.append(entry)
+        try:
+            async with deadlines.limit("tenant_slot"):
+                await future
+        except BaseException:
+            if future.done() and not future.cancelled():
+                # Granted just as the caller gave up; pass the slot on
+                self.release(domain)
+            else:
+                future.cancel()
+                # release() may already have dropped the cancelled entry
+                with contextlib.suppress(ValueError):
+                    tenant.waiting.remove(entry)
+            raise
+
+    def _start(self, tenant: _Tenant, tag: float) -> None:
+        self.running += 1
+        tenant.running += 1
+        self._virtual_time = max(self._virtual_time, tag - 1 / tenant.weight)
+
+    def release(self, domain: str) -> None:
+        """Free a slot and hand it to the next fair waiter"""
+        tenant = self._tenants[domain]
+        self.running -= 1
+        tenant.running -= 1
+        while self.running < self.concurrency:
+            nxt = None
+            for candidate in self._tenants.values():
+                waiting = candidate.waiting
+                while waiting and waiting[0][2].done():
+                    waiting.popleft()
+                if (
+                    waiting
+                    and candidate.running < self.per_tenant
+                    and (nxt is None or waiting[0][:2] < nxt.waiting[0][:2])
+                ):
+                    nxt = candidate
+            if nxt is None:
+                return
+            tag, _order, future = nxt.waiting.popleft()
+            self._start(nxt, tag)
+            future.set_result(None)
+
+    @asynccontextmanager
+    async def slot(self, domain: str) -> AsyncIterator[None]:
+        """Hold a slot for ``domain`` while processing one webhook"""
+        queued_at = time.perf_counter()
+        await self.acquire(domain)
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.release(domain)
+            finished_at = time.perf_counter()
+            tenant = self._tenants[domain]
+            tenant.handled += 1
+            tenant.wait_seconds += started_at - queued_at
+            tenant.busy_seconds += finished_at - started_at
+            instrumentation = get_instrumentation()
+            if instrumentation is not None:
+                instrumentation.observe_tenant_webhook(
+                    domain, started_at - queued_at, finished_at - started_at
+                )
+
+    def queued(self) -> int:
+        """Webhooks waiting for a slot, over all installations"""
+        return sum(len(tenant.waiting) for tenant in self._tenants.values())
+
+    def stats(self) -> dict[str, dict]:
+        """Running, queued and handled webhooks and their average wait and
+        processing time, per installation"""
+        return {domain: tenant.stats() for domain, tenant in self._tenants.items()}
@@ -1,4 +1,7 @@
+import pytest
+
 from saleor_app_sdk.app.config import AppConfigMixin
+from saleor_app_sdk.storage.memory import MemoryConfigStore
 
 
 class AppClassForTesting(AppConfigMixin):
@@ -101,3 +104,52 @@ class TestAppConfigMixin:
         # Verify only that domain was updated
         assert app.get_config(domain1) == {"api_key": "12345", "new_key": "value"}
         assert app.get_config(domain2) == config2
+
+
+class StoreBackedApp(AppConfigMixin):
+    """Test class that persists config through a config store"""
+
+    def __init__(self, store):
+        super().__init__(config_store=store)
+
+
+class TestAppConfigMixinWithStore:
+    @pytest.mark.asyncio
+    async def test_without_store_uses_local_dict(self):
+        """Test async methods fall back to the local dict"""
+        app = AppClassForTesting()
+        domain = "test.saleor.io"
+
+        await app.save_config(domain, {"a": 1})
+        assert await app.patch_config(domain, {"b": 2}) == {"a": 1, "b": 2}
+        assert await app.load_config(domain) == {"a": 1, "b": 2}
+
+    @pytest.mark.asyncio
+    async def test_store_writes_are_visible_to_sync_reads(self):
+        """Test that persisted writes populate the sync read cache"""
+        store = MemoryConfigStore()
+        app = StoreBackedApp(store)
+        domain = "test.saleor.io"
+
+        await app.save_config(domain, {"a": 1})
+        await app.patch_config(domain, {"b": 2})
+
+        assert app.get_config(domain) == {"a": 1, "b": 2}
+        assert (await store.get(domain)).config == {"a": 1, "b": 2}
+
+    @pytest.mark.asyncio
+    async def test_load_config_shares_state_between_workers(self):
+        """Test that two app instances see each other's writes"""
+        store = MemoryConfigStore()
+        worker1 = StoreBackedApp(store)
+        worker2 = StoreBackedApp(store)
+        worker2.config_store.revalidate_after = 0
+        domain = "test.saleor.io"
+
+        await worker1.save_config(domain, {"a": 1})
+        assert await worker2.load_config(domain) == {"a": 1}
+
+        await worker1.patch_config(domain, {"a": 2})
+        assert await worker2.load_config(domain) == {"a": 2}
+        assert worker2.get_config(domain) == {"a": 2}
+        assert await worker2.load_config("missing.saleor.io", {"x": 1}) == {"x": 1}
@@ -1,10 +1,11 @@
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
+import pytest
 from fastapi.testclient import TestClient
 
 from saleor_app_sdk.app.core import SaleorApp
 from saleor_app_sdk.graphql.client import SaleorGraphQLClient
-from saleor_app_sdk.models.installation import AppInstallation
+from saleor_app_sdk.models.installation import AppInstallation, InstallationRecord
 from saleor_app_sdk.webhooks.events import WebhookEventType
 
 
@@ -36,7 +37,61 @@ class TestSaleorApp:
         assert data["appUrl"] == app_manifest.app_url
         assert data["tokenTargetUrl"] == f"{base_url}/api/register"
 
-    def test_register_installation_route(self, test_client, domain, auth_token):
+    def test_get_manifest_route_caching_headers(self, test_client, saleor_app):
+        """Test GET /api/manifest returns ETag and Cache-Control"""
+        response = test_client.get("/api/manifest")
+
+        _body, etag = saleor_app.get_manifest_response()
+        assert response.headers["etag"] == etag
+        assert response.headers["cache-control"] == saleor_app.manifest_cache_control
+        assert response.headers["content-type"] == "application/json"
+
+    def test_get_manifest_route_not_modified(self, test_client, saleor_app):
+        """Test GET /api/manifest answers 304 for a matching If-None-Match"""
+        etag = test_client.get("/api/manifest").headers["etag"]
+
+        response = test_client.get(
+            "/api/manifest", headers={"If-None-Match": f'"other", W/{etag}'}
+        )
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+        response = test_client.get("/api/manifest", headers={"If-None-Match": '"x"'})
+        assert response.status_code == 200
+
+    def test_manifest_response_is_cached(self, saleor_app):
+        """Test the manifest is serialized once until invalidated"""
+        with patch.object(
+            saleor_app, "_serialize_manifest", wraps=saleor_app._serialize_manifest
+        ) as mock_serialize:
+            first = saleor_app.get_manifest_response()
+            second = saleor_app.get_manifest_response()
+
+            assert first is second
+            assert mock_serialize.call_count == 1
+
+            saleor_app.invalidate_manifest_cache()
+            saleor_app.get_manifest_response()
+            assert mock_serialize.call_count == 2
+
+    def test_manifest_cache_invalidated_on_change(self, saleor_app, app_manifest):
+        """Test reassigning base_url or manifest refreshes the cached manifest"""
+        _body, etag = saleor_app.get_manifest_response()
+
+        saleor_app.base_url = "https://other.example.com"
+        new_body, new_etag = saleor_app.get_manifest_response()
+        assert new_etag != etag
+        assert b"https://other.example.com/api/register" in new_body
+
+        app_manifest.version = "2.0.0"
+        saleor_app.manifest = app_manifest
+        assert b'"version":"2.0.0"' in saleor_app.get_manifest_response()[0]
+
+    def test_register_installation_route(
+        self, test_client, saleor_app, domain, auth_token
+    ):
         """Test POST /api/register route"""
         data = {
             "auth_token": auth_token,
@@ -47,6 +102,9 @@ class TestSaleorApp:
 
         assert response.status_code == 200
         assert response.json() == {"success": True}
+        installation = saleor_app.installations[domain]
+        assert isinstance(installation, InstallationRecord)
+        assert installation.auth_token == auth_token
 
     def test_register_installation_with_custom_handler(
         self, app_manifest, secret_key, base_url
@@ -84,9 +142,8 @@ class TestSaleorApp:
         # Here we just check that the route exists and returns 401 for invalid signature
         response = test_client.post("/api/webhooks/ORDER_CREATED", json={})
 
-        # When sending a request without the required headers, we get a validation error
-        assert response.status_code == 422
-        assert "detail" in response.json()
+        assert response.status_code == 401
+        assert response.json() == {"detail": "Invalid signature"}
 
     def test_serialize_manifest_basic(self, saleor_app, app_manifest, base_url):
         """Test serialization of basic app manifest"""
@@ -148,6 +205,31 @@ class TestSaleorApp:
         # Test getting non-existent installation
         assert saleor_app.get_installation("non-existent.domain") is None
 
+    @pytest.mark.asyncio
+    async def test_get_installation_evicts_idle(
+        self, app_manifest, secret_key, base_url, app_installation, domain
+    ):
+        """Test idle installations are evicted and loaded again when used"""
+        loader = AsyncMock(return_value=app_installation)
+        app = SaleorApp(
+            manifest=app_manifest,
+            secret_key=secret_key,
+            base_url=base_url,
+            installation_max_idle=60,
+            installation_loader=loader,
+        )
+        app.installations[domain] = app_installation
+        assert app.get_installation(domain) is app_installation
+        loader.assert_not_called()
+
+        app.installations.evict_idle(max_idle=-1)
+        assert domain not in app.installations
+        assert app.get_installation(domain) is None
+        assert await app.get_installation_async(domain) is app_installation
+        loader.assert_awaited_once_with(domain)
+        client = await app.get_graphql_client_async(domain)
+        assert client.auth_token == app_installation.auth_token
+
     def test_get_graphql_client(self, saleor_app, app_installation, domain):
         """Test getting GraphQL client for installation"""
         # Add installation to the app
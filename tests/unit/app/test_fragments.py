@@ -0,0 +1,227 @@
+from email.utils import formatdate
+
+import pytest
+from fastapi import Request, Response
+from fastapi.responses import HTMLResponse
+from fastapi.testclient import TestClient
+
+from saleor_app_sdk.app.fragments import (
+    CachedFragment,
+    FragmentCache,
+    header_installation_key,
+)
+from saleor_app_sdk.testing import sign_payload
+from saleor_app_sdk.webhooks.events import WebhookEventType
+
+
+@pytest.fixture
+def calls():
+    return []
+
+
+@pytest.fixture
+def fragment_app(saleor_app, calls):
+    @saleor_app.get(
+        "/fragments/search",
+        response_class=HTMLResponse,
+        cache_ttl=60,
+        invalidate_on=[WebhookEventType.PRODUCT_UPDATED],
+        installation_key=header_installation_key,
+    )
+    async def search(request: Request, query: str = ""):
+        calls.append(query)
+        return HTMLResponse(f"<li>{query} #{len(calls)}</li>")
+
+    @saleor_app.get(
+        "/fragments/items/{item_id}",
+        cache_ttl=60,
+        installation_key=header_installation_key,
+    )
+    def item(item_id: str):
+        calls.append(item_id)
+        if item_id == "missing":
+            return Response(status_code=404)
+        if item_id == "broken":
+            return HTMLResponse("error", headers={"Cache-Control": "no-store"})
+        return HTMLResponse(f"<p>{item_id}</p>")
+
+    return saleor_app
+
+
+@pytest.fixture
+def client(fragment_app):
+    return TestClient(fragment_app.fastapi_app, headers={"saleor-domain": "a.shop"})
+
+
+class TestFragmentCache:
+    def test_ttl_expiry(self):
+        """Test that expired entries are not served"""
+        cache = FragmentCache()
+        key = ("shop", "/x", "/x", ())
+        cache.set(key, CachedFragment.from_response(HTMLResponse("a"), ttl=-1))
+
+        assert cache.get(key) is None
+        assert len(cache) == 0
+
+    def test_lru_bound(self):
+        """Test that the least recently used entries are evicted"""
+        cache = FragmentCache(max_entries=2)
+        for path in ("/a", "/b", "/c"):
+            cache.set(
+                ("shop", path, path, ()),
+                CachedFragment.from_response(HTMLResponse(path), ttl=60),
+            )
+
+        assert cache.get(("shop", "/a", "/a", ())) is None
+        assert len(cache) == 2
+
+    def test_invalidate_by_installation_and_route(self):
+        """Test dropping entries for one installation and route"""
+        cache = FragmentCache()
+        entry = CachedFragment.from_response(HTMLResponse("a"), ttl=60)
+        cache.set(("a.shop", "/x", "/x", ()), entry)
+        cache.set(("b.shop", "/x", "/x", ()), entry)
+        cache.set(("a.shop", "/y", "/y", ()), entry)
+
+        assert cache.invalidate("a.shop", "/x") == 1
+        assert cache.get(("b.shop", "/x", "/x", ())) is entry
+        assert cache.get(("a.shop", "/y", "/y", ())) is entry
+
+
+class TestCachedRoutes:
+    def test_cached_per_params_and_installation(self, client, calls):
+        """Test that fragments are rendered once per params and installation"""
+        first = client.get("/fragments/search?query=shoe")
+        second = client.get("/fragments/search?query=shoe")
+        client.get("/fragments/search?query=hat")
+        client.get("/fragments/search?query=shoe", headers={"saleor-domain": "b.shop"})
+
+        assert first.text == second.text == "<li>shoe #1</li>"
+        assert calls == ["shoe", "hat", "shoe"]
+        assert first.headers["etag"] == second.headers["etag"]
+        assert first.headers["cache-control"] == "private, no-cache"
+        assert first.headers["content-type"].startswith("text/html")
+
+    def test_if_none_match(self, client):
+        """Test that a matching ETag gets a 304"""
+        etag = client.get("/fragments/search?query=shoe").headers["etag"]
+
+        response = client.get(
+            "/fragments/search?query=shoe", headers={"If-None-Match": etag}
+        )
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_if_modified_since(self, client):
+        """Test that Last-Modified is honoured without an ETag"""
+        last_modified = client.get("/fragments/search").headers["last-modified"]
+
+        assert (
+            client.get(
+                "/fragments/search", headers={"If-Modified-Since": last_modified}
+            ).status_code
+            == 304
+        )
+        assert (
+            client.get(
+                "/fragments/search",
+                headers={"If-Modified-Since": formatdate(0, usegmt=True)},
+            ).status_code
+            == 200
+        )
+
+    def test_webhook_invalidation(self, client, calls, secret_key):
+        """Test that a webhook for the installation drops its fragments"""
+        headers = {"saleor-domain": "a.shop"}
+        client.get("/fragments/search?query=shoe", headers=headers)
+        client.get("/fragments/search?query=shoe", headers={"saleor-domain": "b.shop"})
+
+        response = client.post(
+            "/api/webhooks/PRODUCT_UPDATED",
+            content=b"{}",
+            headers={
+                "saleor-event": "PRODUCT_UPDATED",
+                "saleor-domain": "a.shop",
+                "saleor-signature": sign_payload(secret_key, b"{}"),
+            },
+        )
+        client.get("/fragments/search?query=shoe", headers=headers)
+        client.get("/fragments/search?query=shoe", headers={"saleor-domain": "b.shop"})
+
+        assert response.status_code == 200
+        assert calls == ["shoe", "shoe", "shoe"]
+
+    def test_sync_endpoint_without_request(self, client, calls):
+        """Test caching endpoints that do not take the request"""
+        assert client.get("/fragments/items/1").text == "<p>1</p>"
+        assert client.get("/fragments/items/1").text == "<p>1</p>"
+
+        assert calls == ["1"]
+
+    def test_uncacheable_responses(self, client, calls):
+        """Test that errors and no-store responses are not cached"""
+        assert client.get("/fragments/items/missing").status_code == 404
+        client.get("/fragments/items/missing")
+        client.get("/fragments/items/broken")
+        client.get("/fragments/items/broken")
+
+        assert calls == ["missing", "missing", "broken", "broken"]
+
+    def test_plain_get_is_not_cached(self, saleor_app, calls):
+        """Test that routes without caching options are left alone"""
+
+        @saleor_app.get("/plain")
+        async def plain():
+            calls.append("plain")
+            return {}
+
+        client = TestClient(saleor_app.fastapi_app)
+        client.get("/plain")
+        response = client.get("/plain")
+
+        assert calls == ["plain", "plain"]
+        assert "etag" not in response.headers
+
+    def test_installation_key_is_required(self, saleor_app):
+        """Test that cached routes must say how installations are identified"""
+        for options in (
+            {"cache_ttl": 60},
+            {"invalidate_on": [WebhookEventType.PRODUCT_UPDATED]},
+        ):
+            with pytest.raises(ValueError, match="installation_key is required"):
+                saleor_app.get("/fragments/unkeyed", **options)
+
+    def test_unknown_installation_bypasses_cache(self, fragment_app, calls):
+        """Test that requests without an installation are never cached"""
+        client = TestClient(fragment_app.fastapi_app)
+        first = client.get("/fragments/search?query=shoe")
+        second = client.get("/fragments/search?query=shoe")
+
+        assert first.text == "<li>shoe #1</li>"
+        assert second.text == "<li>shoe #2</li>"
+        assert "etag" not in second.headers
+        assert len(fragment_app.fragment_cache) == 0
+
+    def test_custom_installation_key(self, saleor_app, calls):
+        """Test keying fragments by an authenticated installation"""
+        sessions = {"token-a": "a.shop", "token-b": "b.shop"}
+
+        @saleor_app.get(
+            "/fragments/orders",
+            cache_ttl=60,
+            installation_key=lambda request: sessions.get(
+                request.cookies.get("session", ""), ""
+            ),
+        )
+        async def orders(request: Request):
+            calls.append(request.cookies.get("session"))
+            return HTMLResponse("<li>orders</li>")
+
+        client = TestClient(saleor_app.fastapi_app)
+        for session in ("token-a", "token-a", "token-b", "forged", "forged"):
+            client.cookies.set("session", session)
+            client.get("/fragments/orders", headers={"saleor-domain": "a.shop"})
+
+        assert calls == ["token-a", "token-b", "forged", "forged"]
@@ -0,0 +1,145 @@
+import json
+from datetime import UTC, datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from saleor_app_sdk.app.installations import InstallationCache, store_loader
+from saleor_app_sdk.models.installation import InstallationRecord
+from saleor_app_sdk.storage.memory import MemoryConfigStore
+
+
+class TestInstallationCache:
+    def test_mapping_behaviour(self, app_installation, domain):
+        """Test that the cache behaves like a dict of installations"""
+        cache = InstallationCache()
+
+        assert cache == {}
+        cache[domain] = app_installation
+
+        assert cache[domain] is app_installation
+        assert cache.get(domain) is app_installation
+        assert cache.get("missing.saleor.io") is None
+        assert domain in cache
+        assert list(cache.values()) == [app_installation]
+
+        del cache[domain]
+        assert cache == {}
+        assert cache.idle_seconds(domain) is None
+
+    def test_get_active_touches(self, app_installation, domain):
+        """Test that get_active refreshes the last-used stamp"""
+        cache = InstallationCache()
+        with patch("saleor_app_sdk.app.installations.time.monotonic") as monotonic:
+            monotonic.return_value = 100.0
+            cache[domain] = app_installation
+            monotonic.return_value = 130.0
+            assert cache.idle_seconds(domain) == 30.0
+
+            assert cache.get_active(domain) is app_installation
+            assert cache.idle_seconds(domain) == 0.0
+
+    def test_last_used_at(self, app_installation, domain):
+        """Test wall-clock last use is derived from the monotonic stamp"""
+        cache = InstallationCache()
+        cache[domain] = app_installation
+
+        last_used = cache.last_used_at(domain)
+
+        assert (datetime.now(UTC) - last_used).total_seconds() < 1
+        assert cache.last_used_at("missing.saleor.io") is None
+
+    def test_evict_idle(self, app_installation, domain):
+        """Test that idle installations are evicted and reported"""
+        on_evict = MagicMock()
+        cache = InstallationCache(
+            max_idle=60, on_evict=on_evict, loader=lambda _domain: None
+        )
+        with patch("saleor_app_sdk.app.installations.time.monotonic") as monotonic:
+            monotonic.return_value = 0.0
+            cache[domain] = app_installation
+            cache["active.saleor.io"] = app_installation
+            monotonic.return_value = 50.0
+            cache.touch("active.saleor.io")
+
+            monotonic.return_value = 90.0
+            evicted = cache.evict_idle()
+
+        assert evicted == [app_installation]
+        on_evict.assert_called_once_with(app_installation)
+        assert domain not in cache
+        assert "active.saleor.io" in cache
+
+    def test_get_active_sweeps_periodically(self, app_installation, domain):
+        """Test that lookups trigger eviction at most once per sweep interval"""
+        cache = InstallationCache(
+            max_idle=60, sweep_interval=10, loader=lambda _domain: None
+        )
+        with patch("saleor_app_sdk.app.installations.time.monotonic") as monotonic:
+            monotonic.return_value = 0.0
+            cache._last_sweep = 0.0
+            cache[domain] = app_installation
+
+            monotonic.return_value = 61.0
+            assert cache.get_active(domain) is None
+
+    def test_no_eviction_without_max_idle(self, app_installation, domain):
+        """Test that eviction is disabled by default"""
+        cache = InstallationCache()
+        cache[domain] = app_installation
+
+        assert cache.evict_idle() == []
+        assert cache.get_active(domain) is app_installation
+
+    def test_eviction_hook_errors_are_logged(self, app_installation, domain):
+        """Test that a failing eviction hook does not stop eviction"""
+        cache = InstallationCache(on_evict=MagicMock(side_effect=RuntimeError))
+        cache[domain] = app_installation
+
+        assert cache.evict_idle(max_idle=-1) == [app_installation]
+        assert domain not in cache
+
+    def test_max_idle_requires_loader(self):
+        """Test that eviction cannot drop the only copy of an installation"""
+        with pytest.raises(ValueError, match="loader"):
+            InstallationCache(max_idle=60)
+
+    @pytest.mark.asyncio
+    async def test_loader_restores_evicted(self, app_installation, domain):
+        """Test that an evicted installation is loaded again on its next use"""
+        persisted = {}
+
+        async def load(domain):
+            return persisted.get(domain)
+
+        cache = InstallationCache(
+            max_idle=60,
+            on_evict=lambda installation: persisted.update(
+                {installation.domain: installation}
+            ),
+            loader=load,
+        )
+        cache[domain] = app_installation
+
+        cache.evict_idle(max_idle=-1)
+        assert domain not in cache
+        assert cache.get_active(domain) is None
+
+        assert await cache.get_active_async(domain) is app_installation
+        assert domain in cache
+        assert cache.idle_seconds(domain) < 1
+        assert await cache.get_active_async("missing.saleor.io") is None
+
+    @pytest.mark.asyncio
+    async def test_store_loader(self, app_installation, domain):
+        """Test loading installations saved in a config store"""
+        store = MemoryConfigStore()
+        await store.set(domain, json.loads(app_installation.model_dump_json()))
+        load = store_loader(store)
+
+        installation = await load(domain)
+
+        assert isinstance(installation, InstallationRecord)
+        assert installation.auth_token == app_installation.auth_token
+        assert installation.installed_at == app_installation.installed_at
+        assert await load("missing.saleor.io") is None
@@ -0,0 +1,182 @@
+import jinja2
+import pytest
+from fastapi import Request
+from fastapi.testclient import TestClient
+
+from saleor_app_sdk.app.core import SaleorApp
+from saleor_app_sdk.app.templates import (
+    TimedTemplate,
+    create_templates,
+    precompile_templates,
+    stream_template,
+)
+
+
+@pytest.fixture
+def templates_dir(tmp_path):
+    directory = tmp_path / "templates"
+    (directory / "partials").mkdir(parents=True)
+    (directory / "base.html").write_text("<main>{% block body %}{% endblock %}</main>")
+    (directory / "partials" / "hello.html").write_text("Hello {{ name }}")
+    (directory / "notes.txt").write_text("not a page")
+    return directory
+
+
+class TestCreateTemplates:
+    def test_defaults(self, templates_dir):
+        """Test that development templates reload and skip bytecode caching"""
+        templates = create_templates(templates_dir)
+
+        assert templates.env.auto_reload is True
+        assert templates.env.bytecode_cache is None
+        assert templates.env.template_class is TimedTemplate
+
+    def test_production(self, templates_dir):
+        """Test that production mode disables reloads and caches bytecode"""
+        templates = create_templates(templates_dir, production=True)
+
+        assert templates.env.auto_reload is False
+        assert isinstance(templates.env.bytecode_cache, jinja2.MemcachedBytecodeCache)
+        template = templates.get_template("partials/hello.html")
+        assert template.render(name="Saleor") == "Hello Saleor"
+
+    def test_filesystem_bytecode_cache(self, templates_dir, tmp_path):
+        """Test that precompiling fills a bytecode cache other workers can reuse"""
+        cache_dir = tmp_path / "cache"
+        templates = create_templates(
+            templates_dir, production=True, bytecode_cache=cache_dir
+        )
+
+        assert precompile_templates(templates) == 2
+        assert len(list(cache_dir.iterdir())) == 2
+
+        worker = create_templates(
+            templates_dir, production=True, bytecode_cache=cache_dir
+        )
+        assert worker.get_template("partials/hello.html").render(name="x") == "Hello x"
+
+    def test_precompile_on_create(self, templates_dir):
+        """Test precompiling all templates at startup"""
+        templates = create_templates(templates_dir, production=True, precompile=True)
+
+        assert len(templates.env.cache) == 2
+
+    def test_render_timing(self, templates_dir, recording):
+        """Test that renders are reported to the instrumentation"""
+        templates = create_templates(templates_dir)
+        templates.get_template("partials/hello.html").render(name="x")
+
+        renders = recording.calls["observe_template_render"]
+        assert [template for template, _ in renders] == ["partials/hello.html"]
+
+    def test_app_uses_given_templates(self, app_manifest, secret_key, templates_dir):
+        """Test passing a production environment to SaleorApp"""
+        templates = create_templates(templates_dir, production=True)
+
+        app = SaleorApp(app_manifest, secret_key, templates=templates)
+
+        assert app.templates is templates
+
+
+class TestStreamTemplate:
+    @pytest.fixture
+    def templates(self, templates_dir):
+        (templates_dir / "rows.html").write_text(
+            "<ul>{% for row in rows %}<li>{{ row }}</li>{% endfor %}</ul>"
+        )
+        (templates_dir / "path.html").write_text("{{ request.url.path }} {{ shop }}")
+        return create_templates(templates_dir, production=True)
+
+    @staticmethod
+    def _request(path="/rows"):
+        return Request({"type": "http", "method": "GET", "path": path, "headers": []})
+
+    @staticmethod
+    async def _body(response):
+        return [chunk async for chunk in response.body_iterator]
+
+    @pytest.mark.asyncio
+    async def test_streams_async_iterator(self, templates):
+        """Test that rows are sent before the iterator is exhausted"""
+        events = []
+
+        async def rows():
+            for page in range(2):
+                events.append(f"fetch {page}")
+                yield f"row {page}"
+
+        response = stream_template(
+            templates, self._request(), "rows.html", {"rows": rows()}, buffer_size=1
+        )
+        async for chunk in response.body_iterator:
+            events.append(chunk)
+
+        assert response.media_type == "text/html"
+        assert events == [
+            "<ul>",
+            "fetch 0",
+            "<li>",
+            "row 0",
+            "</li>",
+            "fetch 1",
+            "<li>",
+            "row 1",
+            "</li>",
+            "</ul>",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_buffering(self, templates):
+        """Test that small chunks are joined up to the buffer size"""
+        response = stream_template(
+            templates, self._request(), "rows.html", {"rows": range(3)}
+        )
+
+        assert await self._body(response) == ["<ul><li>0</li><li>1</li><li>2</li></ul>"]
+
+    @pytest.mark.asyncio
+    async def test_request_and_context_processors(self, templates):
+        """Test that the request and context processors reach the template"""
+        templates.context_processors.append(lambda _request: {"shop": "demo"})
+
+        response = stream_template(templates, self._request("/page"), "path.html")
+
+        assert await self._body(response) == ["/page demo"]
+
+    @pytest.mark.asyncio
+    async def test_sync_rendering_still_works(self, templates):
+        """Test that streaming leaves the regular environment synchronous"""
+        stream_template(templates, self._request(), "rows.html", {"rows": []})
+
+        assert templates.env.is_async is False
+        rendered = templates.get_template("rows.html").render(rows=[1])
+        assert rendered == "<ul><li>1</li></ul>"
+
+    @pytest.mark.asyncio
+    async def test_render_timing(self, templates, recording):
+        """Test that streamed renders are reported to the instrumentation"""
+        response = stream_template(
+            templates, self._request(), "rows.html", {"rows": [1]}
+        )
+        await self._body(response)
+
+        renders = recording.calls["observe_template_render"]
+        assert [template for template, _ in renders] == ["rows.html"]
+
+    def test_app_streaming_route(self, app_manifest, secret_key, templates):
+        """Test streaming a template from a SaleorApp route"""
+        app = SaleorApp(app_manifest, secret_key, templates=templates)
+
+        @app.get("/rows")
+        async def rows(request: Request):
+            async def numbers():
+                for number in range(2):
+                    yield number
+
+            return app.stream_template(request, "rows.html", {"rows": numbers()})
+
+        response = TestClient(app.fastapi_app).get("/rows")
+
+        assert response.status_code == 200
+        assert response.text == "<ul><li>0</li><li>1</li></ul>"
+        assert response.headers["content-type"].startswith("text/html")
@@ -1,19 +1,80 @@
+from collections import defaultdict
 from datetime import UTC, datetime
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 
 from saleor_app_sdk.app.builder import SaleorAppBuilder
 from saleor_app_sdk.app.core import SaleorApp
+from saleor_app_sdk.instrumentation import Instrumentation, set_instrumentation
 from saleor_app_sdk.models.app_manifest import AppManifest
 from saleor_app_sdk.models.installation import AppInstallation
 from saleor_app_sdk.models.webhooks import WebhookDefinition
 from saleor_app_sdk.permissions import SaleorPermission
+from saleor_app_sdk.testing import sign_payload
 from saleor_app_sdk.webhooks.events import WebhookEventType
 from saleor_app_sdk.webhooks.handler import WebhookHandler
 
 
+class RecordingInstrumentation(Instrumentation):
+    """Records the arguments of every hook call, keyed by method name"""
+
+    def __init__(self, tracer=None):
+        super().__init__(tracer=tracer)
+        self.calls = defaultdict(list)
+
+
+def _recorder(name):
+    def record(self, *args, **kwargs):
+        self.calls[name].append((*args, kwargs) if kwargs else args)
+
+    return record
+
+
+for _name in dir(Instrumentation):
+    if _name.startswith("observe_") or _name == "record_cache":
+        setattr(RecordingInstrumentation, _name, _recorder(_name))
+
+
+@pytest.fixture
+def recording():
+    instrumentation = RecordingInstrumentation()
+    set_instrumentation(instrumentation)
+    yield instrumentation
+    set_instrumentation(None)
+
+
+@pytest.fixture
+def app_client():
+    def client(app):
+        return httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app.fastapi_app),
+            base_url="http://app",
+        )
+
+    return client
+
+
+@pytest.fixture
+def signed_post(secret_key):
+    async def post(client, event_type, payload=b"{}", domain=None):
+        headers = {
+            "saleor-event": event_type.value,
+            "saleor-signature": sign_payload(secret_key, payload),
+        }
+        if domain is not None:
+            headers["saleor-domain"] = domain
+        return await client.post(
+            f"/api/webhooks/{event_type.value.lower()}",
+            content=payload,
+            headers=headers,
+        )
+
+    return post
+
+
 @pytest.fixture
 def app_id():
     return "test-app-id"
@@ -3,6 +3,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from saleor_app_sdk.graphql.client import SaleorGraphQLClient
+from saleor_app_sdk.graphql.queries import SaleorQueries
+from saleor_app_sdk.testing import FakeSaleorServer
 
 
 class TestSaleorGraphQLClient:
@@ -13,6 +15,7 @@ class TestSaleorGraphQLClient:
         assert client.api_url == saleor_api_url
         assert client.auth_token == auth_token
         assert client._client is None
+        assert client._async_client is None
 
     def test_client_property(
         self, auth_token, saleor_api_url, mock_httpx_transport, mock_gql_client
@@ -45,6 +48,25 @@ class TestSaleorGraphQLClient:
             assert mock_client_class.call_count == 1
             assert gql_client2 is mock_gql_client
 
+    def test_async_client_property(self, auth_token, saleor_api_url):
+        """Test async_client uses an async transport and is cached"""
+        with (
+            patch(
+                "saleor_app_sdk.graphql.client.HTTPXAsyncTransport"
+            ) as mock_transport,
+            patch("saleor_app_sdk.graphql.client.Client") as mock_client_class,
+        ):
+            client = SaleorGraphQLClient(api_url=saleor_api_url, auth_token=auth_token)
+
+            gql_client = client.async_client
+
+            mock_transport.assert_called_once_with(
+                url=saleor_api_url, headers={"Authorization": f"Bearer {auth_token}"}
+            )
+            assert gql_client is mock_client_class.return_value
+            assert client.async_client is gql_client
+            assert mock_client_class.call_count == 1
+
     def test_execute(self, auth_token, saleor_api_url):
         """Test execute method"""
         # Create a mock GQL client
@@ -121,7 +143,7 @@ class TestSaleorGraphQLClient:
 
         # Create a client with the mock GQL client
         client = SaleorGraphQLClient(api_url=saleor_api_url, auth_token=auth_token)
-        client._client = mock_client
+        client._async_client = mock_client
 
         # Execute a query asynchronously
         query = "query { test }"
@@ -145,7 +167,7 @@ class TestSaleorGraphQLClient:
 
         # Create a client with the mock GQL client
         client = SaleorGraphQLClient(api_url=saleor_api_url, auth_token=auth_token)
-        client._client = mock_client
+        client._async_client = mock_client
 
         # Execute a query asynchronously without variables
         query = "query { test }"
@@ -155,3 +177,36 @@ class TestSaleorGraphQLClient:
         # Verify the query was executed with empty variables
         mock_session.execute.assert_called_once_with(query, variable_values={})
         assert result == {"data": {"test": "value"}}
+
+    @pytest.mark.asyncio
+    async def test_paginate(self):
+        """Test that paginate follows cursors until the last page"""
+        with FakeSaleorServer(product_count=5) as server:
+            client = SaleorGraphQLClient(server.api_url, "token")
+
+            products = [
+                product["name"]
+                async for product in client.paginate(
+                    SaleorQueries.PRODUCT_LIST, "products", page_size=2
+                )
+            ]
+
+        assert products == [f"Product {pk}" for pk in range(1, 6)]
+        assert server.stats.operations["GetProducts"] == 3
+
+    @pytest.mark.asyncio
+    async def test_paginate_nested_connection(self, auth_token, saleor_api_url):
+        """Test paginating a connection nested inside the result"""
+        client = SaleorGraphQLClient(api_url=saleor_api_url, auth_token=auth_token)
+        page = {
+            "edges": [{"node": {"id": "1"}}],
+            "pageInfo": {"hasNextPage": False, "endCursor": "MA=="},
+        }
+        client.execute_async = AsyncMock(return_value={"shop": {"items": page}})
+
+        nodes = [node async for node in client.paginate("query", "shop.items")]
+
+        assert nodes == [{"id": "1"}]
+        client.execute_async.assert_called_once_with(
+            "query", {"first": 100, "after": None}
+        )
@@ -69,3 +69,10 @@ class TestSaleorQueries:
         mock_gql_client.execute.assert_called_with(
             SaleorQueries.PRODUCT_LIST, variable_values=variables
         )
+
+    def test_queries_are_parsed_once_on_first_access(self):
+        """Test that documents are parsed lazily and cached"""
+        descriptor = SaleorQueries.__dict__["APP_INFO"]
+
+        assert "query GetApp" in descriptor.source
+        assert SaleorQueries.APP_INFO is SaleorQueries.APP_INFO
@@ -0,0 +1,138 @@
+import asyncio
+
+import pytest
+from gql import gql
+
+from saleor_app_sdk.graphql.client import SaleorGraphQLClient
+from saleor_app_sdk.graphql.queries import SaleorQueries
+from saleor_app_sdk.graphql.singleflight import SingleFlight, query_hash, request_key
+from saleor_app_sdk.testing import FakeSaleorServer
+
+
+class TestRequestKey:
+    def test_queries_are_keyed_by_text_and_variables(self):
+        """Test that equal queries and variables give equal keys"""
+        first = gql("query A { shop { name } }")
+        second = gql("query A { shop { name } }")
+
+        assert request_key("shop", first, {"a": 1, "b": 2}) == request_key(
+            "shop", second, {"b": 2, "a": 1}
+        )
+        assert request_key("shop", first, {"a": 1}) != request_key(
+            "shop", first, {"a": 2}
+        )
+        assert request_key("shop", first, {}) != request_key("other", first, {})
+
+    def test_mutations_and_strings_are_not_shared(self):
+        """Test that only parsed query documents can be coalesced"""
+        assert query_hash(gql("mutation M { productDelete(id: 1) { id } }")) is None
+        assert query_hash("query { shop { name } }") is None
+        assert query_hash(SaleorQueries.PRODUCT_LIST) is not None
+
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_result(self):
+        """Test that concurrent callers with one key share a single call"""
+        flight = SingleFlight()
+        calls = []
+
+        async def call():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"value": len(calls)}
+
+        results = await asyncio.gather(*(flight.do("key", call) for _ in range(5)))
+
+        assert calls == [1]
+        assert [shared for _, shared in results] == [False, True, True, True, True]
+        assert all(result is results[0][0] for result, _ in results)
+        assert len(flight) == 0
+
+    @pytest.mark.asyncio
+    async def test_completed_calls_are_not_cached(self):
+        """Test that a new call is made once the previous one finished"""
+        flight = SingleFlight()
+        calls = []
+
+        async def call():
+            calls.append(1)
+            return len(calls)
+
+        assert await flight.do("key", call) == (1, False)
+        assert await flight.do("key", call) == (2, False)
+
+    @pytest.mark.asyncio
+    async def test_exception_is_shared(self):
+        """Test that every waiter sees the shared call's exception"""
+        flight = SingleFlight()
+
+        async def call():
+            await asyncio.sleep(0.01)
+            error_msg = "upstream failed"
+            raise RuntimeError(error_msg)
+
+        results = await asyncio.gather(
+            flight.do("key", call), flight.do("key", call), return_exceptions=True
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert len(flight) == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_call(self):
+        """Test that the other waiters still get the result"""
+        flight = SingleFlight()
+
+        async def call():
+            await asyncio.sleep(0.02)
+            return "done"
+
+        leader = asyncio.create_task(flight.do("key", call))
+        follower = asyncio.create_task(flight.do("key", call))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await follower == ("done", True)
+
+
+class TestClientCoalescing:
+    @pytest.mark.asyncio
+    async def test_identical_queries_collapse_upstream(self):
+        """Test that concurrent identical queries reach Saleor once"""
+        with FakeSaleorServer(product_count=5, latency=0.05) as server:
+            clients = [SaleorGraphQLClient(server.api_url, "token") for _ in range(10)]
+
+            results = await asyncio.gather(
+                *(
+                    client.execute_async(SaleorQueries.PRODUCT_LIST, {"first": 2})
+                    for client in clients
+                )
+            )
+            other = await asyncio.gather(
+                clients[0].execute_async(SaleorQueries.PRODUCT_LIST, {"first": 1}),
+                clients[1].execute_async(SaleorQueries.PRODUCT_LIST, {"first": 3}),
+            )
+
+        assert server.stats.operations["GetProducts"] == 3
+        assert all(result == results[0] for result in results)
+        assert len(results[0]["products"]["edges"]) == 2
+        assert [len(result["products"]["edges"]) for result in other] == [1, 3]
+
+    @pytest.mark.asyncio
+    async def test_coalescing_can_be_disabled(self):
+        """Test that clients created with coalesce=False always send"""
+        with FakeSaleorServer(product_count=5, latency=0.05) as server:
+            clients = [
+                SaleorGraphQLClient(server.api_url, "token", coalesce=False)
+                for _ in range(3)
+            ]
+
+            await asyncio.gather(
+                *(
+                    client.execute_async(SaleorQueries.PRODUCT_LIST, {"first": 2})
+                    for client in clients
+                )
+            )
+
+        assert server.stats.operations["GetProducts"] == 3
@@ -170,3 +170,7 @@ class TestAppManifest:
         assert app_version in repr_str
         assert app_about in repr_str
         assert app_url in repr_str
+
+    def test_slots(self, app_manifest):
+        """Test that manifests do not carry a per-instance dict"""
+        assert not hasattr(app_manifest, "__dict__")
@@ -1,9 +1,11 @@
-from datetime import datetime
+import json
+from dataclasses import FrozenInstanceError
+from datetime import UTC, datetime
 
 import pytest
 from pydantic import ValidationError
 
-from saleor_app_sdk.models.installation import AppInstallation
+from saleor_app_sdk.models.installation import AppInstallation, InstallationRecord
 
 
 class TestAppInstallation:
@@ -20,6 +22,27 @@ class TestAppInstallation:
         assert installation.saleor_api_url == saleor_api_url
         assert isinstance(installation.installed_at, datetime)
 
+    def test_installed_at_is_per_instance(self, auth_token, domain, saleor_api_url):
+        """Test installed_at is generated for each installation"""
+        before = datetime.now(UTC)
+        installation = AppInstallation(
+            auth_token=auth_token,
+            domain=domain,
+            saleor_api_url=saleor_api_url,
+        )
+
+        assert installation.installed_at >= before
+        assert installation.token_refreshed_at is None
+
+    def test_with_token(self, app_installation):
+        """Test replacing the token stamps the refresh time"""
+        refreshed = app_installation.with_token("new-token")
+
+        assert refreshed.auth_token == "new-token"
+        assert refreshed.installed_at == app_installation.installed_at
+        assert refreshed.token_refreshed_at is not None
+        assert app_installation.token_refreshed_at is None
+
     def test_init_with_installed_at(self, auth_token, domain, saleor_api_url):
         """Test initialization with custom installed_at"""
         installed_at = datetime(2023, 1, 1, 12, 0, 0)
@@ -148,3 +171,77 @@ class TestAppInstallation:
         )
 
         assert installation1 != installation3
+
+
+class TestInstallationRecord:
+    def test_init_minimal(self, auth_token, domain, saleor_api_url):
+        """Test initialization with default installed_at"""
+        record = InstallationRecord(auth_token, domain, saleor_api_url)
+
+        assert record.auth_token == auth_token
+        assert record.domain == domain
+        assert record.saleor_api_url == saleor_api_url
+        assert record.installed_at.tzinfo is UTC
+
+    def test_slots_and_frozen(self, auth_token, domain, saleor_api_url):
+        """Test that records are compact and immutable"""
+        record = InstallationRecord(auth_token, domain, saleor_api_url)
+
+        assert not hasattr(record, "__dict__")
+        with pytest.raises(FrozenInstanceError):
+            record.auth_token = "other"
+
+    def test_round_trip_with_app_installation(self, app_installation):
+        """Test conversion to and from AppInstallation"""
+        record = InstallationRecord.from_installation(app_installation)
+
+        assert record.model_dump() == app_installation.model_dump()
+        assert record.to_installation() == app_installation
+
+    def test_model_dump_json_matches_pydantic(self, auth_token, domain, saleor_api_url):
+        """Test the fast JSON path produces the same document as pydantic"""
+        installation = AppInstallation(
+            auth_token=auth_token,
+            domain=domain,
+            saleor_api_url=saleor_api_url,
+            installed_at=datetime(2023, 1, 1, 12, 0, 0, tzinfo=UTC),
+        )
+        record = InstallationRecord.from_installation(installation)
+
+        assert json.loads(record.model_dump_json()) == json.loads(
+            installation.model_dump_json()
+        )
+
+    def test_model_validate(self, auth_token, domain, saleor_api_url):
+        """Test building a record from untrusted data validates it"""
+        record = InstallationRecord.model_validate(
+            {
+                "auth_token": auth_token,
+                "domain": domain,
+                "saleor_api_url": saleor_api_url,
+            }
+        )
+        assert record.domain == domain
+
+        with pytest.raises(ValidationError):
+            InstallationRecord.model_validate({"domain": domain})
+
+    def test_model_copy(self, auth_token, domain, saleor_api_url):
+        """Test copying a record with updated fields"""
+        record = InstallationRecord(auth_token, domain, saleor_api_url)
+
+        updated = record.model_copy(update={"auth_token": "new-token"})
+
+        assert updated.auth_token == "new-token"
+        assert record.auth_token == auth_token
+        assert record.model_copy() is record
+
+    def test_with_token(self, auth_token, domain, saleor_api_url):
+        """Test replacing the token stamps the refresh time"""
+        record = InstallationRecord(auth_token, domain, saleor_api_url)
+
+        refreshed = record.with_token("new-token")
+
+        assert refreshed.auth_token == "new-token"
+        assert refreshed.token_refreshed_at is not None
+        assert json.loads(refreshed.model_dump_json())["token_refreshed_at"]
@@ -1,5 +1,5 @@
 from saleor_app_sdk.models.webhooks import WebhookDefinition
-from saleor_app_sdk.webhooks.events import WebhookEventType
+from saleor_app_sdk.webhooks.events import SyncWebhookEventType, WebhookEventType
 
 
 class TestWebhookDefinition:
@@ -151,3 +151,31 @@ class TestWebhookDefinition:
 
         # Note: WebhookDefinition is a dataclass with mutable fields (list),
         # so it's not hashable by default and can't be used in sets or as dict keys
+
+    def test_slots(self, webhook_definition):
+        """Test that webhook definitions do not carry a per-instance dict"""
+        assert not hasattr(webhook_definition, "__dict__")
+
+    def test_to_dict(self, webhook_definition):
+        """Test serialization to the Saleor manifest shape"""
+        assert webhook_definition.to_dict() == {
+            "name": webhook_definition.name,
+            "asyncEvents": [e.value for e in webhook_definition.events],
+            "query": webhook_definition.query,
+            "targetUrl": webhook_definition.target_url,
+            "isActive": True,
+        }
+
+    def test_to_dict_sync_events(self):
+        """Test that sync events are listed separately in the manifest"""
+        webhook = WebhookDefinition(
+            "Taxes",
+            [SyncWebhookEventType.CHECKOUT_CALCULATE_TAXES],
+            "subscription { event { __typename } }",
+            "https://example.com/api/webhooks/CHECKOUT_CALCULATE_TAXES",
+        )
+
+        data = webhook.to_dict()
+
+        assert data["asyncEvents"] == []
+        assert data["syncEvents"] == ["CHECKOUT_CALCULATE_TAXES"]
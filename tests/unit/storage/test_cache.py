@@ -0,0 +1,139 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from saleor_app_sdk.storage.cache import CachedConfigStore
+from saleor_app_sdk.storage.memory import MemoryConfigStore
+from saleor_app_sdk.storage.sharded import ShardedConfigStore
+
+
+class TestCachedConfigStore:
+    @pytest.mark.asyncio
+    async def test_get_cached_is_populated_by_writes(self, domain):
+        """Test that writes fill the local cache"""
+        cache = CachedConfigStore(MemoryConfigStore())
+
+        assert cache.get_cached(domain) is None
+        await cache.set(domain, {"a": 1})
+        assert cache.get_cached(domain) == {"a": 1}
+
+        await cache.update(domain, {"b": 2})
+        assert cache.get_cached(domain) == {"a": 1, "b": 2}
+
+        await cache.delete(domain)
+        assert cache.get_cached(domain) is None
+
+    @pytest.mark.asyncio
+    async def test_fresh_entry_skips_backing_store(self, domain):
+        """Test that reads within the revalidation window are local"""
+        store = MemoryConfigStore()
+        cache = CachedConfigStore(store, revalidate_after=60)
+        await cache.set(domain, {"a": 1})
+        store.get = AsyncMock()
+        store.get_version = AsyncMock()
+
+        entry = await cache.get(domain)
+
+        assert entry.config == {"a": 1}
+        store.get.assert_not_called()
+        store.get_version.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_stale_version_triggers_reload(self, domain):
+        """Test that a write from another worker is picked up"""
+        store = MemoryConfigStore()
+        cache = CachedConfigStore(store, revalidate_after=0)
+        await cache.set(domain, {"a": 1})
+
+        # Simulate a write from another process
+        await store.update(domain, {"a": 2})
+
+        entry = await cache.get(domain)
+        assert entry.config == {"a": 2}
+        assert cache.get_cached(domain) == {"a": 2}
+
+    @pytest.mark.asyncio
+    async def test_unchanged_version_skips_reload(self, domain):
+        """Test that revalidation only compares version stamps"""
+        store = MemoryConfigStore()
+        cache = CachedConfigStore(store, revalidate_after=0)
+        await cache.set(domain, {"a": 1})
+        store.get = AsyncMock()
+
+        entry = await cache.get(domain)
+
+        assert entry.config == {"a": 1}
+        store.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_start_uses_store_notifications(self, domain):
+        """Test that a subscribed cache is refreshed by the store"""
+        store = MemoryConfigStore()
+        store.subscribe = AsyncMock(return_value=True)
+        cache = CachedConfigStore(store, revalidate_after=0)
+        await cache.start()
+        await cache.start()
+
+        store.subscribe.assert_awaited_once_with(cache.refresh)
+        await cache.set(domain, {"a": 1})
+        await store.update(domain, {"a": 2})
+        await cache.refresh(domain)
+        assert cache.get_cached(domain) == {"a": 2}
+
+    @pytest.mark.asyncio
+    async def test_own_write_notification_keeps_entry(self, domain):
+        """Test that the notification of a local write does not drop the entry"""
+        store = MemoryConfigStore()
+        store.subscribe = AsyncMock(return_value=True)
+        cache = CachedConfigStore(store)
+        await cache.start()
+        await cache.set(domain, {"a": 1})
+        store.get = AsyncMock()
+
+        await cache.refresh(domain)
+
+        assert cache.get_cached(domain) == {"a": 1}
+        store.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_revalidates(self, domain):
+        """Test that an entry whose refresh failed is revalidated on read"""
+        store = MemoryConfigStore()
+        store.subscribe = AsyncMock(return_value=True)
+        cache = CachedConfigStore(store)
+        await cache.start()
+        await cache.set(domain, {"a": 1})
+        await store.update(domain, {"a": 2})
+        store_get = store.get
+        store.get = AsyncMock(side_effect=ConnectionError)
+
+        with pytest.raises(ConnectionError):
+            await cache.refresh(domain)
+        assert cache.get_cached(domain) == {"a": 1}
+
+        store.get = store_get
+        entry = await cache.get(domain)
+        assert entry.config == {"a": 2}
+
+
+class TestShardedConfigStore:
+    def test_requires_shards(self):
+        """Test that an empty shard list is rejected"""
+        with pytest.raises(ValueError):
+            ShardedConfigStore([])
+
+    @pytest.mark.asyncio
+    async def test_routes_domains_to_stable_shards(self):
+        """Test that each domain always lands on the same shard"""
+        shards = [MemoryConfigStore() for _ in range(4)]
+        store = ShardedConfigStore(shards)
+        domains = [f"store{i}.saleor.io" for i in range(20)]
+
+        for domain in domains:
+            await store.set(domain, {"domain": domain})
+
+        for domain in domains:
+            shard = store.shard_for(domain)
+            assert (await shard.get(domain)).config == {"domain": domain}
+            assert (await store.get(domain)).config == {"domain": domain}
+        assert sum(len(shard._configs) for shard in shards) == len(domains)
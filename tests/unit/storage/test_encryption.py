@@ -0,0 +1,133 @@
+from unittest.mock import patch
+
+import pytest
+
+from saleor_app_sdk.storage.encryption import (
+    DecryptionError,
+    EncryptedConfigStore,
+    EnvelopeEncryptor,
+    KeyRing,
+)
+from saleor_app_sdk.storage.memory import MemoryConfigStore
+
+
+@pytest.fixture
+def keyring():
+    return KeyRing({"k1": KeyRing.generate_key()}, primary="k1")
+
+
+@pytest.fixture
+def encryptor(keyring):
+    return EnvelopeEncryptor(keyring, cache_size=2)
+
+
+class TestKeyRing:
+    def test_primary_must_exist(self):
+        """Test that the primary key id must be in the ring"""
+        with pytest.raises(ValueError, match="Primary key"):
+            KeyRing({"k1": KeyRing.generate_key()}, primary="k2")
+
+    def test_key_id_must_not_contain_dot(self):
+        """Test that key ids cannot break the token format"""
+        with pytest.raises(ValueError, match="must not contain"):
+            KeyRing({"k.1": KeyRing.generate_key()}, primary="k.1")
+
+    def test_added_key_id_must_not_contain_dot(self, keyring):
+        """Test that add_key rejects the same key ids as the constructor"""
+        with pytest.raises(ValueError, match="must not contain"):
+            keyring.add_key("k.2", KeyRing.generate_key())
+        assert keyring.primary != "k.2"
+
+
+class TestEnvelopeEncryptor:
+    def test_round_trip(self, encryptor, auth_token, domain):
+        """Test encrypting and decrypting a token"""
+        token = encryptor.encrypt(auth_token, domain)
+
+        assert auth_token not in token
+        assert encryptor.is_encrypted(token)
+        encryptor.clear_cache()
+        assert encryptor.decrypt(token, domain) == auth_token
+
+    def test_context_is_bound(self, encryptor, auth_token, domain):
+        """Test that a token cannot be moved to another domain"""
+        token = encryptor.encrypt(auth_token, domain)
+        encryptor.clear_cache()
+
+        with pytest.raises(DecryptionError):
+            encryptor.decrypt(token, "other.saleor.io")
+
+    def test_malformed_token(self, encryptor):
+        """Test that malformed tokens raise DecryptionError"""
+        with pytest.raises(DecryptionError, match="Malformed"):
+            encryptor.decrypt("not-a-token")
+
+    def test_decrypt_is_cached(self, encryptor, auth_token, domain):
+        """Test that repeated decrypts skip AES"""
+        token = encryptor.encrypt(auth_token, domain)
+        encryptor.clear_cache()
+        encryptor.decrypt(token, domain)
+
+        with patch.object(encryptor, "_open") as mock_open:
+            assert encryptor.decrypt(token, domain) == auth_token
+            mock_open.assert_not_called()
+
+    def test_cache_is_bounded(self, encryptor):
+        """Test that the LRU cache evicts the oldest entries"""
+        tokens = [encryptor.encrypt(f"secret-{i}") for i in range(3)]
+
+        assert len(encryptor._cache) == 2
+        assert (tokens[0], "") not in encryptor._cache
+        assert encryptor.decrypt(tokens[0]) == "secret-0"
+
+    def test_rotation(self, encryptor, keyring, auth_token, domain):
+        """Test that rotation re-wraps tokens onto the new primary key"""
+        old_token = encryptor.encrypt(auth_token, domain)
+        keyring.add_key("k2", KeyRing.generate_key())
+
+        assert encryptor.needs_rotation(old_token)
+        new_token = encryptor.rotate(old_token, domain)
+
+        assert not encryptor.needs_rotation(new_token)
+        assert new_token.split(".")[3] == old_token.split(".")[3]
+        encryptor.clear_cache()
+        assert encryptor.decrypt(new_token, domain) == auth_token
+        assert encryptor.decrypt(old_token, domain) == auth_token
+
+
+class TestEncryptedConfigStore:
+    @pytest.mark.asyncio
+    async def test_secret_fields_are_encrypted_at_rest(
+        self, encryptor, auth_token, domain
+    ):
+        """Test that only secret fields are encrypted in the backing store"""
+        backing = MemoryConfigStore()
+        store = EncryptedConfigStore(backing, encryptor)
+
+        await store.set(domain, {"auth_token": auth_token, "name": "Test"})
+
+        raw = (await backing.get(domain)).config
+        assert raw["name"] == "Test"
+        assert encryptor.is_encrypted(raw["auth_token"])
+        entry = await store.get(domain)
+        assert entry.config == {"auth_token": auth_token, "name": "Test"}
+
+        updated = await store.update(domain, {"auth_token": "new-token"})
+        assert updated.config["auth_token"] == "new-token"
+
+    @pytest.mark.asyncio
+    async def test_rotate(self, encryptor, keyring, auth_token, domain):
+        """Test rotating stored secrets onto a new key"""
+        backing = MemoryConfigStore()
+        store = EncryptedConfigStore(backing, encryptor)
+        await store.set(domain, {"auth_token": auth_token})
+        keyring.add_key("k2", KeyRing.generate_key())
+
+        assert await store.rotate(domain) is True
+        assert await store.rotate(domain) is False
+        assert await store.rotate("missing.saleor.io") is False
+
+        raw = (await backing.get(domain)).config
+        assert raw["auth_token"].split(".")[1] == "k2"
+        encryptor.clear_cache()
+        assert (await store.get(domain)).config == {"auth_token": auth_token}
@@ -0,0 +1,49 @@
+import pytest
+
+from saleor_app_sdk.storage.memory import MemoryConfigStore
+
+
+class TestMemoryConfigStore:
+    @pytest.mark.asyncio
+    async def test_get_missing(self, domain):
+        """Test getting config for a domain that has none"""
+        store = MemoryConfigStore()
+
+        assert await store.get(domain) is None
+        assert await store.get_version(domain) == 0
+
+    @pytest.mark.asyncio
+    async def test_set_and_get(self, domain):
+        """Test that set stores a copy and bumps the version"""
+        store = MemoryConfigStore()
+        config = {"api_key": "12345"}
+
+        assert await store.set(domain, config) == 1
+        config["api_key"] = "changed"
+
+        entry = await store.get(domain)
+        assert entry.config == {"api_key": "12345"}
+        assert entry.version == 1
+
+    @pytest.mark.asyncio
+    async def test_update_merges(self, domain):
+        """Test that update merges top-level keys"""
+        store = MemoryConfigStore()
+        await store.set(domain, {"api_key": "12345", "secret": "s"})
+
+        entry = await store.update(domain, {"api_key": "67890", "new": 1})
+
+        assert entry.config == {"api_key": "67890", "secret": "s", "new": 1}
+        assert entry.version == 2
+
+    @pytest.mark.asyncio
+    async def test_delete_keeps_version_counter(self, domain):
+        """Test that a re-created config never reuses an old version"""
+        store = MemoryConfigStore()
+        await store.set(domain, {"a": 1})
+
+        await store.delete(domain)
+        assert await store.get(domain) is None
+        assert await store.get_version(domain) == 2
+
+        assert await store.set(domain, {"a": 2}) == 3
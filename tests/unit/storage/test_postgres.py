@@ -0,0 +1,139 @@
+import asyncio
+import json
+
+import pytest
+
+from saleor_app_sdk.app.config import AppConfigMixin
+from saleor_app_sdk.app.core import SaleorApp
+from saleor_app_sdk.storage.postgres import PostgresConfigStore
+
+
+class FakeDatabase:
+    """Rows and NOTIFY listeners shared by the connections of fake pools"""
+
+    def __init__(self):
+        self.rows: dict[str, dict] = {}
+        self.listeners: dict[str, list] = {}
+
+    def notify(self, channel, payload):
+        loop = asyncio.get_running_loop()
+        for conn, callback in self.listeners.get(channel, []):
+            # asyncpg delivers notifications from the event loop, not inline
+            loop.call_soon(callback, conn, 0, channel, payload)
+
+
+class FakeConnection:
+    """Runs the statements issued by :class:`PostgresConfigStore`"""
+
+    def __init__(self, db: FakeDatabase):
+        self.db = db
+
+    async def fetchrow(self, query, domain, *args):
+        if query.startswith("SELECT config"):
+            return self.db.rows.get(domain)
+        config, channel = args
+        row = self.db.rows.get(domain) or {"config": None, "version": 0}
+        current = json.loads(row["config"] or "{}")
+        merged = {**current, **json.loads(config)} if "||" in query else config
+        if isinstance(merged, dict):
+            merged = json.dumps(merged)
+        row = self.db.rows[domain] = {"config": merged, "version": row["version"] + 1}
+        self.db.notify(channel, domain)
+        return row
+
+    async def fetchval(self, _query, domain):
+        row = self.db.rows.get(domain)
+        return row and row["version"]
+
+    async def execute(self, _query, domain, channel):
+        row = self.db.rows.get(domain)
+        if row is not None and row["config"] is not None:
+            self.db.rows[domain] = {"config": None, "version": row["version"] + 1}
+            self.db.notify(channel, domain)
+
+    async def add_listener(self, channel, callback):
+        self.db.listeners.setdefault(channel, []).append((self, callback))
+
+
+class FakePool:
+    def __init__(self, db: FakeDatabase):
+        self.db = db
+
+    async def acquire(self, timeout=None):
+        return FakeConnection(self.db)
+
+    async def release(self, _conn):
+        pass
+
+    async def close(self):
+        pass
+
+
+class ConfiguredApp(AppConfigMixin, SaleorApp):
+    pass
+
+
+def fake_store(db: FakeDatabase) -> PostgresConfigStore:
+    store = PostgresConfigStore("postgresql://localhost/test")
+    store._pool = FakePool(db)
+    return store
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestPostgresConfigStore:
+    def test_rejects_invalid_names(self):
+        """Test that table and channel names must be identifiers"""
+        with pytest.raises(ValueError, match="Invalid table"):
+            PostgresConfigStore("postgresql://localhost/test", table="a; DROP")
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self, domain):
+        """Test that writes bump the version and are read back"""
+        store = fake_store(FakeDatabase())
+
+        assert await store.get(domain) is None
+        assert await store.set(domain, {"a": 1}) == 1
+        entry = await store.update(domain, {"b": 2})
+        assert entry.config == {"a": 1, "b": 2}
+        assert entry.version == 2
+
+        await store.delete(domain)
+        assert await store.get(domain) is None
+        assert await store.get_version(domain) == 3
+
+    @pytest.mark.asyncio
+    async def test_own_writes_stay_cached(self, app_manifest, secret_key):
+        """Test that a worker's own NOTIFY does not empty get_config"""
+        app = ConfiguredApp(
+            app_manifest, secret_key, config_store=fake_store(FakeDatabase())
+        )
+        await app.config_store.start()
+
+        await app.save_config("shop.example.com", {"a": 1})
+        await settle()
+        assert app.get_config("shop.example.com") == {"a": 1}
+
+        await app.patch_config("shop.example.com", {"b": 2})
+        await settle()
+        assert app.get_config("shop.example.com") == {"a": 1, "b": 2}
+
+    @pytest.mark.asyncio
+    async def test_other_writers_refresh_cache(self, app_manifest, secret_key):
+        """Test that a write from another worker is pushed into get_config"""
+        db = FakeDatabase()
+        app = ConfiguredApp(app_manifest, secret_key, config_store=fake_store(db))
+        other = fake_store(db)
+        await app.config_store.start()
+        await app.save_config("shop.example.com", {"a": 1})
+
+        await other.update("shop.example.com", {"a": 2})
+        await settle()
+        assert app.get_config("shop.example.com") == {"a": 2}
+
+        await other.delete("shop.example.com")
+        await settle()
+        assert app.get_config("shop.example.com") == {}
@@ -0,0 +1,154 @@
+import asyncio
+
+import pytest
+
+from saleor_app_sdk.app.config import AppConfigMixin
+from saleor_app_sdk.app.core import SaleorApp
+from saleor_app_sdk.storage.redis import RedisConfigStore
+
+
+class FakeRedis:
+    """Just enough of ``redis.asyncio.Redis`` for :class:`RedisConfigStore`"""
+
+    def __init__(self):
+        self.data: dict = {}
+        self.subscribers: dict[str, list[asyncio.Queue]] = {}
+
+    def _get(self, key):
+        return self.data.get(key)
+
+    async def get(self, key):
+        return self._get(key)
+
+    def hgetall(self, key):
+        return dict(self.data.get(key, {}))
+
+    def hset(self, key, mapping):
+        self.data.setdefault(key, {}).update(mapping)
+        return len(mapping)
+
+    def delete(self, key):
+        return int(self.data.pop(key, None) is not None)
+
+    def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) + 1)
+        return int(self.data[key])
+
+    def publish(self, channel, message):
+        queues = self.subscribers.get(channel, [])
+        for queue in queues:
+            queue.put_nowait({"type": "message", "data": message})
+        return len(queues)
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def pubsub(self):
+        return FakePubSub(self)
+
+    async def aclose(self):
+        pass
+
+
+class FakePipeline:
+    def __init__(self, redis: FakeRedis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_exc):
+        return False
+
+    def __getattr__(self, name):
+        # Queued commands run synchronously on execute()
+        command = getattr(self.redis, "_get" if name == "get" else name)
+        return lambda *args, **kwargs: self.commands.append((command, args, kwargs))
+
+    async def execute(self):
+        return [command(*args, **kwargs) for command, args, kwargs in self.commands]
+
+
+class FakePubSub:
+    def __init__(self, redis: FakeRedis):
+        self.redis = redis
+        self.queue: asyncio.Queue = asyncio.Queue()
+
+    async def subscribe(self, channel):
+        self.redis.subscribers.setdefault(channel, []).append(self.queue)
+
+    async def listen(self):
+        while True:
+            yield await self.queue.get()
+
+    async def aclose(self):
+        pass
+
+
+class ConfiguredApp(AppConfigMixin, SaleorApp):
+    pass
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+def redis():
+    return FakeRedis()
+
+
+class TestRedisConfigStore:
+    @pytest.mark.asyncio
+    async def test_round_trip(self, redis, domain):
+        """Test that writes bump the version and are read back"""
+        store = RedisConfigStore(client=redis)
+
+        assert await store.get(domain) is None
+        assert await store.set(domain, {"a": 1}) == 1
+        entry = await store.update(domain, {"b": [2]})
+        assert entry.config == {"a": 1, "b": [2]}
+        assert entry.version == 2
+        assert await store.get(domain) == entry
+
+        await store.delete(domain)
+        assert await store.get(domain) is None
+        assert await store.get_version(domain) == 3
+
+    @pytest.mark.asyncio
+    async def test_own_writes_stay_cached(self, redis, app_manifest, secret_key):
+        """Test that a worker's own notifications do not empty get_config"""
+        app = ConfiguredApp(
+            app_manifest, secret_key, config_store=RedisConfigStore(client=redis)
+        )
+        await app.config_store.start()
+
+        await app.save_config("shop.example.com", {"a": 1})
+        await settle()
+        assert app.get_config("shop.example.com") == {"a": 1}
+
+        await app.patch_config("shop.example.com", {"b": 2})
+        await settle()
+        assert app.get_config("shop.example.com") == {"a": 1, "b": 2}
+        await app.config_store.close()
+
+    @pytest.mark.asyncio
+    async def test_other_writers_refresh_cache(self, redis, app_manifest, secret_key):
+        """Test that a write from another worker is pushed into get_config"""
+        app = ConfiguredApp(
+            app_manifest, secret_key, config_store=RedisConfigStore(client=redis)
+        )
+        other = RedisConfigStore(client=redis)
+        await app.config_store.start()
+        await app.save_config("shop.example.com", {"a": 1})
+
+        await other.update("shop.example.com", {"a": 2})
+        await settle()
+        assert app.get_config("shop.example.com") == {"a": 2}
+
+        await other.delete("shop.example.com")
+        await settle()
+        assert app.get_config("shop.example.com") == {}
+        await app.config_store.close()
@@ -0,0 +1,58 @@
+import asyncio
+
+import pytest
+
+from saleor_app_sdk.storage.sqlite import SQLiteConfigStore
+
+
+@pytest.fixture
+async def sqlite_store(tmp_path):
+    store = SQLiteConfigStore(str(tmp_path / "config.db"))
+    yield store
+    await store.close()
+
+
+class TestSQLiteConfigStore:
+    def test_invalid_table_name(self, tmp_path):
+        """Test that table names are validated"""
+        with pytest.raises(ValueError, match="Invalid table name"):
+            SQLiteConfigStore(str(tmp_path / "config.db"), table="config; DROP")
+
+    @pytest.mark.asyncio
+    async def test_set_get_update_delete(self, sqlite_store, domain):
+        """Test the full config lifecycle"""
+        assert await sqlite_store.get(domain) is None
+
+        assert await sqlite_store.set(domain, {"api_key": "12345"}) == 1
+        entry = await sqlite_store.update(domain, {"webhooks": ["ORDER_CREATED"]})
+        assert entry.config == {"api_key": "12345", "webhooks": ["ORDER_CREATED"]}
+        assert entry.version == 2
+
+        await sqlite_store.delete(domain)
+        assert await sqlite_store.get(domain) is None
+        assert await sqlite_store.get_version(domain) == 3
+
+    @pytest.mark.asyncio
+    async def test_persists_across_instances(self, tmp_path, domain):
+        """Test that config survives a restart"""
+        path = str(tmp_path / "config.db")
+        first = SQLiteConfigStore(path)
+        await first.set(domain, {"api_key": "12345"})
+        await first.close()
+
+        second = SQLiteConfigStore(path)
+        entry = await second.get(domain)
+        await second.close()
+
+        assert entry.config == {"api_key": "12345"}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_updates_are_not_lost(self, sqlite_store, domain):
+        """Test that concurrent partial updates all land"""
+        await asyncio.gather(
+            *(sqlite_store.update(domain, {f"key{i}": i}) for i in range(20))
+        )
+
+        entry = await sqlite_store.get(domain)
+        assert entry.config == {f"key{i}": i for i in range(20)}
+        assert entry.version == 20
@@ -0,0 +1,82 @@
+from unittest.mock import patch
+
+import pytest
+
+from saleor_app_sdk.cli import build_parser, cli
+from saleor_app_sdk.webhooks.events import WebhookEventType
+
+
+class TestCli:
+    def test_parse_bench_webhooks(self):
+        """Test parsing bench-webhooks options"""
+        args = build_parser().parse_args(
+            [
+                "bench-webhooks",
+                "http://localhost:8000",
+                "--secret-key",
+                "key",
+                "--event",
+                "order_created",
+                "--rps",
+                "50",
+                "--requests",
+                "100",
+            ]
+        )
+
+        assert args.command == "bench-webhooks"
+        assert args.events == [WebhookEventType.ORDER_CREATED]
+        assert args.rps == 50.0
+        assert args.requests == 100
+
+    def test_unknown_event_type(self, capsys):
+        """Test that unknown event types are rejected"""
+        with pytest.raises(SystemExit):
+            build_parser().parse_args(
+                ["bench-webhooks", "http://app", "--secret-key", "k", "--event", "NOPE"]
+            )
+
+        assert "unknown webhook event type" in capsys.readouterr().err
+
+    def test_fake_saleor_forwards_arguments(self):
+        """Test that fake-saleor passes its options through"""
+        with patch("saleor_app_sdk.testing.fake_saleor.main") as main:
+            assert cli(["fake-saleor", "--port", "9000"]) == 0
+
+        main.assert_called_once_with(["--port", "9000"])
+
+    def test_bench_webhooks_unreachable_app(self, capsys):
+        """Test that connection errors are reported and fail the run"""
+        exit_code = cli(
+            [
+                "bench-webhooks",
+                "http://127.0.0.1:9",
+                "--secret-key",
+                "key",
+                "--requests",
+                "2",
+                "--json",
+            ]
+        )
+
+        assert exit_code == 1
+        assert '"ConnectError": 2' in capsys.readouterr().out
+
+    def test_compile_templates(self, tmp_path, capsys):
+        """Test filling a bytecode cache from the command line"""
+        (tmp_path / "templates").mkdir()
+        (tmp_path / "templates" / "index.html").write_text("{{ 1 + 1 }}")
+        cache_dir = tmp_path / "cache"
+
+        exit_code = cli(
+            [
+                "compile-templates",
+                str(tmp_path / "templates"),
+                "--cache-dir",
+                str(cache_dir),
+            ]
+        )
+
+        assert exit_code == 0
+        assert "Compiled 1 templates" in capsys.readouterr().out
+        assert len(list(cache_dir.iterdir())) == 1
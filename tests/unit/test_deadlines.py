@@ -0,0 +1,243 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+from gql import gql
+
+from saleor_app_sdk import deadlines
+from saleor_app_sdk.app.core import SaleorApp
+from saleor_app_sdk.deadlines import DeadlineExceededError, deadline, remaining
+from saleor_app_sdk.graphql.client import SaleorGraphQLClient
+from saleor_app_sdk.storage.postgres import PostgresConfigStore
+from saleor_app_sdk.testing import sign_payload
+from saleor_app_sdk.webhooks.events import SyncWebhookEventType, WebhookEventType
+from saleor_app_sdk.webhooks.partitions import PartitionedExecutor
+from saleor_app_sdk.webhooks.retry import RetryPolicy
+from saleor_app_sdk.webhooks.sync import CalculateTaxesResponse
+from saleor_app_sdk.webhooks.tenants import TenantScheduler
+
+
+@pytest.fixture
+def exceeded(recording):
+    return recording.calls["observe_deadline_exceeded"]
+
+
+SHOP_QUERY = gql("query { shop { name } }")
+
+
+class SlowPool:
+    """asyncpg-like pool whose connections are all taken"""
+
+    async def acquire(self, timeout=None):
+        await asyncio.sleep(timeout)
+        raise TimeoutError
+
+
+class TestDeadline:
+    def test_no_deadline(self):
+        """Test that there is no deadline outside a deadline block"""
+        assert remaining() is None
+        assert deadlines.check("test") is None
+
+    def test_deadlines_only_shrink(self):
+        """Test that an inner deadline cannot extend the outer one"""
+        with deadline(1.0) as outer:
+            assert 0.9 < outer <= 1.0
+            with deadline(60.0) as inner:
+                assert inner <= 1.0
+            with deadline(0.5) as inner:
+                assert inner <= 0.5
+            with deadline(None) as inner:
+                assert inner <= 1.0
+        assert remaining() is None
+
+    def test_check_after_deadline(self, exceeded):
+        """Test that check raises and records once the deadline passed"""
+        with deadline(0), pytest.raises(DeadlineExceededError) as info:
+            deadlines.check("graphql")
+        assert info.value.operation == "graphql"
+        assert isinstance(info.value, TimeoutError)
+        assert exceeded == [("graphql",)]
+
+    @pytest.mark.asyncio
+    async def test_limit_cancels_work(self, exceeded):
+        """Test that limit cancels the block when the deadline passes"""
+        with deadline(0.02), pytest.raises(DeadlineExceededError):
+            async with deadlines.limit("slow"):
+                await asyncio.sleep(1)
+        assert exceeded == [("slow",)]
+
+    @pytest.mark.asyncio
+    async def test_limit_keeps_other_timeouts(self, exceeded):
+        """Test that timeouts not caused by the deadline are raised as they are"""
+        with deadline(10), pytest.raises(TimeoutError) as info:
+            async with deadlines.limit("call"):
+                raise TimeoutError
+        assert not isinstance(info.value, DeadlineExceededError)
+        assert exceeded == []
+
+    @pytest.mark.asyncio
+    async def test_deadline_follows_tasks(self):
+        """Test that tasks started inside a deadline block inherit it"""
+        with deadline(5):
+            left = await asyncio.create_task(asyncio.to_thread(remaining))
+        assert 4 < left <= 5
+
+
+class TestDeadlineUsers:
+    @pytest.mark.asyncio
+    async def test_graphql_cancelled(self, exceeded, auth_token, saleor_api_url):
+        """Test that a slow GraphQL call is cancelled at the deadline"""
+
+        async def slow_execute(*_args, **_kwargs):
+            await asyncio.sleep(1)
+
+        session = AsyncMock()
+        session.execute.side_effect = slow_execute
+        gql_client = MagicMock()
+        gql_client.__aenter__.return_value = session
+        client = SaleorGraphQLClient(saleor_api_url, auth_token)
+        client._async_client = gql_client
+
+        with deadline(0.02), pytest.raises(DeadlineExceededError):
+            await client.execute_async(SHOP_QUERY)
+        assert exceeded == [("graphql",)]
+
+    @pytest.mark.asyncio
+    async def test_graphql_not_sent_after_deadline(
+        self, exceeded, auth_token, saleor_api_url
+    ):
+        """Test that no GraphQL call is started once the deadline passed"""
+        gql_client = MagicMock()
+        client = SaleorGraphQLClient(saleor_api_url, auth_token)
+        client._async_client = gql_client
+
+        with deadline(0), pytest.raises(DeadlineExceededError):
+            await client.execute_async(SHOP_QUERY)
+        with deadline(0), pytest.raises(DeadlineExceededError):
+            await client.execute(SHOP_QUERY)
+        gql_client.__aenter__.assert_not_called()
+        assert exceeded == [("graphql",), ("graphql",)]
+
+    @pytest.mark.asyncio
+    async def test_retry_stops_at_deadline(self, exceeded):
+        """Test that no retry is attempted when its delay outlasts the deadline"""
+        calls = []
+
+        async def failing():
+            calls.append(1)
+            error_msg = "down"
+            raise RuntimeError(error_msg)
+
+        policy = RetryPolicy(attempts=5, base_delay=0.2, jitter=0)
+        with deadline(0.1), pytest.raises(RuntimeError, match="down"):
+            await policy.run(failing)
+        assert len(calls) == 1
+        assert exceeded == [("retry",)]
+
+    @pytest.mark.asyncio
+    async def test_tenant_slot_wait(self, exceeded):
+        """Test that waiting for a tenant slot ends at the deadline"""
+        scheduler = TenantScheduler(concurrency=1)
+        await scheduler.acquire("a.com")
+
+        with deadline(0.02), pytest.raises(DeadlineExceededError):
+            await scheduler.acquire("b.com")
+        assert scheduler.queued() == 0
+        assert exceeded == [("tenant_slot",)]
+
+        scheduler.release("a.com")
+        await scheduler.acquire("b.com")
+        assert scheduler.running == 1
+
+    @pytest.mark.asyncio
+    async def test_postgres_pool_wait(self, exceeded):
+        """Test that waiting for a pooled connection ends at the deadline"""
+        store = PostgresConfigStore("postgresql://localhost/test")
+        store._pool = SlowPool()
+
+        with deadline(0.02), pytest.raises(DeadlineExceededError):
+            await store.get("a.com")
+        assert exceeded == [("postgres_pool",)]
+
+    def test_webhook_deadline(self, app_manifest, secret_key, base_url):
+        """Test that webhook handlers run within the webhook deadline"""
+        app = SaleorApp(
+            manifest=app_manifest,
+            secret_key=secret_key,
+            base_url=base_url,
+            webhook_deadline=3.0,
+        )
+        seen = {}
+
+        @app.webhook(WebhookEventType.ORDER_CREATED)
+        async def order_created(_data):
+            seen["async"] = remaining()
+
+        @app.sync_webhook(SyncWebhookEventType.CHECKOUT_CALCULATE_TAXES, deadline=1.0)
+        async def taxes(_data):
+            seen["sync"] = remaining()
+            return CalculateTaxesResponse(0, 0, 0)
+
+        client = TestClient(app.fastapi_app)
+        for event in (
+            WebhookEventType.ORDER_CREATED,
+            SyncWebhookEventType.CHECKOUT_CALCULATE_TAXES,
+        ):
+            response = client.post(
+                f"/api/webhooks/{event.value}",
+                content=b"{}",
+                headers={
+                    "saleor-event": event.value,
+                    "saleor-signature": sign_payload(secret_key, b"{}"),
+                },
+            )
+            assert response.status_code == 200
+        assert 2 < seen["async"] <= 3
+        assert 0 < seen["sync"] <= 1
+
+    @pytest.mark.asyncio
+    async def test_partitioned_webhook_deadline(
+        self, app_manifest, secret_key, app_client, signed_post
+    ):
+        """Test that partitioned handlers see their own request's deadline"""
+        app = SaleorApp(
+            manifest=app_manifest,
+            secret_key=secret_key,
+            webhook_executor=PartitionedExecutor(2),
+            webhook_deadline=0.2,
+        )
+        seen = []
+
+        @app.webhook(WebhookEventType.ORDER_CREATED)
+        async def order_created(_data):
+            seen.append(deadlines.check("graphql"))
+
+        async with app_client(app) as client:
+            for _ in range(2):
+                response = await signed_post(client, WebhookEventType.ORDER_CREATED)
+                assert response.status_code == 200
+                await asyncio.sleep(0.3)
+        await app.webhook_handler.executor.close()
+
+        assert len(seen) == 2
+        assert all(0.1 < left <= 0.2 for left in seen)
+        assert remaining() is None
+
+    def test_request_deadline(self, app_manifest, secret_key, base_url):
+        """Test that request_deadline sets a deadline for app routes"""
+        app = SaleorApp(
+            manifest=app_manifest,
+            secret_key=secret_key,
+            base_url=base_url,
+            request_deadline=5.0,
+        )
+
+        @app.get("/left")
+        async def left():
+            return {"remaining": remaining()}
+
+        response = TestClient(app.fastapi_app).get("/left")
+
+        assert 4 < response.json()["remaining"] <= 5
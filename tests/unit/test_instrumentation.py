@@ -0,0 +1,350 @@
+import json
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+from graphql import parse, print_ast
+
+from saleor_app_sdk.app.core import SaleorApp
+from saleor_app_sdk.graphql.client import SaleorGraphQLClient
+from saleor_app_sdk.graphql.queries import SaleorQueries
+from saleor_app_sdk.instrumentation import (
+    Instrumentation,
+    PrometheusInstrumentation,
+    get_instrumentation,
+    graphql_span,
+    operation_name,
+    set_instrumentation,
+)
+from saleor_app_sdk.testing import FakeSaleorServer, sign_payload
+from saleor_app_sdk.webhooks.events import WebhookEventType
+from saleor_app_sdk.webhooks.partitions import PartitionedExecutor
+
+pytest.importorskip("prometheus_client")
+
+
+@pytest.fixture(autouse=True)
+def reset_instrumentation():
+    yield
+    set_instrumentation(None)
+
+
+@pytest.fixture
+def prometheus():
+    return PrometheusInstrumentation()
+
+
+@pytest.fixture
+def instrumented_app(app_manifest, secret_key, base_url, prometheus):
+    return SaleorApp(
+        manifest=app_manifest,
+        secret_key=secret_key,
+        base_url=base_url,
+        instrumentation=prometheus,
+    )
+
+
+def _post_webhook(client, secret_key, body, signature=None):
+    return client.post(
+        "/api/webhooks/ORDER_CREATED",
+        content=body,
+        headers={
+            "saleor-event": "ORDER_CREATED",
+            "saleor-signature": signature or sign_payload(secret_key, body),
+        },
+    )
+
+
+class TestInstrumentation:
+    def test_disabled_by_default(self, saleor_app):
+        """Test that instrumentation is off unless configured"""
+        assert get_instrumentation() is None
+        assert saleor_app.instrumentation is None
+
+    def test_no_metrics_route_when_disabled(self, test_client):
+        """Test that /metrics is not exposed without instrumentation"""
+        assert test_client.get("/metrics").status_code == 404
+
+    def test_operation_name(self):
+        """Test extracting the operation name from a document"""
+        assert operation_name(SaleorQueries.PRODUCT_LIST) == "GetProducts"
+        assert operation_name("{ shop { name } }") == "anonymous"
+
+    def test_webhook_stages(self, saleor_app, secret_key, recording):
+        """Test that every webhook stage is timed per event type"""
+        saleor_app.webhook(WebhookEventType.ORDER_CREATED)(lambda _data: None)
+        client = TestClient(saleor_app.fastapi_app)
+
+        assert _post_webhook(client, secret_key, b"{}").status_code == 200
+        assert _post_webhook(client, secret_key, b"{}", "bad").status_code == 401
+
+        stages = recording.calls["observe_webhook_stage"]
+        assert [(event, stage) for event, stage, _ in stages[:4]] == [
+            ("ORDER_CREATED", "receive"),
+            ("ORDER_CREATED", "verify"),
+            ("ORDER_CREATED", "decode"),
+            ("ORDER_CREATED", "handler"),
+        ]
+        assert recording.calls["observe_webhook_result"] == [
+            ("ORDER_CREATED", "ok"),
+            ("ORDER_CREATED", "invalid_signature"),
+        ]
+
+    def test_graphql_span(self, recording):
+        """Test that GraphQL calls are recorded with sizes"""
+        with graphql_span(
+            recording, SaleorQueries.PRODUCT_LIST, {"first": 2}, "shop.local"
+        ) as outcome:
+            outcome["result"] = {"products": {"edges": []}}
+
+        operation, installation, _, sizes = recording.calls["observe_graphql"][0]
+        assert operation == "GetProducts"
+        assert installation == "shop.local"
+        assert sizes["response_size"] == len(json.dumps({"products": {"edges": []}}))
+        assert sizes["error"] is False
+
+    def test_graphql_span_sizes_from_caller(self, recording):
+        """Test that the response size given by the caller is recorded"""
+        document = parse("query GetShop { shop { name } }", no_location=True)
+
+        with patch("graphql.print_ast", wraps=print_ast) as printer:
+            for _ in range(2):
+                with graphql_span(recording, document, {}, "shop.local") as out:
+                    out["result"] = {"shop": {"name": "Shop"}}
+                    out["response_size"] = 123
+
+        assert printer.call_count == 1
+        sizes = [call[3] for call in recording.calls["observe_graphql"]]
+        assert [s["response_size"] for s in sizes] == [123, 123]
+        assert sizes[0]["request_size"] == len(print_ast(document)) + len("{}")
+
+    def test_graphql_span_error(self, recording):
+        """Test that failed GraphQL calls are recorded as errors"""
+        with (
+            pytest.raises(RuntimeError),
+            graphql_span(recording, SaleorQueries.APP_INFO, {}, "shop.local"),
+        ):
+            raise RuntimeError
+
+        assert recording.calls["observe_graphql"][0][3]["error"] is True
+
+    def test_pool_sampling(self):
+        """Test registering and sampling connection pools"""
+        instrumentation = Instrumentation()
+        instrumentation.register_pool("db", lambda: (2, 5))
+
+        assert list(instrumentation.sample_pools()) == [("db", 2, 5)]
+
+        instrumentation.unregister_pool("db")
+        assert list(instrumentation.sample_pools()) == []
+
+
+class TestPrometheusInstrumentation:
+    def test_metrics_endpoint(self, instrumented_app, prometheus, secret_key):
+        """Test that webhook, cache and pool metrics are exposed"""
+        prometheus.register_pool("db", lambda: (3, 10))
+        client = TestClient(instrumented_app.fastapi_app)
+        client.get("/api/manifest")
+        client.get("/api/manifest")
+        _post_webhook(client, secret_key, b"{}")
+
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        text = response.text
+        assert (
+            'saleor_app_webhook_stage_seconds_count{event_type="ORDER_CREATED",'
+            'stage="verify"} 1.0' in text
+        )
+        assert (
+            'saleor_app_webhooks_total{event_type="ORDER_CREATED",outcome="ok"} 1.0'
+            in text
+        )
+        assert 'saleor_app_cache_lookups_total{cache="manifest",result="hit"} 1.0' in (
+            text
+        )
+        assert 'saleor_app_pool_connections_in_use{pool="db"} 3.0' in text
+
+    def test_sync_webhook_histogram(self, prometheus):
+        """Test that sync webhook latency is recorded per event and outcome"""
+        prometheus.observe_sync_webhook("CHECKOUT_CALCULATE_TAXES", "timeout", 0.3)
+
+        text = prometheus.render_metrics()[0].decode()
+        assert (
+            "saleor_app_sync_webhook_seconds_count{"
+            'event_type="CHECKOUT_CALCULATE_TAXES",outcome="timeout"} 1.0' in text
+        )
+
+    def test_webhook_batch_histograms(self, prometheus):
+        """Test that batch sizes and durations are recorded per event"""
+        prometheus.observe_webhook_batch("PRODUCT_UPDATED", 40, 0.2)
+
+        text = prometheus.render_metrics()[0].decode()
+        assert (
+            'saleor_app_webhook_batch_size_sum{event_type="PRODUCT_UPDATED"} 40.0'
+            in text
+        )
+        assert (
+            'saleor_app_webhook_batch_seconds_count{event_type="PRODUCT_UPDATED"} 1.0'
+            in text
+        )
+
+    def test_retry_and_dead_letter_counters(self, prometheus):
+        """Test that retries and dead letters are counted per event"""
+        prometheus.observe_webhook_retry("ORDER_CREATED")
+        prometheus.observe_dead_letter("ORDER_CREATED", "stored")
+
+        text = prometheus.render_metrics()[0].decode()
+        assert (
+            'saleor_app_webhook_retries_total{event_type="ORDER_CREATED"} 1.0' in text
+        )
+        assert (
+            "saleor_app_dead_letters_total{"
+            'event_type="ORDER_CREATED",outcome="stored"} 1.0' in text
+        )
+
+    def test_shed_counter(self, prometheus):
+        """Test that shed webhooks are counted per event and reason"""
+        prometheus.observe_webhook_shed("ORDER_CREATED", "loop_lag")
+
+        text = prometheus.render_metrics()[0].decode()
+        assert (
+            "saleor_app_webhooks_shed_total{"
+            'event_type="ORDER_CREATED",reason="loop_lag"} 1.0' in text
+        )
+
+    def test_tenant_histograms(self, prometheus):
+        """Test that queueing and processing time are recorded per installation"""
+        prometheus.observe_tenant_webhook("a.example.com", 0.5, 0.1)
+
+        text = prometheus.render_metrics()[0].decode()
+        assert (
+            'saleor_app_tenant_queue_seconds_sum{installation="a.example.com"} 0.5'
+            in text
+        )
+        assert (
+            'saleor_app_tenant_webhook_seconds_count{installation="a.example.com"} 1.0'
+            in text
+        )
+
+    def test_installation_labels_are_capped(self):
+        """Test that installations beyond the cap share the "other" label"""
+        prometheus = PrometheusInstrumentation(max_installations=2)
+        for domain in ("a.com", "b.com", "c.com", "d.com", "a.com"):
+            prometheus.observe_tenant_webhook(domain, 0.1, 0.1)
+
+        text = prometheus.render_metrics()[0].decode()
+        assert 'tenant_webhook_seconds_count{installation="a.com"} 2.0' in text
+        assert 'tenant_webhook_seconds_count{installation="other"} 2.0' in text
+        assert 'installation="c.com"' not in text
+
+    def test_deadline_counter(self, prometheus):
+        """Test that work given up at the deadline is counted per operation"""
+        prometheus.observe_deadline_exceeded("graphql")
+
+        text = prometheus.render_metrics()[0].decode()
+        assert 'saleor_app_deadlines_exceeded_total{operation="graphql"} 1.0' in text
+
+    def test_abandoned_counter(self, prometheus):
+        """Test that work left unfinished at shutdown is counted by kind"""
+        prometheus.observe_abandoned("webhook", 3)
+
+        text = prometheus.render_metrics()[0].decode()
+        assert 'saleor_app_abandoned_work_total{kind="webhook"} 3.0' in text
+
+    @pytest.mark.asyncio
+    async def test_graphql_metrics(self, prometheus):
+        """Test GraphQL latency and size metrics per operation and installation"""
+        set_instrumentation(prometheus)
+        with FakeSaleorServer(product_count=5) as server:
+            client = SaleorGraphQLClient(server.api_url, "token")
+            await client.execute_async(SaleorQueries.PRODUCT_LIST, {"first": 2})
+
+        headers = client.async_client.transport.response_headers
+        assert prometheus.graphql_response_bytes.labels(
+            operation="GetProducts"
+        )._sum.get() == int(headers["content-length"])
+
+        text = prometheus.render_metrics()[0].decode()
+        installation = client.installation
+        assert (
+            "saleor_app_graphql_request_seconds_count{"
+            f'installation="{installation}",operation="GetProducts"}} 1.0' in text
+        )
+        assert 'saleor_app_graphql_response_bytes_count{operation="GetProducts"}' in (
+            text
+        )
+
+
+class TestTracing:
+    @pytest.mark.asyncio
+    async def test_graphql_span_is_child_of_webhook_span(
+        self, saleor_app, recording, app_client, signed_post
+    ):
+        """Test that spans propagate from a webhook to its GraphQL calls"""
+        pytest.importorskip("opentelemetry.sdk")
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+            InMemorySpanExporter,
+        )
+
+        exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+        recording.tracer = provider.get_tracer("t")
+
+        with FakeSaleorServer(product_count=5) as server:
+            graphql_client = SaleorGraphQLClient(server.api_url, "token")
+
+            @saleor_app.webhook(WebhookEventType.ORDER_CREATED)
+            async def handler(_data):
+                await graphql_client.execute_async(
+                    SaleorQueries.PRODUCT_LIST, {"first": 1}
+                )
+
+            async with app_client(saleor_app) as client:
+                response = await signed_post(client, WebhookEventType.ORDER_CREATED)
+
+        assert response.status_code == 200
+        spans = {span.name: span for span in exporter.get_finished_spans()}
+        webhook_span = spans["saleor.webhook"]
+        graphql_span_ = spans["saleor.graphql"]
+        assert graphql_span_.parent.span_id == webhook_span.context.span_id
+        assert graphql_span_.attributes["graphql.operation.name"] == "GetProducts"
+
+    @pytest.mark.asyncio
+    async def test_partitioned_handler_spans(
+        self, saleor_app, recording, app_client, signed_post
+    ):
+        """Test that partitioned handlers keep their own webhook span as parent"""
+        pytest.importorskip("opentelemetry.sdk")
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+            InMemorySpanExporter,
+        )
+
+        exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+        recording.tracer = provider.get_tracer("t")
+        saleor_app.webhook_handler.executor = PartitionedExecutor(1)
+
+        @saleor_app.webhook(WebhookEventType.ORDER_CREATED)
+        async def handler(_data):
+            with get_instrumentation().span("handler"):
+                pass
+
+        async with app_client(saleor_app) as client:
+            for _ in range(2):
+                response = await signed_post(client, WebhookEventType.ORDER_CREATED)
+                assert response.status_code == 200
+        await saleor_app.webhook_handler.executor.close()
+
+        spans = exporter.get_finished_spans()
+        webhooks = [s.context.span_id for s in spans if s.name == "saleor.webhook"]
+        parents = [s.parent.span_id for s in spans if s.name == "handler"]
+        assert len(webhooks) == 2
+        assert parents == webhooks
@@ -0,0 +1,70 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import saleor_app_sdk
+
+SRC_DIR = str(Path(saleor_app_sdk.__file__).resolve().parents[1])
+
+
+def _run(code: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={"PYTHONPATH": SRC_DIR},
+    )
+    return result.stdout.strip()
+
+
+class TestLazyImports:
+    def test_package_import_is_light(self):
+        """Test that importing the package loads no heavy dependencies"""
+        loaded = _run(
+            "import sys, saleor_app_sdk, saleor_app_sdk.webhooks.events; "
+            "print(sorted(m for m in ('fastapi', 'gql', 'graphql', 'jinja2', "
+            "'pydantic', 'httpx', 'cryptography') if m in sys.modules))"
+        )
+
+        assert loaded == "[]"
+
+    def test_public_names_resolve(self):
+        """Test that every exported name can be accessed"""
+        for name in saleor_app_sdk.__all__:
+            assert getattr(saleor_app_sdk, name).__name__ == name
+
+    def test_names_are_cached_after_first_access(self):
+        """Test that resolved names are stored on the package"""
+        app_class = saleor_app_sdk.SaleorApp
+
+        assert saleor_app_sdk.__dict__["SaleorApp"] is app_class
+
+    def test_unknown_attribute(self):
+        """Test that unknown names raise AttributeError"""
+        with pytest.raises(AttributeError, match="no attribute 'Missing'"):
+            _ = saleor_app_sdk.Missing
+
+    def test_dir_lists_exports(self):
+        """Test that dir() includes names that are not imported yet"""
+        assert set(saleor_app_sdk.__all__) <= set(dir(saleor_app_sdk))
+
+    @pytest.mark.parametrize(
+        "package",
+        [
+            "saleor_app_sdk.app",
+            "saleor_app_sdk.graphql",
+            "saleor_app_sdk.models",
+            "saleor_app_sdk.storage",
+            "saleor_app_sdk.testing",
+            "saleor_app_sdk.webhooks",
+        ],
+    )
+    def test_subpackage_exports(self, package):
+        """Test that subpackage exports resolve lazily too"""
+        module = __import__(package, fromlist=["__all__"])
+
+        for name in module.__all__:
+            assert getattr(module, name) is not None
@@ -0,0 +1,194 @@
+import marshal
+import pstats
+
+import pytest
+from fastapi.testclient import TestClient
+
+from saleor_app_sdk.app.core import SaleorApp
+from saleor_app_sdk.profiling import PROFILE_HEADER, Profiler, ProfileStore
+from saleor_app_sdk.testing import sign_payload
+from saleor_app_sdk.webhooks.events import WebhookEventType
+
+ADMIN_TOKEN = "admin-token"
+
+
+@pytest.fixture
+def profiled_app(app_manifest, secret_key, base_url):
+    app = SaleorApp(
+        manifest=app_manifest,
+        secret_key=secret_key,
+        base_url=base_url,
+        profiler=Profiler(
+            rates={WebhookEventType.ORDER_CREATED: 1.0, "/slow": 1.0},
+            admin_token=ADMIN_TOKEN,
+        ),
+    )
+
+    @app.get("/slow")
+    async def slow():
+        return {"total": sum(range(1000))}
+
+    @app.get("/fast")
+    async def fast():
+        return {}
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: int):
+        return {"id": item_id}
+
+    return app
+
+
+@pytest.fixture
+def admin_headers():
+    return {"Authorization": f"Bearer {ADMIN_TOKEN}"}
+
+
+def _post_webhook(client, secret_key, event_type):
+    return client.post(
+        f"/api/webhooks/{event_type}",
+        content=b"{}",
+        headers={
+            "saleor-event": event_type,
+            "saleor-signature": sign_payload(secret_key, b"{}"),
+        },
+    )
+
+
+class TestProfiler:
+    def test_rates(self):
+        """Test per-key sample rates with a global fallback"""
+        profiler = Profiler(
+            sample_rate=0.0, rates={WebhookEventType.ORDER_CREATED: 1.0, "/a": 1.0}
+        )
+
+        assert profiler.should_profile("webhook:ORDER_CREATED")
+        assert profiler.should_profile("route:/a")
+        assert not profiler.should_profile("webhook:ORDER_UPDATED")
+
+    def test_header_trigger(self):
+        """Test that the admin token in the header forces a profile"""
+        profiler = Profiler(admin_token=ADMIN_TOKEN)
+
+        assert profiler.should_profile("route:/x", {PROFILE_HEADER: ADMIN_TOKEN})
+        assert not profiler.should_profile("route:/x", {PROFILE_HEADER: "guess"})
+
+    def test_profile_captures_stats(self):
+        """Test that a sampled block is stored as a profile"""
+        profiler = Profiler(sample_rate=1.0)
+
+        with profiler.profile("route:/x") as profile:
+            sum(range(100))
+
+        assert profile is not None
+        record = profiler.store.list()[0]
+        assert record.key == "route:/x"
+        assert record.duration >= 0
+        assert "function calls" in record.format_text()
+
+    def test_one_profile_at_a_time(self):
+        """Test that nested or concurrent requests are not profiled"""
+        profiler = Profiler(sample_rate=1.0)
+
+        with (
+            profiler.profile("route:/a") as outer,
+            profiler.profile("route:/b") as inner,
+        ):
+            pass
+
+        assert outer is not None
+        assert inner is None
+        assert [r.key for r in profiler.store.list()] == ["route:/a"]
+
+    def test_store_is_bounded(self):
+        """Test that the store keeps only the newest profiles"""
+        store = ProfileStore(max_profiles=2)
+        for i in range(3):
+            store.add(f"route:/{i}", 0.0, 0.0, {})
+
+        assert [r.key for r in store.list()] == ["route:/2", "route:/1"]
+        assert store.get(1) is None
+
+
+class TestProfilingRoutes:
+    def test_profiles_webhooks_and_routes(
+        self, profiled_app, secret_key, admin_headers
+    ):
+        """Test that sampled webhooks and routes are captured"""
+        client = TestClient(profiled_app.fastapi_app)
+
+        assert _post_webhook(client, secret_key, "ORDER_CREATED").status_code == 200
+        client.get("/slow")
+        client.get("/fast")
+        _post_webhook(client, secret_key, "ORDER_UPDATED")
+
+        profiles = client.get("/api/admin/profiles", headers=admin_headers).json()
+        assert [p["key"] for p in profiles] == [
+            "route:/slow",
+            "webhook:ORDER_CREATED",
+        ]
+
+    def test_header_triggered_route(self, profiled_app):
+        """Test profiling an unsampled route on demand"""
+        client = TestClient(profiled_app.fastapi_app)
+
+        client.get("/fast", headers={PROFILE_HEADER: ADMIN_TOKEN})
+
+        assert profiled_app.profiler.store.list()[0].key == "route:/fast"
+
+    def test_routes_keyed_by_template(self, profiled_app):
+        """Test that path parameters share one key and unknown paths get none"""
+        client = TestClient(profiled_app.fastapi_app)
+        headers = {PROFILE_HEADER: ADMIN_TOKEN}
+
+        client.get("/items/1", headers=headers)
+        client.get("/items/2", headers=headers)
+        assert client.get("/missing", headers=headers).status_code == 404
+
+        keys = [record.key for record in profiled_app.profiler.store.list()]
+        assert keys == ["route:/items/{item_id}", "route:/items/{item_id}"]
+
+    def test_download_profile(self, profiled_app, admin_headers):
+        """Test downloading a profile as .prof and as text"""
+        client = TestClient(profiled_app.fastapi_app)
+        client.get("/slow")
+        profile_id = profiled_app.profiler.store.list()[0].id
+
+        response = client.get(
+            f"/api/admin/profiles/{profile_id}", headers=admin_headers
+        )
+
+        assert response.status_code == 200
+        assert "profile-" in response.headers["content-disposition"]
+        stats = pstats.Stats()
+        stats.stats = marshal.loads(response.content)
+        assert stats.stats
+
+        text = client.get(
+            f"/api/admin/profiles/{profile_id}?format=text", headers=admin_headers
+        )
+        assert "function calls" in text.text
+
+    def test_admin_routes_require_token(self, profiled_app):
+        """Test that profiles are only served to admins"""
+        client = TestClient(profiled_app.fastapi_app)
+
+        assert client.get("/api/admin/profiles").status_code == 401
+        assert (
+            client.get(
+                "/api/admin/profiles/1", headers={"Authorization": "Bearer nope"}
+            ).status_code
+            == 401
+        )
+
+    def test_missing_profile(self, profiled_app, admin_headers):
+        """Test downloading an evicted or unknown profile"""
+        client = TestClient(profiled_app.fastapi_app)
+
+        response = client.get("/api/admin/profiles/99", headers=admin_headers)
+
+        assert response.status_code == 404
+
+    def test_disabled_by_default(self, test_client):
+        """Test that no admin routes exist without a profiler"""
+        assert test_client.get("/api/admin/profiles").status_code == 404
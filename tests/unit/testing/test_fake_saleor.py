@@ -0,0 +1,148 @@
+import httpx
+import pytest
+from graphql import print_ast
+
+from saleor_app_sdk.graphql.client import SaleorGraphQLClient
+from saleor_app_sdk.graphql.queries import SaleorQueries
+from saleor_app_sdk.testing.fake_saleor import (
+    FakeSaleor,
+    FakeSaleorConfig,
+    FakeSaleorServer,
+    decode_id,
+    encode_id,
+)
+
+
+def _client(fake: FakeSaleor) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=fake.app), base_url="http://fake"
+    )
+
+
+async def _post(fake: FakeSaleor, query: str, variables=None, headers=None):
+    async with _client(fake) as client:
+        return await client.post(
+            "/graphql/",
+            json={"query": query, "variables": variables or {}},
+            headers=headers,
+        )
+
+
+class TestFakeSaleor:
+    def test_global_ids_round_trip(self):
+        """Test Saleor-style global IDs"""
+        assert decode_id(encode_id("Product", 42)) == ("Product", 42)
+
+    def test_unknown_config_knob(self):
+        """Test that misspelled knobs are rejected"""
+        with pytest.raises(TypeError):
+            FakeSaleor(latencyy=1)
+
+    @pytest.mark.asyncio
+    async def test_orders_pagination(self):
+        """Test that ORDERS_LIST pages through every order"""
+        fake = FakeSaleor(order_count=25)
+        query = print_ast(SaleorQueries.ORDERS_LIST)
+        numbers, after = [], None
+
+        while True:
+            response = await _post(fake, query, {"first": 10, "after": after})
+            orders = response.json()["data"]["orders"]
+            numbers += [edge["node"]["number"] for edge in orders["edges"]]
+            if not orders["pageInfo"]["hasNextPage"]:
+                break
+            after = orders["pageInfo"]["endCursor"]
+
+        assert numbers == [str(pk) for pk in range(1, 26)]
+        assert fake.stats.requests == 3
+        assert fake.stats.operations["GetOrders"] == 3
+
+    @pytest.mark.asyncio
+    async def test_page_size_limit(self):
+        """Test that oversized pages fail like Saleor"""
+        fake = FakeSaleor(max_page_size=10)
+
+        response = await _post(fake, "{ products(first: 11) { totalCount } }")
+
+        assert (
+            "exceeds the `first` limit of 10"
+            in (response.json()["errors"][0]["message"])
+        )
+
+    @pytest.mark.asyncio
+    async def test_product_search_create_and_delete(self):
+        """Test the product operations used by the example app"""
+        fake = FakeSaleor(product_count=3)
+
+        response = await _post(
+            fake,
+            "query($search: String!) { products(first: 10, filter: {search: $search})"
+            " { edges { node { id name } } } }",
+            {"search": "product 2"},
+        )
+        edges = response.json()["data"]["products"]["edges"]
+        assert [edge["node"]["name"] for edge in edges] == ["Product 2"]
+
+        response = await _post(
+            fake,
+            'mutation { productCreate(input: {name: "New"}) '
+            "{ product { id name } errors { field } } }",
+        )
+        created = response.json()["data"]["productCreate"]["product"]
+        assert created["name"] == "New"
+
+        response = await _post(
+            fake,
+            "mutation($id: ID!) { productDelete(id: $id) { errors { field } } }",
+            {"id": created["id"]},
+        )
+        assert response.json()["data"]["productDelete"]["errors"] == []
+        assert len(fake.products) == 3
+
+    @pytest.mark.asyncio
+    async def test_rate_limiting(self):
+        """Test that throttled requests answer 429 with Retry-After"""
+        fake = FakeSaleor(rate_limit_rate=1.0, retry_after=3)
+
+        response = await _post(fake, "{ shop { name } }")
+
+        assert response.status_code == 429
+        assert response.headers["retry-after"] == "3"
+        assert fake.stats.throttled == 1
+
+    @pytest.mark.asyncio
+    async def test_error_rate(self):
+        """Test that injected failures answer 500"""
+        fake = FakeSaleor(error_rate=1.0)
+
+        response = await _post(fake, "{ shop { name } }")
+
+        assert response.status_code == 500
+        assert fake.stats.errors == 1
+
+    @pytest.mark.asyncio
+    async def test_auth_token(self):
+        """Test that a configured token is enforced"""
+        fake = FakeSaleor(FakeSaleorConfig(auth_token="secret"))
+
+        response = await _post(fake, "{ shop { name } }")
+        assert response.status_code == 401
+
+        response = await _post(
+            fake, "{ shop { name } }", headers={"Authorization": "Bearer secret"}
+        )
+        assert response.json() == {"data": {"shop": {"name": "Fake Saleor"}}}
+
+    @pytest.mark.asyncio
+    async def test_server_with_graphql_client(self):
+        """Test SaleorGraphQLClient against a real socket"""
+        with FakeSaleorServer(product_count=5, auth_token="token") as server:
+            client = SaleorGraphQLClient(server.api_url, "token")
+
+            result = await client.execute_async(
+                SaleorQueries.PRODUCT_LIST, {"first": 2}
+            )
+
+            assert len(result["products"]["edges"]) == 2
+            assert result["products"]["pageInfo"]["hasNextPage"] is True
+            assert server.stats.operations["GetProducts"] == 1
@@ -0,0 +1,138 @@
+import json
+
+import httpx
+import pytest
+
+from saleor_app_sdk.testing.load import (
+    LoadReport,
+    WebhookLoadGenerator,
+    load_recorded_payloads,
+    percentile,
+)
+from saleor_app_sdk.testing.webhooks import WebhookEmitter
+from saleor_app_sdk.webhooks.events import WebhookEventType
+
+
+@pytest.fixture
+def asgi_client(saleor_app):
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=saleor_app.fastapi_app))
+
+
+class TestPercentile:
+    def test_percentile(self):
+        """Test nearest-rank percentiles"""
+        values = [float(i) for i in range(1, 101)]
+
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 99) == 99.0
+        assert percentile(values, 100) == 100.0
+
+    def test_percentile_empty(self):
+        """Test percentiles of no samples"""
+        assert percentile([], 95) == 0.0
+
+
+class TestLoadRecordedPayloads:
+    def test_jsonl(self, tmp_path):
+        """Test loading deliveries from a JSON Lines file"""
+        path = tmp_path / "payloads.jsonl"
+        path.write_text(
+            json.dumps({"event": "ORDER_CREATED", "payload": {"order": {"id": "1"}}})
+            + "\n\n"
+        )
+
+        deliveries = load_recorded_payloads(path)
+
+        assert deliveries == [
+            (WebhookEventType.ORDER_CREATED, b'{"order": {"id": "1"}}')
+        ]
+
+    def test_directory(self, tmp_path):
+        """Test loading deliveries from per-event JSON files"""
+        (tmp_path / "PRODUCT_UPDATED.1.json").write_bytes(b'{"product": {}}')
+
+        deliveries = load_recorded_payloads(tmp_path)
+
+        assert deliveries == [(WebhookEventType.PRODUCT_UPDATED, b'{"product": {}}')]
+
+    def test_empty(self, tmp_path):
+        """Test that an empty source is rejected"""
+        with pytest.raises(ValueError, match="No recorded payloads"):
+            load_recorded_payloads(tmp_path)
+
+
+class TestLoadReport:
+    def test_summary(self):
+        """Test the report summary counts and error breakdown"""
+        report = LoadReport(duration=2.0)
+        report.latencies = [0.01, 0.02, 0.03, 0.04]
+        report.corrected_latencies = [0.01, 0.02, 0.03, 0.05]
+        report.statuses.update({200: 3, 401: 1})
+        report.errors["HTTP 401"] += 1
+
+        summary = report.summary()
+
+        assert summary["requests"] == 4
+        assert summary["succeeded"] == 3
+        assert summary["failed"] == 1
+        assert summary["throughput_rps"] == 2.0
+        assert summary["latency_ms"]["max"] == 40.0
+        assert summary["errors"] == {"HTTP 401": 1}
+        assert "HTTP 401" in report.format_text()
+
+
+class TestWebhookLoadGenerator:
+    @pytest.mark.asyncio
+    async def test_run_requests(self, saleor_app, asgi_client, secret_key):
+        """Test sending a fixed number of signed webhooks"""
+        received = []
+        saleor_app.webhook(WebhookEventType.ORDER_CREATED)(received.append)
+        emitter = WebhookEmitter("http://app.local", secret_key, client=asgi_client)
+        generator = WebhookLoadGenerator(
+            emitter, events=[WebhookEventType.ORDER_CREATED], concurrency=4
+        )
+
+        async with asgi_client:
+            report = await generator.run(requests=20)
+
+        assert report.total == 20
+        assert report.succeeded == 20
+        assert len(received) == 20
+        assert report.by_event == {"ORDER_CREATED": 20}
+
+    @pytest.mark.asyncio
+    async def test_run_reports_errors(self, saleor_app, asgi_client):
+        """Test that rejected deliveries show up in the error breakdown"""
+        emitter = WebhookEmitter("http://app.local", "wrong-key", client=asgi_client)
+        generator = WebhookLoadGenerator(
+            emitter, events=[WebhookEventType.ORDER_CREATED]
+        )
+
+        async with asgi_client:
+            report = await generator.run(requests=5)
+
+        assert report.failed == 5
+        assert report.errors == {"HTTP 401": 5}
+
+    @pytest.mark.asyncio
+    async def test_run_recorded_at_rate(self, saleor_app, asgi_client, secret_key):
+        """Test replaying recorded payloads for a fixed duration"""
+        received = []
+        saleor_app.webhook(WebhookEventType.PRODUCT_UPDATED)(received.append)
+        emitter = WebhookEmitter("http://app.local", secret_key, client=asgi_client)
+        recorded = [(WebhookEventType.PRODUCT_UPDATED, b'{"product": {"id": "7"}}')]
+        generator = WebhookLoadGenerator(emitter, recorded=recorded, rps=100)
+
+        async with asgi_client:
+            report = await generator.run(duration=0.1)
+
+        assert 5 <= report.total <= 11
+        assert received[0] == {"product": {"id": "7"}}
+
+    @pytest.mark.asyncio
+    async def test_run_requires_limit(self, secret_key):
+        """Test that a run needs a request count or duration"""
+        generator = WebhookLoadGenerator(WebhookEmitter("http://app", secret_key))
+
+        with pytest.raises(ValueError, match="requests or duration"):
+            await generator.run()
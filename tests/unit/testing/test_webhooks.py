@@ -0,0 +1,51 @@
+import json
+
+import httpx
+import pytest
+
+from saleor_app_sdk.testing.webhooks import WebhookEmitter, sample_payload, sign_payload
+from saleor_app_sdk.webhooks.events import WebhookEventType
+
+
+class TestWebhookEmitter:
+    def test_sign_payload_matches_handler(self, webhook_handler, secret_key):
+        """Test that emitted signatures verify in WebhookHandler"""
+        body = b'{"order": {"id": "1"}}'
+
+        assert webhook_handler.verify_signature(body, sign_payload(secret_key, body))
+
+    @pytest.mark.parametrize("event_type", list(WebhookEventType))
+    def test_sample_payload(self, event_type):
+        """Test that every event type has a JSON-serializable sample"""
+        payload = sample_payload(event_type, 3)
+
+        assert json.loads(json.dumps(payload)) == payload
+
+    def test_build_request(self, secret_key, domain):
+        """Test the URL and headers of a delivery"""
+        emitter = WebhookEmitter("http://app.local/", secret_key, domain=domain)
+
+        url, body, headers = emitter.build_request(
+            WebhookEventType.ORDER_CREATED, {"order": {"id": "1"}}
+        )
+
+        assert url == "http://app.local/api/webhooks/ORDER_CREATED"
+        assert headers["saleor-event"] == "ORDER_CREATED"
+        assert headers["saleor-domain"] == domain
+        assert headers["saleor-signature"] == sign_payload(secret_key, body)
+
+    @pytest.mark.asyncio
+    async def test_emit_to_app(self, saleor_app, secret_key):
+        """Test delivering a webhook end to end"""
+        received = []
+        saleor_app.webhook(WebhookEventType.PRODUCT_UPDATED)(received.append)
+        client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=saleor_app.fastapi_app)
+        )
+        emitter = WebhookEmitter("http://app.local", secret_key, client=client)
+
+        async with client:
+            response = await emitter.emit(WebhookEventType.PRODUCT_UPDATED)
+
+        assert response.status_code == 200
+        assert received[0]["product"]["id"]
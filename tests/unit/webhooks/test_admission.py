@@ -0,0 +1,133 @@
+import asyncio
+import json
+import time
+
+import pytest
+
+from saleor_app_sdk.app.core import SaleorApp
+from saleor_app_sdk.webhooks.admission import AdmissionController
+from saleor_app_sdk.webhooks.events import SyncWebhookEventType, WebhookEventType
+from saleor_app_sdk.webhooks.sync import CalculateTaxesResponse
+
+TAXES = SyncWebhookEventType.CHECKOUT_CALCULATE_TAXES
+FLAT_TAXES = CalculateTaxesResponse(0.0, 0.0, 0.0)
+
+
+@pytest.fixture
+def admission():
+    return AdmissionController(max_in_flight=1, retry_after=7)
+
+
+@pytest.fixture
+def guarded_app(app_manifest, secret_key, admission):
+    return SaleorApp(app_manifest, secret_key, admission=admission)
+
+
+class TestAdmissionController:
+    @pytest.mark.asyncio
+    async def test_admits_under_limits(self):
+        """Test that webhooks are admitted while every signal is healthy"""
+        controller = AdmissionController(max_in_flight=10, max_queue_depth=10)
+
+        assert controller.check(in_flight=9, queue_depth=9) is None
+        assert controller.stats()["admitted"] == 1
+        await controller.close()
+
+    @pytest.mark.asyncio
+    async def test_sheds_by_reason(self):
+        """Test each threshold and the resulting shed ratio"""
+        controller = AdmissionController(max_in_flight=10, max_queue_depth=10)
+
+        assert controller.check(in_flight=10, queue_depth=0) == "in_flight"
+        assert controller.check(in_flight=0, queue_depth=10) == "queue_depth"
+        controller.loop_lag = 1.0
+        assert controller.check(in_flight=0, queue_depth=0) == "loop_lag"
+        controller.loop_lag = 0.0
+        assert controller.check(in_flight=0, queue_depth=0) is None
+
+        assert controller.shed == {"in_flight": 1, "queue_depth": 1, "loop_lag": 1}
+        assert controller.shed_ratio == 0.75
+        await controller.close()
+
+    @pytest.mark.asyncio
+    async def test_sync_events_get_headroom(self):
+        """Test that sync events are admitted past the async limits"""
+        controller = AdmissionController(max_in_flight=10, sync_headroom=2.0)
+
+        assert controller.check(in_flight=15, queue_depth=0) == "in_flight"
+        assert controller.check(in_flight=15, queue_depth=0, sync=True) is None
+        assert controller.check(in_flight=20, queue_depth=0, sync=True) == "in_flight"
+        await controller.close()
+
+    @pytest.mark.asyncio
+    async def test_measures_loop_lag(self):
+        """Test that a blocked event loop shows up as lag"""
+        controller = AdmissionController(lag_interval=0.01)
+        controller.check(in_flight=0, queue_depth=0)
+        await asyncio.sleep(0)
+
+        time.sleep(0.1)
+        # Shorter than the interval, so the monitor samples exactly once
+        await asyncio.sleep(0.005)
+
+        assert controller.loop_lag > 0.05
+        await controller.close()
+
+
+class TestAdmissionWebhooks:
+    @pytest.mark.asyncio
+    async def test_overload_answers_503(
+        self, guarded_app, admission, recording, app_client, signed_post
+    ):
+        """Test that webhooks past the in-flight limit get 503 and Retry-After"""
+        release = asyncio.Event()
+
+        @guarded_app.webhook(WebhookEventType.ORDER_CREATED)
+        async def order_created(_payload):
+            await release.wait()
+
+        async with app_client(guarded_app) as client:
+            first = asyncio.ensure_future(
+                signed_post(client, WebhookEventType.ORDER_CREATED)
+            )
+            await asyncio.sleep(0.01)
+            shed = await signed_post(client, WebhookEventType.ORDER_CREATED)
+            release.set()
+            admitted = await first
+        await admission.close()
+
+        assert admitted.status_code == 200
+        assert shed.status_code == 503
+        assert shed.headers["retry-after"] == "7"
+        assert recording.calls["observe_webhook_shed"] == [
+            ("ORDER_CREATED", "in_flight")
+        ]
+        assert guarded_app.webhook_handler.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_sync_events_shed_to_fallback(
+        self, guarded_app, admission, app_client, signed_post
+    ):
+        """Test that shed sync webhooks get their fallback or a 503"""
+        admission.lag_interval = 60
+
+        @guarded_app.sync_webhook(TAXES, fallback=FLAT_TAXES)
+        async def calculate_taxes(_payload):
+            return CalculateTaxesResponse(1.0, 1.0, 0.0)
+
+        @guarded_app.sync_webhook(SyncWebhookEventType.ORDER_CALCULATE_TAXES)
+        async def calculate_order_taxes(_payload):
+            return CalculateTaxesResponse(1.0, 1.0, 0.0)
+
+        async with app_client(guarded_app) as client:
+            # Start the monitor on this loop, then fake a stalled loop
+            admission.check(in_flight=0, queue_depth=0)
+            admission.loop_lag = 10.0
+            fallback = await signed_post(client, TAXES)
+            rejected = await signed_post(
+                client, SyncWebhookEventType.ORDER_CALCULATE_TAXES
+            )
+        await admission.close()
+
+        assert json.loads(fallback.content) == FLAT_TAXES.to_payload()
+        assert rejected.status_code == 503
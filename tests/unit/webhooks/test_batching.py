@@ -0,0 +1,145 @@
+import asyncio
+import json
+
+import pytest
+
+from saleor_app_sdk.webhooks.batching import WebhookBatcher
+from saleor_app_sdk.webhooks.events import WebhookEventType
+
+PRODUCT_UPDATED = WebhookEventType.PRODUCT_UPDATED
+
+
+class TestWebhookBatcher:
+    def test_invalid_options(self):
+        """Test that empty batches and negative waits are rejected"""
+        with pytest.raises(ValueError, match="max_size"):
+            WebhookBatcher(PRODUCT_UPDATED, print, max_size=0)
+        with pytest.raises(ValueError, match="max_wait"):
+            WebhookBatcher(PRODUCT_UPDATED, print, max_wait=-1)
+
+    @pytest.mark.asyncio
+    async def test_flushes_at_max_size(self):
+        """Test that a full batch is handled without waiting"""
+        batches = []
+        batcher = WebhookBatcher(
+            PRODUCT_UPDATED, batches.append, max_size=3, max_wait=60
+        )
+
+        await asyncio.wait_for(
+            asyncio.gather(*(batcher.submit({"pk": pk}) for pk in range(6))), 1
+        )
+
+        assert batches == [
+            [{"pk": 0}, {"pk": 1}, {"pk": 2}],
+            [{"pk": 3}, {"pk": 4}, {"pk": 5}],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_flushes_after_max_wait(self):
+        """Test that a partial batch is handled once the window closes"""
+        batches = []
+
+        async def handler(payloads):
+            batches.append(payloads)
+
+        batcher = WebhookBatcher(PRODUCT_UPDATED, handler, max_size=100, max_wait=0.01)
+
+        await asyncio.gather(batcher.submit({"pk": 1}), batcher.submit({"pk": 2}))
+
+        assert batches == [[{"pk": 1}, {"pk": 2}]]
+        assert len(batcher) == 0
+
+    @pytest.mark.asyncio
+    async def test_failure_fails_every_event(self):
+        """Test that each submitter sees the batch handler's error"""
+
+        def handler(_payloads):
+            error_msg = "index unavailable"
+            raise RuntimeError(error_msg)
+
+        batcher = WebhookBatcher(PRODUCT_UPDATED, handler, max_size=2)
+
+        results = await asyncio.gather(
+            batcher.submit({"pk": 1}), batcher.submit({"pk": 2}), return_exceptions=True
+        )
+
+        assert [str(result) for result in results] == ["index unavailable"] * 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_events_are_skipped(self):
+        """Test that payloads of abandoned requests are not handled"""
+        batches = []
+        batcher = WebhookBatcher(PRODUCT_UPDATED, batches.append, max_wait=60)
+        abandoned = asyncio.ensure_future(batcher.submit({"pk": 1}))
+        kept = asyncio.ensure_future(batcher.submit({"pk": 2}))
+        await asyncio.sleep(0)
+
+        abandoned.cancel()
+        await batcher.flush()
+
+        assert batches == [[{"pk": 2}]]
+        assert kept.done()
+
+    @pytest.mark.asyncio
+    async def test_flush_hands_over_pending(self):
+        """Test that flush runs the current batch before the window closes"""
+        batches = []
+        batcher = WebhookBatcher(PRODUCT_UPDATED, batches.append, max_wait=60)
+        submitted = asyncio.ensure_future(batcher.submit({"pk": 1}))
+        await asyncio.sleep(0)
+
+        await batcher.flush()
+        await submitted
+
+        assert batches == [[{"pk": 1}]]
+
+    @pytest.mark.asyncio
+    async def test_batch_size_is_observed(self, recording):
+        """Test that batch sizes are reported to the instrumentation"""
+        batcher = WebhookBatcher(PRODUCT_UPDATED, len, max_size=2)
+
+        await asyncio.gather(*(batcher.submit({}) for _ in range(2)))
+
+        batches = recording.calls["observe_webhook_batch"]
+        assert [(event, size) for event, size, _ in batches] == [("PRODUCT_UPDATED", 2)]
+
+
+class TestBatchWebhooks:
+    @pytest.mark.asyncio
+    async def test_concurrent_webhooks_are_batched(
+        self, saleor_app, app_client, signed_post
+    ):
+        """Test that concurrent deliveries reach the handler as one list"""
+        batches = []
+
+        @saleor_app.batch_webhook(PRODUCT_UPDATED, max_size=5, max_wait=1)
+        async def index_products(payloads):
+            batches.append([payload["product"]["id"] for payload in payloads])
+
+        async with app_client(saleor_app) as client:
+
+            def post(pk):
+                body = json.dumps({"product": {"id": pk}}).encode()
+                return signed_post(client, PRODUCT_UPDATED, body)
+
+            responses = await asyncio.gather(*(post(pk) for pk in range(5)))
+
+        assert [response.status_code for response in responses] == [200] * 5
+        assert batches == [[0, 1, 2, 3, 4]]
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_not_acknowledged(
+        self, saleor_app, app_client, signed_post
+    ):
+        """Test that webhooks of a failed batch get an error for Saleor to retry"""
+
+        @saleor_app.batch_webhook(PRODUCT_UPDATED, max_wait=0)
+        async def index_products(_payloads):
+            error_msg = "index unavailable"
+            raise RuntimeError(error_msg)
+
+        async with app_client(saleor_app) as client:
+            response = await signed_post(client, PRODUCT_UPDATED)
+
+        assert response.status_code == 400
+        assert "index unavailable" in response.json()["detail"]
@@ -0,0 +1,311 @@
+import functools
+from unittest.mock import patch
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from saleor_app_sdk.app.core import SaleorApp
+from saleor_app_sdk.cli import cli
+from saleor_app_sdk.testing import sign_payload
+from saleor_app_sdk.webhooks.dead_letters import (
+    DeadLetter,
+    MemoryDeadLetterStore,
+    SQLiteDeadLetterStore,
+)
+from saleor_app_sdk.webhooks.events import WebhookEventType
+from saleor_app_sdk.webhooks.retry import RetryPolicy
+
+ORDER_CREATED = WebhookEventType.ORDER_CREATED
+NO_DELAY = RetryPolicy(attempts=3, base_delay=0)
+ADMIN = {"Authorization": "Bearer admin-token"}
+
+
+@pytest.fixture
+def store():
+    return MemoryDeadLetterStore()
+
+
+@pytest.fixture
+def dlq_app(app_manifest, secret_key, base_url, store):
+    return SaleorApp(
+        manifest=app_manifest,
+        secret_key=secret_key,
+        base_url=base_url,
+        webhook_retry=NO_DELAY,
+        dead_letters=store,
+        admin_token="admin-token",
+    )
+
+
+@pytest.fixture
+def post_webhook(dlq_app, secret_key):
+    client = TestClient(dlq_app.fastapi_app)
+
+    def post(payload=b'{"order": {"id": "1"}}'):
+        return client.post(
+            "/api/webhooks/order_created",
+            content=payload,
+            headers={
+                "saleor-event": ORDER_CREATED.value,
+                "saleor-domain": "shop.example.com",
+                "saleor-signature": sign_payload(secret_key, payload),
+            },
+        )
+
+    return post
+
+
+def failing_handler(app, failures):
+    """Register an ORDER_CREATED handler failing ``failures`` times"""
+    calls = []
+
+    @app.webhook(ORDER_CREATED)
+    async def order_created(payload):
+        calls.append(payload)
+        if len(calls) <= failures:
+            error_msg = f"failure {len(calls)}"
+            raise RuntimeError(error_msg)
+
+    return calls
+
+
+class TestRetryPolicy:
+    def test_invalid_attempts(self):
+        """Test that at least one attempt is required"""
+        with pytest.raises(ValueError, match="attempts"):
+            RetryPolicy(attempts=0)
+
+    def test_exponential_delay_is_capped(self):
+        """Test that delays grow by the multiplier up to max_delay"""
+        policy = RetryPolicy(base_delay=0.1, max_delay=0.5, jitter=0)
+
+        assert [policy.delay(n) for n in range(1, 5)] == [0.1, 0.2, 0.4, 0.5]
+
+    def test_jitter_shortens_delay(self):
+        """Test that jitter only ever reduces the delay"""
+        policy = RetryPolicy(base_delay=1, jitter=0.5)
+
+        assert all(0.5 <= policy.delay(1) <= 1 for _ in range(20))
+
+    @pytest.mark.asyncio
+    async def test_retries_until_success(self):
+        """Test that transient failures are retried"""
+        attempts = []
+        retries = []
+
+        async def call():
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise ConnectionError
+            return "ok"
+
+        result = await NO_DELAY.run(call, lambda n, _e: retries.append(n))
+
+        assert result == "ok"
+        assert retries == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_raises_last_error(self):
+        """Test that the last error is raised when attempts run out"""
+        attempts = []
+
+        async def call():
+            attempts.append(1)
+            error_msg = f"attempt {len(attempts)}"
+            raise ConnectionError(error_msg)
+
+        with pytest.raises(ConnectionError, match="attempt 3"):
+            await NO_DELAY.run(call)
+
+    @pytest.mark.asyncio
+    async def test_only_retries_listed_errors(self):
+        """Test that errors outside retry_on fail straight away"""
+        attempts = []
+
+        async def call():
+            attempts.append(1)
+            raise KeyError
+
+        with pytest.raises(KeyError):
+            await RetryPolicy(base_delay=0, retry_on=(ConnectionError,)).run(call)
+        assert len(attempts) == 1
+
+
+class TestDeadLetterStores:
+    @pytest.mark.asyncio
+    async def test_memory_store(self, store):
+        """Test adding, filtering, limiting and removing entries"""
+        first = DeadLetter("ORDER_CREATED", "a.com", {"n": 1}, "err", 3)
+        second = DeadLetter("PRODUCT_UPDATED", "a.com", {"n": 2}, "err", 3)
+        await store.add(first)
+        await store.add(second)
+
+        assert await store.list() == [first, second]
+        assert await store.list(limit=1) == [first]
+        assert await store.list(event_type="PRODUCT_UPDATED") == [second]
+        assert await store.remove(first.id)
+        assert not await store.remove(first.id)
+        assert await store.get(first.id) is None
+
+    @pytest.mark.asyncio
+    async def test_memory_store_drops_oldest(self):
+        """Test that the store stays within max_entries"""
+        store = MemoryDeadLetterStore(max_entries=2)
+        entries = [DeadLetter("ORDER_CREATED", "", {}, "err", 1) for _ in range(3)]
+        for entry in entries:
+            await store.add(entry)
+
+        assert await store.list() == entries[1:]
+
+    @pytest.mark.asyncio
+    async def test_sqlite_store(self, tmp_path):
+        """Test that entries round-trip through SQLite"""
+        store = SQLiteDeadLetterStore(str(tmp_path / "dlq.sqlite3"))
+        entry = DeadLetter("ORDER_CREATED", "a.com", {"order": {"id": "1"}}, "err", 3)
+        await store.add(entry)
+        entry.attempts = 6
+        await store.add(entry)
+
+        assert await store.get(entry.id) == entry
+        assert await store.list(event_type="ORDER_CREATED") == [entry]
+        assert await store.list(event_type="PRODUCT_UPDATED") == []
+        assert await store.remove(entry.id)
+        assert await store.list() == []
+        await store.close()
+
+
+class TestDeadLetterWebhooks:
+    def test_transient_failure_is_retried(self, dlq_app, post_webhook, store):
+        """Test that a handler failing once succeeds on a local retry"""
+        calls = failing_handler(dlq_app, failures=1)
+
+        response = post_webhook()
+
+        assert response.json() == {"received": True}
+        assert len(calls) == 2
+        assert len(store) == 0
+
+    def test_exhausted_retries_are_dead_lettered(self, dlq_app, post_webhook, store):
+        """Test that the payload and error are kept and the webhook acknowledged"""
+        failing_handler(dlq_app, failures=10)
+
+        response = post_webhook()
+
+        assert response.status_code == 200
+        (entry,) = store._entries.values()
+        assert response.json() == {"received": True, "deadLetter": entry.id}
+        assert entry.payload == {"order": {"id": "1"}}
+        assert entry.domain == "shop.example.com"
+        assert entry.attempts == 3
+        assert "failure 3" in entry.error
+
+    def test_without_store_errors_reach_saleor(self, saleor_app, secret_key):
+        """Test that failures still answer 400 without a dead-letter store"""
+        failing_handler(saleor_app, failures=10)
+
+        response = TestClient(saleor_app.fastapi_app).post(
+            "/api/webhooks/order_created",
+            content=b"{}",
+            headers={
+                "saleor-event": ORDER_CREATED.value,
+                "saleor-signature": sign_payload(secret_key, b"{}"),
+            },
+        )
+
+        assert response.status_code == 400
+
+    def test_invalid_payload_is_rejected(self, post_webhook, store):
+        """Test that undecodable payloads are not dead-lettered"""
+        assert post_webhook(b"not json").status_code == 400
+        assert len(store) == 0
+
+    @pytest.mark.asyncio
+    async def test_replay(self, dlq_app, post_webhook, store):
+        """Test that a failed replay keeps the entry and a later one removes it"""
+        calls = failing_handler(dlq_app, failures=6)
+        entry_id = post_webhook().json()["deadLetter"]
+
+        assert not await dlq_app.webhook_handler.replay(entry_id)
+        assert (await store.get(entry_id)).attempts == 6
+
+        assert await dlq_app.webhook_handler.replay(entry_id)
+        assert await store.get(entry_id) is None
+        assert len(calls) == 7
+
+        with pytest.raises(KeyError):
+            await dlq_app.webhook_handler.replay(entry_id)
+
+
+class TestDeadLetterAdmin:
+    def test_requires_admin_token(self, dlq_app):
+        """Test that the admin routes reject missing or wrong tokens"""
+        client = TestClient(dlq_app.fastapi_app)
+
+        assert client.get("/api/admin/dead-letters").status_code == 401
+        assert (
+            client.get(
+                "/api/admin/dead-letters", headers={"Authorization": "Bearer nope"}
+            ).status_code
+            == 401
+        )
+
+    def test_not_exposed_without_admin_token(self, saleor_app):
+        """Test that no admin routes exist unless an admin token is set"""
+        client = TestClient(saleor_app.fastapi_app)
+
+        assert client.get("/api/admin/dead-letters", headers=ADMIN).status_code == 404
+
+    def test_list_inspect_replay_and_delete(self, dlq_app, post_webhook):
+        """Test the admin routes on dead-lettered webhooks"""
+        failing_handler(dlq_app, failures=6)
+        first = post_webhook().json()["deadLetter"]
+        second = post_webhook().json()["deadLetter"]
+        client = TestClient(dlq_app.fastapi_app, headers=ADMIN)
+
+        listed = client.get("/api/admin/dead-letters").json()
+        assert [entry["id"] for entry in listed] == [first, second]
+        assert "payload" not in listed[0]
+        assert client.get(f"/api/admin/dead-letters/{first}").json()["payload"] == {
+            "order": {"id": "1"}
+        }
+
+        replay = client.post(f"/api/admin/dead-letters/{first}/replay")
+        assert replay.json() == {"replayed": True}
+        assert client.delete(f"/api/admin/dead-letters/{second}").status_code == 200
+        assert client.get("/api/admin/dead-letters").json() == []
+        assert client.get(f"/api/admin/dead-letters/{first}").status_code == 404
+        assert client.post(f"/api/admin/dead-letters/{first}/replay").status_code == (
+            404
+        )
+
+    def test_cli_replay(self, dlq_app, post_webhook, capsys):
+        """Test replaying every dead letter from the command line"""
+        failing_handler(dlq_app, failures=6)
+        post_webhook()
+        post_webhook()
+        client = functools.partial(
+            httpx.AsyncClient, transport=httpx.ASGITransport(app=dlq_app.fastapi_app)
+        )
+
+        with patch("saleor_app_sdk.cli.httpx.AsyncClient", client):
+            exit_code = cli(
+                [
+                    "dead-letters",
+                    "replay",
+                    "http://app",
+                    "--admin-token",
+                    "admin-token",
+                    "--rate",
+                    "0",
+                ]
+            )
+            listed = cli(
+                ["dead-letters", "list", "http://app", "--admin-token", "admin-token"]
+            )
+
+        captured = capsys.readouterr()
+        assert exit_code == 0
+        assert listed == 0
+        assert captured.out.count("replayed") == 2
+        assert "Replayed 2 of 2 dead letters" in captured.err
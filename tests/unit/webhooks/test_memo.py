@@ -0,0 +1,241 @@
+import asyncio
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from saleor_app_sdk.testing import sign_payload
+from saleor_app_sdk.webhooks.events import SyncWebhookEventType
+from saleor_app_sdk.webhooks.memo import (
+    SyncResponseCache,
+    memo_key_function,
+    payload_digest,
+)
+from saleor_app_sdk.webhooks.sync import CalculateTaxesResponse, SyncWebhookRoute
+
+TAXES = SyncWebhookEventType.CHECKOUT_CALCULATE_TAXES
+
+
+def _tax_payload(quantity=1, checkout_id="Q2hlY2tvdXQ6MQ==", street="Main St"):
+    return {
+        "taxBase": {
+            "sourceObject": {"id": checkout_id, "updatedAt": "2024-01-01"},
+            "channel": {"slug": "default"},
+            "currency": "USD",
+            "address": {"streetAddress1": street, "country": {"code": "US"}},
+            "lines": [{"quantity": quantity, "totalPrice": {"amount": 10}}],
+        }
+    }
+
+
+class FakeRedis:
+    """In-memory stand-in for the redis.asyncio calls the cache makes"""
+
+    def __init__(self):
+        self.data = {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def set(self, key, value, px=None):
+        self.data[key] = (value, px)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_exc):
+        return False
+
+    def get(self, key):
+        self.commands.append(lambda: self.redis.data.get(key, (None, -2))[0])
+
+    def pttl(self, key):
+        self.commands.append(lambda: self.redis.data.get(key, (None, -2))[1])
+
+    async def execute(self):
+        return [command() for command in self.commands]
+
+
+class TestMemoKey:
+    def test_payload_digest_is_canonical(self):
+        """Test that key order does not change the digest"""
+        assert payload_digest({"a": 1, "b": {"c": 2, "d": 3}}) == payload_digest(
+            {"b": {"d": 3, "c": 2}, "a": 1}
+        )
+
+    def test_default_fields_ignore_volatile_data(self):
+        """Test that re-sends of an unchanged checkout share a key"""
+        key = memo_key_function(TAXES)
+
+        assert key(_tax_payload()) == key(_tax_payload(checkout_id="other"))
+        assert key(_tax_payload()) != key(_tax_payload(quantity=2))
+        assert key(_tax_payload()) != key(_tax_payload(street="Other St"))
+
+    def test_payloads_without_key_fields(self):
+        """Test that payloads lacking the key fields are keyed by their content"""
+        key = memo_key_function(TAXES)
+
+        assert key({"checkout": {"lines": [1]}}) != key({"checkout": {"lines": [2]}})
+        assert key([{"id": "1", "lines": [1]}]) != key([{"id": "2", "lines": [1]}])
+        assert key([{"id": "1"}]) == key([{"id": "1"}])
+
+    def test_custom_fields_and_callable(self):
+        """Test keying on given fields or a custom function"""
+        by_field = memo_key_function(TAXES, ["taxBase.currency"])
+        by_callable = memo_key_function(TAXES, lambda p: p["taxBase"]["lines"])
+
+        assert by_field(_tax_payload(quantity=1)) == by_field(_tax_payload(quantity=2))
+        assert by_callable(_tax_payload(street="a")) == by_callable(
+            _tax_payload(street="b")
+        )
+        assert by_callable(_tax_payload(quantity=1)) != by_callable(
+            _tax_payload(quantity=2)
+        )
+
+    @pytest.mark.parametrize(
+        "event_type",
+        [
+            SyncWebhookEventType.TRANSACTION_CHARGE_REQUESTED,
+            SyncWebhookEventType.PAYMENT_GATEWAY_INITIALIZE_SESSION,
+        ],
+    )
+    def test_payment_events_are_not_memoizable(self, event_type):
+        """Test that money-moving events are refused even with a memo_key"""
+        with pytest.raises(ValueError, match="must not be memoized"):
+            SyncWebhookRoute(
+                event_type,
+                lambda _data: None,
+                memo=SyncResponseCache(),
+                memo_key=["action.amount"],
+            )
+
+    def test_memo_key_required_without_defaults(self):
+        """Test that events without default memo fields need a memo_key"""
+        event_type = SyncWebhookEventType.CHECKOUT_FILTER_SHIPPING_METHODS
+        with pytest.raises(ValueError, match="requires a memo_key"):
+            SyncWebhookRoute(event_type, lambda _data: None, memo=SyncResponseCache())
+
+        route = SyncWebhookRoute(
+            event_type,
+            lambda _data: None,
+            memo=SyncResponseCache(),
+            memo_key=["checkout.shippingMethods"],
+        )
+        assert route.memo is not None
+
+
+class TestSyncResponseCache:
+    @pytest.mark.asyncio
+    async def test_ttl(self):
+        """Test that expired responses are not served"""
+        cache = SyncResponseCache(ttl=-1)
+        cache.set("key", b"{}")
+
+        assert await cache.get("key") is None
+
+    @pytest.mark.asyncio
+    async def test_lru(self):
+        """Test that the least recently used response is evicted"""
+        cache = SyncResponseCache(max_entries=2)
+        cache.set("a", b"a")
+        cache.set("b", b"b")
+        await cache.get("a")
+        cache.set("c", b"c")
+
+        assert await cache.get("b") is None
+        assert await cache.get("a") == b"a"
+        assert len(cache) == 2
+
+    @pytest.mark.asyncio
+    async def test_redis_tier(self):
+        """Test that workers share responses through Redis"""
+        redis = FakeRedis()
+        writer = SyncResponseCache(ttl=60, redis=redis)
+        reader = SyncResponseCache(ttl=60, redis=redis)
+
+        writer.set("key", b"{}")
+        await asyncio.sleep(0)
+
+        assert redis.data["saleor_app:sync:key"] == (b"{}", 60000)
+        assert await reader.get("key") == b"{}"
+        assert len(reader) == 1
+
+    @pytest.mark.asyncio
+    async def test_redis_errors_are_misses(self):
+        """Test that an unavailable Redis does not fail the webhook"""
+
+        class BrokenRedis:
+            def pipeline(self, transaction=True):
+                raise ConnectionError
+
+            async def set(self, *_args, **_kwargs):
+                raise ConnectionError
+
+        cache = SyncResponseCache(redis=BrokenRedis())
+        cache.set("a", b"a")
+        await asyncio.sleep(0)
+
+        assert await cache.get("missing") is None
+        assert await cache.get("a") == b"a"
+
+
+class TestMemoizedSyncWebhook:
+    @pytest.fixture
+    def post(self, saleor_app, secret_key):
+        client = TestClient(saleor_app.fastapi_app)
+
+        def post(payload, domain="a.shop"):
+            body = json.dumps(payload).encode()
+            return client.post(
+                "/api/webhooks/CHECKOUT_CALCULATE_TAXES",
+                content=body,
+                headers={
+                    "saleor-event": TAXES.value,
+                    "saleor-domain": domain,
+                    "saleor-signature": sign_payload(secret_key, body),
+                },
+            )
+
+        return post
+
+    def test_repeated_payloads_skip_the_handler(self, saleor_app, post):
+        """Test that re-sent checkouts are answered from the cache"""
+        calls = []
+
+        @saleor_app.sync_webhook(TAXES, memoize=SyncResponseCache())
+        async def calculate_taxes(payload):
+            calls.append(payload)
+            quantity = payload["taxBase"]["lines"][0]["quantity"]
+            return CalculateTaxesResponse(quantity, quantity, 0)
+
+        first = post(_tax_payload())
+        again = post(_tax_payload(checkout_id="resent"))
+        changed = post(_tax_payload(quantity=2))
+        other_shop = post(_tax_payload(), domain="b.shop")
+
+        assert len(calls) == 3
+        assert first.json() == again.json()
+        assert changed.json()["shipping_price_gross_amount"] == 2
+        assert other_shop.status_code == 200
+
+    def test_fallbacks_are_not_memoized(self, saleor_app, post):
+        """Test that only successful responses are cached"""
+        calls = []
+        fallback = CalculateTaxesResponse(0, 0, 0)
+
+        @saleor_app.sync_webhook(TAXES, memoize=SyncResponseCache(), fallback=fallback)
+        async def calculate_taxes(_payload):
+            calls.append(1)
+            error_msg = "tax API unavailable"
+            raise RuntimeError(error_msg)
+
+        post(_tax_payload())
+        post(_tax_payload())
+
+        assert len(calls) == 2
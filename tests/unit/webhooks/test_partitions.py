@@ -0,0 +1,181 @@
+import asyncio
+import contextvars
+import json
+
+import pytest
+
+from saleor_app_sdk.webhooks.events import WebhookEventType
+from saleor_app_sdk.webhooks.partitions import PartitionedExecutor, entity_key
+
+
+def keys_on_partitions(executor, count):
+    """Find ``count`` keys landing on different partitions"""
+    keys = {}
+    for pk in range(1000):
+        keys.setdefault(executor.partition(f"order:{pk}"), f"order:{pk}")
+    return list(keys.values())[:count]
+
+
+class TestEntityKey:
+    def test_first_object_with_id(self):
+        """Test that the event's subject identifies the entity"""
+        payload = {"issuedAt": "now", "order": {"id": "T3JkZXI6MQ==", "user": {}}}
+
+        assert entity_key(payload) == "order:T3JkZXI6MQ=="
+
+    def test_legacy_list_payload(self):
+        """Test that list payloads use the first item's type and id"""
+        assert entity_key([{"type": "Product", "id": "UHJvZHVjdDox"}]) == (
+            "Product:UHJvZHVjdDox"
+        )
+
+    def test_no_entity(self):
+        """Test that payloads without an identified object have no key"""
+        assert entity_key({"meta": {"issuedAt": "now"}}) is None
+        assert entity_key([]) is None
+
+
+class TestPartitionedExecutor:
+    def test_invalid_partitions(self):
+        """Test that at least one partition is required"""
+        with pytest.raises(ValueError, match="partitions"):
+            PartitionedExecutor(0)
+
+    def test_same_key_same_partition(self):
+        """Test that a key always maps to the same partition"""
+        executor = PartitionedExecutor(4)
+
+        assert len({executor.partition("order:1") for _ in range(10)}) == 1
+
+    @pytest.mark.asyncio
+    async def test_same_key_runs_in_order(self):
+        """Test that calls for one entity apply in submission order"""
+        executor = PartitionedExecutor(4)
+        applied = []
+
+        def update(version):
+            async def call():
+                # Earlier updates are slower; they must still finish first
+                await asyncio.sleep(0.005 * (5 - version))
+                applied.append(version)
+
+            return call
+
+        await asyncio.gather(
+            *(executor.submit("order:1", update(version)) for version in range(5))
+        )
+        await executor.close()
+
+        assert applied == [0, 1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_different_keys_run_in_parallel(self):
+        """Test that entities on different partitions do not wait for each other"""
+        executor = PartitionedExecutor(4)
+        first, second = keys_on_partitions(executor, 2)
+        both_running = asyncio.Barrier(2)
+
+        async def call():
+            await asyncio.wait_for(both_running.wait(), 1)
+
+        await asyncio.gather(
+            executor.submit(first, call), executor.submit(second, call)
+        )
+        await executor.close()
+
+    @pytest.mark.asyncio
+    async def test_failure_is_returned_to_caller(self):
+        """Test that a failing call raises for its caller and not the worker"""
+        executor = PartitionedExecutor(1)
+
+        async def fail():
+            error_msg = "boom"
+            raise RuntimeError(error_msg)
+
+        async def succeed():
+            return "ok"
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await executor.submit("order:1", fail)
+        assert await executor.submit("order:1", succeed) == "ok"
+        await executor.close()
+
+    @pytest.mark.asyncio
+    async def test_calls_run_in_submitter_context(self):
+        """Test that each call sees the context variables of its submitter"""
+        request = contextvars.ContextVar("request")
+        executor = PartitionedExecutor(1)
+
+        async def current():
+            return request.get(None)
+
+        async def submit(value):
+            request.set(value)
+            return await executor.submit("order:1", current)
+
+        assert await asyncio.create_task(submit("first")) == "first"
+        assert await asyncio.create_task(submit("second")) == "second"
+        assert await executor.submit("order:1", current) is None
+        await executor.close()
+
+    @pytest.mark.asyncio
+    async def test_lag_and_depth_are_reported(self, recording):
+        """Test that queueing lag is observed and queued calls are counted"""
+        executor = PartitionedExecutor(1)
+        release = asyncio.Event()
+
+        async def blocked():
+            await release.wait()
+
+        calls = [
+            asyncio.ensure_future(executor.submit("order:1", blocked)) for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        assert len(executor) == 2
+        assert executor.stats()[0]["depth"] == 2
+
+        release.set()
+        await asyncio.gather(*calls)
+        await executor.close()
+
+        lags = recording.calls["observe_partition_lag"]
+        assert [partition for partition, _ in lags] == ["0", "0", "0"]
+
+
+class TestPartitionedWebhooks:
+    @pytest.mark.asyncio
+    async def test_updates_for_one_order_apply_in_order(
+        self, saleor_app, app_client, signed_post
+    ):
+        """Test that concurrent deliveries for one order are handled in sequence"""
+        saleor_app.webhook_handler.executor = PartitionedExecutor(4)
+        applied = []
+
+        @saleor_app.webhook(WebhookEventType.ORDER_UPDATED)
+        async def order_updated(payload):
+            version = payload["order"]["version"]
+            await asyncio.sleep(0.005 * (3 - version))
+            applied.append(version)
+
+        async with app_client(saleor_app) as client:
+
+            def post(version):
+                body = json.dumps({"order": {"id": "1", "version": version}}).encode()
+                return signed_post(
+                    client,
+                    WebhookEventType.ORDER_UPDATED,
+                    body,
+                    domain="shop.example.com",
+                )
+
+            tasks = []
+            for version in range(3):
+                tasks.append(asyncio.ensure_future(post(version)))
+                await asyncio.sleep(0.001)
+            responses = await asyncio.gather(*tasks)
+        await saleor_app.webhook_handler.executor.close()
+
+        assert [response.status_code for response in responses] == [200] * 3
+        assert applied == [0, 1, 2]
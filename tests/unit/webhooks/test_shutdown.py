@@ -0,0 +1,232 @@
+import asyncio
+import contextlib
+
+import pytest
+from fastapi.testclient import TestClient
+
+from saleor_app_sdk.app.config import AppConfigMixin
+from saleor_app_sdk.app.core import SaleorApp
+from saleor_app_sdk.storage.memory import MemoryConfigStore
+from saleor_app_sdk.webhooks.dead_letters import MemoryDeadLetterStore
+from saleor_app_sdk.webhooks.events import SyncWebhookEventType, WebhookEventType
+from saleor_app_sdk.webhooks.partitions import PartitionedExecutor
+from saleor_app_sdk.webhooks.sync import CalculateTaxesResponse
+
+ORDER_CREATED = WebhookEventType.ORDER_CREATED
+
+
+class ClosingStore(MemoryDeadLetterStore):
+    closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+class ConfiguredApp(AppConfigMixin, SaleorApp):
+    pass
+
+
+class ClosingConfigStore(MemoryConfigStore):
+    closed = False
+    subscribed = 0
+
+    async def subscribe(self, callback):
+        self.subscribed += 1
+        return True
+
+    async def close(self):
+        self.closed = True
+
+
+async def until(condition):
+    while not condition():
+        await asyncio.sleep(0.001)
+
+
+class TestWebhookShutdown:
+    @pytest.mark.asyncio
+    async def test_drains_in_flight_webhooks(
+        self, app_manifest, secret_key, app_client, signed_post
+    ):
+        """Test that webhooks in flight finish and new ones are refused"""
+        app = SaleorApp(
+            app_manifest, secret_key, webhook_executor=PartitionedExecutor(2)
+        )
+        release = asyncio.Event()
+        handled = []
+
+        @app.webhook(ORDER_CREATED)
+        async def order_created(data):
+            await release.wait()
+            handled.append(data)
+
+        async with app_client(app) as client:
+            request = asyncio.ensure_future(signed_post(client, ORDER_CREATED))
+            await until(lambda: app.webhook_handler.in_flight)
+            shutdown = asyncio.ensure_future(app.webhook_handler.shutdown(5))
+            await asyncio.sleep(0.01)
+
+            refused = await signed_post(client, ORDER_CREATED)
+            assert refused.status_code == 503
+            assert refused.headers["retry-after"] == "5"
+            assert not shutdown.done()
+
+            release.set()
+            assert (await request).status_code == 200
+            assert await shutdown == {"webhook": 0, "batch": 0, "partition": 0}
+        assert handled == [{}]
+
+    @pytest.mark.asyncio
+    async def test_reports_abandoned_webhooks(
+        self, app_manifest, secret_key, recording, app_client, signed_post
+    ):
+        """Test that webhooks still running after the grace period are reported"""
+        app = SaleorApp(app_manifest, secret_key, instrumentation=recording)
+
+        @app.webhook(ORDER_CREATED)
+        async def order_created(_data):
+            await asyncio.sleep(10)
+
+        async with app_client(app) as client:
+            request = asyncio.ensure_future(signed_post(client, ORDER_CREATED))
+            await until(lambda: app.webhook_handler.in_flight)
+
+            abandoned = await app.webhook_handler.shutdown(0.02)
+            assert recording.calls["observe_abandoned"] == []
+            request.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await request
+
+        assert abandoned["webhook"] == 1
+        assert recording.calls["observe_abandoned"] == [("webhook", 1)]
+
+    @pytest.mark.asyncio
+    async def test_counts_webhooks_cancelled_by_server(
+        self, app_manifest, secret_key, recording, app_client, signed_post
+    ):
+        """Test that requests the server cancels before shutdown are abandoned.
+
+        uvicorn cancels requests still running at the end of
+        ``--timeout-graceful-shutdown``, before the lifespan shutdown runs.
+        """
+        app = SaleorApp(app_manifest, secret_key, instrumentation=recording)
+
+        @app.webhook(ORDER_CREATED)
+        async def order_created(_data):
+            await asyncio.sleep(10)
+
+        async with app_client(app) as client:
+            request = asyncio.ensure_future(signed_post(client, ORDER_CREATED))
+            await until(lambda: app.webhook_handler.in_flight)
+            request.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await request
+
+            abandoned = await app.webhook_handler.shutdown(1)
+
+        assert app.webhook_handler.in_flight == 0
+        assert abandoned["webhook"] == 0
+        assert recording.calls["observe_abandoned"] == [("webhook", 1)]
+
+    @pytest.mark.asyncio
+    async def test_flushes_batches(
+        self, app_manifest, secret_key, app_client, signed_post
+    ):
+        """Test that pending batches are handled without waiting for max_wait"""
+        app = SaleorApp(app_manifest, secret_key)
+        batches = []
+
+        @app.batch_webhook(ORDER_CREATED, max_wait=60)
+        async def orders_created(payloads):
+            batches.append(len(payloads))
+
+        async with app_client(app) as client:
+            requests = [
+                asyncio.ensure_future(signed_post(client, ORDER_CREATED))
+                for _ in range(3)
+            ]
+            await until(lambda: app.webhook_handler.in_flight == 3)
+
+            abandoned = await asyncio.wait_for(app.webhook_handler.shutdown(5), 1)
+            responses = await asyncio.gather(*requests)
+
+        assert batches == [3]
+        assert [response.status_code for response in responses] == [200] * 3
+        assert abandoned["batch"] == 0
+
+    @pytest.mark.asyncio
+    async def test_sync_fallback_while_shutting_down(
+        self, app_manifest, secret_key, app_client, signed_post
+    ):
+        """Test that sync webhooks get their fallback once shutdown started"""
+        app = SaleorApp(app_manifest, secret_key)
+
+        @app.sync_webhook(
+            SyncWebhookEventType.CHECKOUT_CALCULATE_TAXES,
+            fallback=CalculateTaxesResponse(0.0, 0.0, 0.0),
+        )
+        async def taxes(_data):
+            error_msg = "not called"
+            raise AssertionError(error_msg)
+
+        await app.webhook_handler.shutdown(1)
+        async with app_client(app) as client:
+            response = await signed_post(
+                client, SyncWebhookEventType.CHECKOUT_CALCULATE_TAXES
+            )
+
+        assert response.status_code == 200
+        assert response.json()["shipping_tax_rate"] == 0.0
+
+
+class TestAppLifespan:
+    # on_event is deprecated, but apps using it must keep working
+    @pytest.mark.filterwarnings("ignore:\\s*on_event is deprecated")
+    def test_shutdown_closes_resources(self, app_manifest, secret_key):
+        """Test that the lifespan subscribes, runs callbacks and closes stores"""
+        dead_letters = ClosingStore()
+        config_store = ClosingConfigStore()
+        app = ConfiguredApp(
+            app_manifest,
+            secret_key,
+            dead_letters=dead_letters,
+            config_store=config_store,
+        )
+        events = []
+
+        @app.on_shutdown
+        async def stop_worker():
+            events.append("callback")
+
+        @app.fastapi_app.on_event("startup")
+        def started():
+            events.append("startup")
+
+        @app.fastapi_app.on_event("shutdown")
+        def stopped():
+            events.append("shutdown")
+
+        with TestClient(app.fastapi_app):
+            assert events == ["startup"]
+            assert app.webhook_handler.accepting
+            assert config_store.subscribed == 1
+
+        assert events == ["startup", "callback", "shutdown"]
+        assert not app.webhook_handler.accepting
+        assert dead_letters.closed
+        assert config_store.closed
+
+    def test_failing_callback_does_not_stop_shutdown(self, app_manifest, secret_key):
+        """Test that a failing shutdown callback does not keep stores open"""
+        dead_letters = ClosingStore()
+        app = SaleorApp(app_manifest, secret_key, dead_letters=dead_letters)
+
+        @app.on_shutdown
+        def broken():
+            error_msg = "broken"
+            raise RuntimeError(error_msg)
+
+        with TestClient(app.fastapi_app):
+            pass
+
+        assert dead_letters.closed
@@ -0,0 +1,270 @@
+import json
+
+import pytest
+from graphql import build_schema, introspection_from_schema, print_schema
+
+from saleor_app_sdk.cli import cli
+from saleor_app_sdk.graphql.client import SaleorGraphQLClient
+from saleor_app_sdk.testing import FakeSaleorServer
+from saleor_app_sdk.testing.fake_saleor import SCHEMA
+from saleor_app_sdk.testing.webhooks import sample_payload
+from saleor_app_sdk.webhooks.events import SyncWebhookEventType, WebhookEventType
+from saleor_app_sdk.webhooks.subscriptions import (
+    build_subscription,
+    event_type_name,
+    fetch_schema,
+    load_schema,
+    project_payload,
+    size_report,
+)
+
+FULL_ORDER_QUERY = (
+    "subscription { event { ... on OrderCreated { order { id number status "
+    "total { gross { amount currency } net { amount currency } } "
+    "user { id email firstName lastName } userEmail created updatedAt } } } }"
+)
+
+TAX_SCHEMA = build_schema(
+    """
+    type Query { shop: String }
+    type Checkout { id: ID! email: String }
+    type Order { id: ID! number: String! }
+    union TaxSourceObject = Checkout | Order
+    type TaxableObject { sourceObject: TaxSourceObject! currency: String! }
+    type CalculateTaxes { taxBase: TaxableObject! }
+    union Event = CalculateTaxes
+    type Subscription { event: Event }
+    """
+)
+TAXES = SyncWebhookEventType.CHECKOUT_CALCULATE_TAXES
+
+
+class TestEventTypeName:
+    def test_pascal_case(self):
+        """Test that event names map to their PascalCase payload type"""
+        assert event_type_name(WebhookEventType.ORDER_FULLY_PAID) == "OrderFullyPaid"
+        assert (
+            event_type_name(SyncWebhookEventType.SHIPPING_LIST_METHODS_FOR_CHECKOUT)
+            == "ShippingListMethodsForCheckout"
+        )
+
+    def test_calculate_taxes(self):
+        """Test that both tax events share the CalculateTaxes type"""
+        assert (
+            event_type_name(SyncWebhookEventType.CHECKOUT_CALCULATE_TAXES)
+            == "CalculateTaxes"
+        )
+        assert (
+            event_type_name(SyncWebhookEventType.ORDER_CALCULATE_TAXES)
+            == "CalculateTaxes"
+        )
+
+
+class TestBuildSubscription:
+    def test_merges_dotted_paths(self):
+        """Test that shared prefixes become one nested selection"""
+        query = build_subscription(
+            WebhookEventType.ORDER_CREATED,
+            ["order.id", "order.total.gross.amount", "order.total.gross.currency"],
+        )
+
+        assert query == (
+            "subscription { event { ... on OrderCreated { order { id "
+            "total { gross { amount currency } } } } } }"
+        )
+
+    def test_validates_against_schema(self):
+        """Test that a valid selection passes schema validation"""
+        query = build_subscription(
+            WebhookEventType.PRODUCT_UPDATED, ["product.id", "product.name"], SCHEMA
+        )
+
+        assert "... on ProductUpdated { product { id name } }" in query
+
+    @pytest.mark.parametrize(
+        ("fields", "message"),
+        [
+            (["order.sku"], "Order has no field 'sku'"),
+            (["order.total"], "order.total is a TaxedMoney; select its fields"),
+            (["order.id.value"], "order.id is a ID and has no fields"),
+            (["order..id"], "invalid field path"),
+            ([], "at least one field is required"),
+        ],
+    )
+    def test_invalid_selection(self, fields, message):
+        """Test that selections the schema rejects raise ValueError"""
+        with pytest.raises(ValueError, match=message):
+            build_subscription(WebhookEventType.ORDER_CREATED, fields, SCHEMA)
+
+    def test_unknown_event_type_in_schema(self):
+        """Test that events missing from the schema are reported"""
+        with pytest.raises(ValueError, match="no subscription type 'CalculateTaxes'"):
+            build_subscription(
+                SyncWebhookEventType.CHECKOUT_CALCULATE_TAXES,
+                ["taxBase.currency"],
+                SCHEMA,
+            )
+
+    def test_type_conditions(self):
+        """Test that union fields are selected per type with field[Type]"""
+        query = build_subscription(
+            TAXES,
+            [
+                "taxBase.currency",
+                "taxBase.sourceObject[Checkout].id",
+                "taxBase.sourceObject[Checkout].email",
+                "taxBase.sourceObject[Order].number",
+            ],
+            TAX_SCHEMA,
+        )
+
+        assert query == (
+            "subscription { event { ... on CalculateTaxes { taxBase { currency "
+            "sourceObject { ... on Checkout { id email } ... on Order { number } } "
+            "} } } }"
+        )
+
+    @pytest.mark.parametrize(
+        ("fields", "message"),
+        [
+            (["taxBase.sourceObject.id"], "select a type with taxBase.sourceObject"),
+            (["taxBase.sourceObject[Product].id"], "Product is not a possible type"),
+            (["taxBase[Checkout].currency"], "Checkout is not a possible type"),
+            (["taxBase.sourceObject[Checkout]"], "select its fields"),
+            (["taxBase.sourceObject[Check-out].id"], "invalid field path"),
+        ],
+    )
+    def test_invalid_type_condition(self, fields, message):
+        """Test that missing or impossible type conditions raise ValueError"""
+        with pytest.raises(ValueError, match=message):
+            build_subscription(TAXES, fields, TAX_SCHEMA)
+
+
+class TestSchemaLoading:
+    def test_load_sdl(self, tmp_path):
+        """Test loading a schema saved as SDL"""
+        path = tmp_path / "schema.graphql"
+        path.write_text(print_schema(SCHEMA))
+
+        schema = load_schema(path)
+
+        assert schema.get_type("OrderCreated") is not None
+
+    def test_load_introspection(self, tmp_path):
+        """Test loading an introspection result, with or without the data key"""
+        path = tmp_path / "schema.json"
+        path.write_text(json.dumps({"data": introspection_from_schema(SCHEMA)}))
+
+        schema = load_schema(path)
+
+        assert schema.get_type("OrderCreated") is not None
+
+    @pytest.mark.asyncio
+    async def test_fetch_schema_fills_cache(self, tmp_path):
+        """Test that the schema is introspected once and then read from cache"""
+        cache_path = tmp_path / "schema.graphql"
+        with FakeSaleorServer() as server:
+            client = SaleorGraphQLClient(server.api_url, "token")
+            schema = await fetch_schema(client, cache_path)
+
+        assert schema.get_type("OrderCreated") is not None
+        assert cache_path.exists()
+
+        cached = await fetch_schema(
+            SaleorGraphQLClient("http://127.0.0.1:9", ""), cache_path
+        )
+
+        assert print_schema(cached) == print_schema(schema)
+
+
+class TestSizeReport:
+    def test_project_payload(self):
+        """Test that a payload is cut down to the selected fields"""
+        query = build_subscription(
+            WebhookEventType.ORDER_CREATED, ["order.id", "order.total.gross.amount"]
+        )
+        payload = {
+            "order": {
+                "id": "T3JkZXI6MQ==",
+                "number": "1",
+                "total": {"gross": {"amount": 10.0, "currency": "USD"}},
+            }
+        }
+
+        assert project_payload(payload, query) == {
+            "order": {"id": "T3JkZXI6MQ==", "total": {"gross": {"amount": 10.0}}}
+        }
+
+    def test_project_payload_lists(self):
+        """Test that selections apply to every item of a list"""
+        query = build_subscription(WebhookEventType.ORDER_CREATED, ["lines.sku"])
+
+        assert project_payload(
+            {"lines": [{"sku": "A", "quantity": 1}, {"sku": "B", "quantity": 2}]}, query
+        ) == {"lines": [{"sku": "A"}, {"sku": "B"}]}
+
+    def test_project_payload_type_conditions(self):
+        """Test that only the branch matching __typename is kept"""
+        query = build_subscription(
+            TAXES,
+            ["sourceObject[Checkout].email", "sourceObject[Order].number"],
+        )
+        payload = {
+            "sourceObject": {
+                "__typename": "Order",
+                "number": "1",
+                "email": "a@example.com",
+            }
+        }
+
+        assert project_payload(payload, query) == {"sourceObject": {"number": "1"}}
+
+    def test_reports_reduction(self):
+        """Test the size report for a handler reading two order fields"""
+        query = build_subscription(
+            WebhookEventType.ORDER_CREATED, ["order.id", "order.userEmail"], SCHEMA
+        )
+
+        report = size_report(
+            WebhookEventType.ORDER_CREATED,
+            query,
+            sample_payload(WebhookEventType.ORDER_CREATED),
+            FULL_ORDER_QUERY,
+        )
+
+        assert report.payload_bytes < report.original_payload_bytes
+        assert report.query_bytes < report.original_query_bytes
+        assert report.payload_reduction > 0.5
+        text = report.format_text()
+        assert text.startswith("ORDER_CREATED:")
+        assert "smaller" in text
+
+    def test_cli(self, tmp_path, capsys):
+        """Test printing a query and its size report from the command line"""
+        schema_path = tmp_path / "schema.graphql"
+        schema_path.write_text(print_schema(SCHEMA))
+
+        exit_code = cli(
+            [
+                "subscription",
+                "order_created",
+                "order.id",
+                "order.number",
+                "--schema",
+                str(schema_path),
+            ]
+        )
+
+        captured = capsys.readouterr()
+        assert exit_code == 0
+        assert captured.out.strip() == (
+            "subscription { event { ... on OrderCreated { order { id number } } } }"
+        )
+        assert "payload" in captured.err
+
+    def test_cli_invalid_field(self, capsys):
+        """Test that invalid fields are reported as usage errors"""
+        with pytest.raises(SystemExit):
+            cli(["subscription", "order_created", "order..id"])
+
+        assert "invalid field path" in capsys.readouterr().err
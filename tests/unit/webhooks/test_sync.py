@@ -0,0 +1,229 @@
+import asyncio
+import json
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+from saleor_app_sdk.testing import sign_payload
+from saleor_app_sdk.webhooks.events import SyncWebhookEventType
+from saleor_app_sdk.webhooks.sync import (
+    CalculateTaxesResponse,
+    ExcludedShippingMethod,
+    FilterShippingMethodsResponse,
+    ListShippingMethodsResponse,
+    ShippingMethod,
+    SyncWebhookRoute,
+    TaxLine,
+    TransactionResponse,
+)
+
+TAXES = SyncWebhookEventType.CHECKOUT_CALCULATE_TAXES
+FLAT_TAXES = CalculateTaxesResponse(
+    shipping_price_gross_amount=10.0,
+    shipping_price_net_amount=10.0,
+    shipping_tax_rate=0.0,
+)
+
+
+@pytest.fixture
+def post_sync(saleor_app, secret_key):
+    client = TestClient(saleor_app.fastapi_app)
+
+    def post(event_type, payload=b"{}"):
+        return client.post(
+            f"/api/webhooks/{event_type.value}",
+            content=payload,
+            headers={
+                "saleor-event": event_type.value,
+                "saleor-signature": sign_payload(secret_key, payload),
+            },
+        )
+
+    return post
+
+
+class TestResponses:
+    def test_calculate_taxes(self):
+        """Test the tax response uses Saleor's snake_case keys"""
+        response = CalculateTaxesResponse(
+            shipping_price_gross_amount=12.3,
+            shipping_price_net_amount=10.0,
+            shipping_tax_rate=23.0,
+            lines=[TaxLine(12.3, 10.0, 23.0)],
+        )
+
+        assert response.to_payload() == {
+            "shipping_price_gross_amount": 12.3,
+            "shipping_price_net_amount": 10.0,
+            "shipping_tax_rate": 23.0,
+            "lines": [
+                {"total_gross_amount": 12.3, "total_net_amount": 10.0, "tax_rate": 23.0}
+            ],
+        }
+
+    def test_shipping_methods(self):
+        """Test that shipping responses omit unset optional fields"""
+        listed = ListShippingMethodsResponse(
+            [ShippingMethod("dhl", "DHL", 9.5, "EUR", maximum_delivery_days=3)]
+        )
+        filtered = FilterShippingMethodsResponse([ExcludedShippingMethod("dhl")])
+
+        assert listed.to_payload() == [
+            {
+                "id": "dhl",
+                "name": "DHL",
+                "amount": 9.5,
+                "currency": "EUR",
+                "maximum_delivery_days": 3,
+            }
+        ]
+        assert filtered.to_payload() == {
+            "excluded_methods": [{"id": "dhl", "reason": ""}]
+        }
+
+    def test_transaction(self):
+        """Test the camelCase transaction response"""
+        response = TransactionResponse(
+            "CHARGE_SUCCESS", amount=10, psp_reference="psp-1"
+        )
+
+        assert response.to_payload() == {
+            "result": "CHARGE_SUCCESS",
+            "amount": 10,
+            "pspReference": "psp-1",
+        }
+
+
+class TestSyncWebhookRoute:
+    def test_fallback_must_match_event(self):
+        """Test that a fallback of the wrong type is rejected up front"""
+        with pytest.raises(TypeError, match="CalculateTaxesResponse"):
+            SyncWebhookRoute(
+                TAXES, lambda _data: None, fallback=TransactionResponse("x")
+            )
+
+    def test_deadline_must_be_positive(self):
+        """Test that a zero deadline is rejected"""
+        with pytest.raises(ValueError, match="deadline"):
+            SyncWebhookRoute(TAXES, lambda _data: None, deadline=0)
+
+    @pytest.mark.asyncio
+    async def test_handler_is_cancelled_at_deadline(self):
+        """Test that a slow coroutine handler is cancelled"""
+        cancelled = asyncio.Event()
+
+        async def handler(_data):
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        route = SyncWebhookRoute(TAXES, handler, deadline=0.01, fallback=FLAT_TAXES)
+
+        response, outcome = await route.respond({})
+
+        assert outcome == "timeout"
+        assert cancelled.is_set()
+        assert json.loads(response.body) == FLAT_TAXES.to_payload()
+
+
+class TestSyncWebhooks:
+    def test_handler_response(self, saleor_app, post_sync):
+        """Test that the handler's typed response is returned to Saleor"""
+
+        @saleor_app.sync_webhook(TAXES)
+        async def calculate_taxes(payload):
+            rate = payload["rate"]
+            return CalculateTaxesResponse(10.0 * (1 + rate), 10.0, rate * 100)
+
+        response = post_sync(TAXES, b'{"rate": 0.5}')
+
+        assert response.status_code == 200
+        assert response.json()["shipping_price_gross_amount"] == 15.0
+        assert response.json()["lines"] == []
+
+    def test_plain_function_handler(self, saleor_app, post_sync):
+        """Test that non-async handlers run in a thread"""
+        threads = []
+
+        @saleor_app.sync_webhook(
+            SyncWebhookEventType.SHIPPING_LIST_METHODS_FOR_CHECKOUT
+        )
+        def list_methods(_payload):
+            threads.append(threading.current_thread())
+            return ListShippingMethodsResponse([ShippingMethod("a", "A", 1.0, "USD")])
+
+        response = post_sync(SyncWebhookEventType.SHIPPING_LIST_METHODS_FOR_CHECKOUT)
+
+        assert response.json() == [
+            {"id": "a", "name": "A", "amount": 1.0, "currency": "USD"}
+        ]
+        assert threads[0] is not threading.main_thread()
+
+    def test_deadline_uses_fallback(self, saleor_app, post_sync):
+        """Test that a missed deadline answers with the fallback"""
+
+        @saleor_app.sync_webhook(TAXES, deadline=0.01, fallback=FLAT_TAXES)
+        async def calculate_taxes(_payload):
+            await asyncio.sleep(1)
+
+        response = post_sync(TAXES)
+
+        assert response.status_code == 200
+        assert response.json() == FLAT_TAXES.to_payload()
+
+    def test_wrong_response_type_uses_fallback(self, saleor_app, post_sync):
+        """Test that responses breaking the contract are not sent"""
+
+        @saleor_app.sync_webhook(TAXES, fallback=FLAT_TAXES)
+        async def calculate_taxes(_payload):
+            return {"shipping_price_gross_amount": 1}
+
+        assert post_sync(TAXES).json() == FLAT_TAXES.to_payload()
+
+    def test_failure_without_fallback(self, saleor_app, post_sync):
+        """Test that a failed handler without fallback returns a 503"""
+
+        @saleor_app.sync_webhook(TAXES, deadline=0.01)
+        async def calculate_taxes(_payload):
+            await asyncio.sleep(1)
+
+        response = post_sync(TAXES)
+
+        assert response.status_code == 503
+        assert "timeout" in response.json()["detail"]
+
+    def test_latency_is_observed(self, saleor_app, post_sync, recording):
+        """Test that sync handler latency is reported with its outcome"""
+
+        @saleor_app.sync_webhook(TAXES, deadline=0.01, fallback=FLAT_TAXES)
+        async def calculate_taxes(payload):
+            if payload.get("slow"):
+                await asyncio.sleep(1)
+            return FLAT_TAXES
+
+        post_sync(TAXES)
+        post_sync(TAXES, b'{"slow": true}')
+
+        observed = recording.calls["observe_sync_webhook"]
+        assert [(event, outcome) for event, outcome, _ in observed] == [
+            ("CHECKOUT_CALCULATE_TAXES", "ok"),
+            ("CHECKOUT_CALCULATE_TAXES", "timeout"),
+        ]
+
+    def test_invalid_signature(self, saleor_app):
+        """Test that sync webhooks are verified like async ones"""
+
+        @saleor_app.sync_webhook(TAXES, fallback=FLAT_TAXES)
+        async def calculate_taxes(_payload):
+            return FLAT_TAXES
+
+        response = TestClient(saleor_app.fastapi_app).post(
+            "/api/webhooks/CHECKOUT_CALCULATE_TAXES",
+            content=b"{}",
+            headers={"saleor-event": TAXES.value, "saleor-signature": "bad"},
+        )
+
+        assert response.status_code == 401
@@ -0,0 +1,196 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from saleor_app_sdk.app.core import SaleorApp
+from saleor_app_sdk.webhooks.events import WebhookEventType
+from saleor_app_sdk.webhooks.tenants import TenantScheduler
+
+
+async def serve(scheduler, arrivals):
+    """Queue one webhook per domain in ``arrivals`` and return the start order"""
+    started = []
+    gate = asyncio.Event()
+
+    async def webhook(domain):
+        async with scheduler.slot(domain):
+            started.append(domain)
+            await gate.wait()
+
+    tasks = []
+    for domain in arrivals:
+        tasks.append(asyncio.ensure_future(webhook(domain)))
+        await asyncio.sleep(0)
+    # Release the webhooks one loop iteration at a time
+    while len(started) < len(arrivals):
+        gate.set()
+        await asyncio.sleep(0)
+        gate.clear()
+        await asyncio.sleep(0)
+    gate.set()
+    await asyncio.gather(*tasks)
+    return started
+
+
+class TestTenantScheduler:
+    def test_invalid_options(self):
+        """Test that slots and weights must be positive"""
+        with pytest.raises(ValueError, match="at least 1"):
+            TenantScheduler(concurrency=0)
+        with pytest.raises(ValueError, match="weight"):
+            TenantScheduler().set_weight("a.com", 0)
+
+    @pytest.mark.asyncio
+    async def test_bulkhead_caps_one_tenant(self):
+        """Test that one installation cannot take more than per_tenant slots"""
+        scheduler = TenantScheduler(concurrency=10, per_tenant=2)
+        await scheduler.acquire("a.com")
+        await scheduler.acquire("a.com")
+        third = asyncio.ensure_future(scheduler.acquire("a.com"))
+        await scheduler.acquire("b.com")
+        await asyncio.sleep(0)
+
+        assert not third.done()
+        assert scheduler.stats()["a.com"]["queued"] == 1
+
+        scheduler.release("a.com")
+        await asyncio.sleep(0)
+
+        assert third.done()
+        assert scheduler.running == 3
+
+    @pytest.mark.asyncio
+    async def test_bulk_import_does_not_starve_others(self):
+        """Test that a later tenant is interleaved with a backlogged one"""
+        scheduler = TenantScheduler(concurrency=1, per_tenant=10)
+
+        started = await serve(scheduler, ["a"] * 5 + ["b"] * 2)
+
+        assert started == ["a", "b", "a", "b", "a", "a", "a"]
+
+    @pytest.mark.asyncio
+    async def test_weights_split_slots(self):
+        """Test that a tenant with twice the weight gets twice the slots"""
+        scheduler = TenantScheduler(concurrency=1, weights={"a": 2.0})
+
+        started = await serve(scheduler, ["x"] + ["a"] * 6 + ["b"] * 3)
+
+        assert started == ["x"] + ["a", "a", "b"] * 3
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_queue(self):
+        """Test that a webhook dropped while queued gives up its place"""
+        scheduler = TenantScheduler(concurrency=1)
+        await scheduler.acquire("a.com")
+        waiter = asyncio.ensure_future(scheduler.acquire("b.com"))
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        await asyncio.sleep(0)
+        scheduler.release("a.com")
+
+        assert scheduler.queued() == 0
+        assert scheduler.running == 0
+
+    @pytest.mark.asyncio
+    async def test_stats_and_metrics(self, recording):
+        """Test that handled webhooks are counted and observed per tenant"""
+        scheduler = TenantScheduler()
+
+        async with scheduler.slot("a.com"):
+            pass
+
+        stats = scheduler.stats()["a.com"]
+        assert stats["handled"] == 1
+        assert stats["running"] == 0
+        observed = recording.calls["observe_tenant_webhook"]
+        assert [installation for installation, _, _ in observed] == ["a.com"]
+
+    @pytest.mark.asyncio
+    async def test_idle_tenants_are_forgotten(self):
+        """Test that only max_tenants installations are tracked"""
+        scheduler = TenantScheduler(max_tenants=2)
+        await scheduler.acquire("busy.com")
+        for domain in ("a.com", "b.com", "c.com"):
+            async with scheduler.slot(domain):
+                pass
+
+        assert list(scheduler.stats()) == ["busy.com", "c.com"]
+        scheduler.release("busy.com")
+
+
+class TestTenantWebhooks:
+    @pytest.mark.asyncio
+    async def test_busy_tenant_does_not_block_others(
+        self, app_manifest, secret_key, app_client, signed_post
+    ):
+        """Test that a tenant at its cap queues while others proceed"""
+        scheduler = TenantScheduler(concurrency=10, per_tenant=1)
+        app = SaleorApp(app_manifest, secret_key, tenant_scheduler=scheduler)
+        release = asyncio.Event()
+        handled = []
+
+        @app.webhook(WebhookEventType.ORDER_CREATED)
+        async def order_created(payload):
+            handled.append(payload["shop"])
+            if payload["shop"] == "busy":
+                await release.wait()
+
+        async with app_client(app) as client:
+
+            def post(domain):
+                body = f'{{"shop": "{domain}"}}'.encode()
+                return signed_post(
+                    client, WebhookEventType.ORDER_CREATED, body, domain=domain
+                )
+
+            busy = [asyncio.ensure_future(post("busy")) for _ in range(2)]
+            await asyncio.sleep(0.01)
+            assert (await post("quiet")).status_code == 200
+            assert handled == ["busy", "quiet"]
+            assert scheduler.stats()["busy"]["queued"] == 1
+            release.set()
+            await asyncio.gather(*busy)
+
+        assert handled == ["busy", "quiet", "busy"]
+
+    @pytest.mark.asyncio
+    async def test_unsigned_webhooks_take_no_slot(
+        self, app_manifest, secret_key, app_client
+    ):
+        """Test that tenants are only tracked for verified webhooks"""
+        scheduler = TenantScheduler()
+        app = SaleorApp(app_manifest, secret_key, tenant_scheduler=scheduler)
+
+        async with app_client(app) as client:
+            for domain in ("forged-1.com", "forged-2.com"):
+                response = await client.post(
+                    "/api/webhooks/order_created",
+                    content=b"{}",
+                    headers={
+                        "saleor-event": WebhookEventType.ORDER_CREATED.value,
+                        "saleor-domain": domain,
+                        "saleor-signature": "invalid",
+                    },
+                )
+                assert response.status_code == 401
+
+        assert scheduler.stats() == {}
+
+    def test_admin_stats_route(self, app_manifest, secret_key):
+        """Test that per-tenant stats are served to admins"""
+        scheduler = TenantScheduler()
+        app = SaleorApp(
+            app_manifest,
+            secret_key,
+            tenant_scheduler=scheduler,
+            admin_token="admin-token",
+        )
+        client = TestClient(app.fastapi_app)
+
+        assert client.get("/api/admin/tenants").status_code == 401
+        response = client.get(
+            "/api/admin/tenants", headers={"Authorization": "Bearer admin-token"}
+        )
+        assert response.json() == {"running": 0, "queued": 0, "tenants": {}}